@@ -0,0 +1,76 @@
+"""Tests for deferred imports (Model.Infrastructure.lazy).
+
+Tests cover:
+- lazy_module defers execution until first attribute access
+- Missing optional modules still fail at the import site
+- lazy_exports resolves and caches package re-exports
+"""
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for proper imports
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Model.Infrastructure.lazy import lazy_exports, lazy_module
+
+
+@pytest.fixture
+def module_dir(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    for name in [n for n in sys.modules if n.startswith("prismq_lazy_")]:
+        del sys.modules[name]
+
+
+class TestLazyModule:
+    def test_executes_on_first_attribute(self, module_dir):
+        (module_dir / "prismq_lazy_heavy.py").write_text(
+            "import builtins\nbuiltins.prismq_lazy_loaded = True\nVALUE = 42\n"
+        )
+        module = lazy_module("prismq_lazy_heavy")
+        import builtins
+
+        assert not getattr(builtins, "prismq_lazy_loaded", False)
+        assert module.VALUE == 42
+        assert builtins.prismq_lazy_loaded
+        del builtins.prismq_lazy_loaded
+
+    def test_missing_module_raises_now(self):
+        with pytest.raises(ModuleNotFoundError):
+            lazy_module("prismq_lazy_not_installed")
+
+    def test_loaded_module_is_returned_as_is(self):
+        import json
+
+        assert lazy_module("json") is json
+
+
+class TestLazyExports:
+    def test_resolves_and_caches(self, module_dir):
+        package = module_dir / "prismq_lazy_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text(
+            "from Model.Infrastructure.lazy import lazy_exports\n"
+            "__getattr__, __dir__ = lazy_exports(__name__, {'answer': '.sub'})\n"
+        )
+        (package / "sub.py").write_text("answer = 42\n")
+        import prismq_lazy_pkg
+
+        assert "prismq_lazy_pkg.sub" not in sys.modules
+        assert "answer" in dir(prismq_lazy_pkg)
+        assert prismq_lazy_pkg.answer == 42
+        assert "prismq_lazy_pkg.sub" in sys.modules
+        assert prismq_lazy_pkg.__dict__["answer"] == 42
+
+    def test_unknown_name_is_attribute_error(self):
+        module = types.ModuleType("prismq_lazy_empty")
+        sys.modules["prismq_lazy_empty"] = module
+        module.__getattr__, module.__dir__ = lazy_exports("prismq_lazy_empty", {})
+
+        with pytest.raises(AttributeError):
+            module.missing
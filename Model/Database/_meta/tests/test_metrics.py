@@ -0,0 +1,160 @@
+"""Tests for the Prometheus/OpenMetrics instrumentation module.
+
+Tests cover:
+- Counter, gauge and histogram exposition (Prometheus text and OpenMetrics)
+- LLM call observation with Ollama token statistics
+- Stage result classification
+- Textfile-collector output and the /metrics HTTP endpoint
+"""
+
+import sys
+import urllib.request
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path for proper imports
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Model.Infrastructure import metrics
+from Model.Infrastructure.metrics import (
+    MetricsRegistry,
+    TextfileExporter,
+    observe_llm_call,
+    record_service_result,
+    start_metrics_server,
+    write_textfile,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestExposition:
+    def test_counter_renders_total_suffix(self, registry):
+        counter = registry.counter("jobs", "Jobs done", ["stage"])
+        counter.inc(stage="11")
+        counter.inc(2, stage="11")
+
+        text = registry.render()
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{stage="11"} 3' in text
+
+    def test_openmetrics_family_name_and_eof(self, registry):
+        registry.counter("jobs", "Jobs done").inc()
+
+        text = registry.render(openmetrics=True)
+        assert "# TYPE jobs counter" in text
+        assert text.endswith("# EOF\n")
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        histogram = registry.histogram("latency_seconds", "Latency", ["model"], buckets=(1, 5))
+        for value in (0.5, 2, 10):
+            histogram.observe(value, model="m")
+
+        text = registry.render()
+        assert 'latency_seconds_bucket{model="m",le="1"} 1' in text
+        assert 'latency_seconds_bucket{model="m",le="5"} 2' in text
+        assert 'latency_seconds_bucket{model="m",le="+Inf"} 3' in text
+        assert 'latency_seconds_count{model="m"} 3' in text
+        assert 'latency_seconds_sum{model="m"} 12.5' in text
+
+    def test_extra_labels_and_escaping(self, registry):
+        registry.gauge("depth", "Depth", ["stage"]).set(4, stage='a"b')
+
+        text = registry.render(extra_labels={"worker": "stage_11"})
+        assert 'depth{stage="a\\"b",worker="stage_11"} 4' in text
+
+    def test_label_mismatch_raises(self, registry):
+        counter = registry.counter("jobs", "Jobs done", ["stage"])
+        with pytest.raises(ValueError):
+            counter.inc(model="x")
+
+    def test_reregistering_returns_same_metric(self, registry):
+        first = registry.counter("jobs", "Jobs done", ["stage"])
+        assert registry.counter("jobs", "Jobs done", ["stage"]) is first
+        with pytest.raises(ValueError):
+            registry.gauge("jobs", "Jobs done", ["stage"])
+
+
+class TestRecording:
+    def test_observe_llm_call_records_tokens(self):
+        model = "test-model-ok"
+        with observe_llm_call(model) as call:
+            data = call.record(
+                {"response": "x", "prompt_eval_count": 40, "eval_count": 100, "eval_duration": 2e9}
+            )
+
+        assert data["response"] == "x"
+        assert metrics.LLM_REQUESTS.value(model=model, status="ok") == 1
+        assert metrics.LLM_TOKENS.value(model=model, kind="prompt") == 40
+        assert metrics.LLM_TOKENS.value(model=model, kind="completion") == 100
+        assert metrics.LLM_TOKENS_PER_SECOND.count(model=model) == 1
+        assert metrics.LLM_LATENCY.count(model=model) == 1
+
+    def test_observe_llm_call_counts_errors(self):
+        model = "test-model-error"
+        with pytest.raises(RuntimeError):
+            with observe_llm_call(model):
+                raise RuntimeError("Ollama down")
+
+        assert metrics.LLM_REQUESTS.value(model=model, status="error") == 1
+        assert metrics.LLM_TOKENS.value(model=model, kind="completion") == 0
+
+    def test_record_service_result_classifies(self):
+        stage = "t1"
+        record_service_result(stage, SimpleNamespace(story_id=1, success=True, passes=True), 2.0)
+        record_service_result(stage, SimpleNamespace(story_id=2, success=True, accepted=False))
+        record_service_result(stage, SimpleNamespace(story_id=3, success=False, passes=None))
+        record_service_result(stage, SimpleNamespace(story_id=None, success=True))
+
+        for result in ("pass", "fail", "error"):
+            assert metrics.STORIES_PROCESSED.value(stage=stage, result=result) == 1
+        assert metrics.STAGE_DURATION.count(stage=stage) == 1
+
+
+class TestExport:
+    def test_write_textfile(self, tmp_path, registry):
+        registry.counter("jobs", "Jobs done").inc()
+        path = tmp_path / "prismq.prom"
+
+        write_textfile(str(path), registry)
+        assert "jobs_total 1" in path.read_text(encoding="utf-8")
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_textfile_exporter_throttles(self, tmp_path):
+        exporter = TextfileExporter("stage_11", directory=str(tmp_path), interval=60)
+
+        assert exporter.maybe_write()
+        assert not exporter.maybe_write()
+        assert exporter.maybe_write(force=True)
+        assert 'worker="stage_11"' in (tmp_path / "prismq_stage_11.prom").read_text(encoding="utf-8")
+
+    def test_textfile_exporter_disabled_without_directory(self, monkeypatch):
+        monkeypatch.delenv("PRISMQ_METRICS_TEXTFILE_DIR", raising=False)
+        exporter = TextfileExporter("stage_11")
+        assert not exporter.enabled
+        assert not exporter.maybe_write()
+
+    def test_http_endpoint_negotiates_format(self, registry):
+        registry.gauge("depth", "Depth").set(3)
+        server = start_metrics_server(0, registry=registry)
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        try:
+            with urllib.request.urlopen(url, timeout=5) as response:
+                assert response.headers["Content-Type"].startswith("text/plain")
+                assert b"depth 3" in response.read()
+
+            request = urllib.request.Request(
+                url, headers={"Accept": "application/openmetrics-text"}
+            )
+            with urllib.request.urlopen(request, timeout=5) as response:
+                assert "openmetrics" in response.headers["Content-Type"]
+                assert response.read().endswith(b"# EOF\n")
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,116 @@
+"""Tests for the shared Ollama call used by the stage services.
+
+Tests cover:
+- Request payload, <think> stripping and LLM metrics for generate()
+- Error mapping when Ollama is unreachable or the request fails
+- Review verdict parsing and the prompt/llm/parse spans of run_review()
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path for proper imports
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Model.Infrastructure.metrics import LLM_REQUESTS
+from Model.Infrastructure.ollama import generate, parse_review, run_review
+from Model.Infrastructure.tracing import configure_tracing, trace_stage
+
+
+class RequestException(Exception):
+    pass
+
+
+class FakeRequests:
+    """Stands in for the ``requests`` module."""
+
+    exceptions = SimpleNamespace(RequestException=RequestException)
+
+    def __init__(self, reply="", tags_status=200, post_error=None):
+        self.reply = reply
+        self.tags_status = tags_status
+        self.post_error = post_error
+        self.posted = []
+
+    def get(self, url, timeout):
+        return SimpleNamespace(status_code=self.tags_status)
+
+    def post(self, url, json, timeout):
+        if self.post_error:
+            raise self.post_error
+        self.posted.append((url, json, timeout))
+        body = {"response": self.reply, "eval_count": 5, "eval_duration": 1e9}
+        return SimpleNamespace(raise_for_status=lambda: None, json=lambda: body)
+
+
+@pytest.fixture
+def fake_requests(monkeypatch):
+    def install(**kwargs):
+        fake = FakeRequests(**kwargs)
+        monkeypatch.setitem(sys.modules, "requests", fake)
+        return fake
+
+    return install
+
+
+class TestGenerate:
+    def test_posts_prompt_and_strips_thinking(self, fake_requests):
+        fake = fake_requests(reply="<think>hmm</think>\n  Final text ")
+        before = LLM_REQUESTS.value(model="m", status="ok")
+
+        text = generate("m", "Prompt", temperature=0.3, max_tokens=400, timeout=60)
+
+        assert text == "Final text"
+        url, payload, timeout = fake.posted[0]
+        assert url.endswith("/api/generate") and timeout == 60
+        assert payload["options"] == {"temperature": 0.3, "num_predict": 400, "num_ctx": 4096}
+        assert (payload["stream"], payload["think"]) == (False, False)
+        assert LLM_REQUESTS.value(model="m", status="ok") == before + 1
+
+    def test_unavailable_server(self, fake_requests):
+        fake_requests(tags_status=503)
+        with pytest.raises(RuntimeError, match="status 503"):
+            generate("m", "Prompt", temperature=0.3, max_tokens=400, timeout=60)
+
+    def test_failed_request_counts_as_error(self, fake_requests):
+        fake_requests(post_error=RequestException("timed out"))
+        before = LLM_REQUESTS.value(model="m", status="error")
+
+        with pytest.raises(RuntimeError, match="Ollama API call failed: timed out"):
+            generate("m", "Prompt", temperature=0.3, max_tokens=400, timeout=60)
+        assert LLM_REQUESTS.value(model="m", status="error") == before + 1
+
+
+class TestReview:
+    def test_parse_clamps_score_and_defaults_feedback(self):
+        assert parse_review('Verdict: {"overall_score": 140}', "Done.") == ("Done.", 100)
+        with pytest.raises(ValueError):
+            parse_review("no verdict", "Done.")
+
+    def test_run_review_spans(self, fake_requests, tmp_path):
+        fake = fake_requests(reply='{"overall_score": 91, "feedback": "Clean."}')
+        template = tmp_path / "review.txt"
+        template.write_text("Review {title_text}", encoding="utf-8")
+        batches = []
+        tracer = configure_tracing("test", directory="", otlp_endpoint="")
+        tracer.exporters.append(SimpleNamespace(export=batches.append))
+
+        def process():
+            review = run_review(
+                "m", template, {"title_text": "Storm"}, default_feedback="Done.",
+                temperature=0.3, max_tokens=400, timeout=60,
+            )
+            return SimpleNamespace(story_id=1, success=True, review=review)
+
+        try:
+            result = trace_stage("11", process)
+        finally:
+            configure_tracing("test", directory="", otlp_endpoint="")
+
+        assert result.review == ("Clean.", 91)
+        assert fake.posted[0][1]["prompt"] == "Review Storm"
+        assert [s.name for s in batches[0]] == ["stage 11", "prompt", "llm", "parse"]
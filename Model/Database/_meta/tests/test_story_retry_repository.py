@@ -0,0 +1,189 @@
+"""Tests for StoryRetryRepository.
+
+Tests cover:
+- Exponential backoff and the RETRY_READY_SQL stage filter
+- Dead-lettering after max attempts
+- Deferring a story without counting an attempt
+- Per-state attempt counting and clearing on state change
+- Requeue of dead-lettered stories
+- Table creation inside a caller's transaction
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for proper imports
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Model.Entities.story import Story
+from Model.Repositories.story_repository import StoryRepository
+from Model.Repositories.story_retry_repository import (
+    RETRY_READY_SQL,
+    RetryPolicy,
+    StoryRetryRepository,
+)
+from Model.state import DEAD_LETTER_STATE
+
+GRAMMAR = "PrismQ.T.Review.Content.Grammar"
+TONE = "PrismQ.T.Review.Content.Tone"
+
+
+@pytest.fixture
+def db_connection():
+    """Create in-memory SQLite database with the Story table."""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript(Story.get_sql_schema())
+    conn.executemany("INSERT INTO Story (state) VALUES (?)", [(GRAMMAR,)] * 3)
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def retry_repo(db_connection):
+    return StoryRetryRepository(db_connection, RetryPolicy(max_attempts=3, base_delay=60))
+
+
+def ready_ids(conn, state=GRAMMAR):
+    rows = conn.execute(
+        f"SELECT s.id FROM Story s WHERE s.state = ? AND {RETRY_READY_SQL} ORDER BY s.id",
+        (state,),
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def story_state(conn, story_id):
+    return conn.execute("SELECT state FROM Story WHERE id = ?", (story_id,)).fetchone()[0]
+
+
+class TestRetryPolicy:
+    def test_delay_doubles_up_to_cap(self):
+        policy = RetryPolicy(base_delay=60, max_delay=200)
+        assert [policy.delay_for(n) for n in range(4)] == [0.0, 60, 120, 200]
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("PRISMQ_RETRY_MAX_ATTEMPTS", "2")
+        monkeypatch.setenv("PRISMQ_RETRY_BASE_DELAY", "5")
+        policy = RetryPolicy.from_env()
+        assert policy.max_attempts == 2
+        assert policy.base_delay == 5.0
+        assert policy.max_delay == 3600.0
+
+
+class TestEnsureTable:
+    def test_does_not_commit_open_transaction(self, db_connection):
+        db_connection.execute("INSERT INTO Story (state) VALUES (?)", (TONE,))
+        StoryRetryRepository(db_connection)
+
+        assert db_connection.in_transaction
+        db_connection.rollback()
+        assert db_connection.execute("SELECT COUNT(*) FROM Story").fetchone()[0] == 3
+
+    def test_creates_table_outside_transaction(self, db_connection):
+        StoryRetryRepository(db_connection)
+        assert db_connection.execute("SELECT COUNT(*) FROM StoryRetry").fetchone()[0] == 0
+
+
+class TestRecordFailure:
+    def test_failure_backs_off_story(self, db_connection, retry_repo):
+        retry = retry_repo.record_failure(1, GRAMMAR, "timeout")
+
+        assert retry.attempts == 1
+        assert retry.next_attempt_at is not None
+        assert not retry.is_dead_lettered
+        assert ready_ids(db_connection) == [2, 3]
+        assert retry_repo.count_backing_off() == {GRAMMAR: 1}
+
+    def test_expired_backoff_is_ready_again(self, db_connection, retry_repo):
+        retry_repo.record_failure(1, GRAMMAR, "timeout")
+        db_connection.execute(
+            "UPDATE StoryRetry SET next_attempt_at = datetime('now', '-1 seconds')"
+        )
+        assert ready_ids(db_connection) == [1, 2, 3]
+
+    def test_dead_letter_after_max_attempts(self, db_connection, retry_repo):
+        for _ in range(3):
+            retry = retry_repo.record_failure(1, GRAMMAR, "bad JSON")
+
+        assert retry.is_dead_lettered
+        assert retry.attempts == 3
+        assert story_state(db_connection, 1) == DEAD_LETTER_STATE
+        assert [r.story_id for r in retry_repo.find_dead_letters()] == [1]
+        assert retry_repo.find_dead_letters(TONE) == []
+
+    def test_attempts_restart_in_new_state(self, retry_repo):
+        retry_repo.record_failure(1, GRAMMAR, "timeout")
+        retry_repo.record_failure(1, GRAMMAR, "timeout")
+        retry = retry_repo.record_failure(1, TONE, "timeout")
+        assert retry.attempts == 1
+        assert retry.state == TONE
+
+    def test_long_error_is_truncated(self, retry_repo):
+        retry = retry_repo.record_failure(1, GRAMMAR, "x" * 5000)
+        assert len(retry.last_error) == 1000
+
+
+class TestDefer:
+    def test_defer_backs_off_without_counting(self, db_connection, retry_repo):
+        retry_repo.record_failure(1, GRAMMAR, "timeout")
+        for _ in range(5):
+            retry = retry_repo.defer(1, GRAMMAR, "near-duplicate")
+
+        assert retry.attempts == 1
+        assert retry.last_error == "near-duplicate"
+        assert not retry.is_dead_lettered
+        assert story_state(db_connection, 1) == GRAMMAR
+        assert ready_ids(db_connection) == [2, 3]
+
+    def test_defer_in_new_state_starts_at_zero(self, retry_repo):
+        retry_repo.record_failure(1, GRAMMAR, "timeout")
+        assert retry_repo.defer(1, TONE, "near-duplicate").attempts == 0
+
+
+class TestRequeue:
+    def test_requeue_restores_failed_state(self, db_connection, retry_repo):
+        for _ in range(3):
+            retry_repo.record_failure(2, GRAMMAR, "timeout")
+
+        assert retry_repo.requeue(2)
+        assert story_state(db_connection, 2) == GRAMMAR
+        assert retry_repo.find_by_story_id(2) is None
+        assert ready_ids(db_connection) == [1, 2, 3]
+
+    def test_requeue_ignores_live_story(self, retry_repo):
+        retry_repo.record_failure(1, GRAMMAR, "timeout")
+        assert not retry_repo.requeue(1)
+        assert not retry_repo.requeue(99)
+
+    def test_requeue_all_filters_by_state(self, db_connection, retry_repo):
+        db_connection.execute("UPDATE Story SET state = ? WHERE id = 3", (TONE,))
+        for _ in range(3):
+            retry_repo.record_failure(1, GRAMMAR, "timeout")
+            retry_repo.record_failure(3, TONE, "timeout")
+
+        assert retry_repo.requeue_all(TONE) == 1
+        assert story_state(db_connection, 3) == TONE
+        assert story_state(db_connection, 1) == DEAD_LETTER_STATE
+
+
+class TestStoryRepositoryIntegration:
+    def test_state_change_clears_retry(self, db_connection, retry_repo):
+        retry_repo.record_failure(1, GRAMMAR, "timeout")
+        story_repo = StoryRepository(db_connection)
+        story = story_repo.find_by_id(1)
+        story.state = TONE
+        story_repo.update(story)
+
+        assert retry_repo.find_by_story_id(1) is None
+
+    def test_find_oldest_skips_backing_off(self, db_connection, retry_repo):
+        retry_repo.record_failure(1, GRAMMAR, "timeout")
+        story_repo = StoryRepository(db_connection)
+
+        assert story_repo.find_oldest_by_state(GRAMMAR).id == 1
+        assert story_repo.find_oldest_by_state(GRAMMAR, skip_backing_off=True).id == 2
@@ -0,0 +1,181 @@
+"""Tests for per-story span tracing.
+
+Tests cover:
+- Span trees keyed by story id (deterministic trace id)
+- Discarded polls and disabled tracing
+- LLM spans recorded through the metrics hook
+- Spans from the traced decorator and the standalone workflow wrapper
+- JSONL store round trip and OTLP/JSON conversion
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path for proper imports
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Model.Infrastructure import tracing
+from Model.Infrastructure.metrics import observe_llm_call
+from Model.Infrastructure.tracing import (
+    configure_tracing,
+    load_spans,
+    span,
+    story_trace_id,
+    to_otlp,
+    trace_stage,
+    traced,
+)
+from Model.Infrastructure.workflow import StageTelemetry
+
+
+class MemoryExporter:
+    def __init__(self):
+        self.batches = []
+
+    def export(self, spans):
+        self.batches.append(spans)
+
+
+@pytest.fixture
+def exporter():
+    memory = MemoryExporter()
+    tracer = configure_tracing("test", directory="", otlp_endpoint="")
+    tracer.exporters.append(memory)
+    yield memory
+    configure_tracing("test", directory="", otlp_endpoint="")
+
+
+def process_story(story_id, success=True):
+    with span("fetch"):
+        pass
+    with observe_llm_call("test-model") as call:
+        call.record({"eval_count": 10, "eval_duration": 1e9})
+    with span("commit"):
+        pass
+    return SimpleNamespace(story_id=story_id, success=success, passes=True, next_state="Next")
+
+
+class TestTraceStage:
+    def test_stage_span_tree_keyed_by_story(self, exporter):
+        result = trace_stage("11", lambda: process_story(42))
+
+        assert result.story_id == 42
+        [spans] = exporter.batches
+        root = spans[0]
+        assert root.name == "stage 11"
+        assert root.parent_id is None
+        assert root.attributes["next_state"] == "Next"
+        assert [s.name for s in spans[1:]] == ["fetch", "llm", "commit"]
+        assert all(s.parent_id == root.span_id for s in spans[1:])
+        assert {s.trace_id for s in spans} == {story_trace_id(42)}
+        assert spans[2].attributes["completion_tokens"] == 10
+
+    def test_stages_of_a_story_share_trace(self, exporter):
+        trace_stage("11", lambda: process_story(7))
+        trace_stage("12", lambda: process_story(7))
+
+        assert exporter.batches[0][0].trace_id == exporter.batches[1][0].trace_id
+        assert len(story_trace_id(7)) == 32
+
+    def test_idle_poll_is_discarded(self, exporter):
+        trace_stage("11", lambda: SimpleNamespace(story_id=None, success=True))
+        assert exporter.batches == []
+
+    def test_failed_result_marks_root_error(self, exporter):
+        trace_stage("11", lambda: process_story(3, success=False))
+        assert exporter.batches[0][0].status == "error"
+
+    def test_exception_marks_span_error(self, exporter):
+        with pytest.raises(ValueError):
+            with span("stage 11") as root:
+                root.story_id = 5
+                with span("parse"):
+                    raise ValueError("bad JSON")
+
+        parse = exporter.batches[0][1]
+        assert parse.status == "error"
+        assert "bad JSON" in parse.attributes["error"]
+
+    def test_disabled_tracer_records_nothing(self):
+        configure_tracing("test", directory="", otlp_endpoint="")
+        with span("fetch") as current:
+            assert current is None
+        assert trace_stage("11", lambda: process_story(1)).story_id == 1
+
+
+    def test_traced_decorator_adds_child_span(self, exporter):
+        @traced("fetch")
+        def fetch(story_id):
+            return SimpleNamespace(story_id=story_id, success=True)
+
+        assert trace_stage("11", lambda: fetch(4)).story_id == 4
+        assert [s.name for s in exporter.batches[0]] == ["stage 11", "fetch"]
+
+
+class TestStageTelemetry:
+    def test_traces_without_metrics_textfile(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PRISMQ_TRACE_DIR", str(tmp_path))
+        monkeypatch.delenv("PRISMQ_METRICS_TEXTFILE_DIR", raising=False)
+        try:
+            telemetry = StageTelemetry("11")
+            result = telemetry.run(lambda: process_story(8))
+        finally:
+            configure_tracing("test", directory="", otlp_endpoint="")
+
+        assert result.story_id == 8
+        assert not telemetry.exporter.enabled
+        assert [s.name for s in load_spans(str(tmp_path))] == ["stage 11", "fetch", "llm", "commit"]
+
+    def test_writes_metrics_textfile(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PRISMQ_METRICS_TEXTFILE_DIR", str(tmp_path))
+        telemetry = StageTelemetry("12", worker="tone")
+        telemetry.run(lambda: process_story(8))
+
+        text = (tmp_path / "prismq_tone.prom").read_text(encoding="utf-8")
+        assert 'prismq_stories_processed_total{stage="12",result="pass",worker="tone"}' in text
+
+
+class TestExport:
+    def test_jsonl_round_trip(self, tmp_path):
+        configure_tracing("stage_11", directory=str(tmp_path), otlp_endpoint="")
+        try:
+            trace_stage("11", lambda: process_story(9))
+        finally:
+            configure_tracing("test", directory="", otlp_endpoint="")
+
+        spans = load_spans(str(tmp_path))
+        assert (tmp_path / "stage_11.jsonl").exists()
+        assert [s.name for s in spans] == ["stage 11", "fetch", "llm", "commit"]
+        assert all(s.story_id == 9 and s.worker == "stage_11" for s in spans)
+
+    def test_partial_line_is_skipped(self, tmp_path):
+        (tmp_path / "w.jsonl").write_text('{"name": "x", "span_id": "1", "start": 1}\n{"name', encoding="utf-8")
+        assert len(load_spans(str(tmp_path))) == 1
+
+    def test_otlp_conversion(self, exporter):
+        trace_stage("11", lambda: process_story(42))
+        payload = to_otlp(exporter.batches[0])
+
+        otlp_spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert otlp_spans[0]["traceId"] == story_trace_id(42)
+        assert "parentSpanId" not in otlp_spans[0]
+        assert otlp_spans[1]["parentSpanId"] == otlp_spans[0]["spanId"]
+        assert int(otlp_spans[0]["endTimeUnixNano"]) >= int(otlp_spans[0]["startTimeUnixNano"])
+        json.dumps(payload)
+
+    def test_env_configuration(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PRISMQ_TRACE_DIR", str(tmp_path))
+        monkeypatch.setenv("PRISMQ_TRACE_OTLP_ENDPOINT", "http://localhost:4318")
+        tracer = configure_tracing("pipeline")
+        try:
+            assert tracer.enabled
+            assert tracer.exporters[0].path == str(tmp_path / "pipeline.jsonl")
+            assert tracer.exporters[1].endpoint == "http://localhost:4318/v1/traces"
+        finally:
+            configure_tracing("test", directory="", otlp_endpoint="")
+        assert not tracing.get_tracer().enabled
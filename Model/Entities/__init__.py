@@ -11,6 +11,7 @@ Entities:
     - IdeaSchema: SQL schema definition for Idea and IdeaInspiration tables
     - InspirationSchema: SQL schema definition for the Inspiration registry table
     - StoryReviewModel: Linking table for Story reviews
+    - StoryRetry: Per-story failure/backoff bookkeeping
 
 Interfaces:
     - IReadable: Interface for read-only model operations
@@ -28,6 +29,7 @@ from Model.Entities.script import Script
 from Model.Entities.review import Review
 from Model.Entities.idea import IdeaSchema
 from Model.Entities.inspiration import InspirationSchema
+from Model.Entities.story_retry import StoryRetry
 
 try:
     from Model.Entities.story_review import StoryReviewModel, ReviewType
@@ -46,6 +48,7 @@ __all__ = [
     "Review",
     "IdeaSchema",
     "InspirationSchema",
+    "StoryRetry",
     "StoryReviewModel",
     "ReviewType",
 ]
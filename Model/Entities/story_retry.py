@@ -0,0 +1,111 @@
+"""StoryRetry model for per-story failure tracking in the PrismQ workflow.
+
+When a stage fails to process a story (AI timeout, unparsable JSON, Ollama
+down), the story stays in its input state. StoryRetry records how often that
+happened and when the story may be picked up again, so the failing story does
+not block the head of the queue. After too many failures the story is moved
+to the dead-letter state (see ``Model.state.DEAD_LETTER_STATE``) and can be
+requeued manually.
+
+Schema:
+    StoryRetry (
+        story_id INTEGER PRIMARY KEY,       -- FK to Story(id)
+        state TEXT NOT NULL,                -- state the failures happened in
+        attempts INTEGER NOT NULL,          -- consecutive failures in that state
+        next_attempt_at TEXT NULL,          -- UTC, honored by the stage queries
+        last_error TEXT NULL,
+        dead_lettered_at TEXT NULL,
+        updated_at TEXT NOT NULL
+    )
+
+Note:
+    Rows are keyed by story and remember the state the failures belong to.
+    Once the story moves to another state the row no longer applies, so
+    successful processing needs no bookkeeping.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class StoryRetry:
+    """Failure bookkeeping for one story.
+
+    Attributes:
+        story_id: Story the failures belong to
+        state: Story state in which the failures occurred
+        attempts: Number of consecutive failed attempts in ``state``
+        next_attempt_at: Earliest UTC time (``YYYY-MM-DD HH:MM:SS``) at which
+            stages may pick the story again; None when not backing off
+        last_error: Error message of the most recent failure
+        dead_lettered_at: UTC time the story was moved to the dead-letter
+            state, None while it is still being retried
+        updated_at: UTC time of the last change
+
+    Example:
+        >>> retry = StoryRetry(story_id=42, state="PrismQ.T.Review.Content.Grammar")
+        >>> retry.is_dead_lettered
+        False
+    """
+
+    story_id: int
+    state: str
+    attempts: int = 0
+    next_attempt_at: Optional[str] = None
+    last_error: Optional[str] = None
+    dead_lettered_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    @property
+    def is_dead_lettered(self) -> bool:
+        """True once the story has been moved to the dead-letter state."""
+        return self.dead_lettered_at is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "story_id": self.story_id,
+            "state": self.state,
+            "attempts": self.attempts,
+            "next_attempt_at": self.next_attempt_at,
+            "last_error": self.last_error,
+            "dead_lettered_at": self.dead_lettered_at,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StoryRetry":
+        """Create from dictionary (or sqlite3.Row) representation."""
+        return cls(
+            story_id=data["story_id"],
+            state=data["state"],
+            attempts=data["attempts"] or 0,
+            next_attempt_at=data["next_attempt_at"],
+            last_error=data["last_error"],
+            dead_lettered_at=data["dead_lettered_at"],
+            updated_at=data["updated_at"],
+        )
+
+    @classmethod
+    def get_sql_schema(cls) -> str:
+        """Get the SQL CREATE TABLE statement for StoryRetry."""
+        return """
+        CREATE TABLE IF NOT EXISTS StoryRetry (
+            story_id INTEGER PRIMARY KEY,
+            state TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at TEXT NULL,
+            last_error TEXT NULL,
+            dead_lettered_at TEXT NULL,
+            updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+            FOREIGN KEY (story_id) REFERENCES Story(id)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_story_retry_next_attempt ON StoryRetry(next_attempt_at);
+        """
+
+
+__all__ = [
+    "StoryRetry",
+]
@@ -8,6 +8,12 @@ Components:
     - schema: Schema creation and initialization
     - exceptions: Custom database exception types
     - startup: Application startup utilities
+    - metrics: Prometheus/OpenMetrics counters and histograms
+    - tracing: Per-story span tracing (JSONL / OTLP)
+    - ollama: Instrumented Ollama generate call shared by the stage services
+    - workflow: Tracing and metrics wrapper for standalone stage workflows
+    - backpressure: WIP limits that pause the upstream generation stages
+    - lazy: Deferred imports for heavy optional dependencies
 
 Example:
     >>> from Model.Infrastructure import get_connection, initialize_database
@@ -0,0 +1,233 @@
+"""Work-in-progress limits and backpressure for the PrismQ.T state machine.
+
+Stories flow through four groups of states. Upstream generation stages
+(02 Story.From.Idea, 03 Title.From.Idea, 04 Content.From.Idea.Title) are
+gated by the group they feed and every group after it: when one of those
+groups holds more stories than its WIP limit, the upstream stages pause
+instead of spending GPU time on content that will wait days for review. A
+stage's own input queue is left out of its group's depth (stage 03 reads
+Title.From.Idea, which is in the generation group), so a stage is never held
+back by the backlog only it can drain.
+
+Groups (in pipeline order):
+    generation - Title.From.Idea, Content.From.Idea.Title          (steps 03-04)
+    review     - initial review cycle and refinement loop          (steps 05-10)
+    quality    - grammar/tone/content/consistency/editing/readability (11-17)
+    expert     - external story review and polish                  (steps 18-19)
+
+Limits come from ``PRISMQ_WIP_LIMIT_<GROUP>`` environment variables
+(e.g. ``PRISMQ_WIP_LIMIT_REVIEW=200``); ``0`` disables a limit. A paused
+group resumes once its depth falls to ``resume_ratio`` of the limit, so
+stages do not flap on and off around the threshold.
+
+Usage:
+    >>> gate = BackpressureGate()
+    >>> gate.refresh(conn)               # one GROUP BY query
+    >>> if gate.is_paused(4):
+    ...     print(gate.describe(4))      # "review 214/200"
+    >>> gate.paused_stages()             # {2: "review 214/200", 3: ..., 4: ...}
+"""
+
+import os
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from Model import StateNames
+
+# Default WIP limits per group (stories); override via PRISMQ_WIP_LIMIT_<GROUP>
+DEFAULT_WIP_LIMITS: Dict[str, int] = {
+    "generation": 100,
+    "review": 200,
+    "quality": 300,
+    "expert": 100,
+}
+
+# Fraction of the limit a paused group must drain to before upstream resumes
+DEFAULT_RESUME_RATIO = 0.9
+
+_GROUP_STATES: List[Tuple[str, Tuple[str, ...]]] = [
+    ("generation", (
+        StateNames.TITLE_FROM_IDEA,
+        StateNames.CONTENT_FROM_IDEA_TITLE,
+    )),
+    ("review", (
+        StateNames.REVIEW_TITLE_FROM_CONTENT_IDEA,
+        StateNames.REVIEW_CONTENT_FROM_TITLE_IDEA,
+        StateNames.REVIEW_TITLE_FROM_CONTENT,
+        StateNames.TITLE_FROM_TITLE_REVIEW_CONTENT,
+        StateNames.CONTENT_FROM_TITLE_CONTENT_REVIEW,
+        StateNames.CONTENT_FROM_CONTENT_REVIEW_TITLE,
+        StateNames.CONTENT_FROM_TITLE_REVIEW_CONTENT,
+        StateNames.TITLE_FROM_CONTENT_REVIEW_TITLE,
+        StateNames.REVIEW_CONTENT_FROM_TITLE,
+    )),
+    ("quality", tuple(StateNames.get_quality_review_states())),
+    ("expert", (
+        StateNames.STORY_REVIEW,
+        StateNames.STORY_REVIEW_GPT_PENDING,
+        StateNames.STORY_REVIEW_CLAUDE_PENDING,
+        StateNames.STORY_REVIEW_MANUAL_PENDING,
+        StateNames.STORY_POLISH,
+        StateNames.STORY_POLISH_GPT_PENDING,
+        StateNames.STORY_POLISH_CLAUDE_PENDING,
+        StateNames.STORY_POLISH_MANUAL_PENDING,
+    )),
+]
+
+# Upstream stage -> first group (by name) that gates it; all later groups gate it too
+GATED_STAGES: Dict[int, str] = {
+    2: "generation",
+    3: "generation",
+    4: "review",
+}
+
+# Input state of each gated stage; not counted against the stage's own gate
+STAGE_INPUT_STATES: Dict[int, str] = {
+    3: StateNames.TITLE_FROM_IDEA,
+    4: StateNames.CONTENT_FROM_IDEA_TITLE,
+}
+
+
+@dataclass(frozen=True)
+class WipGroup:
+    """A named group of Story states sharing one WIP limit."""
+
+    name: str
+    states: Tuple[str, ...]
+    limit: Optional[int] = None
+
+
+@dataclass
+class GroupPressure:
+    """Current load of one WIP group."""
+
+    name: str
+    depth: int
+    limit: Optional[int]
+    paused: bool = False
+
+    @property
+    def ratio(self) -> float:
+        """Depth as a fraction of the limit (0.0 when unlimited)."""
+        if not self.limit:
+            return 0.0
+        return self.depth / self.limit
+
+
+def load_wip_groups(limits: Optional[Mapping[str, Optional[int]]] = None) -> List[WipGroup]:
+    """Build the WIP groups with limits from arguments, environment or defaults.
+
+    Args:
+        limits: Explicit limits by group name; take precedence over the
+            environment. ``None`` or ``0`` means unlimited.
+
+    Returns:
+        Groups in pipeline order.
+    """
+    groups = []
+    for name, states in _GROUP_STATES:
+        if limits is not None and name in limits:
+            limit = limits[name]
+        else:
+            limit = int(os.getenv(f"PRISMQ_WIP_LIMIT_{name.upper()}", DEFAULT_WIP_LIMITS[name]))
+        groups.append(WipGroup(name=name, states=states, limit=limit or None))
+    return groups
+
+
+def count_states(conn: sqlite3.Connection) -> Dict[str, int]:
+    """Return the number of stories per state with a single query."""
+    return {
+        row[0]: row[1]
+        for row in conn.execute("SELECT state, COUNT(*) FROM Story GROUP BY state")
+    }
+
+
+class BackpressureGate:
+    """Decides whether upstream stages may start new work.
+
+    The gate is fed either by the pipeline runner's per-tick state counts
+    (:meth:`update`) or directly from the database (:meth:`refresh`).
+
+    Attributes:
+        groups: WIP groups in pipeline order.
+        resume_ratio: Fraction of the limit a paused group must drain to.
+    """
+
+    def __init__(
+        self,
+        groups: Optional[List[WipGroup]] = None,
+        resume_ratio: float = DEFAULT_RESUME_RATIO,
+        gated_stages: Optional[Mapping[int, str]] = None,
+    ):
+        self.groups = groups if groups is not None else load_wip_groups()
+        self.resume_ratio = resume_ratio
+        self.gated_stages = dict(gated_stages if gated_stages is not None else GATED_STAGES)
+        self._pressure: Dict[str, GroupPressure] = {
+            group.name: GroupPressure(group.name, 0, group.limit) for group in self.groups
+        }
+        # (stage, group) -> pressure without the stage's own input state
+        self._stage_pressure: Dict[Tuple[int, str], GroupPressure] = {}
+
+    def update(self, state_counts: Mapping[str, int]) -> Dict[str, GroupPressure]:
+        """Recompute group pressure from per-state story counts."""
+        for group in self.groups:
+            depth = sum(state_counts.get(state, 0) for state in group.states)
+            self._apply(self._pressure[group.name], group, depth)
+            for stage in self.gated_stages:
+                own = STAGE_INPUT_STATES.get(stage)
+                if own not in group.states:
+                    continue
+                current = self._stage_pressure.setdefault(
+                    (stage, group.name), GroupPressure(group.name, 0, group.limit)
+                )
+                self._apply(current, group, depth - state_counts.get(own, 0))
+        return self.pressure
+
+    def _apply(self, current: GroupPressure, group: WipGroup, depth: int) -> None:
+        """Set depth and paused flag, with hysteresis around the limit."""
+        current.depth = depth
+        if not group.limit:
+            current.paused = False
+        elif current.paused:
+            current.paused = depth > group.limit * self.resume_ratio
+        else:
+            current.paused = depth >= group.limit
+
+    def refresh(self, conn: sqlite3.Connection) -> Dict[str, GroupPressure]:
+        """Recompute group pressure from the Story table."""
+        return self.update(count_states(conn))
+
+    @property
+    def pressure(self) -> Dict[str, GroupPressure]:
+        """Current pressure per group, in pipeline order."""
+        return dict(self._pressure)
+
+    def blocking_groups(self, stage: int) -> List[GroupPressure]:
+        """Return the paused downstream groups that hold back ``stage``."""
+        first = self.gated_stages.get(stage)
+        if first is None:
+            return []
+        names = [group.name for group in self.groups]
+        if first not in names:
+            return []
+        pressures = [
+            self._stage_pressure.get((stage, name), self._pressure[name])
+            for name in names[names.index(first):]
+        ]
+        return [pressure for pressure in pressures if pressure.paused]
+
+    def is_paused(self, stage: int) -> bool:
+        """True when ``stage`` must not start new work."""
+        return bool(self.blocking_groups(stage))
+
+    def describe(self, stage: int) -> str:
+        """Human-readable reason why ``stage`` is paused (empty when not)."""
+        return ", ".join(
+            f"{p.name} {p.depth}/{p.limit}" for p in self.blocking_groups(stage)
+        )
+
+    def paused_stages(self, stages: Optional[Iterable[int]] = None) -> Dict[int, str]:
+        """Return the paused stages (default: every gated stage) with the reason."""
+        numbers = sorted(self.gated_stages) if stages is None else stages
+        return {stage: self.describe(stage) for stage in numbers if self.is_paused(stage)}
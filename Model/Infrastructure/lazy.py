@@ -0,0 +1,77 @@
+"""Deferred imports for heavy optional dependencies and package re-exports.
+
+Stage workflows are short-lived processes that are restarted often, and most
+of them only need sqlite3 and requests. Modules that use nltk, scikit-learn
+or scipy for one feature, and package ``__init__`` files that re-export many
+submodules, should not make every entry point pay for those imports.
+
+    lazy_module   - a module object whose import runs on first attribute
+                    access (``nltk = lazy_module("nltk")``)
+    lazy_exports  - module-level ``__getattr__`` / ``__dir__`` for a package
+                    ``__init__`` that re-exports names from submodules
+
+Example:
+    >>> from Model.Infrastructure.lazy import lazy_exports
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {
+    ...     "PipelineRunner": ".runner",
+    ...     "simulate": ".simulator",
+    ... })
+"""
+
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_module(name: str) -> ModuleType:
+    """Return module ``name`` without executing it until an attribute is used.
+
+    A module that is already imported is returned as is.
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed (checked now, so
+            optional-dependency guards keep working).
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for a package's re-exports.
+
+    Args:
+        package: ``__name__`` of the package.
+        exports: Exported name -> submodule (relative, e.g. ``.runner``).
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign at module level. Each name is
+        imported on first access and then cached in the package namespace.
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        try:
+            submodule = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(submodule, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
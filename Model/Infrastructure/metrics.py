@@ -0,0 +1,504 @@
+"""PrismQ Metrics Module - counters and histograms in Prometheus/OpenMetrics format.
+
+Dependency-free instrumentation for the PrismQ.T pipeline. Stage services
+observe their Ollama calls; the pipeline runner observes finished jobs, queue
+depths and its database queries. The runner serves the registry over HTTP
+(``/metrics``); standalone workflows write it as a node_exporter
+textfile-collector file instead.
+
+Metrics:
+    prismq_stories_processed_total{stage, result}      pass / fail / done / error
+    prismq_stage_duration_seconds{stage}               histogram
+    prismq_llm_requests_total{model, status}           ok / error
+    prismq_llm_request_duration_seconds{model}         histogram
+    prismq_llm_tokens_total{model, kind}               prompt / completion
+    prismq_llm_tokens_per_second{model}                histogram (eval_count / eval_duration)
+    prismq_db_query_duration_seconds{query}            histogram
+    prismq_queue_depth{stage}                          gauge
+
+Usage:
+    >>> from Model.Infrastructure.metrics import observe_llm_call
+    >>> with observe_llm_call("qwen3:14b") as call:
+    ...     response = requests.post(url, json=payload, timeout=120)
+    ...     data = call.record(response.json())
+    >>>
+    >>> server = start_metrics_server(9464)        # pipeline runner
+    >>> write_textfile("C:/metrics/prismq_11.prom")  # standalone workflow
+
+Environment:
+    PRISMQ_METRICS_TEXTFILE_DIR  directory for textfile-collector output of
+                                 standalone workflows (unset = disabled)
+"""
+
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from Model.Infrastructure.tracing import add_span
+
+if TYPE_CHECKING:  # http.server is only imported when a server is started
+    from http.server import ThreadingHTTPServer
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers quick reviews through long content generation
+DURATION_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+TOKENS_PER_SECOND_BUCKETS = (1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 50.0, 75.0, 100.0, 150.0, 250.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class: one metric family with a fixed set of label names."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Mapping[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """Return ``(suffix, label string, value)`` for the exposition."""
+        raise NotImplementedError
+
+    def render(self, openmetrics: bool, extra_labels: str = "") -> List[str]:
+        family = self.name
+        if self.kind == "counter" and not openmetrics:
+            family += "_total"
+        lines = [f"# HELP {family} {self.documentation}", f"# TYPE {family} {self.kind}"]
+        for suffix, labels, value in self.samples():
+            if extra_labels:
+                labels = labels[:-1] + "," + extra_labels + "}" if labels else "{" + extra_labels + "}"
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count (exposed as ``<name>_total``)."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [("_total", _format_labels(self.labelnames, key), value) for key, value in items]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [("", _format_labels(self.labelnames, key), value) for key, value in items]
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed upper bounds."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # label values -> [bucket counts..., sum, count]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe the duration of the ``with`` block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: Any) -> int:
+        state = self._values.get(self._key(labels))
+        return int(state[-1]) if state else 0
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+        result = []
+        for key, state in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                result.append(("_bucket", _format_labels(self.labelnames, key, le), cumulative))
+            labels = _format_labels(self.labelnames, key)
+            result.append(("_count", labels, state[-1]))
+            result.append(("_sum", labels, state[-2]))
+        return result
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self, openmetrics: bool = False, extra_labels: Optional[Mapping[str, str]] = None) -> str:
+        """Render all metrics.
+
+        Args:
+            openmetrics: OpenMetrics 1.0 instead of the Prometheus 0.0.4 text format.
+            extra_labels: Labels added to every sample (e.g. the workflow that
+                wrote a textfile, so files from several processes do not clash).
+        """
+        extra = ",".join(
+            f'{name}="{_escape(str(value))}"' for name, value in sorted((extra_labels or {}).items())
+        )
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render(openmetrics, extra))
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STORIES_PROCESSED = REGISTRY.counter(
+    "prismq_stories_processed", "Stories processed by a pipeline stage", ["stage", "result"]
+)
+STAGE_DURATION = REGISTRY.histogram(
+    "prismq_stage_duration_seconds", "Time to process one story", ["stage"]
+)
+LLM_REQUESTS = REGISTRY.counter(
+    "prismq_llm_requests", "Ollama generate requests", ["model", "status"]
+)
+LLM_LATENCY = REGISTRY.histogram(
+    "prismq_llm_request_duration_seconds", "Ollama request latency", ["model"]
+)
+LLM_TOKENS = REGISTRY.counter(
+    "prismq_llm_tokens", "Tokens evaluated by Ollama", ["model", "kind"]
+)
+LLM_TOKENS_PER_SECOND = REGISTRY.histogram(
+    "prismq_llm_tokens_per_second", "Ollama generation speed (eval_count / eval_duration)",
+    ["model"], buckets=TOKENS_PER_SECOND_BUCKETS,
+)
+DB_QUERY_DURATION = REGISTRY.histogram(
+    "prismq_db_query_duration_seconds", "Database query time", ["query"], buckets=DB_BUCKETS
+)
+QUEUE_DEPTH = REGISTRY.gauge("prismq_queue_depth", "Stories waiting for a stage", ["stage"])
+
+
+# =============================================================================
+# Recording helpers
+# =============================================================================
+
+
+class LlmCall:
+    """Handle returned by :func:`observe_llm_call`."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.data: Optional[Mapping[str, Any]] = None
+
+    def record(self, data: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Keep the Ollama response for token statistics; returns it unchanged."""
+        self.data = data
+        return data
+
+
+def record_llm_call(
+    model: str, seconds: float, data: Optional[Mapping[str, Any]] = None, ok: bool = True
+) -> None:
+    """Record one finished Ollama request.
+
+    Token counters use ``prompt_eval_count``, ``eval_count`` and
+    ``eval_duration`` (nanoseconds) from the response body ``data``. The
+    request is also added as an ``llm`` span to the active trace.
+    """
+    LLM_LATENCY.observe(seconds, model=model)
+    LLM_REQUESTS.inc(model=model, status="ok" if ok else "error")
+    if not ok or not data:
+        add_span("llm", seconds, "ok" if ok else "error", model=model)
+        return
+    prompt_tokens = data.get("prompt_eval_count") or 0
+    completion_tokens = data.get("eval_count") or 0
+    add_span(
+        "llm", seconds, model=model,
+        prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+    )
+    if prompt_tokens:
+        LLM_TOKENS.inc(prompt_tokens, model=model, kind="prompt")
+    if completion_tokens:
+        LLM_TOKENS.inc(completion_tokens, model=model, kind="completion")
+        eval_seconds = (data.get("eval_duration") or 0) / 1e9
+        if eval_seconds > 0:
+            LLM_TOKENS_PER_SECOND.observe(completion_tokens / eval_seconds, model=model)
+
+
+@contextmanager
+def observe_llm_call(model: str) -> Iterator[LlmCall]:
+    """Time an Ollama request; any exception inside the block counts as an error.
+
+    Pass the response body to :meth:`LlmCall.record` for token statistics.
+    """
+    call = LlmCall(model)
+    started = time.perf_counter()
+    try:
+        yield call
+    except BaseException:
+        record_llm_call(model, time.perf_counter() - started, ok=False)
+        raise
+    record_llm_call(model, time.perf_counter() - started, call.data)
+
+
+def record_stage_result(
+    stage: str,
+    success: bool,
+    passes: Optional[bool] = None,
+    duration: Optional[float] = None,
+) -> None:
+    """Count one processed story (``stage`` is the two-digit step number)."""
+    if not success:
+        result = "error"
+    elif passes is None:
+        result = "done"
+    else:
+        result = "pass" if passes else "fail"
+    STORIES_PROCESSED.inc(stage=stage, result=result)
+    if duration is not None:
+        STAGE_DURATION.observe(duration, stage=stage)
+
+
+def record_service_result(stage: str, result: Any, duration: Optional[float] = None) -> None:
+    """Count a stage service result (``process_oldest_story()`` return value).
+
+    Results without a ``story_id`` (nothing to process) are ignored. Services
+    name the verdict ``passes`` or ``accepted``.
+    """
+    if result is None or getattr(result, "story_id", None) is None:
+        return
+    passes = getattr(result, "passes", None)
+    if passes is None:
+        passes = getattr(result, "accepted", None)
+    record_stage_result(stage, bool(getattr(result, "success", True)), passes, duration)
+
+
+# =============================================================================
+# Export
+# =============================================================================
+
+
+def write_textfile(path: str, registry: MetricsRegistry = REGISTRY,
+                   extra_labels: Optional[Mapping[str, str]] = None) -> None:
+    """Write the registry for node_exporter's textfile collector (atomic replace)."""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        handle.write(registry.render(extra_labels=extra_labels))
+    os.replace(temp_path, path)
+
+
+class TextfileExporter:
+    """Periodic textfile-collector output for a standalone workflow.
+
+    Enabled when ``PRISMQ_METRICS_TEXTFILE_DIR`` is set; writes
+    ``prismq_<worker>.prom`` at most every ``interval`` seconds.
+    """
+
+    def __init__(self, worker: str, directory: Optional[str] = None, interval: float = 15.0):
+        self.worker = worker
+        self.directory = directory if directory is not None else os.getenv("PRISMQ_METRICS_TEXTFILE_DIR")
+        self.interval = interval
+        self._last_write = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory)
+
+    @property
+    def path(self) -> Optional[str]:
+        if not self.directory:
+            return None
+        return os.path.join(self.directory, f"prismq_{self.worker}.prom")
+
+    def maybe_write(self, force: bool = False) -> bool:
+        """Write the file if enabled and due; return True when written."""
+        if not self.enabled:
+            return False
+        now = time.monotonic()
+        if not force and now - self._last_write < self.interval:
+            return False
+        try:
+            write_textfile(self.path, extra_labels={"worker": self.worker})
+        except OSError:
+            return False
+        self._last_write = now
+        return True
+
+
+class _MetricsHandler:
+    """Request handling mixed into ``BaseHTTPRequestHandler`` by :func:`start_metrics_server`."""
+
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+        body = self.registry.render(openmetrics=openmetrics).encode("utf-8")
+        self.send_response(200)
+        self.send_header(
+            "Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE
+        )
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(
+    port: int, host: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY
+) -> "ThreadingHTTPServer":
+    """Serve ``/metrics`` from a daemon thread; call ``shutdown()`` to stop.
+
+    Raises:
+        OSError: If the port is already in use.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    handler = type(
+        "MetricsHandler", (_MetricsHandler, BaseHTTPRequestHandler), {"registry": registry}
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="prismq-metrics", daemon=True)
+    thread.start()
+    return server
+
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "REGISTRY",
+    "STORIES_PROCESSED",
+    "STAGE_DURATION",
+    "LLM_REQUESTS",
+    "LLM_LATENCY",
+    "LLM_TOKENS",
+    "LLM_TOKENS_PER_SECOND",
+    "DB_QUERY_DURATION",
+    "QUEUE_DEPTH",
+    "LlmCall",
+    "record_llm_call",
+    "observe_llm_call",
+    "record_stage_result",
+    "record_service_result",
+    "write_textfile",
+    "TextfileExporter",
+    "start_metrics_server",
+]
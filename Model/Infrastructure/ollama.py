@@ -0,0 +1,126 @@
+"""PrismQ Ollama Module - the instrumented Ollama call shared by the stage services.
+
+Stages 05-17 all send one non-streaming ``/api/generate`` request per story.
+:func:`generate` makes that request: it checks that Ollama is up, records
+latency and token usage through
+:func:`~Model.Infrastructure.metrics.observe_llm_call` (which also adds the
+``llm`` span) and strips Qwen3 ``<think>`` blocks from the reply.
+
+The review stages score a story from a prompt template. :func:`run_review`
+wraps :func:`generate` in the ``prompt`` and ``parse`` spans and returns
+``(feedback, score)`` from the JSON verdict.
+
+Usage:
+    >>> text = generate("qwen3:14b", prompt, temperature=0.7, max_tokens=2000, timeout=180)
+    >>> feedback, score = run_review(
+    ...     "qwen3:14b", _PROMPTS_DIR / "review_grammar.txt",
+    ...     {"title_text": title, "content_text": content},
+    ...     default_feedback="AI grammar review completed.",
+    ...     temperature=0.3, max_tokens=400, timeout=120,
+    ... )
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Mapping, Tuple
+
+from Model.Infrastructure.metrics import observe_llm_call
+from Model.Infrastructure.tracing import span
+
+OLLAMA_URL = "http://localhost:11434"
+DEFAULT_NUM_CTX = 4096
+
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def generate(
+    model: str,
+    prompt: str,
+    *,
+    temperature: float,
+    max_tokens: int,
+    timeout: float,
+    num_ctx: int = DEFAULT_NUM_CTX,
+) -> str:
+    """Run one prompt on the local Ollama server and return the reply text.
+
+    Raises:
+        RuntimeError: ``requests`` is missing, Ollama is not reachable or the
+            request failed.
+    """
+    try:
+        import requests
+    except ImportError as exc:
+        raise RuntimeError("requests library not available; run: pip install requests") from exc
+
+    try:
+        check = requests.get(f"{OLLAMA_URL}/api/tags", timeout=5)
+        if check.status_code != 200:
+            raise RuntimeError(f"Ollama not available (status {check.status_code})")
+    except requests.exceptions.RequestException as exc:
+        raise RuntimeError(f"Ollama not reachable: {exc}") from exc
+
+    try:
+        with observe_llm_call(model) as call:
+            response = requests.post(
+                f"{OLLAMA_URL}/api/generate",
+                json={
+                    "model": model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "think": False,
+                    "options": {
+                        "temperature": temperature,
+                        "num_predict": max_tokens,
+                        "num_ctx": num_ctx,
+                    },
+                },
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            raw = call.record(response.json()).get("response", "")
+    except requests.exceptions.RequestException as exc:
+        raise RuntimeError(f"Ollama API call failed: {exc}") from exc
+
+    return _THINK_RE.sub("", raw).strip()
+
+
+def parse_review(raw: str, default_feedback: str) -> Tuple[str, int]:
+    """Read ``(feedback, score)`` from a JSON review verdict; score is clamped to 0-100.
+
+    Raises:
+        ValueError: The reply contains no JSON object.
+    """
+    match = _JSON_RE.search(raw)
+    if not match:
+        raise ValueError(f"No JSON in AI response: {raw[:200]}")
+    data = json.loads(match.group())
+    score = max(0, min(100, int(data.get("overall_score", 50))))
+    feedback = str(data.get("feedback", default_feedback))
+    return feedback, score
+
+
+def run_review(
+    model: str,
+    template: Path,
+    fields: Mapping[str, Any],
+    *,
+    default_feedback: str,
+    temperature: float,
+    max_tokens: int,
+    timeout: float,
+) -> Tuple[str, int]:
+    """Fill ``template`` with ``fields``, run it and parse the verdict.
+
+    Returns:
+        ``(feedback, score)`` as parsed by :func:`parse_review`.
+    """
+    with span("prompt"):
+        prompt = template.read_text(encoding="utf-8").format(**fields)
+    raw = generate(
+        model, prompt, temperature=temperature, max_tokens=max_tokens, timeout=timeout
+    )
+    with span("parse"):
+        return parse_review(raw, default_feedback)
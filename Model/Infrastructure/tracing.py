@@ -0,0 +1,424 @@
+"""PrismQ Tracing Module - per-story span tracing across pipeline stages.
+
+Every stage run of a story is a root span; the work inside it (database
+fetch, prompt build, LLM call, parse, commit) are child spans. All spans of
+a story share one trace id derived from the story id, so the runs of all
+stages - in the pipeline runner or in standalone workflows, days apart -
+form a single trace.
+
+Finished span trees are appended to ``<worker>.jsonl`` in
+``PRISMQ_TRACE_DIR`` and, optionally, sent to an OpenTelemetry collector as
+OTLP/HTTP JSON (``PRISMQ_TRACE_OTLP_ENDPOINT``). Without either, tracing is
+disabled and :func:`span` costs a context-variable lookup.
+
+Usage:
+    >>> configure_tracing("stage_11")
+    >>> result = trace_stage("11", service.process_oldest_story)
+    >>>
+    >>> # inside the service
+    >>> with span("fetch"):
+    ...     row = self._fetch_story()
+    >>>
+    >>> @traced("commit")
+    ... def _save_review(self, row, feedback, score): ...
+
+Render traces with ``python -m T.Pipeline.src.traces``.
+"""
+
+import contextvars
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_OTLP_PATH = "/v1/traces"
+OTLP_TIMEOUT = 2.0
+
+
+def story_trace_id(story_id: int) -> str:
+    """Deterministic 128-bit trace id (32 hex chars) shared by all spans of a story."""
+    return hashlib.md5(f"prismq-story-{story_id}".encode("utf-8")).hexdigest()
+
+
+def _new_span_id() -> str:
+    return os.urandom(8).hex()
+
+
+@dataclass
+class Span:
+    """One timed operation.
+
+    Attributes:
+        name: Operation name (``stage 11``, ``fetch``, ``llm``, ...).
+        span_id: 64-bit id (16 hex chars).
+        parent_id: Parent span id; None for a stage (root) span.
+        start / end: Unix timestamps.
+        story_id: Story the work belongs to (set on the root span).
+        status: ``ok`` or ``error``.
+        attributes: Extra key/value pairs (stage, model, tokens, ...).
+    """
+
+    name: str
+    span_id: str = field(default_factory=_new_span_id)
+    parent_id: Optional[str] = None
+    start: float = field(default_factory=time.time)
+    end: Optional[float] = None
+    story_id: Optional[int] = None
+    trace_id: Optional[str] = None
+    status: str = "ok"
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    worker: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.time()) - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "story_id": self.story_id,
+            "start": self.start,
+            "end": self.end,
+            "duration": self.duration,
+            "status": self.status,
+            "attributes": self.attributes,
+            "worker": self.worker,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Span":
+        return cls(
+            name=data["name"],
+            span_id=data["span_id"],
+            parent_id=data.get("parent_id"),
+            start=data["start"],
+            end=data.get("end"),
+            story_id=data.get("story_id"),
+            trace_id=data.get("trace_id"),
+            status=data.get("status", "ok"),
+            attributes=data.get("attributes") or {},
+            worker=data.get("worker"),
+        )
+
+
+class _Trace:
+    """Spans of one root span, exported together when the root ends."""
+
+    def __init__(self, root: Span):
+        self.root = root
+        self.spans: List[Span] = []
+        self.discarded = False
+
+
+class JsonlSpanStore:
+    """Append-only JSONL file, one span per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        lines = "".join(json.dumps(s.to_dict(), separators=(",", ":")) + "\n" for s in spans)
+        with self._lock:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(lines)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: List[Span], service_name: str = "prismq") -> Dict[str, Any]:
+    """Convert spans to an OTLP/JSON ``ExportTraceServiceRequest``."""
+    otlp_spans = []
+    for s in spans:
+        attributes = dict(s.attributes)
+        if s.story_id is not None:
+            attributes["prismq.story_id"] = s.story_id
+        item = {
+            "traceId": s.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": 1,
+            "startTimeUnixNano": str(int(s.start * 1e9)),
+            "endTimeUnixNano": str(int((s.end or s.start) * 1e9)),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()],
+            "status": {"code": 2 if s.status == "error" else 1},
+        }
+        if s.parent_id:
+            item["parentSpanId"] = s.parent_id
+        otlp_spans.append(item)
+    resource = [{"key": "service.name", "value": {"stringValue": service_name}}]
+    if spans and spans[0].worker:
+        resource.append({"key": "service.instance.id", "value": {"stringValue": spans[0].worker}})
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": resource},
+                "scopeSpans": [{"scope": {"name": "prismq"}, "spans": otlp_spans}],
+            }
+        ]
+    }
+
+
+class OtlpHttpExporter:
+    """Send span trees to an OTLP/HTTP collector (JSON encoding).
+
+    Failures are logged and the spans dropped; tracing never fails a stage.
+    """
+
+    def __init__(self, endpoint: str, timeout: float = OTLP_TIMEOUT):
+        endpoint = endpoint.rstrip("/")
+        if not endpoint.endswith(DEFAULT_OTLP_PATH):
+            endpoint += DEFAULT_OTLP_PATH
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def export(self, spans: List[Span]) -> None:
+        import urllib.request
+
+        body = json.dumps(to_otlp(spans)).encode("utf-8")
+        request = urllib.request.Request(
+            self.endpoint, data=body, headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except Exception as e:
+            logger.debug(f"OTLP export to {self.endpoint} failed: {e}")
+
+
+class Tracer:
+    """Creates spans and hands finished span trees to the exporters."""
+
+    def __init__(self, worker: str = "prismq", exporters: Optional[List[Any]] = None):
+        self.worker = worker
+        self.exporters: List[Any] = list(exporters or [])
+        self._current: contextvars.ContextVar = contextvars.ContextVar(
+            f"prismq_span_{id(self)}", default=None
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.exporters)
+
+    def current_span(self) -> Optional[Span]:
+        active = self._current.get()
+        return active[0] if active else None
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """Time the ``with`` block as a child of the active span (or a new root).
+
+        Yields None when tracing is disabled.
+        """
+        if not self.enabled:
+            yield None
+            return
+        parent = self._current.get()
+        new = Span(name=name, attributes=attributes, worker=self.worker)
+        if parent is None:
+            trace = _Trace(new)
+        else:
+            new.parent_id = parent[0].span_id
+            trace = parent[1]
+        token = self._current.set((new, trace))
+        try:
+            yield new
+        except BaseException as e:
+            new.status = "error"
+            new.set_attribute("error", f"{type(e).__name__}: {e}"[:500])
+            raise
+        finally:
+            new.end = time.time()
+            self._current.reset(token)
+            trace.spans.append(new)
+            if parent is None:
+                self._finish(trace)
+
+    def add_span(self, name: str, duration: float, status: str = "ok", **attributes: Any) -> None:
+        """Record an already finished operation that ended now (child of the active span)."""
+        active = self._current.get()
+        if not self.enabled or active is None:
+            return
+        end = time.time()
+        active[1].spans.append(
+            Span(
+                name=name,
+                parent_id=active[0].span_id,
+                start=end - duration,
+                end=end,
+                status=status,
+                attributes=attributes,
+                worker=self.worker,
+            )
+        )
+
+    def discard(self) -> None:
+        """Drop the active trace (e.g. a poll that found no story)."""
+        active = self._current.get()
+        if active is not None:
+            active[1].discarded = True
+
+    def _finish(self, trace: _Trace) -> None:
+        root = trace.root
+        if trace.discarded or root.story_id is None:
+            return
+        trace_id = story_trace_id(root.story_id)
+        for s in trace.spans:
+            s.trace_id = trace_id
+            s.story_id = root.story_id
+        # Root first, children in start order
+        spans = [root] + sorted((s for s in trace.spans if s is not root), key=lambda s: s.start)
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans)
+            except Exception as e:
+                logger.warning(f"Trace export failed: {e}")
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def configure_tracing(
+    worker: str,
+    directory: Optional[str] = None,
+    otlp_endpoint: Optional[str] = None,
+) -> Tracer:
+    """Set up the process-wide tracer.
+
+    Args:
+        worker: Name of this process (``pipeline``, ``stage_11``); the JSONL
+            file is ``<directory>/<worker>.jsonl``.
+        directory: Trace directory (default: ``PRISMQ_TRACE_DIR``).
+        otlp_endpoint: Collector URL, e.g. ``http://localhost:4318``
+            (default: ``PRISMQ_TRACE_OTLP_ENDPOINT``).
+
+    Returns:
+        The tracer; disabled when neither a directory nor an endpoint is set.
+    """
+    global _tracer
+    directory = directory if directory is not None else os.getenv("PRISMQ_TRACE_DIR")
+    otlp_endpoint = (
+        otlp_endpoint if otlp_endpoint is not None else os.getenv("PRISMQ_TRACE_OTLP_ENDPOINT")
+    )
+    exporters: List[Any] = []
+    if directory:
+        exporters.append(JsonlSpanStore(os.path.join(directory, f"{worker}.jsonl")))
+    if otlp_endpoint:
+        exporters.append(OtlpHttpExporter(otlp_endpoint))
+    _tracer = Tracer(worker, exporters)
+    return _tracer
+
+
+def span(name: str, **attributes: Any):
+    """Context manager for a span on the process-wide tracer."""
+    return _tracer.span(name, **attributes)
+
+
+def add_span(name: str, duration: float, status: str = "ok", **attributes: Any) -> None:
+    """Record a finished child span on the process-wide tracer."""
+    _tracer.add_span(name, duration, status, **attributes)
+
+
+def traced(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator: run the function inside a :func:`span` called ``name``."""
+
+    def decorate(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            with _tracer.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def trace_stage(stage: str, process: Callable[[], T]) -> T:
+    """Run one stage job inside a root span keyed by the processed story.
+
+    ``process`` returns a stage result with ``story_id`` (a service result or
+    :class:`StageOutcome`). Polls that found no story are not recorded.
+    """
+    tracer = _tracer
+    if not tracer.enabled:
+        return process()
+    with tracer.span(f"stage {stage}", stage=stage) as root:
+        result = process()
+        story_id = getattr(result, "story_id", None)
+        if story_id is None:
+            tracer.discard()
+            return result
+        root.story_id = story_id
+        if getattr(result, "success", True) is False:
+            root.status = "error"
+            error = getattr(result, "error", None)
+            if error:
+                root.set_attribute("error", str(error)[:500])
+        for name in ("passes", "accepted", "next_state"):
+            value = getattr(result, name, None)
+            if value is not None:
+                root.set_attribute(name, value)
+    return result
+
+
+def load_spans(directory: str) -> List[Span]:
+    """Read all spans from the ``*.jsonl`` files in ``directory``."""
+    spans: List[Span] = []
+    for path in sorted(Path(directory).glob("*.jsonl")):
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    spans.append(Span.from_dict(json.loads(line)))
+                except (ValueError, KeyError):
+                    # Partially written last line of a running worker
+                    continue
+    return spans
+
+
+__all__ = [
+    "Span",
+    "Tracer",
+    "JsonlSpanStore",
+    "OtlpHttpExporter",
+    "to_otlp",
+    "story_trace_id",
+    "get_tracer",
+    "configure_tracing",
+    "span",
+    "add_span",
+    "trace_stage",
+    "load_spans",
+]
@@ -0,0 +1,46 @@
+"""PrismQ Workflow Module - tracing and metrics for standalone stage workflows.
+
+Each ``*_workflow.py`` polls its stage service in a loop. :class:`StageTelemetry`
+runs one poll inside a ``stage NN`` root span and counts the result in the
+stage metrics, so the workflows share a single setup.
+
+Tracing (``PRISMQ_TRACE_DIR`` / ``PRISMQ_TRACE_OTLP_ENDPOINT``) and the
+metrics textfile (``PRISMQ_METRICS_TEXTFILE_DIR``) are enabled independently.
+
+Usage:
+    >>> telemetry = StageTelemetry("11")
+    >>> while True:
+    ...     result = telemetry.run(service.process_oldest_story)
+"""
+
+import time
+from typing import Callable, Optional, TypeVar
+
+from Model.Infrastructure.metrics import TextfileExporter, record_service_result
+from Model.Infrastructure.tracing import configure_tracing, trace_stage
+
+T = TypeVar("T")
+
+
+class StageTelemetry:
+    """Tracing and metrics for one standalone workflow process.
+
+    Args:
+        stage: Two-digit step number (``"04"`` ... ``"17"``).
+        worker: Process name for the trace and ``.prom`` files
+            (default: ``stage_<stage>``).
+    """
+
+    def __init__(self, stage: str, worker: Optional[str] = None):
+        self.stage = stage
+        self.worker = worker or f"stage_{stage}"
+        self.tracer = configure_tracing(self.worker)
+        self.exporter = TextfileExporter(self.worker)
+
+    def run(self, process: Callable[[], T]) -> T:
+        """Run one ``process_oldest_story`` call; returns its result unchanged."""
+        started = time.monotonic()
+        result = trace_stage(self.stage, process)
+        record_service_result(self.stage, result, time.monotonic() - started)
+        self.exporter.maybe_write()
+        return result
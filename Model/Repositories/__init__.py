@@ -9,6 +9,7 @@ Repositories:
     - ScriptRepository: Insert-only versioned Script persistence
     - ReviewRepository: Insert-only Review persistence
     - StoryReviewRepository: Story review linking table operations
+    - StoryRetryRepository: Retry backoff and dead-letter handling for stories
 
 Interfaces:
     - IRepository: Base repository interface (read + insert)
@@ -25,6 +26,11 @@ from Model.Repositories.story_repository import StoryRepository
 from Model.Repositories.title_repository import TitleRepository
 from Model.Repositories.script_repository import ScriptRepository
 from Model.Repositories.review_repository import ReviewRepository
+from Model.Repositories.story_retry_repository import (
+    RETRY_READY_SQL,
+    RetryPolicy,
+    StoryRetryRepository,
+)
 
 try:
     from Model.Repositories.story_review_repository import StoryReviewRepository
@@ -41,4 +47,7 @@ __all__ = [
     "ScriptRepository",
     "ReviewRepository",
     "StoryReviewRepository",
+    "StoryRetryRepository",
+    "RetryPolicy",
+    "RETRY_READY_SQL",
 ]
@@ -30,6 +30,7 @@ from datetime import datetime
 from Model.Repositories.base import IUpdatableRepository
 from Model.Entities.story import Story
 from Model.state import TransitionValidator
+from Model.Repositories.story_retry_repository import RETRY_READY_SQL
 from Model.Infrastructure.exceptions import (
     EntityNotFoundError,
     ForeignKeyViolationError,
@@ -253,6 +254,8 @@ class StoryRepository(IUpdatableRepository[Story, int]):
                     entity.id
                 )
             )
+            if current_state != new_state:
+                self._clear_retry(entity.id)
             self._conn.commit()
         except sqlite3.IntegrityError as e:
             raise map_sqlite_error(e, {
@@ -267,18 +270,21 @@ class StoryRepository(IUpdatableRepository[Story, int]):
     
     # === Custom Query Methods ===
     
-    def find_by_state(self, state: str) -> List[Story]:
+    def find_by_state(self, state: str, skip_backing_off: bool = False) -> List[Story]:
         """Find all stories in a specific state.
         
         Args:
             state: The state to filter by (e.g., 'IDEA', 'TITLE', 'SCRIPT').
+            skip_backing_off: Skip stories whose next retry is not due yet
+                (requires the StoryRetry table, see StoryRetryRepository).
             
         Returns:
             List of Story entities in the specified state.
         """
+        retry_filter = f"AND {RETRY_READY_SQL} " if skip_backing_off else ""
         cursor = self._conn.execute(
-            "SELECT id, idea_id, state, created_at, updated_at "
-            "FROM Story WHERE state = ? ORDER BY id",
+            "SELECT s.id, s.idea_id, s.state, s.created_at, s.updated_at "
+            f"FROM Story s WHERE s.state = ? {retry_filter}ORDER BY s.id",
             (state,)
         )
         return [self._row_to_model(row) for row in cursor.fetchall()]
@@ -342,7 +348,7 @@ class StoryRepository(IUpdatableRepository[Story, int]):
         )
         return [self._row_to_model(row) for row in cursor.fetchall()]
     
-    def find_oldest_by_state(self, state: str) -> Optional[Story]:
+    def find_oldest_by_state(self, state: str, skip_backing_off: bool = False) -> Optional[Story]:
         """Find the oldest story in a specific state.
         
         This method is useful for processing stories in FIFO order,
@@ -350,6 +356,8 @@ class StoryRepository(IUpdatableRepository[Story, int]):
         
         Args:
             state: The state to filter by (e.g., 'PrismQ.T.Script.From.Idea.Title').
+            skip_backing_off: Skip stories whose next retry is not due yet
+                (requires the StoryRetry table, see StoryRetryRepository).
             
         Returns:
             The oldest Story entity in the specified state, or None if no stories found.
@@ -360,9 +368,10 @@ class StoryRepository(IUpdatableRepository[Story, int]):
             >>> if story:
             ...     print(f"Processing story {story.id}")
         """
+        retry_filter = f"AND {RETRY_READY_SQL} " if skip_backing_off else ""
         cursor = self._conn.execute(
-            "SELECT id, idea_id, state, created_at, updated_at "
-            "FROM Story WHERE state = ? ORDER BY created_at ASC LIMIT 1",
+            "SELECT s.id, s.idea_id, s.state, s.created_at, s.updated_at "
+            f"FROM Story s WHERE s.state = ? {retry_filter}ORDER BY s.created_at ASC LIMIT 1",
             (state,)
         )
         row = cursor.fetchone()
@@ -481,6 +490,13 @@ class StoryRepository(IUpdatableRepository[Story, int]):
     
     # === Helper Methods ===
     
+    def _clear_retry(self, story_id: int) -> None:
+        """Reset failure bookkeeping after a state change (fresh retry budget)."""
+        try:
+            self._conn.execute("DELETE FROM StoryRetry WHERE story_id = ?", (story_id,))
+        except sqlite3.OperationalError:
+            pass  # StoryRetry table not created yet - nothing to reset
+
     def _get_module_type(self, state: str) -> str:
         """Determine the module type from the state pattern.
         
@@ -0,0 +1,294 @@
+"""StoryRetry Repository - bounded retry and dead-letter handling for stories.
+
+Stage services call :meth:`StoryRetryRepository.record_failure` when they fail
+to process a story. The story stays in its input state but is skipped until
+``next_attempt_at`` (exponential backoff), so one broken story no longer blocks
+the head of the queue. After ``max_attempts`` consecutive failures in the same
+state the story is moved to ``DEAD_LETTER_STATE`` and waits for a manual
+requeue (``python -m T.Pipeline.src.dead_letter``).
+
+A story whose output was rejected rather than failed (e.g. a near-duplicate
+title or content) is put back with :meth:`StoryRetryRepository.defer`: it is
+skipped for ``base_delay`` seconds like a failure, but no attempt is counted,
+so it is never dead-lettered for it.
+
+Stage queries honor the backoff by adding :data:`RETRY_READY_SQL` to their
+``WHERE`` clause (the Story table must be aliased as ``s``).
+
+Policy (environment overrides):
+    PRISMQ_RETRY_MAX_ATTEMPTS  attempts before dead-lettering (default 5)
+    PRISMQ_RETRY_BASE_DELAY    first backoff in seconds (default 60)
+    PRISMQ_RETRY_MAX_DELAY     backoff cap in seconds (default 3600)
+
+Usage:
+    >>> repo = StoryRetryRepository(conn)
+    >>> retry = repo.record_failure(story_id, INPUT_STATE, "Ollama not reachable")
+    >>> retry.next_attempt_at            # e.g. '2025-01-01 12:01:00'
+    >>> repo.requeue(story_id)           # back to the state it failed in
+
+Note:
+    Unlike the other repositories, this one creates its table on first use:
+    the table is needed by every stage query, and existing databases are not
+    migrated by SchemaManager.
+"""
+
+import os
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from Model.Entities.story_retry import StoryRetry
+from Model.state import DEAD_LETTER_STATE
+
+# WHERE-clause fragment for stage queries: skip stories that are backing off
+RETRY_READY_SQL = (
+    "NOT EXISTS (SELECT 1 FROM StoryRetry sr WHERE sr.story_id = s.id "
+    "AND sr.state = s.state AND sr.next_attempt_at > datetime('now'))"
+)
+
+_COLUMNS = "story_id, state, attempts, next_attempt_at, last_error, dead_lettered_at, updated_at"
+_MAX_ERROR_LENGTH = 1000
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with a maximum number of attempts.
+
+    Attributes:
+        max_attempts: Failures in one state before the story is dead-lettered
+        base_delay: Backoff after the first failure (seconds)
+        max_delay: Upper bound for the backoff (seconds)
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 60.0
+    max_delay: float = 3600.0
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """Build the policy from ``PRISMQ_RETRY_*`` environment variables."""
+        return cls(
+            max_attempts=int(os.getenv("PRISMQ_RETRY_MAX_ATTEMPTS", cls.max_attempts)),
+            base_delay=float(os.getenv("PRISMQ_RETRY_BASE_DELAY", cls.base_delay)),
+            max_delay=float(os.getenv("PRISMQ_RETRY_MAX_DELAY", cls.max_delay)),
+        )
+
+    def delay_for(self, attempts: int) -> float:
+        """Backoff in seconds after ``attempts`` consecutive failures."""
+        if attempts <= 0:
+            return 0.0
+        return min(self.max_delay, self.base_delay * (2 ** (attempts - 1)))
+
+
+class StoryRetryRepository:
+    """SQLite repository for StoryRetry rows and dead-letter operations.
+
+    Attributes:
+        policy: Retry policy used by :meth:`record_failure`.
+
+    Example:
+        >>> repo = StoryRetryRepository(conn, RetryPolicy(max_attempts=3))
+        >>> for _ in range(3):
+        ...     retry = repo.record_failure(7, "PrismQ.T.Review.Content.Grammar", "timeout")
+        >>> retry.is_dead_lettered
+        True
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        policy: Optional[RetryPolicy] = None,
+        ensure_table: bool = True,
+    ):
+        """Initialize repository with database connection.
+
+        Args:
+            connection: SQLite connection.
+            policy: Retry policy (default: from environment).
+            ensure_table: Create the StoryRetry table if it does not exist.
+        """
+        self._conn = connection
+        self.policy = policy or RetryPolicy.from_env()
+        if ensure_table:
+            self.ensure_table()
+
+    def ensure_table(self) -> None:
+        """Create the StoryRetry table and index if missing.
+
+        Runs each statement with ``execute``: ``executescript`` would commit
+        whatever transaction the caller has open.
+        """
+        for statement in StoryRetry.get_sql_schema().split(";"):
+            if statement.strip():
+                self._conn.execute(statement)
+
+    # === READ Operations ===
+
+    def find_by_story_id(self, story_id: int) -> Optional[StoryRetry]:
+        """Return the retry record of a story, if any."""
+        cursor = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM StoryRetry WHERE story_id = ?", (story_id,)
+        )
+        row = cursor.fetchone()
+        return self._row_to_model(row) if row is not None else None
+
+    def find_dead_letters(self, state: Optional[str] = None) -> List[StoryRetry]:
+        """Return dead-lettered stories, optionally only those from ``state``."""
+        query = """
+            SELECT sr.story_id, sr.state, sr.attempts, sr.next_attempt_at,
+                   sr.last_error, sr.dead_lettered_at, sr.updated_at
+            FROM StoryRetry sr
+            INNER JOIN Story s ON s.id = sr.story_id
+            WHERE s.state = ? AND sr.dead_lettered_at IS NOT NULL
+        """
+        params: list = [DEAD_LETTER_STATE]
+        if state is not None:
+            query += " AND sr.state = ?"
+            params.append(state)
+        query += " ORDER BY sr.dead_lettered_at ASC"
+        return [self._row_to_model(row) for row in self._conn.execute(query, params)]
+
+    def count_backing_off(self) -> Dict[str, int]:
+        """Return the number of stories waiting for their next attempt, per state."""
+        cursor = self._conn.execute(
+            """
+            SELECT s.state, COUNT(*)
+            FROM StoryRetry sr
+            INNER JOIN Story s ON s.id = sr.story_id AND s.state = sr.state
+            WHERE sr.next_attempt_at > datetime('now')
+            GROUP BY s.state
+            """
+        )
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
+    # === WRITE Operations ===
+
+    def record_failure(self, story_id: int, state: str, error: str) -> StoryRetry:
+        """Record a failed attempt and schedule the next one.
+
+        Attempts are counted per state: a failure in a different state than
+        the stored one starts counting from 1 again. When the attempt count
+        reaches ``policy.max_attempts`` the story is moved to
+        ``DEAD_LETTER_STATE``.
+
+        Args:
+            story_id: Story that failed.
+            state: State the story was processed in (the stage input state).
+            error: Error message to keep for diagnosis.
+
+        Returns:
+            The updated StoryRetry record.
+        """
+        current = self.find_by_story_id(story_id)
+        attempts = current.attempts + 1 if current is not None and current.state == state else 1
+        error = (error or "")[:_MAX_ERROR_LENGTH]
+
+        if attempts >= self.policy.max_attempts:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO StoryRetry
+                    (story_id, state, attempts, next_attempt_at, last_error,
+                     dead_lettered_at, updated_at)
+                VALUES (?, ?, ?, NULL, ?, datetime('now'), datetime('now'))
+                """,
+                (story_id, state, attempts, error),
+            )
+            self._conn.execute(
+                "UPDATE Story SET state = ?, updated_at = datetime('now') "
+                "WHERE id = ? AND state = ?",
+                (DEAD_LETTER_STATE, story_id, state),
+            )
+        else:
+            delay = self.policy.delay_for(attempts)
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO StoryRetry
+                    (story_id, state, attempts, next_attempt_at, last_error,
+                     dead_lettered_at, updated_at)
+                VALUES (?, ?, ?, datetime('now', ?), ?, NULL, datetime('now'))
+                """,
+                (story_id, state, attempts, f"+{int(delay)} seconds", error),
+            )
+        self._conn.commit()
+        return self.find_by_story_id(story_id)
+
+    def defer(
+        self, story_id: int, state: str, reason: str, delay: Optional[float] = None
+    ) -> StoryRetry:
+        """Skip a story for a while without counting a failed attempt.
+
+        Used when the generated output was rejected and the story only needs
+        to be regenerated later. The attempt count of ``state`` is kept, so
+        deferring never dead-letters a story.
+
+        Args:
+            story_id: Story to defer.
+            state: State the story stays in.
+            reason: Why the story was deferred (stored as ``last_error``).
+            delay: Seconds to wait (default: ``policy.base_delay``).
+
+        Returns:
+            The updated StoryRetry record.
+        """
+        current = self.find_by_story_id(story_id)
+        attempts = current.attempts if current is not None and current.state == state else 0
+        delay = self.policy.base_delay if delay is None else delay
+        reason = (reason or "")[:_MAX_ERROR_LENGTH]
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO StoryRetry
+                (story_id, state, attempts, next_attempt_at, last_error,
+                 dead_lettered_at, updated_at)
+            VALUES (?, ?, ?, datetime('now', ?), ?, NULL, datetime('now'))
+            """,
+            (story_id, state, attempts, f"+{int(delay)} seconds", reason),
+        )
+        self._conn.commit()
+        return self.find_by_story_id(story_id)
+
+    def requeue(self, story_id: int) -> bool:
+        """Move a dead-lettered story back to the state it failed in.
+
+        Returns:
+            True if the story was dead-lettered and has been requeued.
+        """
+        retry = self.find_by_story_id(story_id)
+        if retry is None:
+            return False
+        cursor = self._conn.execute(
+            "UPDATE Story SET state = ?, updated_at = datetime('now') WHERE id = ? AND state = ?",
+            (retry.state, story_id, DEAD_LETTER_STATE),
+        )
+        if cursor.rowcount == 0:
+            return False
+        self._conn.execute("DELETE FROM StoryRetry WHERE story_id = ?", (story_id,))
+        self._conn.commit()
+        return True
+
+    def requeue_all(self, state: Optional[str] = None) -> int:
+        """Requeue every dead-lettered story (optionally only from ``state``).
+
+        Returns:
+            Number of stories requeued.
+        """
+        return sum(1 for retry in self.find_dead_letters(state) if self.requeue(retry.story_id))
+
+    # === Helper Methods ===
+
+    def _row_to_model(self, row) -> StoryRetry:
+        return StoryRetry(
+            story_id=row[0],
+            state=row[1],
+            attempts=row[2],
+            next_attempt_at=row[3],
+            last_error=row[4],
+            dead_lettered_at=row[5],
+            updated_at=row[6],
+        )
+
+
+__all__ = [
+    "RETRY_READY_SQL",
+    "RetryPolicy",
+    "StoryRetryRepository",
+]
@@ -275,6 +275,20 @@ class TestValidTransitions:
             StateNames.TITLE_FROM_TITLE_REVIEW_SCRIPT
         )
 
+    def test_transitions_emitted_by_services(self, validator):
+        """Test the transitions the refinement/review services perform."""
+        # Title refinement hands the refined title straight to content review
+        assert validator.is_valid_transition(
+            StateNames.TITLE_FROM_TITLE_REVIEW_CONTENT,
+            StateNames.REVIEW_CONTENT_FROM_TITLE
+        )
+
+        # Content review escalates to title review when scores stall
+        assert validator.is_valid_transition(
+            StateNames.REVIEW_CONTENT_FROM_TITLE,
+            StateNames.REVIEW_TITLE_FROM_CONTENT
+        )
+
 
 class TestInvalidTransitions:
     """Tests for invalid state transitions."""
@@ -70,6 +70,7 @@ _TRANSITIONS_DICT: Dict[str, List[str]] = {
         StateNames.CONTENT_FROM_CONTENT_REVIEW_TITLE,  # After title refinement -> Stage 8
         StateNames.REVIEW_CONTENT_FROM_TITLE_IDEA,  # Back to content review
         StateNames.REVIEW_TITLE_FROM_CONTENT,  # Back to title review cycle
+        StateNames.REVIEW_CONTENT_FROM_TITLE,  # Refined title -> content quality gate
     ],
     
     # Content refinement from review (Stage 8)
@@ -82,6 +83,7 @@ _TRANSITIONS_DICT: Dict[str, List[str]] = {
     StateNames.REVIEW_CONTENT_FROM_TITLE: [
         StateNames.REVIEW_CONTENT_GRAMMAR,  # Accepted -> Start quality reviews (Stage 10)
         StateNames.CONTENT_FROM_CONTENT_REVIEW_TITLE,  # Not accepted -> Stage 8 (refine content)
+        StateNames.REVIEW_TITLE_FROM_CONTENT,  # Too many content versions -> title review
     ],
     
     # Quality review chain (Stages 10-16) - linear progression with failure paths
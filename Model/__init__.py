@@ -33,6 +33,7 @@ from Model.state import (
     INITIAL_STATES,
     TERMINAL_STATES,
     EXPERT_REVIEW_STATES,
+    DEAD_LETTER_STATE,
 )
 
 # Domain entities
@@ -68,6 +69,7 @@ __all__ = [
     "INITIAL_STATES",
     "TERMINAL_STATES",
     "EXPERT_REVIEW_STATES",
+    "DEAD_LETTER_STATE",
     # Entities
     "Story",
     "Title",
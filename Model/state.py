@@ -417,6 +417,11 @@ EXPERT_REVIEW_STATES = [
     StateNames.STORY_POLISH_MANUAL_PENDING,
 ]
 
+# Parking state for stories that failed too often in one stage. It is outside
+# the workflow graph (no transitions); StoryRetryRepository moves stories in
+# and requeues them to the state they failed in.
+DEAD_LETTER_STATE = f"{StateNames.STATE_PREFIX}.DeadLetter"
+
 # Re-export TransitionValidator for convenience (imported at end to avoid circular import)
 # This is intentionally placed here to break the circular dependency
 # between Model.state and Model.State.validators.transition_validator
@@ -432,4 +437,5 @@ __all__ = [
     "INITIAL_STATES",
     "TERMINAL_STATES",
     "EXPERT_REVIEW_STATES",
+    "DEAD_LETTER_STATE",
 ]
@@ -905,6 +905,93 @@ class TestScriptFromIdeaTitleService:
         assert result.error is not None
         assert "No title found" in result.error
 
+    def test_process_oldest_story_existing_content_moves_on(self, db_connection):
+        """A story whose content was already saved advances without a retry record."""
+        service = ContentFromIdeaTitleService(db_connection)
+        story_repo = StoryRepository(db_connection)
+        idea_id = self._insert_idea(db_connection)
+        story = story_repo.insert(Story(idea_id=idea_id, state=STATE_CONTENT_FROM_IDEA_TITLE))
+        content = ContentRepository(db_connection).insert(
+            Content(story_id=story.id, version=0, text="Saved before the run stopped")
+        )
+
+        with patch.object(service.content_generator, "generate_content_v1") as generate:
+            result = service.process_oldest_story()
+
+        generate.assert_not_called()
+        assert result.success is True
+        assert result.content_id == content.id
+        assert story_repo.find_by_id(story.id).state == STATE_REVIEW_TITLE_FROM_CONTENT_IDEA
+        assert service.retry_repo.find_by_story_id(story.id) is None
+
+    def test_near_duplicate_content_is_deferred_not_failed(self, db_connection):
+        """Near-duplicate content defers the story without counting a retry attempt."""
+        index = MagicMock()
+        index.find.side_effect = [[MagicMock(ref_id=41, similarity=0.93)], []]
+        service = ContentFromIdeaTitleService(db_connection, duplicate_index=index)
+        story_repo = StoryRepository(db_connection)
+        idea_id = self._insert_idea(db_connection)
+        stories = []
+        for text in ("The Mystery of the Abandoned House", "The Lighthouse Keeper's Log"):
+            story = story_repo.insert(Story(idea_id=idea_id, state=STATE_CONTENT_FROM_IDEA_TITLE))
+            TitleRepository(db_connection).insert(Title(story_id=story.id, version=0, text=text))
+            stories.append(story)
+
+        with patch.object(service.content_generator, "generate_content_v1") as generate:
+            generate.return_value = self._make_mock_script_v1()
+            result = service.process_oldest_story()
+            next_result = service.process_oldest_story()
+
+        assert result.story_id == stories[0].id
+        assert result.success is False
+        assert result.near_duplicate_of == 41
+        assert "near-duplicate of content 41" in result.error
+        assert ContentRepository(db_connection).find_latest_version(stories[0].id) is None
+        assert story_repo.find_by_id(stories[0].id).state == STATE_CONTENT_FROM_IDEA_TITLE
+        retry = service.retry_repo.find_by_story_id(stories[0].id)
+        assert retry.attempts == 0 and retry.next_attempt_at is not None
+
+        # The deferred story no longer blocks the head of the queue
+        assert next_result.story_id == stories[1].id
+        assert next_result.success is True
+
+    def test_success_resets_retry_count(self, db_connection):
+        """Failures separated by a success do not add up towards the dead letter."""
+        from Model.Repositories.story_retry_repository import RetryPolicy
+
+        service = ContentFromIdeaTitleService(db_connection)
+        service.retry_repo.policy = RetryPolicy(max_attempts=3, base_delay=0)
+        story_repo = StoryRepository(db_connection)
+        idea_id = self._insert_idea(db_connection)
+        story = story_repo.insert(Story(idea_id=idea_id, state=STATE_CONTENT_FROM_IDEA_TITLE))
+        TitleRepository(db_connection).insert(
+            Title(story_id=story.id, version=0, text="The Mystery of the Abandoned House")
+        )
+        generate = patch.object(service.content_generator, "generate_content_v1")
+
+        def run(outcome):
+            with generate as mock:
+                mock.side_effect = outcome if isinstance(outcome, Exception) else None
+                mock.return_value = outcome
+                return service.process_oldest_story()
+
+        assert not run(RuntimeError("Ollama timeout")).success
+        assert not run(RuntimeError("Ollama timeout")).success
+        assert service.retry_repo.find_by_story_id(story.id).attempts == 2
+
+        assert run(self._make_mock_script_v1()).success
+        assert service.retry_repo.find_by_story_id(story.id) is None
+
+        # Back in the input state (e.g. content rejected later), the budget starts over
+        db_connection.execute("DELETE FROM Content WHERE story_id = ?", (story.id,))
+        db_connection.execute(
+            "UPDATE Story SET state = ? WHERE id = ?", (STATE_CONTENT_FROM_IDEA_TITLE, story.id)
+        )
+        db_connection.commit()
+        result = run(RuntimeError("Ollama timeout"))
+        assert "dead-lettered" not in result.error
+        assert service.retry_repo.find_by_story_id(story.id).attempts == 1
+
     def test_process_oldest_story_processes_in_order(self, db_connection, sample_idea):
         """Test that process_oldest_story processes stories in creation order (FIFO)."""
         from datetime import timedelta
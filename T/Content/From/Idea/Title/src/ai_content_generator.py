@@ -26,11 +26,20 @@ Prompt Optimization for Qwen3:32b:
 import logging
 import random
 import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-import requests
+try:
+    from Model.Infrastructure.lazy import lazy_module
+    from Model.Infrastructure.metrics import record_llm_call
+
+    requests = lazy_module("requests")  # loaded on the first Ollama call
+except ImportError:  # Model package not on sys.path (standalone use)
+    import requests
+
+    record_llm_call = None
 
 logger = logging.getLogger(__name__)
 
@@ -881,24 +890,29 @@ class AIContentGenerator:
         logger.debug(f"Model: {self.config.model}, Temperature: {self.config.temperature}")
         
         try:
-            response = requests.post(
-                f"{self.config.api_base}/api/generate",
-                json={
-                    "model": self.config.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "think": False,
-                    "options": {
-                        "temperature": self.config.temperature,
-                        "num_predict": self.config.max_tokens,
-                        "num_ctx": 4096,
+            started = time.monotonic()
+            try:
+                response = requests.post(
+                    f"{self.config.api_base}/api/generate",
+                    json={
+                        "model": self.config.model,
+                        "prompt": prompt,
+                        "stream": False,
+                        "think": False,
+                        "options": {
+                            "temperature": self.config.temperature,
+                            "num_predict": self.config.max_tokens,
+                            "num_ctx": 4096,
+                        },
                     },
-                },
-                timeout=self.config.timeout,
-            )
-
-            response.raise_for_status()
-            result = response.json()
+                    timeout=self.config.timeout,
+                )
+                response.raise_for_status()
+                result = response.json()
+            except Exception:
+                self._record_metrics(time.monotonic() - started, None)
+                raise
+            self._record_metrics(time.monotonic() - started, result)
             generated_text = result.get("response", "").strip()
             
             if not generated_text:
@@ -924,6 +938,11 @@ class AIContentGenerator:
             logger.error(f"Failed to parse Ollama response: {e}")
             raise RuntimeError(f"Invalid response from Ollama: {e}")
 
+    def _record_metrics(self, elapsed: float, result: Optional[dict]) -> None:
+        """Record latency and token counts (``None`` result = failed call)."""
+        if record_llm_call is not None:
+            record_llm_call(self.config.model, elapsed, result, ok=result is not None)
+
     def _extract_content_text(self, response: str) -> str:
         """Extract content text from AI response.
         
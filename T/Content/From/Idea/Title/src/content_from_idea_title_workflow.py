@@ -6,6 +6,9 @@ It waits with dynamic intervals when no stories are available:
 - 30 seconds when 0 stories to process
 - Gradually decreasing wait time as more stories become available
 
+Generation pauses while the review queues downstream are over their WIP
+limits (PRISMQ_WIP_LIMIT_*, see Model/Infrastructure/backpressure.py).
+
 Usage:
     python content_from_idea_title_workflow.py  # Run continuously
 
@@ -37,11 +40,21 @@ except ImportError:
 
 try:
     from T.Content.From.Idea.Title.src.story_content_service import StateBasedContentService
+    from Model.Infrastructure.workflow import StageTelemetry
     SERVICE_AVAILABLE = True
 except ImportError as e:
     SERVICE_AVAILABLE = False
     IMPORT_ERROR = str(e)
 
+try:
+    from Model.Infrastructure.backpressure import BackpressureGate
+    BACKPRESSURE_AVAILABLE = True
+except ImportError:
+    BACKPRESSURE_AVAILABLE = False
+
+# Pipeline step number used for WIP-limit gating
+STAGE_NUMBER = 4
+
 
 # ANSI Colors
 class Colors:
@@ -208,6 +221,8 @@ def main():
 
     # Initialize service
     service = StateBasedContentService(conn, audience=audience)
+    telemetry = StageTelemetry("04")
+    gate = BackpressureGate() if BACKPRESSURE_AVAILABLE else None
 
     # Continuous processing loop
     run_count = 0
@@ -246,8 +261,18 @@ def main():
             else:
                 print_success(f"Found {pending_count} pending stories")
             
+            # Hold back while downstream review queues are over their WIP limit
+            if gate is not None:
+                gate.refresh(conn)
+                if gate.is_paused(STAGE_NUMBER):
+                    wait_interval = get_wait_interval(0)
+                    print_warning(f"WIP limit reached ({gate.describe(STAGE_NUMBER)}) - pausing generation")
+                    print_info(f"Waiting {format_wait_time(wait_interval)} before checking again...")
+                    time.sleep(wait_interval)
+                    continue
+
             # Process oldest story
-            result = service.process_oldest_story()
+            result = telemetry.run(service.process_oldest_story)
             
             if result.story_id is None:
                 # Should not happen but handle it
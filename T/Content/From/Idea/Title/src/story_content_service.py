@@ -35,15 +35,19 @@ import sys
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from Model.Database.models.content import Content as ScriptModel
 from Model.Database.models.story import Story
 from Model.Database.repositories.content_repository import ContentRepository
 from Model.Database.repositories.story_repository import StoryRepository
+from Model.Repositories.story_retry_repository import StoryRetryRepository
 from Model.Database.repositories.title_repository import TitleRepository
 from Model import StateNames
 
+if TYPE_CHECKING:
+    from src.near_duplicates import NearDuplicateIndex
+
 # Import ContentGenerator from local module
 from .content_generator import (
     PlatformTarget,
@@ -490,6 +494,8 @@ class StateBasedContentResult:
         script_v1: Generated ContentV1 object (if successful)
         word_count: Word count of the generated content (if successful)
         duration: Estimated duration in seconds (if successful)
+        near_duplicate_of: Id of the existing content the generated text
+            duplicated (content not saved, story deferred for a new attempt)
     """
 
     story_id: Optional[int] = None
@@ -501,6 +507,7 @@ class StateBasedContentResult:
     script_v1: Optional[ContentV1] = None
     word_count: Optional[int] = None
     duration: Optional[float] = None
+    near_duplicate_of: Optional[int] = None
 
 
 class ContentFromIdeaTitleService:
@@ -543,6 +550,7 @@ class ContentFromIdeaTitleService:
         connection: sqlite3.Connection,
         content_generator_config: Optional[ContentGeneratorConfig] = None,
         audience: Optional[dict] = None,
+        duplicate_index: Optional["NearDuplicateIndex"] = None,
     ):
         """Initialize the service with database connection.
 
@@ -551,12 +559,20 @@ class ContentFromIdeaTitleService:
             content_generator_config: Optional configuration for content generation
             audience: Optional target audience dict (age_range, gender, country).
                 If None the AI prompt is generated without audience context.
+            duplicate_index: Optional NearDuplicateIndex (src.near_duplicates).
+                When set, content that is a near-duplicate of any indexed
+                content is not saved and saved content is added to the index.
+                A rejected story stays in the input state and is deferred
+                (StoryRetryRepository.defer) so the next story is taken
+                first; no failed attempt is counted against it.
         """
         self._conn = connection
         self._audience = audience
+        self._duplicate_index = duplicate_index
         self.story_repo = StoryRepository(connection)
         self.content_repo = ContentRepository(connection)
         self.title_repo = TitleRepository(connection)
+        self.retry_repo = StoryRetryRepository(connection)
 
         config = content_generator_config or ContentGeneratorConfig(
             platform_target=PlatformTarget.YOUTUBE_MEDIUM,
@@ -579,10 +595,16 @@ class ContentFromIdeaTitleService:
         """Get the oldest story in the input state.
 
         Returns:
-            The oldest Story in state PrismQ.T.Content.From.Idea.Title,
-            or None if no stories are in this state.
+            The oldest Story in state PrismQ.T.Content.From.Idea.Title
+            that is not backing off after a failure, or None.
         """
-        return self.story_repo.find_oldest_by_state(self.INPUT_STATE)
+        return self.story_repo.find_oldest_by_state(self.INPUT_STATE, skip_backing_off=True)
+
+    def _record_failure(self, story: Story, result: StateBasedContentResult) -> None:
+        """Back off (and eventually dead-letter) a story that could not be processed."""
+        retry = self.retry_repo.record_failure(story.id, self.INPUT_STATE, result.error)
+        if retry.is_dead_lettered:
+            result.error += f" (dead-lettered after {retry.attempts} attempts)"
 
     def process_oldest_story(self) -> StateBasedContentResult:
         """Process the oldest story in the input state.
@@ -613,20 +635,26 @@ class ContentFromIdeaTitleService:
         result.previous_state = story.state
         logger.info(f"Processing story {story.id} in state {story.state}")
 
-        # Idempotency check: skip if content already exists for this story
+        # Idempotency check: content was saved but the state update did not
+        # happen (e.g. interrupted run) - finish the step without regenerating
         existing_content = self.content_repo.find_latest_version(story.id)
         if existing_content:
-            result.error = (
+            logger.warning(
                 f"Story {story.id} already has content (id={existing_content.id}). "
-                "Skipping duplicate generation."
+                f"Skipping duplicate generation, moving to {self.OUTPUT_STATE}."
             )
-            logger.warning(result.error)
+            story.update_state(self.OUTPUT_STATE)
+            self.story_repo.update(story)
+            result.success = True
+            result.content_id = existing_content.id
+            result.new_state = self.OUTPUT_STATE
             return result
 
         # Validate story has an idea reference
         if not story.idea_id:
             result.error = f"Story {story.id} has no idea_id"
             logger.error(result.error)
+            self._record_failure(story, result)
             return result
 
         try:
@@ -639,6 +667,7 @@ class ContentFromIdeaTitleService:
             if not idea_row:
                 result.error = f"Idea with id={story.idea_id} not found"
                 logger.error(f"Story {story.id}: {result.error}")
+                self._record_failure(story, result)
                 return result
             idea_text = (idea_row["text"] or "").strip()
             idea = Idea(title=idea_text, concept=idea_text)
@@ -650,6 +679,7 @@ class ContentFromIdeaTitleService:
             if not title:
                 result.error = f"No title found for story {story.id}"
                 logger.error(f"Story {story.id}: {result.error}")
+                self._record_failure(story, result)
                 return result
             title_text = title.text
             logger.info(f"Story {story.id}: Generating content for title '{title_text}'")
@@ -663,6 +693,19 @@ class ContentFromIdeaTitleService:
                 f"({len(script_v1.full_text)} chars)"
             )
 
+            # Reject near-duplicates before review stages spend AI time on them
+            if self._duplicate_index:
+                matches = self._duplicate_index.find("content", script_v1.full_text)
+                if matches:
+                    result.error = (
+                        f"Content is a near-duplicate of content {matches[0].ref_id} "
+                        f"(similarity {matches[0].similarity:.2f})"
+                    )
+                    logger.warning(f"Story {story.id}: {result.error}, will regenerate")
+                    result.near_duplicate_of = matches[0].ref_id
+                    self.retry_repo.defer(story.id, self.INPUT_STATE, result.error)
+                    return result
+
             # Populate word count and duration from the generated content
             result.word_count = len(script_v1.full_text.split())
             result.duration = float(script_v1.total_duration_seconds)
@@ -674,6 +717,8 @@ class ContentFromIdeaTitleService:
             )
             saved_content = self.content_repo.insert(content_model)
             logger.info(f"Story {story.id}: Content saved with id={saved_content.id}")
+            if self._duplicate_index:
+                self._duplicate_index.add("content", saved_content.id, script_v1.full_text)
 
             # Update Story state
             story.update_state(self.OUTPUT_STATE)
@@ -701,6 +746,7 @@ class ContentFromIdeaTitleService:
         except Exception as e:
             result.error = f"Content generation failed: {str(e)}"
             logger.exception(f"Story {story.id}: Unexpected error during content generation")
+            self._record_failure(story, result)
 
         return result
 
@@ -0,0 +1,144 @@
+"""Tests for concurrent bulk idea generation."""
+
+import json
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../src"))
+
+from flavor_index import FLAVOR_CACHE_ENV
+from flavor_loader import FlavorLoader
+from idea_variants import FlavorSelector, IdeaGenerator
+
+IDEA_TEXT = "A complete refined idea with enough content to be valid."
+
+
+class FakeAI:
+    """Stands in for AIIdeaGenerator; records calls from worker threads."""
+
+    def __init__(self, barrier=None, short_for=()):
+        self.barrier = barrier
+        self.short_for = set(short_for)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def generate_with_custom_prompt(self, input_text, flavor, **kwargs):
+        with self.lock:
+            self.calls.append(flavor)
+        if self.barrier:
+            # Only passes when all parties are in flight at the same time
+            self.barrier.wait(timeout=5)
+        if flavor.split(" and ")[0] in self.short_for:
+            return "too short"
+        return f"{IDEA_TEXT} ({flavor})"
+
+
+class FakeDB:
+    def __init__(self):
+        self.threads = set()
+        self.rows = []
+
+    def insert_idea(self, text, version):
+        self.threads.add(threading.get_ident())
+        self.rows.append(text)
+        return len(self.rows)
+
+
+def make_generator(tmp_path, monkeypatch, flavors, ai):
+    monkeypatch.setenv(FLAVOR_CACHE_ENV, "off")
+    monkeypatch.setattr(FlavorSelector, "NO_FLAVOR_CHANCE", 0.0)
+    path = tmp_path / "flavors.json"
+    path.write_text(json.dumps({"default_fields": {}, "flavors": flavors}))
+    generator = IdeaGenerator(flavor_loader=FlavorLoader(path), use_ai=False)
+    generator.ai_generator = ai
+    return generator
+
+
+def test_variants_run_concurrently(tmp_path, monkeypatch):
+    ai = FakeAI(barrier=threading.Barrier(3))
+    flavors = {name: {"weight": 10} for name in ("A", "B", "C")}
+    generator = make_generator(tmp_path, monkeypatch, flavors, ai)
+
+    result = generator.generate_bulk("Input", specific_flavors=["A", "B", "C"], max_workers=3)
+
+    assert result.count("generated") == 3
+    assert [idea["variant_name"].split(" + ")[0] for idea in result.ideas] == ["A", "B", "C"]
+    assert all(report.seconds > 0 for report in result.reports)
+
+
+def test_identical_prompts_are_generated_once(tmp_path, monkeypatch):
+    ai = FakeAI()
+    generator = make_generator(tmp_path, monkeypatch, {"Only": {"weight": 10}}, ai)
+
+    result = generator.generate_bulk("Input", specific_flavors=["Only"] * 3)
+
+    assert ai.calls == ["Only"]
+    assert len(result.ideas) == 1
+    assert [r.status for r in result.reports] == ["generated", "duplicate", "duplicate"]
+    assert result.reports[2].duplicate_of == 0
+
+
+def test_ideas_are_saved_on_calling_thread(tmp_path, monkeypatch):
+    ai = FakeAI(short_for={"B"})
+    db = FakeDB()
+    generator = make_generator(tmp_path, monkeypatch, {"A": {}, "B": {}, "C": {}}, ai)
+    streamed = []
+
+    result = generator.generate_bulk(
+        "Input",
+        specific_flavors=["A", "B", "C", "Missing"],
+        db=db,
+        max_workers=2,
+        on_result=lambda report, idea: streamed.append((report.index, report.status)),
+    )
+
+    assert db.threads == {threading.get_ident()}
+    assert sorted(idea["idea_id"] for idea in result.ideas) == [1, 2]
+    assert sorted(streamed) == [(0, "generated"), (1, "failed"), (2, "generated"), (3, "failed")]
+    assert "insufficient content" in result.reports[1].error
+    assert "Missing" in result.reports[3].error
+
+
+class FakeIndex:
+    """Stands in for NearDuplicateIndex with exact text matching."""
+
+    def __init__(self, texts=None):
+        self.texts = dict(texts or {})
+
+    def find(self, kind, text):
+        return [
+            SimpleNamespace(ref_id=ref_id, similarity=1.0)
+            for ref_id, stored in self.texts.items() if stored == text
+        ]
+
+    def add(self, kind, ref_id, text):
+        self.texts[ref_id] = text
+
+
+def test_near_duplicates_merge_into_existing_ideas(tmp_path, monkeypatch):
+    ai = FakeAI()
+    db = FakeDB()
+    index = FakeIndex({41: f"{IDEA_TEXT} (A)"})
+    generator = make_generator(tmp_path, monkeypatch, {"A": {}}, ai)
+
+    result = generator.generate_bulk("Input", specific_flavors=["A"], db=db, duplicate_index=index)
+
+    assert result.ideas == [] and db.rows == []
+    report = result.reports[0]
+    assert (report.status, report.idea_id, report.similarity) == ("near_duplicate", 41, 1.0)
+
+    index.texts.clear()
+    result = generator.generate_bulk("Input", specific_flavors=["A"], db=db, duplicate_index=index)
+    assert index.texts == {1: f"{IDEA_TEXT} (A)"}
+
+
+def test_requires_input_and_ai(tmp_path, monkeypatch):
+    generator = make_generator(tmp_path, monkeypatch, {"A": {}}, None)
+    with pytest.raises(ValueError):
+        generator.generate_bulk("")
+    with pytest.raises(RuntimeError):
+        generator.generate_bulk("Input")
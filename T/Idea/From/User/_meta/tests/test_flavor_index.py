@@ -0,0 +1,138 @@
+"""Tests for the compiled flavor index, its cache and hot reloading."""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../src"))
+
+from flavor_index import FLAVOR_CACHE_ENV, FlavorIndex, default_cache_path
+from flavor_loader import FlavorLoader
+
+
+FLAVORS = {
+    "Teen Heart": {
+        "description": "Emotional first love story",
+        "keywords": ["emotional", "Love"],
+        "audience": "13-17 young women US/Canada",
+        "engagement_goal": ["rewatch", "Share"],
+        "format_fit": ["reels", "shorts"],
+        "weight": 90,
+    },
+    "Mystery Gap": {
+        "description": "Central unanswered question",
+        "keywords": ["mystery"],
+        "audience": "Teens and young adults",
+        "engagement_goal": ["comment"],
+        "format_fit": ["TikTok"],
+    },
+    "Story Skeleton": {
+        "description": "Complete story structure",
+        "keywords": ["structure"],
+        "weight": 60,
+    },
+}
+
+
+def write_config(path, flavors, mtime_ns=10**18):
+    path.write_text(json.dumps({"default_fields": {"hook": "Hook"}, "flavors": flavors}))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    monkeypatch.setenv(FLAVOR_CACHE_ENV, str(tmp_path / "flavors.cache.pickle"))
+    path = tmp_path / "flavors.json"
+    write_config(path, FLAVORS)
+    return path
+
+
+class TestFlavorIndex:
+    def test_exact_lookups(self):
+        index = FlavorIndex(FLAVORS)
+        assert index.by_engagement_goal("SHARE") == ["Teen Heart"]
+        assert index.by_format("tiktok") == ["Mystery Gap"]
+        assert index.by_format("stories") == []
+        assert index.engagement == ("Mystery Gap", "Teen Heart")
+        assert index.weights == {"Teen Heart": 90, "Mystery Gap": 50, "Story Skeleton": 60}
+
+    def test_audience_substrings(self):
+        index = FlavorIndex(FLAVORS)
+        assert index.by_audience("young") == ["Mystery Gap", "Teen Heart"]
+        assert index.by_audience("13-17") == ["Teen Heart"]
+        assert index.by_audience("") == ["Mystery Gap", "Teen Heart"]
+
+    def test_search(self):
+        index = FlavorIndex(FLAVORS)
+        assert index.search("STORY") == ["Story Skeleton", "Teen Heart"]
+        assert index.search("mystery") == ["Mystery Gap"]
+        # Keywords are compared with the lowercase query as written
+        assert index.search("Love") == ["Teen Heart"]
+
+    def test_results_are_copies(self):
+        index = FlavorIndex(FLAVORS)
+        index.by_audience("young").append("Other")
+        assert index.by_audience("young") == ["Mystery Gap", "Teen Heart"]
+
+
+class TestLoaderCache:
+    def test_second_loader_uses_cache(self, config, monkeypatch):
+        first = FlavorLoader(config)
+        assert first.get_flavors_by_format("reels") == ["Teen Heart"]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("config parsed again")
+
+        monkeypatch.setattr(json, "load", fail)
+        second = FlavorLoader(config)
+        assert second.get_flavors_by_format("reels") == ["Teen Heart"]
+        assert second.get_default_fields() == {"hook": "Hook"}
+
+    def test_changed_config_is_not_served_from_cache(self, config):
+        FlavorLoader(config).load()
+        write_config(config, {"Only": {"description": "", "keywords": []}}, 2 * 10**18)
+        assert FlavorLoader(config).list_flavor_names() == ["Only"]
+
+    def test_corrupt_cache_is_ignored(self, config, tmp_path):
+        (tmp_path / "flavors.cache.pickle").write_bytes(b"not a pickle")
+        assert FlavorLoader(config).get_flavor_count() == 3
+
+    def test_cache_can_be_disabled(self, config, monkeypatch):
+        monkeypatch.setenv(FLAVOR_CACHE_ENV, "off")
+        assert default_cache_path(config) is None
+        FlavorLoader(config).load()
+        assert not (config.parent / "flavors.cache.pickle").exists()
+
+    def test_default_cache_next_to_config(self, config, monkeypatch):
+        monkeypatch.delenv(FLAVOR_CACHE_ENV)
+        assert default_cache_path(config) == config.parent / "flavors.json.cache.pickle"
+
+
+class TestHotReload:
+    def test_reloads_changed_config(self, config):
+        loader = FlavorLoader(config)
+        loader.RELOAD_CHECK_SECONDS = 0
+        assert loader.get_flavors_by_engagement_goal("comment") == ["Mystery Gap"]
+        assert loader.version == 1
+
+        changed = dict(FLAVORS)
+        changed["New Flavor"] = {"description": "", "keywords": [], "engagement_goal": ["comment"]}
+        write_config(config, changed, 2 * 10**18)
+        assert loader.get_flavors_by_engagement_goal("comment") == ["Mystery Gap", "New Flavor"]
+        assert loader.version == 2
+
+    def test_unchanged_config_is_not_reloaded(self, config):
+        loader = FlavorLoader(config)
+        loader.RELOAD_CHECK_SECONDS = 0
+        index = loader.index
+        loader.get_weights()
+        assert loader.index is index and loader.version == 1
+
+    def test_removed_config_keeps_flavors(self, config):
+        loader = FlavorLoader(config)
+        loader.RELOAD_CHECK_SECONDS = 0
+        loader.load()
+        config.unlink()
+        assert loader.get_flavor_count() == 3
@@ -0,0 +1,92 @@
+"""Tests for alias-table flavor sampling."""
+
+import json
+import os
+import random
+import sys
+from collections import Counter
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../src"))
+
+import flavor_sampler
+from flavor_index import FLAVOR_CACHE_ENV
+from flavor_loader import FlavorLoader
+from flavor_sampler import WeightedSampler
+from idea_variants import FlavorSelector
+
+ITEMS = ["a", "b", "c", "d", "e"]
+WEIGHTS = [50, 25, 15, 10, 0]
+DRAWS = 40000
+
+
+def successive_probability(sequence, weights=dict(zip(ITEMS, WEIGHTS))):
+    """Exact probability of drawing ``sequence`` one item at a time without replacement."""
+    probability, remaining = 1.0, sum(weights.values())
+    for item in sequence:
+        probability *= weights[item] / remaining
+        remaining -= weights[item]
+    return probability
+
+
+class TestWeightedSampler:
+    def test_draw_frequencies(self):
+        sampler = WeightedSampler(ITEMS, WEIGHTS)
+        counts = Counter(sampler.sample_many(random.Random(1), DRAWS))
+        assert counts["e"] == 0
+        for item, weight in zip(ITEMS, WEIGHTS):
+            assert counts[item] / DRAWS == pytest.approx(weight / 100, abs=0.01)
+
+    @pytest.mark.parametrize("max_share", [0.5, 0.0])
+    def test_distinct_draw_order(self, monkeypatch, max_share):
+        # 0.0 forces Efraimidis-Spirakis keys instead of rejection
+        monkeypatch.setattr(flavor_sampler, "MAX_REJECTION_SHARE", max_share)
+        sampler = WeightedSampler(ITEMS, WEIGHTS)
+        rng = random.Random(2)
+        counts = Counter(tuple(sampler.sample_distinct(rng, 2)) for _ in range(DRAWS))
+        for pair in [("a", "b"), ("b", "a"), ("c", "d"), ("d", "a")]:
+            assert counts[pair] / DRAWS == pytest.approx(successive_probability(pair), abs=0.01)
+
+    def test_distinct_skips_excluded_and_zero_weights(self):
+        sampler = WeightedSampler(ITEMS, WEIGHTS)
+        rng = random.Random(3)
+        for _ in range(200):
+            drawn = sampler.sample_distinct(rng, 10, exclude=["a", "unknown"])
+            assert sorted(drawn) == ["b", "c", "d"]
+
+    def test_seeded_draws_repeat(self):
+        sampler = WeightedSampler(ITEMS, WEIGHTS)
+        assert sampler.sample_many(random.Random(7), 20) == sampler.sample_many(
+            random.Random(7), 20
+        )
+        assert sampler.sample_distinct(random.Random(7), 3) == sampler.sample_distinct(
+            random.Random(7), 3
+        )
+
+    @pytest.mark.parametrize(
+        "items, weights", [(["a"], [1, 2]), (["a", "b"], [1, -1]), (["a"], [0]), ([], [])]
+    )
+    def test_invalid_weights(self, items, weights):
+        with pytest.raises(ValueError):
+            WeightedSampler(items, weights)
+
+
+class TestSelectorReload:
+    def test_sampler_follows_config_reload(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(FLAVOR_CACHE_ENV, "off")
+        path = tmp_path / "flavors.json"
+
+        def write(flavors, mtime_ns):
+            path.write_text(json.dumps({"default_fields": {}, "flavors": flavors}))
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+        write({"Old": {"weight": 10}}, 10**18)
+        loader = FlavorLoader(path)
+        loader.RELOAD_CHECK_SECONDS = 0
+        selector = FlavorSelector(loader)
+        assert selector.select_multiple(3, seed=1) == ["Old", "Old", "Old"]
+
+        write({"New": {"weight": 10}, "Newer": {"weight": 0}}, 2 * 10**18)
+        assert selector.select_one(seed=1) == "New"
+        assert selector.select_flavor_combination(seed=1, no_flavor_chance=0.0) == ["New"]
@@ -0,0 +1,187 @@
+"""Compiled flavor indexes and their on-disk cache.
+
+FlavorLoader answers audience, engagement goal, format and keyword queries.
+Scanning every flavor definition per query is wasted work for a config that
+changes a few times a year, so the loader compiles a ``FlavorIndex`` once per
+load:
+
+- Exact-match fields (engagement goals, formats, keywords) become inverted
+  indexes from the lowercase value to the sorted flavor names.
+- Substring queries (audience, keyword search in names and descriptions)
+  scan the distinct values once per query string and are memoized.
+
+The parsed config and its index are pickled next to the JSON file, keyed by
+the file's modification time and size, so later processes skip parsing and
+compiling until the file changes (see ``FLAVOR_CACHE_ENV``).
+"""
+
+import os
+import pickle
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Path of the compiled cache; "off" (or 0/false/no/empty) disables it.
+# Default: <flavors.json>.cache.pickle next to the config file.
+FLAVOR_CACHE_ENV = "PRISMQ_FLAVOR_INDEX_CACHE"
+
+# Bump when FlavorIndex changes so stale caches are rebuilt
+CACHE_FORMAT = 1
+
+# Distinct substring queries remembered per index
+QUERY_CACHE_SIZE = 1024
+
+
+def _inverted(flavors: Dict[str, Dict[str, Any]], field: str) -> Dict[str, Tuple[str, ...]]:
+    """Lowercase value of a list field -> sorted names of flavors listing it."""
+    index = defaultdict(set)
+    for name, flavor in flavors.items():
+        for value in flavor.get(field, []):
+            index[value.lower()].add(name)
+    return {value: tuple(sorted(names)) for value, names in index.items()}
+
+
+class FlavorIndex:
+    """Lookups over flavor definitions, compiled once per config load."""
+
+    def __init__(self, flavors: Dict[str, Dict[str, Any]]):
+        """Compile indexes for ``flavors`` (name -> definition)."""
+        self.names = tuple(sorted(flavors))
+        # Insertion order of the config, like FlavorLoader.get_weights()
+        self.weights = {name: flavor.get('weight', 50) for name, flavor in flavors.items()}
+        self.engagement = tuple(sorted(n for n, f in flavors.items() if 'engagement_goal' in f))
+        self._by_goal = _inverted(flavors, 'engagement_goal')
+        self._by_format = _inverted(flavors, 'format_fit')
+
+        # Keyword search compares the lowercase query with keywords as written
+        by_keyword = defaultdict(set)
+        for name, flavor in flavors.items():
+            for keyword in flavor.get('keywords', []):
+                by_keyword[keyword].add(name)
+        self._by_keyword = dict(by_keyword)
+
+        audiences = defaultdict(list)
+        for name, flavor in flavors.items():
+            if 'audience' in flavor:
+                audiences[flavor['audience'].lower()].append(name)
+        self._audiences = dict(audiences)
+        self._texts = [
+            (name, name.lower(), flavor.get('description', '').lower())
+            for name, flavor in flavors.items()
+        ]
+        self._queries: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_queries'] = {}
+        return state
+
+    def _memoized(self, kind: str, query: str, compute) -> List[str]:
+        key = (kind, query)
+        result = self._queries.get(key)
+        if result is None:
+            if len(self._queries) >= QUERY_CACHE_SIZE:
+                self._queries.clear()
+            result = self._queries[key] = tuple(sorted(compute()))
+        return list(result)
+
+    def by_audience(self, audience: str) -> List[str]:
+        """Flavors whose audience contains ``audience`` (case-insensitive)."""
+        query = audience.lower()
+        return self._memoized('audience', query, lambda: (
+            name
+            for text, names in self._audiences.items() if query in text
+            for name in names
+        ))
+
+    def by_engagement_goal(self, goal: str) -> List[str]:
+        """Flavors listing ``goal`` among their engagement goals."""
+        return list(self._by_goal.get(goal.lower(), ()))
+
+    def by_format(self, format_name: str) -> List[str]:
+        """Flavors listing ``format_name`` in their format fit."""
+        return list(self._by_format.get(format_name.lower(), ()))
+
+    def search(self, keyword: str) -> List[str]:
+        """Flavors with ``keyword`` in their name, description or keywords."""
+        query = keyword.lower()
+
+        def matches() -> Iterable[str]:
+            found = set(self._by_keyword.get(query, ()))
+            found.update(
+                name for name, name_lower, description in self._texts
+                if query in name_lower or query in description
+            )
+            return found
+
+        return self._memoized('search', query, matches)
+
+
+def default_cache_path(config_path: Path) -> Optional[Path]:
+    """Cache file for ``config_path``, or None when caching is disabled."""
+    setting = os.getenv(FLAVOR_CACHE_ENV)
+    if setting is None:
+        return config_path.with_name(config_path.name + '.cache.pickle')
+    if setting.strip().lower() in ('', '0', 'off', 'false', 'no'):
+        return None
+    return Path(setting)
+
+
+def config_stamp(config_path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of the config file, None if it does not exist."""
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cache_key(config_path: Path, stamp: Tuple[int, int]) -> Dict[str, Any]:
+    return {'format': CACHE_FORMAT, 'config': str(config_path.resolve()), 'stamp': list(stamp)}
+
+
+def read_cache(
+    cache_path: Path, config_path: Path, stamp: Tuple[int, int]
+) -> Optional[Tuple[Dict[str, Any], FlavorIndex]]:
+    """Parsed config and index from the cache, None if missing or stale."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached['key'] == _cache_key(config_path, stamp):
+            return cached['data'], cached['index']
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError, TypeError,
+            ImportError):
+        pass
+    return None
+
+
+def write_cache(
+    cache_path: Path,
+    config_path: Path,
+    stamp: Tuple[int, int],
+    data: Dict[str, Any],
+    index: FlavorIndex,
+) -> None:
+    """Store the parsed config and index (best effort)."""
+    # A read-only install only costs the next process a JSON parse
+    try:
+        temp = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+        with open(temp, 'wb') as f:
+            pickle.dump(
+                {'key': _cache_key(config_path, stamp), 'data': data, 'index': index},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temp, cache_path)
+    except OSError:
+        pass
+
+
+__all__ = [
+    'FLAVOR_CACHE_ENV',
+    'FlavorIndex',
+    'config_stamp',
+    'default_cache_path',
+    'read_cache',
+    'write_cache',
+]
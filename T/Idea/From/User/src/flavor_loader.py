@@ -4,12 +4,24 @@ This module implements the Flavor Loader following SOLID principles:
 - Single Responsibility: Only loads and manages flavor definitions
 - Open/Closed: Extended through configuration, not code modification
 - Dependency Inversion: Depends on abstract file loading, not specifics
+
+Queries are answered from a compiled FlavorIndex (see flavor_index.py), and
+the loader reloads the config when the file changes.
 """
 
 import json
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from flavor_index import (
+    FlavorIndex,
+    config_stamp,
+    default_cache_path,
+    read_cache,
+    write_cache,
+)
+
 
 class FlavorLoader:
     """Loads flavor definitions from external JSON configuration.
@@ -21,6 +33,9 @@ class FlavorLoader:
     
     Following Single Responsibility Principle: Does ONE thing only.
     """
+
+    # Seconds between checks of the config file for changes (hot reload)
+    RELOAD_CHECK_SECONDS = 1.0
     
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize flavor loader.
@@ -38,34 +53,76 @@ class FlavorLoader:
         self._data = None
         self._flavors = None
         self._default_fields = None
+        self._index: Optional[FlavorIndex] = None
+        self._stamp = None
+        self._checked_at = 0.0
+        # Incremented on every (re)load so dependents can drop derived data
+        self.version = 0
     
     def load(self) -> None:
         """Load flavor definitions from JSON file.
+
+        Uses the compiled cache when it matches the file's modification time
+        and size, and refreshes it otherwise.
         
         Raises:
             FileNotFoundError: If config file doesn't exist
             json.JSONDecodeError: If JSON is invalid
             ValueError: If required sections are missing
         """
-        if not self.config_path.exists():
+        stamp = config_stamp(self.config_path)
+        if stamp is None:
             raise FileNotFoundError(f"Flavor config not found: {self.config_path}")
-        
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            self._data = json.load(f)
-        
-        # Validate structure
-        if 'flavors' not in self._data:
-            raise ValueError("Missing 'flavors' section in config")
-        if 'default_fields' not in self._data:
-            raise ValueError("Missing 'default_fields' section in config")
-        
-        self._flavors = self._data['flavors']
-        self._default_fields = self._data['default_fields']
+
+        cache_path = default_cache_path(self.config_path)
+        cached = read_cache(cache_path, self.config_path, stamp) if cache_path else None
+        if cached is not None:
+            data, index = cached
+        else:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            # Validate structure
+            if 'flavors' not in data:
+                raise ValueError("Missing 'flavors' section in config")
+            if 'default_fields' not in data:
+                raise ValueError("Missing 'default_fields' section in config")
+
+            index = FlavorIndex(data['flavors'])
+            if cache_path:
+                write_cache(cache_path, self.config_path, stamp, data, index)
+
+        self._data = data
+        self._flavors = data['flavors']
+        self._default_fields = data['default_fields']
+        self._index = index
+        self._stamp = stamp
+        self._checked_at = time.monotonic()
+        self.version += 1
     
     def ensure_loaded(self) -> None:
-        """Ensure flavors are loaded (lazy loading)."""
+        """Ensure flavors are loaded (lazy loading) and current (hot reload).
+
+        At most every RELOAD_CHECK_SECONDS the config file is checked, and
+        reloaded if its modification time or size changed. A file that
+        disappeared keeps the loaded flavors.
+        """
         if self._flavors is None:
             self.load()
+            return
+        now = time.monotonic()
+        if now - self._checked_at < self.RELOAD_CHECK_SECONDS:
+            return
+        self._checked_at = now
+        stamp = config_stamp(self.config_path)
+        if stamp is not None and stamp != self._stamp:
+            self.load()
+
+    @property
+    def index(self) -> FlavorIndex:
+        """Compiled index of the loaded flavors."""
+        self.ensure_loaded()
+        return self._index
     
     def get_all_flavors(self) -> Dict[str, Dict[str, Any]]:
         """Get all flavor definitions.
@@ -99,8 +156,7 @@ class FlavorLoader:
         Returns:
             Sorted list of flavor names
         """
-        self.ensure_loaded()
-        return sorted(self._flavors.keys())
+        return list(self.index.names)
     
     def get_default_fields(self) -> Dict[str, str]:
         """Get default field definitions.
@@ -129,15 +185,7 @@ class FlavorLoader:
         Returns:
             List of matching flavor names
         """
-        self.ensure_loaded()
-        audience_lower = audience.lower()
-        matching = []
-        
-        for name, flavor in self._flavors.items():
-            if 'audience' in flavor and audience_lower in flavor['audience'].lower():
-                matching.append(name)
-        
-        return sorted(matching)
+        return self.index.by_audience(audience)
     
     def get_flavors_by_engagement_goal(self, goal: str) -> List[str]:
         """Get flavors that include a specific engagement goal.
@@ -149,14 +197,7 @@ class FlavorLoader:
         Returns:
             Sorted list of matching flavor names
         """
-        self.ensure_loaded()
-        goal_lower = goal.lower()
-        matching = []
-        for name, flavor in self._flavors.items():
-            goals = flavor.get('engagement_goal', [])
-            if any(goal_lower == g.lower() for g in goals):
-                matching.append(name)
-        return sorted(matching)
+        return self.index.by_engagement_goal(goal)
 
     def get_flavors_by_format(self, format_name: str) -> List[str]:
         """Get flavors that fit a specific content format.
@@ -168,14 +209,27 @@ class FlavorLoader:
         Returns:
             Sorted list of matching flavor names
         """
-        self.ensure_loaded()
-        fmt_lower = format_name.lower()
-        matching = []
-        for name, flavor in self._flavors.items():
-            formats = flavor.get('format_fit', [])
-            if any(fmt_lower == f.lower() for f in formats):
-                matching.append(name)
-        return sorted(matching)
+        return self.index.by_format(format_name)
+
+    def search_flavors(self, keyword: str) -> List[str]:
+        """Get flavors whose name, description or keywords match a keyword.
+
+        Args:
+            keyword: Text to find in names and descriptions (case-insensitive),
+                     or a keyword listed by the flavor
+
+        Returns:
+            Sorted list of matching flavor names
+        """
+        return self.index.search(keyword)
+
+    def get_engagement_flavor_names(self) -> List[str]:
+        """Get flavors that define any engagement goal.
+
+        Returns:
+            Sorted list of flavor names
+        """
+        return list(self.index.engagement)
 
     def get_flavor_count(self) -> int:
         """Get total number of flavors.
@@ -192,11 +246,7 @@ class FlavorLoader:
         Returns:
             Dictionary mapping flavor names to weights
         """
-        self.ensure_loaded()
-        weights = {}
-        for name, flavor in self._flavors.items():
-            weights[name] = flavor.get('weight', 50)  # Default weight: 50
-        return weights
+        return dict(self.index.weights)  # Default weight: 50
 
 
 # Singleton instance for easy access
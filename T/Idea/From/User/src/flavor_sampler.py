@@ -0,0 +1,136 @@
+"""Weighted flavor sampling with precomputed alias tables.
+
+Idea generation draws flavors millions of times from distributions that only
+change when flavors.json does. ``WeightedSampler`` precomputes a Walker/Vose
+alias table once, after which every draw is O(1) and uses a single random
+number from the caller's ``random.Random``, so seeded draws are reproducible.
+
+Draws without replacement (several distinct flavors) reject already chosen
+flavors while they hold a small share of the weight, which keeps the exact
+successive-sampling distribution. Larger selections switch to
+Efraimidis-Spirakis keys over the remaining flavors.
+"""
+
+import heapq
+import math
+import random
+from typing import Generic, Iterable, List, Sequence, TypeVar
+
+T = TypeVar('T')
+
+# Rejection sampling stops once chosen items hold this share of the weight
+MAX_REJECTION_SHARE = 0.5
+
+
+class WeightedSampler(Generic[T]):
+    """Weighted random choice over a fixed list of items.
+
+    Example:
+        >>> sampler = WeightedSampler(['a', 'b', 'c'], [70, 20, 10])
+        >>> sampler.sample(random.Random(1)) in ('a', 'b', 'c')
+        True
+    """
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        """Build the alias table.
+
+        Args:
+            items: Distinct (hashable) items to draw
+            weights: Non-negative weight of each item
+
+        Raises:
+            ValueError: If lengths differ, a weight is negative or all are zero
+        """
+        if len(items) != len(weights):
+            raise ValueError("items and weights must have the same length")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("weights must not be negative")
+        self.items = list(items)
+        self._positions = {item: i for i, item in enumerate(self.items)}
+        self.weights = [float(weight) for weight in weights]
+        self.total = math.fsum(self.weights)
+        if not self.total > 0:
+            raise ValueError("total of weights must be greater than zero")
+
+        # Vose's alias method: every column holds at most two items
+        count = len(self.items)
+        scaled = [weight * count / self.total for weight in self.weights]
+        self._probability = [1.0] * count
+        self._alias = list(range(count))
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._probability[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Leftovers are 1.0 up to rounding
+        for i in small + large:
+            self._probability[i] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._positions
+
+    def _draw(self, rng: random.Random) -> int:
+        column = rng.random() * len(self._probability)
+        index = int(column)
+        if column - index < self._probability[index]:
+            return index
+        return self._alias[index]
+
+    def sample(self, rng: random.Random) -> T:
+        """One item, drawn with probability proportional to its weight."""
+        return self.items[self._draw(rng)]
+
+    def sample_many(self, rng: random.Random, count: int) -> List[T]:
+        """``count`` independent draws (with replacement)."""
+        return [self.items[self._draw(rng)] for _ in range(count)]
+
+    def sample_distinct(
+        self, rng: random.Random, count: int, exclude: Iterable[T] = ()
+    ) -> List[T]:
+        """Up to ``count`` distinct items, in weighted draw order.
+
+        Equivalent to drawing one item at a time and removing it, as
+        ``random.choices`` over the shrinking list would. Items in
+        ``exclude`` and items with zero weight are never returned.
+
+        Args:
+            rng: Random number generator
+            count: Number of items wanted
+            exclude: Items that must not be drawn
+        """
+        taken = {self._positions[item] for item in exclude if item in self._positions}
+        taken_weight = math.fsum(self.weights[i] for i in taken)
+        chosen: List[int] = []
+
+        # Rejecting taken items keeps the distribution exact and is O(1) per
+        # draw while they hold little of the weight
+        while len(chosen) < count and taken_weight < MAX_REJECTION_SHARE * self.total:
+            index = self._draw(rng)
+            if index in taken:
+                continue
+            taken.add(index)
+            chosen.append(index)
+            taken_weight += self.weights[index]
+
+        if len(chosen) < count:
+            # Efraimidis-Spirakis: the smallest Exp(1)/weight keys, in order
+            keys = [
+                (-math.log(1.0 - rng.random()) / weight, i)
+                for i, weight in enumerate(self.weights)
+                if weight > 0 and i not in taken
+            ]
+            chosen.extend(i for _, i in heapq.nsmallest(count - len(chosen), keys))
+
+        return [self.items[i] for i in chosen]
+
+
+__all__ = [
+    'MAX_REJECTION_SHARE',
+    'WeightedSampler',
+]
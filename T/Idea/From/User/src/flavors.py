@@ -14,6 +14,7 @@ from typing import Dict, List, Optional, Tuple
 import random
 
 from flavor_loader import get_flavor_loader
+from flavor_sampler import WeightedSampler
 
 
 # =============================================================================
@@ -400,6 +401,37 @@ def get_top_flavors_for_audience(
 _PRIMARY_ENGAGEMENT_GOALS: frozenset = frozenset({"rewatch", "comment", "share"})
 
 
+# (loader, loader version, sampler) of the boosted distribution
+_boosted_sampler: Optional[Tuple[object, int, WeightedSampler]] = None
+
+
+def _get_boosted_sampler() -> WeightedSampler:
+    """Sampler for pick_weighted_flavor, rebuilt when the flavor config reloads."""
+    global _boosted_sampler
+    loader = get_flavor_loader()
+    loader.ensure_loaded()
+    if _boosted_sampler is not None and _boosted_sampler[:2] == (loader, loader.version):
+        return _boosted_sampler[2]
+
+    all_flavor_data = loader.get_all_flavors()
+    base_weights = get_flavor_weights()
+
+    flavors = []
+    weights = []
+    for name, info in all_flavor_data.items():
+        if info.get("risk_flags"):
+            continue  # skip restricted variants
+        base = base_weights.get(name, 50)
+        goal_overlap = len(_PRIMARY_ENGAGEMENT_GOALS & set(info.get("engagement_goal", [])))
+        effective = base * (1.0 + 0.5 * goal_overlap)
+        flavors.append(name)
+        weights.append(effective)
+
+    sampler = WeightedSampler(flavors, weights)
+    _boosted_sampler = (loader, loader.version, sampler)
+    return sampler
+
+
 def get_flavor_weights() -> Dict[str, int]:
     """Get the flavor weight mappings.
     
@@ -430,22 +462,8 @@ def pick_weighted_flavor(seed: Optional[int] = None) -> str:
     else:
         rng = random.Random()
 
-    loader = get_flavor_loader()
-    all_flavor_data = loader.get_all_flavors()
-    base_weights = get_flavor_weights()
-
-    flavors = []
-    weights = []
-    for name, info in all_flavor_data.items():
-        if info.get("risk_flags"):
-            continue  # skip restricted variants
-        base = base_weights.get(name, 50)
-        goal_overlap = len(_PRIMARY_ENGAGEMENT_GOALS & set(info.get("engagement_goal", [])))
-        effective = base * (1.0 + 0.5 * goal_overlap)
-        flavors.append(name)
-        weights.append(effective)
-
-    return rng.choices(flavors, weights=weights, k=1)[0]
+    # The boosted weights only change with the config, so they are cached
+    return _get_boosted_sampler().sample(rng)
 
 
 def get_default_or_random_flavor(
@@ -496,19 +514,8 @@ def search_flavors_by_keyword(keyword: str) -> List[str]:
     Returns:
         List of matching flavor names
     """
-    keyword_lower = keyword.lower()
-    matches = []
-    
     loader = get_flavor_loader()
-    all_flavors = loader.get_all_flavors()
-    
-    for flavor_name, info in all_flavors.items():
-        if (keyword_lower in flavor_name.lower() or
-            keyword_lower in info.get('description', '').lower() or
-            keyword_lower in info.get('keywords', [])):
-            matches.append(flavor_name)
-    
-    return sorted(matches)
+    return loader.search_flavors(keyword)
 
 
 # =============================================================================
@@ -535,10 +542,7 @@ def get_engagement_flavors(goal: Optional[str] = None) -> List[str]:
     loader = get_flavor_loader()
     if goal:
         return loader.get_flavors_by_engagement_goal(goal)
-    all_flavors = loader.get_all_flavors()
-    return sorted(
-        name for name, info in all_flavors.items() if 'engagement_goal' in info
-    )
+    return loader.get_engagement_flavor_names()
 
 
 def get_flavors_by_format(format_name: str) -> List[str]:
@@ -44,7 +44,7 @@ from idea import ContentGenre, Idea, IdeaStatus
 
 # Try to import Config for database path
 try:
-    from src.config import Config
+    from src.config import get_config
 
     CONFIG_AVAILABLE = True
 except ImportError:
@@ -58,7 +58,7 @@ def get_default_db_path() -> str:
         Path to the database file (db.s3db in working directory)
     """
     if CONFIG_AVAILABLE:
-        config = Config(interactive=False)
+        config = get_config()
         return config.database_path
     else:
         # Fallback to C:/PrismQ/db.s3db
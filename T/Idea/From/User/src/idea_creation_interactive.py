@@ -46,6 +46,7 @@ sys.path.insert(0, str(REPO_ROOT))  # Add repo root for src module import
 try:
     from idea_variants import (
         DEFAULT_IDEA_COUNT,
+        PARALLEL_WORKERS,
         create_ideas_from_input,
         get_flavor,
         list_flavors,
@@ -72,8 +73,9 @@ except ImportError:
 
 # Import database from shared src module - REQUIRED
 try:
-    from src.config import Config
+    from src.config import get_config
     from src.idea import IdeaTable, setup_idea_table
+    from src.near_duplicates import NearDuplicateIndex
 
     DB_AVAILABLE = True
 except ImportError as e:
@@ -151,8 +153,8 @@ def get_database_path() -> str:
     Returns:
         Path to the database file (db.s3db in working directory)
     """
-    if Config is not None:
-        config = Config(interactive=False)
+    if DB_AVAILABLE:
+        config = get_config()
         return config.database_path
     else:
         # Fallback to C:/PrismQ/db.s3db
@@ -312,10 +314,15 @@ def run_interactive_mode():
     # This connection is reused across all inputs for better performance
     db = None
     db_path = None
+    duplicates = None
     
     try:
         db_path = get_database_path()
         db = setup_idea_table(db_path)
+        # Near-duplicate index shares the connection; new ideas are checked against it
+        duplicates = NearDuplicateIndex(connection=db.conn)
+        duplicates.create_tables()
+        duplicates.index_missing("idea")
         print_success("Database connected")
         print_info(f"Database: {db_path}")
         print_info("NOTE: PrismQ uses ONE shared database (db.s3db) for all modules")
@@ -402,32 +409,44 @@ def run_interactive_mode():
                 
                 # Select flavors upfront
                 selected_flavors = selector.select_multiple(DEFAULT_IDEA_COUNT)
-                
-                # Generate variants one at a time with progress feedback
-                for i, flavor_name in enumerate(selected_flavors):
-                    try:
-                        # Show progress
-                        print_info(f"  [{i+1}/{DEFAULT_IDEA_COUNT}] Generating with flavor: {flavor_name}...")
-                        
-                        # Generate the variant using raw input text
-                        # Pass database connection for direct save
-                        idea = generator.generate_from_flavor(
-                            flavor_name=flavor_name,
-                            input_text=input_text,
-                            variation_index=i,
-                            db=db,
-                            logger=None,
+
+                def report_progress(report, idea):
+                    position = f"[{report.index + 1}/{DEFAULT_IDEA_COUNT}]"
+                    if report.status == 'near_duplicate':
+                        print_info(
+                            f"  {position} Skipped {report.variant_name}: near-duplicate of "
+                            f"idea {report.idea_id} ({report.similarity:.0%} similar)"
+                        )
+                    elif report.status == 'duplicate':
+                        print_info(
+                            f"  {position} Skipped {report.variant_name}: same prompt as "
+                            f"variant {report.duplicate_of + 1}"
+                        )
+                    elif report.status == 'failed':
+                        print_warning(
+                            f"  {position} Failed with flavor {report.flavor}: {report.error}"
                         )
-                        
-                        # Track saved ID if returned
-                        if idea.get('idea_id'):
-                            saved_ids.append(idea['idea_id'])
-                        
-                        variants.append(idea)
-                    
-                    except Exception as e:
-                        print_warning(f"  [{i+1}/{DEFAULT_IDEA_COUNT}] Failed with flavor {flavor_name}: {e}")
-                        continue
+                    else:
+                        print_info(
+                            f"  {position} {report.variant_name} ({report.seconds:.1f}s)"
+                        )
+
+                # Generate variants concurrently; each is saved as soon as it completes
+                print_info(f"  Running up to {PARALLEL_WORKERS} AI calls in parallel...")
+                result = generator.generate_bulk(
+                    input_text=input_text,
+                    count=DEFAULT_IDEA_COUNT,
+                    specific_flavors=selected_flavors,
+                    db=db,
+                    on_result=report_progress,
+                    duplicate_index=duplicates,
+                )
+                variants = result.ideas
+                saved_ids = [idea['idea_id'] for idea in variants if idea.get('idea_id')]
+                print_info(
+                    f"  Finished in {result.elapsed:.1f}s "
+                    f"({result.generation_seconds:.1f}s of AI calls)"
+                )
 
             except Exception as e:
                 print_error(f"Error creating variants: {e}")
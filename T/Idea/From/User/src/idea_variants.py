@@ -14,17 +14,72 @@ you provide, ensuring full flexibility in input format.
 """
 
 import hashlib
+import os
 import random
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
 
 from flavor_loader import get_flavor_loader
+from flavor_sampler import WeightedSampler
 from ai_generator import AIIdeaGenerator, AIConfig
 
 logger = logging.getLogger(__name__)
 
+# Number of parallel Ollama slots used by bulk generation; should match
+# OLLAMA_NUM_PARALLEL (shared with T/Title/From/Idea and T/Pipeline)
+PARALLEL_WORKERS = int(os.getenv("PRISMQ_PARALLEL_WORKERS", "4"))
+
+
+@dataclass
+class VariantReport:
+    """Outcome of one variant in a bulk generation run.
+
+    Attributes:
+        index: Position of the variant in the selected flavors
+        flavor: Primary flavor name
+        variant_name: Flavor combination actually used ('' if not planned)
+        status: 'pending', 'generated', 'duplicate', 'near_duplicate' or 'failed'
+        seconds: Latency of the AI call (0.0 if no call was made)
+        idea_id: Database ID when saved, or of the existing idea a
+                 near-duplicate was merged into
+        duplicate_of: Index of the variant with the same prompt
+        similarity: Similarity to the existing idea for near-duplicates
+        error: Error message for failed variants
+    """
+
+    index: int
+    flavor: str
+    variant_name: str = ''
+    status: str = 'pending'
+    seconds: float = 0.0
+    idea_id: Optional[Any] = None
+    duplicate_of: Optional[int] = None
+    similarity: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BulkGenerationResult:
+    """Ideas and per-variant reports from :meth:`IdeaGenerator.generate_bulk`."""
+
+    ideas: List[Dict[str, Any]] = field(default_factory=list)
+    reports: List[VariantReport] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def generation_seconds(self) -> float:
+        """Sum of AI call latencies (what a sequential run would have waited)."""
+        return sum(report.seconds for report in self.reports)
+
+    def count(self, status: str) -> int:
+        """Number of variants with ``status``."""
+        return sum(1 for report in self.reports if report.status == status)
+
 
 # =============================================================================
 # IDEA GENERATION SERVICE
@@ -115,64 +170,13 @@ class IdeaGenerator:
         if not input_text:
             raise ValueError("input_text parameter is required and cannot be empty")
 
-        # Validate primary flavor exists
-        self.loader.get_flavor(flavor_name)
-        seed = self._generate_seed(input_text, variation_index)
-
-        # Build a recursive flavor combination starting from flavor_name
-        selector = FlavorSelector(self.loader)
-        combination = selector.select_flavor_combination(
-            primary_flavor=flavor_name,
-            seed=seed,
-            multi_chance=second_flavor_chance,
-            no_flavor_chance=FlavorSelector.NO_FLAVOR_CHANCE,
+        variant_name, flavor_text = self._plan_variant(
+            flavor_name, input_text, variation_index, second_flavor_chance, logger
         )
-
-        # combination may be empty (no-flavor wild card) or contain 1+ flavors
-        variant_name = " + ".join(combination) if combination else "(no flavor)"
-        if len(combination) > 1 and logger:
-            logger.info(f"Using multi-flavor combination: {variant_name}")
-        elif not combination and logger:
-            logger.info("Using no-flavor (unguided) generation")
-
-        # Generate complete refined idea using idea_improvement prompt
-        if not self.ai_generator:
-            raise RuntimeError(
-                "AI generator not available. Cannot generate ideas without AI. "
-                "Please ensure Ollama is installed and running."
-            )
-
-        # Build flavor text: joined names, or empty string when no flavor
-        flavor_text = " and ".join(combination) if combination else ""
-
-        # Use idea_improvement prompt to generate complete refined idea
-        # Pass input_text directly without any parsing or transformation
-        generated_idea = self.ai_generator.generate_with_custom_prompt(
-            input_text=input_text,
-            prompt_template_name="idea_improvement",
-            flavor=flavor_text,
-            use_random_flavor=False
-        )
-        
-        # Validate content
-        if not generated_idea or len(generated_idea) <= self.MIN_AI_CONTENT_LENGTH:
-            raise RuntimeError(
-                f"AI generated insufficient content. "
-                f"Generated: {len(generated_idea) if generated_idea else 0} characters, "
-                f"minimum required: {self.MIN_AI_CONTENT_LENGTH}."
-            )
+        generated_idea = self._generate_variant_text(input_text, flavor_text)
         
         # Save directly to database if provided (not preview mode)
-        idea_id = None
-        if db:
-            try:
-                idea_id = db.insert_idea(text=generated_idea, version=1)
-                if logger:
-                    logger.debug(f"Saved idea directly to database with ID: {idea_id}")
-            except Exception as e:
-                if logger:
-                    logger.error(f"Failed to save idea to database: {e}")
-                raise RuntimeError(f"Database save failed: {e}")
+        idea_id = self._save_idea(db, generated_idea, logger) if db else None
         
         # Return minimal data for display only
         result = {
@@ -232,9 +236,243 @@ class IdeaGenerator:
                 continue
         
         return ideas
-    
+
+    def generate_bulk(
+        self,
+        input_text: str,
+        count: int = 10,
+        specific_flavors: Optional[List[str]] = None,
+        db: Optional[Any] = None,
+        max_workers: int = PARALLEL_WORKERS,
+        on_result: Optional[Callable[[VariantReport, Optional[Dict[str, Any]]], None]] = None,
+        logger: Optional[logging.Logger] = None,
+        duplicate_index: Optional[Any] = None,
+    ) -> BulkGenerationResult:
+        """Generate multiple ideas with concurrent AI calls.
+
+        Flavor combinations are drawn up front exactly as
+        :meth:`generate_from_flavor` would draw them. Variants whose prompt
+        would repeat an earlier one (same input and flavor text) are skipped,
+        and the remaining prompts are sent to Ollama ``max_workers`` at a
+        time. Each finished idea is saved to ``db`` and passed to
+        ``on_result`` as soon as it completes, on the calling thread, so the
+        database connection is never shared between threads.
+
+        Args:
+            input_text: Raw input text (no parsing)
+            count: Number of ideas to generate
+            specific_flavors: Optional list of specific flavors.
+                            If None, uses weighted random selection.
+            db: Optional database connection for direct save after generation
+            max_workers: Concurrent AI calls; should match OLLAMA_NUM_PARALLEL
+                         (default: PRISMQ_PARALLEL_WORKERS or 4)
+            on_result: Optional callback ``(report, idea)`` called per variant
+                       in completion order; ``idea`` is None unless generated
+            logger: Optional logger for tracking
+            duplicate_index: Optional NearDuplicateIndex (src.near_duplicates).
+                             A generated idea that is a near-duplicate of an
+                             indexed idea is not saved; its report is marked
+                             'near_duplicate' and points at the existing idea.
+                             Saved ideas are added to the index.
+
+        Returns:
+            BulkGenerationResult with ideas in variant order and one
+            VariantReport per selected flavor
+
+        Raises:
+            ValueError: If input_text is empty
+            RuntimeError: If the AI generator is not available
+        """
+        if not input_text:
+            raise ValueError("input_text parameter is required and cannot be empty")
+        if not self.ai_generator:
+            raise RuntimeError(
+                "AI generator not available. Cannot generate ideas without AI. "
+                "Please ensure Ollama is installed and running."
+            )
+
+        started = time.perf_counter()
+        if specific_flavors:
+            selected_flavors = specific_flavors[:count]
+        else:
+            selected_flavors = FlavorSelector(self.loader).select_multiple(count)
+
+        reports: List[VariantReport] = []
+        pending: List[Tuple[VariantReport, str]] = []
+        first_by_prompt: Dict[str, int] = {}
+
+        def finish(report: VariantReport, idea: Optional[Dict[str, Any]] = None) -> None:
+            if on_result:
+                on_result(report, idea)
+
+        # Planning is cheap and uses the selector's RNG, so it stays on this thread
+        for i, flavor_name in enumerate(selected_flavors):
+            report = VariantReport(index=i, flavor=flavor_name)
+            reports.append(report)
+            try:
+                report.variant_name, flavor_text = self._plan_variant(
+                    flavor_name, input_text, i, logger=logger
+                )
+            except KeyError as e:
+                report.status, report.error = 'failed', str(e)
+                finish(report)
+                continue
+            prompt_hash = self._generate_prompt_hash(input_text, flavor_text)
+            if prompt_hash in first_by_prompt:
+                report.status = 'duplicate'
+                report.duplicate_of = first_by_prompt[prompt_hash]
+                finish(report)
+                continue
+            first_by_prompt[prompt_hash] = i
+            pending.append((report, flavor_text))
+
+        def generate(flavor_text: str) -> Tuple[Optional[str], Optional[str], float]:
+            call_started = time.perf_counter()
+            try:
+                text = self._generate_variant_text(input_text, flavor_text)
+                return text, None, time.perf_counter() - call_started
+            except Exception as e:
+                return None, str(e), time.perf_counter() - call_started
+
+        ideas: Dict[int, Dict[str, Any]] = {}
+        if pending:
+            workers = max(1, min(max_workers, len(pending)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(generate, flavor_text): report
+                    for report, flavor_text in pending
+                }
+                for future in as_completed(futures):
+                    report = futures[future]
+                    text, error, report.seconds = future.result()
+                    if error is not None:
+                        report.status, report.error = 'failed', error
+                        finish(report)
+                        continue
+                    idea = {
+                        'text': text,
+                        'variant_name': report.variant_name,
+                        'source_input': input_text,
+                    }
+                    if duplicate_index:
+                        matches = duplicate_index.find('idea', text)
+                        if matches:
+                            report.status = 'near_duplicate'
+                            report.idea_id = matches[0].ref_id
+                            report.similarity = matches[0].similarity
+                            finish(report)
+                            continue
+                    report.status = 'generated'
+                    if db:
+                        try:
+                            report.idea_id = self._save_idea(db, text, logger)
+                        except RuntimeError as e:
+                            report.status, report.error = 'failed', str(e)
+                            finish(report)
+                            continue
+                        if report.idea_id:
+                            idea['idea_id'] = report.idea_id
+                            if duplicate_index:
+                                duplicate_index.add('idea', report.idea_id, text)
+                    ideas[report.index] = idea
+                    finish(report, idea)
+
+        return BulkGenerationResult(
+            ideas=[ideas[i] for i in sorted(ideas)],
+            reports=reports,
+            elapsed=time.perf_counter() - started,
+        )
+
     # Helper methods
-    
+
+    def _plan_variant(
+        self,
+        flavor_name: str,
+        input_text: str,
+        variation_index: int,
+        second_flavor_chance: float = 0.4,
+        logger: Optional[logging.Logger] = None,
+    ) -> Tuple[str, str]:
+        """Draw the flavor combination for one variant.
+
+        Returns:
+            (variant_name, flavor_text) - flavor_text is empty for no flavor
+
+        Raises:
+            KeyError: If flavor not found
+        """
+        # Validate primary flavor exists
+        self.loader.get_flavor(flavor_name)
+        seed = self._generate_seed(input_text, variation_index)
+
+        # Build a recursive flavor combination starting from flavor_name
+        selector = FlavorSelector(self.loader)
+        combination = selector.select_flavor_combination(
+            primary_flavor=flavor_name,
+            seed=seed,
+            multi_chance=second_flavor_chance,
+            no_flavor_chance=FlavorSelector.NO_FLAVOR_CHANCE,
+        )
+
+        # combination may be empty (no-flavor wild card) or contain 1+ flavors
+        variant_name = " + ".join(combination) if combination else "(no flavor)"
+        if len(combination) > 1 and logger:
+            logger.info(f"Using multi-flavor combination: {variant_name}")
+        elif not combination and logger:
+            logger.info("Using no-flavor (unguided) generation")
+
+        # Build flavor text: joined names, or empty string when no flavor
+        flavor_text = " and ".join(combination) if combination else ""
+        return variant_name, flavor_text
+
+    def _generate_variant_text(self, input_text: str, flavor_text: str) -> str:
+        """Generate and validate the refined idea text for one variant.
+
+        Raises:
+            RuntimeError: If AI is not available or the content is too short
+        """
+        # Generate complete refined idea using idea_improvement prompt
+        if not self.ai_generator:
+            raise RuntimeError(
+                "AI generator not available. Cannot generate ideas without AI. "
+                "Please ensure Ollama is installed and running."
+            )
+
+        # Use idea_improvement prompt to generate complete refined idea
+        # Pass input_text directly without any parsing or transformation
+        generated_idea = self.ai_generator.generate_with_custom_prompt(
+            input_text=input_text,
+            prompt_template_name="idea_improvement",
+            flavor=flavor_text,
+            use_random_flavor=False
+        )
+
+        # Validate content
+        if not generated_idea or len(generated_idea) <= self.MIN_AI_CONTENT_LENGTH:
+            raise RuntimeError(
+                f"AI generated insufficient content. "
+                f"Generated: {len(generated_idea) if generated_idea else 0} characters, "
+                f"minimum required: {self.MIN_AI_CONTENT_LENGTH}."
+            )
+        return generated_idea
+
+    @staticmethod
+    def _save_idea(db: Any, text: str, logger: Optional[logging.Logger] = None) -> Any:
+        """Insert a generated idea and return its ID.
+
+        Raises:
+            RuntimeError: If the database insert fails
+        """
+        try:
+            idea_id = db.insert_idea(text=text, version=1)
+            if logger:
+                logger.debug(f"Saved idea directly to database with ID: {idea_id}")
+            return idea_id
+        except Exception as e:
+            if logger:
+                logger.error(f"Failed to save idea to database: {e}")
+            raise RuntimeError(f"Database save failed: {e}")
+
     @staticmethod
     def _generate_seed(input_text: str, variation_index: int) -> int:
         """Generate consistent seed from inputs.
@@ -264,7 +502,17 @@ class IdeaGenerator:
         """
         content = f"{input_text}{flavor_name}{variation_index}{datetime.now().isoformat()}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
-    
+
+    @staticmethod
+    def _generate_prompt_hash(input_text: str, flavor_text: str) -> str:
+        """Generate a stable hash of the inputs that determine the AI prompt.
+
+        Unlike :meth:`_generate_idea_hash` it has no timestamp, so two
+        variants with the same input and flavor text hash the same.
+        """
+        content = f"{input_text}\x00{flavor_text}"
+        return hashlib.sha256(content.encode()).hexdigest()[:16]
+
     @staticmethod
     def _humanize_topic(title: str) -> str:
         """Convert title to readable topic format."""
@@ -371,6 +619,9 @@ class FlavorSelector:
     """Selects flavors using weighted random selection.
     
     Single Responsibility: Flavor selection logic only.
+
+    Draws use a WeightedSampler (alias table) built once per flavor config
+    and rebuilt when the FlavorLoader reloads.
     """
 
     # Default number of ideas (slots) to generate
@@ -401,6 +652,18 @@ class FlavorSelector:
         """
         self.loader = flavor_loader or get_flavor_loader()
         self.loader.ensure_loaded()
+        self._sampler: Optional[WeightedSampler] = None
+        self._sampler_version: Optional[int] = None
+
+    def _get_sampler(self) -> WeightedSampler:
+        """Sampler over all flavors by weight, rebuilt after a config reload."""
+        self.loader.ensure_loaded()
+        if self._sampler is None or self._sampler_version != self.loader.version:
+            flavors = self.loader.list_flavor_names()
+            weights = self.loader.get_weights()
+            self._sampler = WeightedSampler(flavors, [weights.get(f, 50) for f in flavors])
+            self._sampler_version = self.loader.version
+        return self._sampler
     
     def select_one(self, seed: Optional[int] = None) -> str:
         """Select a single flavor using weighted random selection.
@@ -412,12 +675,7 @@ class FlavorSelector:
             Selected flavor name
         """
         rng = random.Random(seed) if seed is not None else random.Random()
-        
-        flavors = self.loader.list_flavor_names()
-        weights = self.loader.get_weights()
-        flavor_weights = [weights.get(f, 50) for f in flavors]
-        
-        return rng.choices(flavors, weights=flavor_weights, k=1)[0]
+        return self._get_sampler().sample(rng)
 
     def select_flavor_combination(
         self,
@@ -462,23 +720,23 @@ class FlavorSelector:
         if no_flavor_chance > 0.0 and rng.random() < no_flavor_chance:
             return []
 
-        flavors = self.loader.list_flavor_names()
-        weights = self.loader.get_weights()
+        sampler = self._get_sampler()
 
         # --- first flavor ---
         if primary_flavor is not None:
             selected = [primary_flavor]
+            remaining = len(sampler) - (primary_flavor in sampler)
         else:
-            flavor_weights = [weights.get(f, 50) for f in flavors]
-            selected = [rng.choices(flavors, weights=flavor_weights, k=1)[0]]
+            selected = [sampler.sample(rng)]
+            remaining = len(sampler) - 1
 
         # --- recursively add more flavors ---
-        remaining = [f for f in flavors if f not in selected]
         while remaining and rng.random() < multi_chance:
-            remaining_weights = [weights.get(f, 50) for f in remaining]
-            next_flavor = rng.choices(remaining, weights=remaining_weights, k=1)[0]
-            selected.append(next_flavor)
-            remaining = [f for f in remaining if f != next_flavor]
+            next_flavors = sampler.sample_distinct(rng, 1, exclude=selected)
+            if not next_flavors:
+                break
+            selected.extend(next_flavors)
+            remaining -= 1
 
         return selected
 
@@ -499,28 +757,13 @@ class FlavorSelector:
             List of selected flavor names
         """
         rng = random.Random(seed) if seed is not None else random.Random()
+        sampler = self._get_sampler()
         
-        flavors = self.loader.list_flavor_names()
-        weights = self.loader.get_weights()
-        flavor_weights = [weights.get(f, 50) for f in flavors]
-        
-        if allow_duplicates or count > len(flavors):
-            return rng.choices(flavors, weights=flavor_weights, k=count)
+        if allow_duplicates or count > len(sampler):
+            return sampler.sample_many(rng, count)
         
         # Ensure unique flavors
-        selected = []
-        remaining_flavors = flavors.copy()
-        remaining_weights = flavor_weights.copy()
-        
-        for _ in range(min(count, len(flavors))):
-            choice = rng.choices(remaining_flavors, weights=remaining_weights, k=1)[0]
-            selected.append(choice)
-            
-            idx = remaining_flavors.index(choice)
-            remaining_flavors.pop(idx)
-            remaining_weights.pop(idx)
-        
-        return selected
+        return sampler.sample_distinct(rng, count)
 
 
 # =============================================================================
@@ -594,6 +837,37 @@ def create_ideas_from_input(
     )
 
 
+def create_ideas_in_bulk(
+    input_text: str,
+    count: int = 10,
+    flavors: Optional[List[str]] = None,
+    db: Optional[Any] = None,
+    max_workers: int = PARALLEL_WORKERS,
+) -> BulkGenerationResult:
+    """Create multiple ideas with concurrent AI calls - convenience function.
+
+    See :meth:`IdeaGenerator.generate_bulk` for details.
+
+    Args:
+        input_text: Raw input text (no parsing)
+        count: Number of ideas (default: 10)
+        flavors: Optional list of specific flavors
+        db: Optional database connection; ideas are saved as they complete
+        max_workers: Concurrent AI calls (default: PRISMQ_PARALLEL_WORKERS or 4)
+
+    Returns:
+        BulkGenerationResult with ideas and per-variant latency reports
+    """
+    generator = _get_generator()
+    return generator.generate_bulk(
+        input_text=input_text,
+        count=count,
+        specific_flavors=flavors,
+        db=db,
+        max_workers=max_workers,
+    )
+
+
 def generate_idea_from_flavor(
     flavor_name: str,
     input_text: str,
@@ -747,8 +1021,11 @@ __all__ = [
     'IdeaGenerator',
     'FlavorSelector',
     'IdeaFormatter',
+    'VariantReport',
+    'BulkGenerationResult',
     # AI/flavor convenience functions
     'create_ideas_from_input',
+    'create_ideas_in_bulk',
     'generate_idea_from_flavor',
     'pick_weighted_flavor',
     'pick_multiple_weighted_flavors',
@@ -759,6 +1036,7 @@ __all__ = [
     'pick_flavor_combination',
     # Constants
     'DEFAULT_IDEA_COUNT',
+    'PARALLEL_WORKERS',
     # Template-based generation (not replaced by AI)
     'VARIANT_TEMPLATES',
     'VARIANT_EMOTION_FIRST',
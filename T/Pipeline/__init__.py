@@ -0,0 +1,63 @@
+"""T.Pipeline - Single-process runner for the PrismQ.T stage pipeline
+
+Hosts every numbered T stage (02-17, see _meta/scripts) in one Python process
+instead of one Run.bat loop per stage. Stage services are imported once and
+each worker slot keeps its database connection and service instance for the
+whole run.
+
+Example Usage:
+    ```bash
+    python -m T.Pipeline --stages 03,05-07,10-17
+    python -m T.Pipeline --stages 11-17 --once
+    ```
+
+    ```python
+    from T.Pipeline import PipelineRunner, parse_stage_filter
+
+    runner = PipelineRunner("C:/PrismQ/db.s3db", parse_stage_filter("10-17"))
+    stats = runner.run(stop_when_idle=True)
+    ```
+"""
+
+from Model.Infrastructure.lazy import lazy_exports
+
+# Submodules are imported on first use of a name, so importing one part of
+# the pipeline does not pay for the simulator, benchmark or fake Ollama server.
+# The WIP-limit names are re-exported from Model.Infrastructure.backpressure.
+_EXPORTS = {
+    "BenchmarkResult": ".src.benchmark",
+    "run_benchmark": ".src.benchmark",
+    "BackpressureGate": "Model.Infrastructure.backpressure",
+    "DEFAULT_WIP_LIMITS": "Model.Infrastructure.backpressure",
+    "GroupPressure": "Model.Infrastructure.backpressure",
+    "WipGroup": "Model.Infrastructure.backpressure",
+    "load_wip_groups": "Model.Infrastructure.backpressure",
+    "FakeOllama": ".src.fake_ollama",
+    "start_fake_ollama": ".src.fake_ollama",
+    "StageRun": ".src.history",
+    "StageRunLog": ".src.history",
+    "JournalTail": ".src.journal",
+    "StateStats": ".src.journal",
+    "install_journal": ".src.journal",
+    "PipelineRunner": ".src.runner",
+    "StageStats": ".src.runner",
+    "PipelineModel": ".src.simulator",
+    "SimulationConfig": ".src.simulator",
+    "SimulationResult": ".src.simulator",
+    "StageModel": ".src.simulator",
+    "fit_pipeline": ".src.simulator",
+    "simulate": ".src.simulator",
+    "StageBreakdown": ".src.traces",
+    "aggregate_stages": ".src.traces",
+    "build_waterfall": ".src.traces",
+    "STAGES": ".src.stages",
+    "StageContext": ".src.stages",
+    "StageOutcome": ".src.stages",
+    "StageSpec": ".src.stages",
+    "get_stage": ".src.stages",
+    "parse_stage_filter": ".src.stages",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
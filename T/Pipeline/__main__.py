@@ -0,0 +1,7 @@
+"""Allow ``python -m T.Pipeline``."""
+
+import sys
+
+from .src.cli import main
+
+sys.exit(main())
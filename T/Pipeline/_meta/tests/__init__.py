@@ -0,0 +1 @@
+"""Tests for PrismQ.T.Pipeline - single-process stage runner."""
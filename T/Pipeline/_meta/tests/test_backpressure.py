@@ -0,0 +1,194 @@
+"""Tests for WIP limits and backpressure (Model.Infrastructure.backpressure)."""
+
+import sqlite3
+
+import pytest
+
+from Model import StateNames
+from Model.Entities.story import Story
+from Model.Infrastructure.backpressure import BackpressureGate, load_wip_groups
+from T.Pipeline import PipelineRunner, StageOutcome, StageSpec
+
+REVIEW_STATE = StateNames.REVIEW_CONTENT_FROM_TITLE
+GRAMMAR_STATE = StateNames.REVIEW_CONTENT_GRAMMAR
+
+
+class MoveHandler:
+    """Moves the oldest story from one state to the next."""
+
+    def __init__(self, context, number, from_state, to_state):
+        self.conn = context.connect()
+        self.number = number
+        self.from_state = from_state
+        self.to_state = to_state
+
+    def process_next(self):
+        row = self.conn.execute(
+            "SELECT id FROM Story WHERE state = ? ORDER BY id LIMIT 1", (self.from_state,)
+        ).fetchone()
+        if row is None:
+            return StageOutcome(stage=self.number, success=True)
+        self.conn.execute("UPDATE Story SET state = ? WHERE id = ?", (self.to_state, row["id"]))
+        self.conn.commit()
+        return StageOutcome(stage=self.number, success=True, story_id=row["id"], passes=True)
+
+    def close(self):
+        self.conn.close()
+
+
+def add_stories(db_path, state, count):
+    conn = sqlite3.connect(db_path)
+    conn.executemany("INSERT INTO Story (state) VALUES (?)", [(state,)] * count)
+    conn.commit()
+    conn.close()
+
+
+def states(db_path):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT state, COUNT(*) FROM Story GROUP BY state").fetchall()
+    conn.close()
+    return dict(rows)
+
+
+def gate_with(**limits):
+    names = ("generation", "review", "quality", "expert")
+    return BackpressureGate(load_wip_groups({name: limits.get(name) for name in names}))
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "db.s3db")
+    conn = sqlite3.connect(path)
+    conn.executescript(Story.get_sql_schema())
+    conn.commit()
+    conn.close()
+    return path
+
+
+class TestLoadWipGroups:
+    def test_defaults_cover_review_and_quality_states(self):
+        groups = {group.name: group for group in load_wip_groups()}
+        assert REVIEW_STATE in groups["review"].states
+        assert GRAMMAR_STATE in groups["quality"].states
+        assert groups["review"].limit == 200
+
+    def test_environment_overrides_default(self, monkeypatch):
+        monkeypatch.setenv("PRISMQ_WIP_LIMIT_REVIEW", "25")
+        monkeypatch.setenv("PRISMQ_WIP_LIMIT_QUALITY", "0")
+        groups = {group.name: group for group in load_wip_groups()}
+        assert groups["review"].limit == 25
+        assert groups["quality"].limit is None
+
+
+class TestBackpressureGate:
+    def test_pauses_upstream_at_limit(self):
+        gate = gate_with(review=10)
+        gate.update({REVIEW_STATE: 10})
+        assert gate.is_paused(3)
+        assert gate.is_paused(4)
+        assert gate.describe(4) == "review 10/10"
+
+    def test_downstream_stages_never_paused(self):
+        gate = gate_with(review=10)
+        gate.update({REVIEW_STATE: 50})
+        assert not gate.is_paused(10)
+        assert not gate.is_paused(11)
+
+    def test_story_creation_gated_by_generation_queue(self):
+        gate = gate_with(generation=5)
+        gate.update({StateNames.TITLE_FROM_IDEA: 5})
+        assert gate.is_paused(2)
+        assert not gate.is_paused(3)
+
+    def test_title_generation_gated_by_content_queue(self):
+        gate = gate_with(generation=5)
+        gate.update({StateNames.TITLE_FROM_IDEA: 2, StateNames.CONTENT_FROM_IDEA_TITLE: 5})
+        assert gate.is_paused(3)
+        assert gate.describe(3) == "generation 5/5"
+        assert not gate.is_paused(4)
+
+        # Stage 03 drains its own queue; only stage 02 stops feeding it
+        gate.update({StateNames.TITLE_FROM_IDEA: 6, StateNames.CONTENT_FROM_IDEA_TITLE: 4})
+        assert gate.is_paused(2)
+        assert not gate.is_paused(3)
+
+    def test_paused_stages_lists_every_gated_stage(self):
+        gate = gate_with(generation=5, review=10)
+        gate.update({StateNames.TITLE_FROM_IDEA: 6, REVIEW_STATE: 3})
+        assert gate.paused_stages() == {2: "generation 6/5"}
+
+        gate.update({REVIEW_STATE: 10})
+        assert gate.paused_stages() == {2: "review 10/10", 3: "review 10/10", 4: "review 10/10"}
+        assert gate.paused_stages([4, 10]) == {4: "review 10/10"}
+
+    def test_later_groups_also_gate_upstream(self):
+        gate = gate_with(quality=10)
+        gate.update({GRAMMAR_STATE: 12})
+        assert gate.is_paused(2)
+        assert gate.is_paused(4)
+
+    def test_hysteresis_resumes_below_ratio(self):
+        gate = gate_with(review=20)
+        gate.update({REVIEW_STATE: 20})
+        gate.update({REVIEW_STATE: 19})
+        assert gate.is_paused(4)
+        gate.update({REVIEW_STATE: 18})
+        assert not gate.is_paused(4)
+
+    def test_unlimited_group_never_pauses(self):
+        gate = gate_with()
+        gate.update({REVIEW_STATE: 10_000})
+        assert not gate.is_paused(4)
+        assert gate.pressure["review"].ratio == 0.0
+
+    def test_refresh_reads_story_table(self, db_path):
+        add_stories(db_path, REVIEW_STATE, 3)
+        gate = gate_with(review=3)
+        conn = sqlite3.connect(db_path)
+        try:
+            pressure = gate.refresh(conn)
+        finally:
+            conn.close()
+        assert pressure["review"].depth == 3
+        assert pressure["review"].paused
+
+
+class TestRunnerBackpressure:
+    def fake_stages(self):
+        return [
+            StageSpec(
+                4, "Fake.Content", "Draft",
+                lambda context: MoveHandler(context, 4, "Draft", REVIEW_STATE),
+            ),
+            StageSpec(
+                10, "Fake.Review", REVIEW_STATE,
+                lambda context: MoveHandler(context, 10, REVIEW_STATE, "Done"),
+            ),
+        ]
+
+    def test_paused_stage_is_not_scheduled(self, db_path):
+        add_stories(db_path, "Draft", 3)
+        add_stories(db_path, REVIEW_STATE, 5)
+        gate = gate_with(review=5)
+        gate.gated_stages = {4: "review"}
+        runner = PipelineRunner(db_path, self.fake_stages(), max_workers=2, gate=gate)
+        runner.start()
+        try:
+            runner.tick()
+            assert runner.paused_stages() == {4: "review 5/5"}
+            assert [stage for stage, _ in runner._in_flight.values()] == [10]
+        finally:
+            runner.close()
+
+    def test_upstream_resumes_as_review_drains(self, db_path):
+        add_stories(db_path, "Draft", 3)
+        add_stories(db_path, REVIEW_STATE, 5)
+        gate = gate_with(review=5)
+        gate.gated_stages = {4: "review"}
+        runner = PipelineRunner(
+            db_path, self.fake_stages(), max_workers=1, poll_interval=0.01, gate=gate
+        )
+        runner.run(stop_when_idle=True)
+
+        assert states(db_path) == {"Done": 8}
+        assert runner.stats[4].processed == 3
@@ -0,0 +1,129 @@
+"""Tests for the fake Ollama server and the end-to-end benchmark."""
+
+import json
+import socket
+import subprocess
+import sys
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from Model.Infrastructure.tracing import Span
+from T.Pipeline.src.benchmark import (
+    BenchmarkResult,
+    StageBenchmark,
+    TimedStageContext,
+    aggregate_spans,
+    compare_results,
+    db_seconds,
+)
+from T.Pipeline.src.fake_ollama import (
+    DEFAULT_PORT,
+    PASS_SCORE,
+    FakeOllama,
+    classify_prompt,
+    start_fake_ollama,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+
+
+def port_in_use(port):
+    with socket.socket() as sock:
+        return sock.connect_ex(("127.0.0.1", port)) == 0
+
+
+class TestFakeOllama:
+    def test_prompt_families(self):
+        assert classify_prompt("Respond with a single JSON object only") == "review"
+        assert classify_prompt("You are a title architect. Write one title.") == "title"
+        assert classify_prompt("Write the narration for this story") == "content"
+
+    def test_same_prompt_same_answer(self):
+        fake = FakeOllama(time_scale=0)
+        first = fake.generate({"prompt": "Return JSON for: story A"})
+        again = fake.generate({"prompt": "Return JSON for: story A"})
+
+        assert first["response"] == again["response"]
+        assert fake.requests == {"review": 2}
+
+    def test_review_is_schema_valid(self):
+        fake = FakeOllama(time_scale=0, pass_rate=1.0)
+        review = json.loads(fake.generate({"prompt": "Return JSON"})["response"])
+
+        assert review["overall_score"] == PASS_SCORE
+        assert isinstance(review["feedback"], str)
+
+    def test_durations_follow_profile(self):
+        result = FakeOllama(time_scale=0).generate({"prompt": "Write the narration"})
+        tokens_per_second = result["eval_count"] / (result["eval_duration"] / 1e9)
+        assert tokens_per_second == pytest.approx(40.0, rel=0.01)
+
+    def test_http_endpoints(self):
+        server = start_fake_ollama(port=0, fake=FakeOllama(time_scale=0, models=["qwen3:14b"]))
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with urllib.request.urlopen(f"{base}/api/tags") as response:
+                assert json.load(response)["models"][0]["name"] == "qwen3:14b"
+            request = urllib.request.Request(
+                f"{base}/api/generate",
+                data=json.dumps({"prompt": "Write one title", "stream": False}).encode(),
+                headers={"Content-Type": "application/json"},
+            )
+            with urllib.request.urlopen(request) as response:
+                assert json.load(response)["done"] is True
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestBenchmarkResults:
+    def test_spans_split_into_llm_db_and_overhead(self):
+        root = Span(name="stage 11", start=0.0, end=1.0, story_id=1,
+                    attributes={"stage": "11", "db_seconds": 0.2})
+        parse = Span(name="parse", parent_id=root.span_id, start=0.1, end=0.8)
+        llm = Span(name="llm", parent_id=parse.span_id, start=0.1, end=0.6)
+
+        [stage] = aggregate_spans([root, parse, llm])
+
+        assert (stage.stage, stage.runs) == ("11", 1)
+        assert stage.llm_seconds == pytest.approx(0.5)
+        assert stage.overhead_seconds == pytest.approx(0.3)
+        assert stage.db_share == pytest.approx(0.2)
+        assert stage.mean_overhead_ms == pytest.approx(500.0)
+
+    def test_compare_flags_slower_stage(self):
+        def result(ms):
+            stage = StageBenchmark("11", runs=10, wall_seconds=ms / 100 + 1.0, llm_seconds=1.0)
+            return BenchmarkResult(1, 10, 10, 0, 10.0, {}, [stage]).to_dict()
+
+        assert compare_results(result(10), result(10)) == []
+        assert compare_results(result(20), result(10)) == ["stage 11 overhead 10.0ms -> 20.0ms"]
+
+    def test_timed_connection_counts_sqlite_time(self, tmp_path):
+        conn = TimedStageContext(str(tmp_path / "t.s3db")).connect()
+        before = db_seconds()
+        conn.execute("CREATE TABLE t (x)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(100)])
+        conn.commit()
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 100
+        assert db_seconds() > before
+        conn.close()
+
+
+@pytest.mark.skipif(port_in_use(DEFAULT_PORT), reason="Ollama port in use")
+def test_stories_flow_through_all_stages():
+    # Fresh interpreter: the stage services need the repository's own 'src'
+    # package, which other test modules shadow on sys.path.
+    completed = subprocess.run(
+        [sys.executable, "-m", "T.Pipeline.src.benchmark", "--ideas", "1", "--timeout", "120", "--json"],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=300,
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+    result = json.loads(completed.stdout)
+
+    assert not result["timed_out"]
+    assert result["finished"] == result["stories"] == 10
+    assert {"02", "17"} <= set(result["stages"])
+    assert 0 < result["db_share"] < 1
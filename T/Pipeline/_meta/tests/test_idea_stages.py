@@ -0,0 +1,126 @@
+"""Stages 02 and 03 driven by PipelineRunner on its worker threads.
+
+Also covers stage 03 deferring a story whose title is a near-duplicate.
+"""
+
+import sqlite3
+import sys
+import threading
+
+import pytest
+
+from Model.Infrastructure import initialize_database
+from T.Pipeline import PipelineRunner, get_stage
+from T.Pipeline.src import stages
+from T.Pipeline.src.stages import REPO_ROOT, StageContext, load_service_module
+
+IDEA_TEXT = "A lighthouse keeper finds a diary that predicts every storm before it arrives"
+
+
+@pytest.fixture(autouse=True)
+def repo_src(monkeypatch):
+    """Use the repository's ``src`` package for this test.
+
+    Other suites import T/Idea/Model/src as ``src``. The stages need the
+    repository root one, so hide the other package until the test is done.
+    """
+    saved = {name: mod for name, mod in sys.modules.items() if name.split(".")[0] == "src"}
+    for name in saved:
+        del sys.modules[name]
+    monkeypatch.syspath_prepend(str(REPO_ROOT))
+    yield
+    for name in [name for name in sys.modules if name.split(".")[0] == "src"]:
+        del sys.modules[name]
+    sys.modules.update(saved)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "db.s3db")
+    conn = sqlite3.connect(path)
+    initialize_database(conn)
+    conn.execute("INSERT INTO Idea (text) VALUES (?)", (IDEA_TEXT,))
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def offline_titles(monkeypatch):
+    """Replace the AI title call; records the threads it ran on."""
+    module = load_service_module("T.Title.From.Idea.src.story_title_service")
+    variant_cls = load_service_module("T.Title.From.Idea.src.title_variant").TitleVariant
+    threads = set()
+
+    def generate_title(self, idea):
+        threads.add(threading.get_ident())
+        return variant_cls(text=f"The Storm Diary {len(threads)}", style="direct",
+                           length=20, keywords=[])
+
+    monkeypatch.setattr(module.StoryTitleService, "generate_title", generate_title)
+    monkeypatch.setattr(module.StoryTitleService, "is_ai_available", lambda self: True)
+    return threads
+
+
+def test_idea_stages_run_on_pool_threads(db_path, offline_titles):
+    outcomes = []
+    runner = PipelineRunner(
+        db_path,
+        [get_stage(2), get_stage(3)],
+        concurrency={2: 1, 3: 2},
+        poll_interval=0.01,
+        on_outcome=outcomes.append,
+    )
+    # Failing stages keep their stories pending; stop instead of hanging
+    timer = threading.Timer(30, runner.stop)
+    timer.start()
+    try:
+        stats = runner.run(stop_when_idle=True)
+    finally:
+        timer.cancel()
+
+    assert [o.error for o in outcomes if not o.success] == []
+    assert stats[2].processed == 1
+    assert stats[3].processed == 10
+    assert threading.get_ident() not in offline_titles
+
+    conn = sqlite3.connect(db_path)
+    states = dict(conn.execute("SELECT state, COUNT(*) FROM Story GROUP BY state"))
+    conn.close()
+    assert states == {"PrismQ.T.Content.From.Idea.Title": 10}
+
+
+def test_near_duplicate_title_defers_story(db_path, offline_titles, monkeypatch):
+    monkeypatch.setattr(stages, "NEAR_DUPLICATES", True)
+    context = StageContext(db_path)
+    get_stage(2).factory(context).process_next()
+
+    handler = get_stage(3).factory(context)
+    module = load_service_module("T.Title.From.Idea.src.story_title_service")
+    variant_cls = load_service_module("T.Title.From.Idea.src.title_variant").TitleVariant
+    monkeypatch.setattr(
+        module.StoryTitleService,
+        "generate_title",
+        lambda self, idea: variant_cls(text="The Storm Diary", style="direct",
+                                       length=15, keywords=[]),
+    )
+    try:
+        titled = handler.process_next()
+        rejected = handler.process_next()
+        following = handler.process_next()
+    finally:
+        handler.close()
+
+    assert titled.success and titled.passes is None
+    # A rejection is not a stage error, and the next call takes another story
+    assert rejected.success and rejected.passes is False
+    assert "near-duplicate" in rejected.error
+    assert following.story_id not in (titled.story_id, rejected.story_id)
+
+    conn = sqlite3.connect(db_path)
+    retry = conn.execute(
+        "SELECT attempts, next_attempt_at FROM StoryRetry WHERE story_id = ?",
+        (rejected.story_id,),
+    ).fetchone()
+    conn.close()
+    assert retry[0] == 0 and retry[1] is not None
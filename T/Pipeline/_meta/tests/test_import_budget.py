@@ -0,0 +1,84 @@
+"""Tests for the startup import budget (T.Pipeline.src.import_budget)."""
+
+from T.Pipeline.src.import_budget import (
+    EntryPoint,
+    discover_entry_points,
+    measure,
+    parse_importtime,
+    select_entry_points,
+)
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | encodings
+import time:      5000 |       5000 |     nltk.data
+import time:      1000 |       6000 |   nltk
+import time:       500 |       6500 | keyword_extractor
+"""
+
+
+def test_parse_importtime_nesting():
+    records = parse_importtime(IMPORTTIME)
+
+    assert [(r.module, r.depth) for r in records] == [
+        ("_io", 1), ("encodings", 0), ("nltk.data", 2), ("nltk", 1), ("keyword_extractor", 0),
+    ]
+    assert sum(r.cumulative_us for r in records if r.depth == 0) == 6920
+
+
+def test_discover_entry_points_from_run_bat(tmp_path):
+    folder = tmp_path / "scripts" / "11_PrismQ.T.Review.Content.Grammar"
+    folder.mkdir(parents=True)
+    workflow = tmp_path / "T" / "grammar_workflow.py"
+    workflow.parent.mkdir()
+    workflow.write_text("")
+    (folder / "Run.bat").write_text(
+        "@echo off\r\ncall ..\\common\\setup_env.bat\r\npython ..\\..\\T\\grammar_workflow.py\r\n"
+        "python ..\\..\\T\\missing.py\r\n"
+    )
+
+    [entry] = discover_entry_points(tmp_path / "scripts")
+
+    assert entry.path == workflow.resolve()
+    assert entry.stage == 11
+    assert select_entry_points([entry], "02-10") == []
+    assert select_entry_points([entry], "04,11") == [entry]
+
+
+def test_measure_flags_heavy_imports_without_running_main(tmp_path):
+    script = tmp_path / "workflow.py"
+    script.write_text(
+        "import json\n"
+        "if __name__ == '__main__':\n"
+        "    raise SystemExit('main must not run')\n"
+    )
+
+    profile = measure(EntryPoint("99_Test", script), runs=1, heavy_modules=("json",))
+
+    assert profile.error is None
+    assert profile.heavy == ["json"]
+    assert profile.total_ms > 0
+    assert profile.over_budget(10_000)
+
+
+def test_import_error_is_reported(tmp_path):
+    script = tmp_path / "broken.py"
+    script.write_text("import prismq_module_that_does_not_exist\n")
+
+    profile = measure(EntryPoint("99_Test", script), runs=1)
+
+    assert "prismq_module_that_does_not_exist" in profile.error
+    assert profile.over_budget(10_000)
+
+
+def test_stage_workflows_do_not_import_scientific_stacks():
+    entry_points = select_entry_points(discover_entry_points(), "04-17")
+    assert entry_points
+
+    heavy = {}
+    for entry in entry_points:
+        profile = measure(entry, runs=1)
+        if profile.error is None and profile.heavy:
+            heavy[entry.folder] = profile.heavy
+    assert heavy == {}
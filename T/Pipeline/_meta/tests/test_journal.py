@@ -0,0 +1,111 @@
+"""Tests for the Story state journal (T.Pipeline.src.journal)."""
+
+import sqlite3
+
+import pytest
+
+from Model import StateNames
+from Model.Entities.story import Story
+from T.Pipeline.src.journal import JournalTail, install_journal, prune_journal, rebuild_counts
+
+GRAMMAR = StateNames.REVIEW_CONTENT_GRAMMAR
+TONE = StateNames.REVIEW_CONTENT_TONE
+REFINE = StateNames.CONTENT_FROM_CONTENT_REVIEW_TITLE
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(Story.get_sql_schema())
+    connection.executemany("INSERT INTO Story (state) VALUES (?)", [(GRAMMAR,)] * 4)
+    connection.commit()
+    yield connection
+    connection.close()
+
+
+def counts(conn):
+    return dict(conn.execute("SELECT state, count FROM StoryStateCount WHERE count > 0"))
+
+
+def move(conn, story_id, state):
+    conn.execute("UPDATE Story SET state = ? WHERE id = ?", (state, story_id))
+    conn.commit()
+
+
+class TestInstallJournal:
+    def test_seeds_counts_from_existing_stories(self, conn):
+        assert install_journal(conn)
+        assert counts(conn) == {GRAMMAR: 4}
+
+    def test_install_is_idempotent(self, conn):
+        install_journal(conn)
+        install_journal(conn)
+        conn.execute("INSERT INTO Story (state) VALUES (?)", (GRAMMAR,))
+        assert counts(conn) == {GRAMMAR: 5}
+
+    def test_without_story_table(self):
+        assert not install_journal(sqlite3.connect(":memory:"))
+
+    def test_triggers_track_updates_and_deletes(self, conn):
+        install_journal(conn)
+        move(conn, 1, TONE)
+        move(conn, 1, TONE)  # no change, no transition
+        conn.execute("DELETE FROM Story WHERE id = 2")
+        conn.commit()
+
+        assert counts(conn) == {GRAMMAR: 2, TONE: 1}
+        transitions = conn.execute(
+            "SELECT story_id, from_state, to_state FROM StoryTransition ORDER BY id"
+        ).fetchall()
+        assert transitions == [(1, GRAMMAR, TONE), (2, GRAMMAR, None)]
+
+    def test_rebuild_and_prune(self, conn):
+        install_journal(conn)
+        conn.execute("UPDATE StoryStateCount SET count = 99")
+        rebuild_counts(conn)
+        assert counts(conn) == {GRAMMAR: 4}
+
+        move(conn, 1, TONE)
+        conn.execute("UPDATE StoryTransition SET changed_at = changed_at - 40 * 86400")
+        assert prune_journal(conn, keep_days=30) == 1
+
+
+class TestJournalTail:
+    def test_poll_reads_only_new_transitions(self, conn):
+        install_journal(conn)
+        tail = JournalTail(conn)
+        move(conn, 1, TONE)
+        assert tail.poll() == 1
+        assert tail.poll() == 0
+        move(conn, 2, TONE)
+        assert tail.poll() == 1
+        assert tail.counts == {GRAMMAR: 2, TONE: 2}
+
+    def test_stats_rates_pass_rate_and_eta(self, conn):
+        install_journal(conn)
+        tail = JournalTail(conn)
+        move(conn, 1, TONE)
+        move(conn, 2, TONE)
+        move(conn, 3, REFINE)
+        tail.poll()
+
+        now = tail._journal_start + 1800.0  # half an hour of journal
+        grammar = tail.stats(now=now)[GRAMMAR]
+        assert grammar.count == 1
+        assert grammar.departures_per_hour == pytest.approx(6.0)
+        assert grammar.pass_rate == pytest.approx(2 / 3)
+        assert grammar.eta_seconds == pytest.approx(600.0)
+        assert grammar.p50_seconds is not None
+
+        tone = tail.stats(now=now)[TONE]
+        assert tone.arrivals_per_hour == pytest.approx(4.0)
+        assert tone.eta_seconds is None
+
+    def test_window_expires_old_transitions(self, conn):
+        install_journal(conn)
+        tail = JournalTail(conn, window=600.0)
+        move(conn, 1, TONE)
+        tail.poll()
+        stats = tail.stats(now=tail._journal_start + 3600.0)
+        assert stats[TONE].arrivals_per_hour == 0.0
+        assert stats[TONE].count == 1
@@ -0,0 +1,276 @@
+"""Tests for the single-process pipeline runner (T.Pipeline)."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from Model.Entities.story import Story
+from Model.Infrastructure import metrics
+from T.Pipeline import (
+    STAGES,
+    PipelineRunner,
+    StageContext,
+    StageOutcome,
+    StageSpec,
+    get_stage,
+    parse_stage_filter,
+)
+
+
+class FakeHandler:
+    """Moves the oldest story from one state to the next."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, context, number, from_state, to_state, delay=0.0):
+        self.conn = context.connect()
+        self.number = number
+        self.from_state = from_state
+        self.to_state = to_state
+        self.delay = delay
+        self.closed = False
+
+    def process_next(self):
+        with FakeHandler.lock:
+            FakeHandler.active += 1
+            FakeHandler.peak = max(FakeHandler.peak, FakeHandler.active)
+        try:
+            time.sleep(self.delay)
+            row = self.conn.execute(
+                "SELECT id FROM Story WHERE state = ? ORDER BY id LIMIT 1", (self.from_state,)
+            ).fetchone()
+            if row is None:
+                return StageOutcome(stage=self.number, success=True)
+            self.conn.execute(
+                "UPDATE Story SET state = ? WHERE id = ?", (self.to_state, row["id"])
+            )
+            self.conn.commit()
+            return StageOutcome(
+                stage=self.number, success=True, story_id=row["id"],
+                passes=True, next_state=self.to_state,
+            )
+        finally:
+            with FakeHandler.lock:
+                FakeHandler.active -= 1
+
+    def close(self):
+        self.closed = True
+        self.conn.close()
+
+
+def fake_stage(number, from_state, to_state, delay=0.0, max_concurrency=1):
+    return StageSpec(
+        number, f"Fake.{number}", from_state,
+        lambda context: FakeHandler(context, number, from_state, to_state, delay),
+        max_concurrency=max_concurrency,
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "db.s3db")
+    conn = sqlite3.connect(path)
+    conn.executescript(Story.get_sql_schema())
+    conn.commit()
+    conn.close()
+    return path
+
+
+def add_stories(db_path, state, count):
+    conn = sqlite3.connect(db_path)
+    conn.executemany("INSERT INTO Story (state) VALUES (?)", [(state,)] * count)
+    conn.commit()
+    conn.close()
+
+
+def states(db_path):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT state, COUNT(*) FROM Story GROUP BY state").fetchall()
+    conn.close()
+    return dict(rows)
+
+
+class TestStageFilter:
+    def test_empty_filter_selects_all(self):
+        assert parse_stage_filter(None) == STAGES
+
+    def test_ranges_and_singles(self):
+        numbers = [s.number for s in parse_stage_filter("03,05-07,11")]
+        assert numbers == [3, 5, 6, 7, 11]
+
+    def test_unknown_stage_rejected(self):
+        with pytest.raises(ValueError, match="Unknown stage"):
+            parse_stage_filter("01,11")
+
+    def test_malformed_filter_rejected(self):
+        with pytest.raises(ValueError, match="Invalid stage filter"):
+            parse_stage_filter("ab")
+
+    def test_registry_mirrors_script_folders(self):
+        assert get_stage(11).folder == "11_PrismQ.T.Review.Content.Grammar"
+        assert get_stage(3).max_concurrency > 1
+
+
+class TestStageContext:
+    def test_claim_skips_held_stories(self):
+        context = StageContext(":memory:")
+        assert context.claim(3, [1, 2]) == 1
+        assert context.claim(3, [1, 2]) == 2
+        assert context.claim(3, [1, 2]) is None
+        context.release(3, 1)
+        assert context.claim(3, [1, 2]) == 1
+
+
+class TestPipelineRunner:
+    def test_drains_chain_in_one_process(self, db_path):
+        add_stories(db_path, "A", 5)
+        runner = PipelineRunner(
+            db_path, [fake_stage(1, "A", "B"), fake_stage(2, "B", "C")], poll_interval=0.01
+        )
+        stats = runner.run(stop_when_idle=True)
+
+        assert states(db_path) == {"C": 5}
+        assert stats[1].processed == 5
+        assert stats[2].processed == 5
+
+    def test_outcomes_and_depths_are_exported_as_metrics(self, db_path):
+        add_stories(db_path, "A", 3)
+        runner = PipelineRunner(db_path, [fake_stage(91, "A", "B")], poll_interval=0.01)
+        runner.run(stop_when_idle=True)
+
+        assert metrics.STORIES_PROCESSED.value(stage="91", result="pass") == 3
+        assert metrics.STAGE_DURATION.count(stage="91") == 3
+        assert metrics.QUEUE_DEPTH.value(stage="91") == 0
+        assert metrics.DB_QUERY_DURATION.count(query="state_counts") > 0
+
+    def test_handlers_are_reused_and_closed(self, db_path):
+        add_stories(db_path, "A", 3)
+        created = []
+
+        def factory(context):
+            handler = FakeHandler(context, 1, "A", "B")
+            created.append(handler)
+            return handler
+
+        runner = PipelineRunner(db_path, [StageSpec(1, "Fake", "A", factory)], poll_interval=0.01)
+        runner.run(stop_when_idle=True)
+
+        assert len(created) == 1
+        assert created[0].closed
+
+    def test_concurrency_clamped_to_stage_maximum(self, db_path):
+        runner = PipelineRunner(db_path, [fake_stage(1, "A", "B")], concurrency={1: 8})
+        assert runner.concurrency[1] == 1
+
+    def test_zero_concurrency_disables_stage(self, db_path):
+        add_stories(db_path, "A", 2)
+        runner = PipelineRunner(db_path, [fake_stage(1, "A", "B")], concurrency={1: 0})
+        runner.run(stop_when_idle=True)
+        assert states(db_path) == {"A": 2}
+
+    def test_max_workers_bounds_jobs_in_flight(self, db_path):
+        for state in ("A", "B", "C"):
+            add_stories(db_path, state, 2)
+        FakeHandler.peak = 0
+        stages = [
+            fake_stage(1, "A", "X", delay=0.05),
+            fake_stage(2, "B", "X", delay=0.05),
+            fake_stage(3, "C", "X", delay=0.05),
+        ]
+        runner = PipelineRunner(db_path, stages, max_workers=2, poll_interval=0.01)
+        runner.run(stop_when_idle=True)
+
+        assert states(db_path) == {"X": 6}
+        assert FakeHandler.peak == 2
+
+    def test_downstream_stage_scheduled_first(self, db_path):
+        add_stories(db_path, "A", 1)
+        add_stories(db_path, "B", 1)
+        order = []
+        runner = PipelineRunner(
+            db_path,
+            [fake_stage(1, "A", "B"), fake_stage(2, "B", "C")],
+            max_workers=1,
+            poll_interval=0.01,
+            on_outcome=lambda outcome: order.append(outcome.stage),
+        )
+        runner.run(stop_when_idle=True)
+        assert order[0] == 2
+
+
+class ErrorHandler:
+    """Always fails, like a stage whose model server is down."""
+
+    def __init__(self, number):
+        self.number = number
+        self.calls = 0
+
+    def process_next(self):
+        self.calls += 1
+        return StageOutcome(stage=self.number, success=False, error="Ollama not reachable")
+
+    def close(self):
+        pass
+
+
+class IdleHandler:
+    """Finds nothing to do although its state has stories (e.g. no content yet)."""
+
+    def __init__(self, number):
+        self.number = number
+        self.calls = 0
+
+    def process_next(self):
+        self.calls += 1
+        return StageOutcome(stage=self.number, success=True)
+
+    def close(self):
+        pass
+
+
+class TestRetryAwareScheduling:
+    def test_backing_off_stories_are_not_pending(self, db_path):
+        from Model.Repositories.story_retry_repository import StoryRetryRepository
+
+        add_stories(db_path, "A", 2)
+        conn = sqlite3.connect(db_path)
+        StoryRetryRepository(conn).record_failure(1, "A", "timeout")
+        conn.close()
+
+        runner = PipelineRunner(db_path, [fake_stage(1, "A", "B")])
+        runner.start()
+        try:
+            assert runner.queue_depths() == {1: 1}
+        finally:
+            runner.close()
+
+    def test_repeated_errors_pause_stage(self, db_path):
+        add_stories(db_path, "A", 3)
+        handler = ErrorHandler(1)
+        runner = PipelineRunner(
+            db_path, [StageSpec(1, "Fake", "A", lambda context: handler)], poll_interval=0.01
+        )
+        runner.run(stop_when_idle=True)
+
+        assert handler.calls == 2
+        assert runner.stats[1].errors == 2
+        assert runner._resume_at[1] > time.monotonic()
+
+    def test_idle_stage_backs_off_while_others_run(self, db_path):
+        add_stories(db_path, "A", 1)
+        add_stories(db_path, "B", 1)
+        idle = IdleHandler(1)
+        runner = PipelineRunner(
+            db_path,
+            [StageSpec(1, "Fake", "A", lambda context: idle), fake_stage(2, "B", "C", delay=0.5)],
+            poll_interval=0.01,
+        )
+        runner.run(stop_when_idle=True)
+
+        assert states(db_path) == {"A": 1, "C": 1}
+        # Without backoff stage 01 is resubmitted on every tick (hundreds of calls)
+        assert idle.calls <= 10
@@ -0,0 +1,149 @@
+"""Tests for the pipeline throughput simulator (T.Pipeline.src.simulator)."""
+
+import sqlite3
+
+import pytest
+
+from Model import StateNames
+from Model.Entities.story import Story
+from Model.Entities.title import Title
+from T.Pipeline import PipelineRunner, StageOutcome, StageSpec, get_stage
+from T.Pipeline.src.history import StageRunLog
+from T.Pipeline.src.simulator import (
+    PipelineModel,
+    SimulationConfig,
+    StageModel,
+    compare_results,
+    fit_pipeline,
+    parse_stage_values,
+    simulate,
+)
+
+NO_LIMITS = {"generation": None, "review": None, "quality": None, "expert": None}
+
+
+def two_stage_model(title_seconds=60.0):
+    """Stage 02 (ideas -> 10 stories) feeding stage 03 with a fixed service time."""
+    return PipelineModel(stages={
+        2: StageModel(2, "Story.From.Idea", None, samples=[1.0] * 5,
+                      routes=[(StateNames.TITLE_FROM_IDEA, 1.0)]),
+        3: StageModel(3, "Title.From.Idea", StateNames.TITLE_FROM_IDEA, samples=[title_seconds] * 5,
+                      routes=[(StateNames.CONTENT_FROM_IDEA_TITLE, 1.0)]),
+    })
+
+
+def short_run(**kwargs):
+    return SimulationConfig(wip_limits=NO_LIMITS, days=0.5, warmup_days=0.05, **kwargs)
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(Story.get_sql_schema())
+    yield connection
+    connection.close()
+
+
+class TestFitPipeline:
+    def test_empty_database_uses_transition_graph(self, conn):
+        model = fit_pipeline(conn)
+        grammar = model.stages[11]
+        assert grammar.source == "default"
+        assert grammar.routes[0] == (StateNames.REVIEW_CONTENT_TONE, 0.9)
+        assert sum(p for _, p in grammar.routes) == pytest.approx(1.0)
+
+    def test_fits_durations_and_routing_from_run_log(self, conn):
+        log = StageRunLog(conn)
+        for index in range(10):
+            passes = index < 6
+            log.record(StageOutcome(
+                stage=11, success=True, story_id=index, passes=passes, duration=12.0,
+                next_state=StateNames.REVIEW_CONTENT_TONE if passes
+                else StateNames.CONTENT_FROM_CONTENT_REVIEW_TITLE,
+            ))
+        grammar = fit_pipeline(conn, [get_stage(11)]).stages[11]
+        assert grammar.source == "log"
+        assert grammar.mean_service == 12.0
+        assert dict(grammar.routes)[StateNames.REVIEW_CONTENT_TONE] == pytest.approx(0.6)
+
+    def test_fits_durations_from_artifact_gaps(self, conn):
+        conn.executescript(Title.get_sql_schema())
+        conn.executemany(
+            "INSERT INTO Title (story_id, version, text, created_at) "
+            "VALUES (?, 0, 't', datetime('now', ?))",
+            [(i, f"-{3600 - i * 30} seconds") for i in range(8)],
+        )
+        titles = fit_pipeline(conn, [get_stage(3)]).stages[3]
+        assert titles.source == "artifacts"
+        assert titles.mean_service == pytest.approx(30.0, abs=1.0)
+
+
+class TestSimulate:
+    def test_single_worker_throughput(self):
+        result = simulate(two_stage_model(60.0), short_run())
+        assert result.stories_per_day == pytest.approx(1440, rel=0.02)
+        assert result.bottleneck == "03 Title.From.Idea"
+        stage = {s.number: s for s in result.stages}[3]
+        assert stage.utilization == pytest.approx(1.0, abs=0.01)
+
+    def test_speed_factor_models_faster_model(self):
+        result = simulate(two_stage_model(60.0), short_run(speed={3: 0.5}))
+        assert result.stories_per_day == pytest.approx(2880, rel=0.02)
+
+    def test_slots_reported_as_bottleneck(self):
+        model = two_stage_model(60.0)
+        model.stages[3].max_concurrency = 4
+        result = simulate(model, short_run(max_workers=2))
+        assert result.bottleneck.startswith("slots")
+
+    def test_same_seed_is_deterministic(self):
+        model = fit_pipeline(sqlite3.connect(":memory:"))
+        config = SimulationConfig(days=0.2, warmup_days=0.05, seed=3)
+        assert simulate(model, config).to_dict() == simulate(model, config).to_dict()
+
+    def test_idea_arrivals_bound_throughput(self):
+        result = simulate(two_stage_model(1.0), short_run(ideas_per_day=20))
+        assert 100 < result.stories_per_day < 300
+
+
+class TestRegression:
+    def test_compare_detects_slower_stage(self):
+        baseline = simulate(two_stage_model(60.0), short_run()).to_dict()
+        current = simulate(two_stage_model(90.0), short_run()).to_dict()
+        problems = compare_results(current, baseline, tolerance=0.1)
+        assert any("stories/day" in problem for problem in problems)
+        assert any("stage 03" in problem for problem in problems)
+        assert compare_results(baseline, baseline) == []
+
+    def test_parse_stage_values_expands_ranges(self):
+        assert parse_stage_values(["11-13=0.5", "03=2"]) == {11: 0.5, 12: 0.5, 13: 0.5, 3: 2.0}
+
+
+class TestRunnerHistory:
+    def test_runner_records_outcomes(self, tmp_path):
+        db_path = str(tmp_path / "db.s3db")
+        setup = sqlite3.connect(db_path)
+        setup.executescript(Story.get_sql_schema())
+        setup.execute("INSERT INTO Story (state) VALUES ('A')")
+        setup.commit()
+        setup.close()
+
+        class Handler:
+            def __init__(self, context):
+                self.conn = context.connect()
+
+            def process_next(self):
+                self.conn.execute("UPDATE Story SET state = 'B'")
+                self.conn.commit()
+                return StageOutcome(stage=1, success=True, story_id=1, next_state="B", duration=2.5)
+
+            def close(self):
+                self.conn.close()
+
+        runner = PipelineRunner(db_path, [StageSpec(1, "Fake", "A", Handler)], record_history=True)
+        runner.run(stop_when_idle=True)
+
+        check = sqlite3.connect(db_path)
+        runs = StageRunLog(check, ensure_table=False).load()
+        check.close()
+        assert [(run.stage, run.next_state, run.duration) for run in runs] == [(1, "B", 2.5)]
@@ -0,0 +1,70 @@
+"""Tests for the trace waterfall and stage breakdown (T.Pipeline.src.traces)."""
+
+from Model.Infrastructure.tracing import Span
+from T.Pipeline import aggregate_stages, build_waterfall
+from T.Pipeline.src.traces import SELF_TIME, filter_spans, main
+
+
+def stage_run(story_id, stage, start, parts, status="ok"):
+    """Root span of ``stage`` starting at ``start`` with sequential child spans."""
+    root = Span(
+        name=f"stage {stage}", start=start, story_id=story_id, status=status,
+        attributes={"stage": stage},
+    )
+    spans = [root]
+    t = start
+    for name, seconds in parts:
+        spans.append(Span(name=name, parent_id=root.span_id, start=t, end=t + seconds))
+        t += seconds
+    root.end = t + 1.0  # one second outside named sub-spans
+    return spans
+
+
+def sample_spans():
+    return (
+        stage_run(1, "11", 0.0, [("fetch", 1.0), ("llm", 8.0)])
+        + stage_run(1, "12", 110.0, [("fetch", 1.0), ("llm", 18.0)])
+        + stage_run(2, "11", 20.0, [("fetch", 1.0), ("llm", 18.0)], status="error")
+    )
+
+
+class TestAggregateStages:
+    def test_breakdown_per_stage(self):
+        grammar, tone = aggregate_stages(sample_spans())
+
+        assert (grammar.stage, grammar.runs, grammar.errors) == ("11", 2, 1)
+        assert grammar.total_seconds == 30.0
+        assert grammar.mean_seconds == 15.0
+        assert grammar.parts == {"fetch": 2.0, "llm": 26.0, SELF_TIME: 2.0}
+        assert round(grammar.share("llm"), 2) == 0.87
+        assert grammar.mean_wait_seconds is None
+
+    def test_queue_wait_between_stages_of_a_story(self):
+        tone = aggregate_stages(sample_spans())[1]
+        # Story 1 left stage 11 at t=10 and entered stage 12 at t=110
+        assert tone.mean_wait_seconds == 100.0
+
+
+class TestWaterfall:
+    def test_roots_in_time_order_with_children(self):
+        spans = filter_spans(sample_spans(), story_id=1)
+        rows = build_waterfall(spans)
+
+        assert [(depth, s.name) for depth, s in rows] == [
+            (0, "stage 11"), (1, "fetch"), (1, "llm"),
+            (0, "stage 12"), (1, "fetch"), (1, "llm"),
+        ]
+
+    def test_filter_keeps_whole_trees(self):
+        spans = filter_spans(sample_spans(), stage="12")
+        assert len(spans) == 3
+        assert {s.story_id for s in spans if s.parent_id is None} == {1}
+
+
+class TestCli:
+    def test_requires_trace_directory(self, monkeypatch):
+        monkeypatch.delenv("PRISMQ_TRACE_DIR", raising=False)
+        assert main([]) == 2
+
+    def test_missing_story_exits_nonzero(self, tmp_path):
+        assert main(["--dir", str(tmp_path), "--story", "5"]) == 1
@@ -0,0 +1,44 @@
+"""Pipeline runner module initialization."""
+
+from Model.Infrastructure.lazy import lazy_exports
+
+# Submodules are imported on first use of a name, so importing one part of
+# the pipeline does not pay for the simulator, benchmark or fake Ollama server.
+# The WIP-limit names are re-exported from Model.Infrastructure.backpressure.
+_EXPORTS = {
+    "BenchmarkResult": ".benchmark",
+    "run_benchmark": ".benchmark",
+    "BackpressureGate": "Model.Infrastructure.backpressure",
+    "DEFAULT_WIP_LIMITS": "Model.Infrastructure.backpressure",
+    "GroupPressure": "Model.Infrastructure.backpressure",
+    "WipGroup": "Model.Infrastructure.backpressure",
+    "load_wip_groups": "Model.Infrastructure.backpressure",
+    "FakeOllama": ".fake_ollama",
+    "start_fake_ollama": ".fake_ollama",
+    "StageRun": ".history",
+    "StageRunLog": ".history",
+    "JournalTail": ".journal",
+    "StateStats": ".journal",
+    "install_journal": ".journal",
+    "PipelineRunner": ".runner",
+    "StageStats": ".runner",
+    "PipelineModel": ".simulator",
+    "SimulationConfig": ".simulator",
+    "SimulationResult": ".simulator",
+    "StageModel": ".simulator",
+    "fit_pipeline": ".simulator",
+    "simulate": ".simulator",
+    "StageBreakdown": ".traces",
+    "aggregate_stages": ".traces",
+    "build_waterfall": ".traces",
+    "STAGES": ".stages",
+    "StageContext": ".stages",
+    "StageOutcome": ".stages",
+    "StageSpec": ".stages",
+    "get_stage": ".stages",
+    "parse_stage_filter": ".stages",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
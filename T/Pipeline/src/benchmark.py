@@ -0,0 +1,494 @@
+"""End-to-end pipeline benchmark against the fake Ollama server.
+
+Seeds a fresh database with N synthetic ideas, serves
+:mod:`T.Pipeline.src.fake_ollama` on the Ollama port and drives every idea
+through the hosted stages with :class:`PipelineRunner` until no work is
+left. No GPU is needed, so framework regressions (slower queries, extra
+commits, heavier prompt building) show up in local runs.
+
+Reported:
+    stories/hour  - stories that left the hosted stages (e.g. reached
+                    ``Story.Review``) per hour of benchmark wall time
+    per stage     - runs, errors and where the wall time goes: the LLM call
+                    (``llm`` spans), SQLite (timed connection) and the rest
+                    (overhead: prompt building, parsing, Python)
+    DB share      - SQLite seconds / stage wall seconds
+
+With ``--time-scale 0`` (default) LLM calls return at once, so the numbers
+measure the framework alone; ``--time-scale 1`` replays the family latency
+profiles of the fake server.
+
+Usage:
+    python -m T.Pipeline.src.benchmark                       # 3 ideas, stages 02-17
+    python -m T.Pipeline.src.benchmark --ideas 10 --max-workers 8
+    python -m T.Pipeline.src.benchmark --time-scale 0.05 --pass-rate 0.7
+    python -m T.Pipeline.src.benchmark --save bench.json
+    python -m T.Pipeline.src.benchmark --compare bench.json  # exit 1 on regression
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Dict, List, Mapping, Optional
+
+from Model.Infrastructure.tracing import Span, configure_tracing, get_tracer
+
+from .cli import (
+    Colors,
+    print_error,
+    print_header,
+    print_info,
+    print_success,
+    print_warning,
+)
+from .fake_ollama import DEFAULT_PASS_RATE, DEFAULT_PORT, FakeOllama, start_fake_ollama
+from .runner import PipelineRunner
+from .stages import PARALLEL_WORKERS, StageContext, StageSpec, parse_stage_filter
+
+DEFAULT_IDEAS = 3
+DEFAULT_STAGES = "02-17"
+DEFAULT_TIMEOUT = 600.0
+
+DEAD_LETTER_STATE = "PrismQ.DeadLetter"
+
+_IDEA_TEMPLATES = (
+    "A lighthouse keeper finds letters from her missing sister hidden under the stairs ({n}).",
+    "A night-shift nurse hears her own voice on the hospital intercom ({n}).",
+    "Two friends discover the abandoned mall still plays music at 3 a.m. ({n}).",
+    "A girl inherits a key that opens every door in town except her own ({n}).",
+)
+
+
+# =============================================================================
+# Timed SQLite
+# =============================================================================
+
+_db_time = threading.local()
+
+
+def db_seconds() -> float:
+    """SQLite seconds spent by timed connections on the calling thread."""
+    return getattr(_db_time, "seconds", 0.0)
+
+
+class _Timed:
+    """Add the block's duration to the thread's SQLite time."""
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        _db_time.seconds = db_seconds() + time.perf_counter() - self.start
+
+
+class TimedCursor(sqlite3.Cursor):
+    def execute(self, *args, **kwargs):
+        with _Timed():
+            return super().execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        with _Timed():
+            return super().executemany(*args, **kwargs)
+
+    def fetchone(self):
+        with _Timed():
+            return super().fetchone()
+
+    def fetchmany(self, *args, **kwargs):
+        with _Timed():
+            return super().fetchmany(*args, **kwargs)
+
+    def fetchall(self):
+        with _Timed():
+            return super().fetchall()
+
+
+class TimedConnection(sqlite3.Connection):
+    """Connection whose statements, fetches and commits count as SQLite time."""
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, *args, **kwargs):
+        return self.cursor().execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        return self.cursor().executemany(*args, **kwargs)
+
+    def executescript(self, *args, **kwargs):
+        with _Timed():
+            return super().executescript(*args, **kwargs)
+
+    def commit(self):
+        with _Timed():
+            return super().commit()
+
+
+@dataclass
+class TimedStageContext(StageContext):
+    """Stage context handing out :class:`TimedConnection` connections."""
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path, timeout=30, check_same_thread=False, factory=TimedConnection
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+
+class _TimedHandler:
+    """Stage handler wrapper that stores the job's SQLite time on its span."""
+
+    def __init__(self, handler: Any):
+        self._handler = handler
+
+    def process_next(self):
+        before = db_seconds()
+        try:
+            return self._handler.process_next()
+        finally:
+            root = get_tracer().current_span()
+            if root is not None:
+                root.set_attribute("db_seconds", db_seconds() - before)
+
+    def close(self) -> None:
+        self._handler.close()
+
+
+def _timed_spec(spec: StageSpec) -> StageSpec:
+    return replace(spec, factory=lambda context: _TimedHandler(spec.factory(context)))
+
+
+class _SpanCollector:
+    """Tracing exporter keeping finished span trees in memory."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            self.spans.extend(spans)
+
+
+# =============================================================================
+# Results
+# =============================================================================
+
+
+@dataclass
+class StageBenchmark:
+    """Where one stage's wall time went during the benchmark."""
+
+    stage: str
+    runs: int = 0
+    errors: int = 0
+    wall_seconds: float = 0.0
+    llm_seconds: float = 0.0
+    db_seconds: float = 0.0
+
+    @property
+    def overhead_seconds(self) -> float:
+        return max(0.0, self.wall_seconds - self.llm_seconds - self.db_seconds)
+
+    @property
+    def mean_overhead_ms(self) -> float:
+        """Mean non-LLM milliseconds per run (SQLite + framework)."""
+        if not self.runs:
+            return 0.0
+        return (self.wall_seconds - self.llm_seconds) / self.runs * 1000
+
+    @property
+    def db_share(self) -> float:
+        return self.db_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+
+@dataclass
+class BenchmarkResult:
+    ideas: int
+    stories: int
+    finished: int
+    dead_letters: int
+    elapsed_seconds: float
+    llm_requests: Dict[str, int]
+    stages: List[StageBenchmark] = field(default_factory=list)
+    timed_out: bool = False
+
+    @property
+    def stories_per_hour(self) -> float:
+        return self.finished / self.elapsed_seconds * 3600 if self.elapsed_seconds else 0.0
+
+    @property
+    def db_share(self) -> float:
+        wall = sum(s.wall_seconds for s in self.stages)
+        return sum(s.db_seconds for s in self.stages) / wall if wall else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["stories_per_hour"] = self.stories_per_hour
+        data["db_share"] = self.db_share
+        data["stages"] = {
+            s.stage: {
+                **asdict(s),
+                "overhead_seconds": s.overhead_seconds,
+                "mean_overhead_ms": s.mean_overhead_ms,
+                "db_share": s.db_share,
+            }
+            for s in self.stages
+        }
+        return data
+
+
+def aggregate_spans(spans: List[Span]) -> List[StageBenchmark]:
+    """Per-stage wall, LLM and SQLite seconds from benchmark span trees."""
+    by_id = {s.span_id: s for s in spans}
+
+    def root_of(s: Span) -> Span:
+        while s.parent_id is not None and s.parent_id in by_id:
+            s = by_id[s.parent_id]
+        return s
+
+    llm: Dict[str, float] = {}
+    for s in spans:
+        if s.name == "llm":
+            root = root_of(s)
+            llm[root.span_id] = llm.get(root.span_id, 0.0) + s.duration
+
+    stages: Dict[str, StageBenchmark] = {}
+    for root in (s for s in spans if s.parent_id is None):
+        name = str(root.attributes.get("stage") or root.name)
+        bench = stages.setdefault(name, StageBenchmark(stage=name))
+        bench.runs += 1
+        bench.errors += root.status == "error"
+        bench.wall_seconds += root.duration
+        bench.llm_seconds += llm.get(root.span_id, 0.0)
+        bench.db_seconds += float(root.attributes.get("db_seconds", 0.0))
+    return [stages[name] for name in sorted(stages)]
+
+
+def compare_results(current: Mapping, baseline: Mapping, tolerance: float = 0.2) -> List[str]:
+    """List regressions of ``current`` against a saved ``baseline`` (both ``to_dict()``).
+
+    A regression is a drop in stories/hour or a rise in a stage's mean
+    non-LLM time per run of more than ``tolerance`` (relative).
+    """
+    problems = []
+    before, after = baseline.get("stories_per_hour", 0), current.get("stories_per_hour", 0)
+    if before and after < before * (1 - tolerance):
+        problems.append(f"stories/hour {before:.0f} -> {after:.0f}")
+    for stage, old in baseline.get("stages", {}).items():
+        new = current.get("stages", {}).get(stage)
+        if new and old.get("mean_overhead_ms") and new["mean_overhead_ms"] > old["mean_overhead_ms"] * (1 + tolerance):
+            problems.append(
+                f"stage {stage} overhead {old['mean_overhead_ms']:.1f}ms -> {new['mean_overhead_ms']:.1f}ms"
+            )
+    return problems
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+
+def seed_database(db_path: str, ideas: int) -> None:
+    """Create the schema and insert ``ideas`` synthetic ideas."""
+    # Imported here: the services' import order requires src.config first
+    import src.config  # noqa: F401
+    from Model.Entities.content import Content
+    from Model.Infrastructure import initialize_database
+
+    conn = sqlite3.connect(db_path)
+    try:
+        initialize_database(conn)
+        conn.executescript(Content.get_sql_schema())
+        conn.executemany(
+            "INSERT INTO Idea (text) VALUES (?)",
+            [(_IDEA_TEMPLATES[n % len(_IDEA_TEMPLATES)].format(n=n),) for n in range(ideas)],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def run_benchmark(
+    db_path: str,
+    specs: List[StageSpec],
+    ideas: int = DEFAULT_IDEAS,
+    fake: Optional[FakeOllama] = None,
+    port: int = DEFAULT_PORT,
+    max_workers: int = PARALLEL_WORKERS,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> BenchmarkResult:
+    """Seed ``db_path`` and run the hosted stages against a fake Ollama.
+
+    Raises:
+        OSError: If the Ollama port is in use.
+    """
+    seed_database(db_path, ideas)
+    fake = fake or FakeOllama(time_scale=0)
+    server = start_fake_ollama(port, fake=fake)
+
+    collector = _SpanCollector()
+    tracer = configure_tracing("benchmark")
+    tracer.exporters.append(collector)
+
+    runner = PipelineRunner(
+        db_path,
+        [_timed_spec(spec) for spec in specs],
+        max_workers=max_workers,
+        poll_interval=0.01,
+        idle_interval=0.01,
+        context=TimedStageContext(db_path),
+    )
+    expired = threading.Event()
+
+    def expire() -> None:
+        expired.set()
+        runner.stop()
+
+    timer = threading.Timer(timeout, expire)
+    timer.daemon = True
+    started = time.perf_counter()
+    timer.start()
+    try:
+        runner.run(stop_when_idle=True)
+    finally:
+        timer.cancel()
+        elapsed = time.perf_counter() - started
+        server.shutdown()
+        server.server_close()
+        configure_tracing("pipeline")
+
+    consumed = {spec.input_state for spec in specs if spec.input_state}
+    conn = sqlite3.connect(db_path)
+    try:
+        states = dict(conn.execute("SELECT state, COUNT(*) FROM Story GROUP BY state").fetchall())
+    finally:
+        conn.close()
+    return BenchmarkResult(
+        ideas=ideas,
+        stories=sum(states.values()),
+        finished=sum(n for state, n in states.items() if state not in consumed and state != DEAD_LETTER_STATE),
+        dead_letters=states.get(DEAD_LETTER_STATE, 0),
+        elapsed_seconds=elapsed,
+        llm_requests=dict(fake.requests),
+        stages=aggregate_spans(collector.spans),
+        timed_out=expired.is_set(),
+    )
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def print_result(result: BenchmarkResult) -> None:
+    print(f"{'Stage':<6} {'Runs':>5} {'Err':>4} {'Wall s':>8} {'LLM s':>8} {'DB s':>7} "
+          f"{'Other s':>8} {'DB %':>6} {'ms/run':>8}")
+    for s in result.stages:
+        error_color = Colors.RED if s.errors else ""
+        print(
+            f"{s.stage:<6} {s.runs:>5} {error_color}{s.errors:>4}{Colors.END if s.errors else ''} "
+            f"{s.wall_seconds:>8.2f} {s.llm_seconds:>8.2f} {s.db_seconds:>7.2f} "
+            f"{s.overhead_seconds:>8.2f} {s.db_share:>6.0%} {s.mean_overhead_ms:>8.1f}"
+        )
+    print()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m T.Pipeline.src.benchmark",
+        description="Benchmark the PrismQ.T pipeline end to end without a GPU",
+    )
+    parser.add_argument("--ideas", type=int, default=DEFAULT_IDEAS,
+                        help=f"Synthetic ideas to seed (default: {DEFAULT_IDEAS})")
+    parser.add_argument("--stages", default=DEFAULT_STAGES,
+                        help=f"Stages to run (default: {DEFAULT_STAGES})")
+    parser.add_argument("--max-workers", type=int, default=PARALLEL_WORKERS,
+                        help=f"Jobs in flight across all stages (default: {PARALLEL_WORKERS})")
+    parser.add_argument("--time-scale", type=float, default=0.0,
+                        help="LLM latency factor (0 = instant, 1 = profile speed)")
+    parser.add_argument("--pass-rate", type=float, default=DEFAULT_PASS_RATE,
+                        help=f"Share of passing reviews (default: {DEFAULT_PASS_RATE})")
+    parser.add_argument("--parallel", type=int, default=4,
+                        help="Requests the fake server serves at once")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"Stop after N seconds (default: {DEFAULT_TIMEOUT:g})")
+    parser.add_argument("--keep-db", metavar="PATH",
+                        help="Write the benchmark database here instead of a temp file")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    parser.add_argument("--save", metavar="FILE", help="Save the result as a regression baseline")
+    parser.add_argument("--compare", metavar="FILE", help="Compare with a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative regression for --compare (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    try:
+        specs = parse_stage_filter(args.stages)
+    except ValueError as e:
+        print_error(str(e))
+        return 2
+    if args.keep_db and os.path.exists(args.keep_db):
+        print_error(f"Database already exists: {args.keep_db}")
+        return 2
+
+    fake = FakeOllama(
+        pass_rate=args.pass_rate, seed=args.seed, time_scale=args.time_scale,
+        parallel=args.parallel,
+    )
+    with tempfile.TemporaryDirectory(prefix="prismq-bench-") as tmp:
+        db_path = args.keep_db or os.path.join(tmp, "bench.s3db")
+        try:
+            result = run_benchmark(
+                db_path, specs, args.ideas, fake,
+                max_workers=args.max_workers, timeout=args.timeout,
+            )
+        except OSError as e:
+            print_error(f"Cannot start fake Ollama on port {DEFAULT_PORT}: {e} (stop Ollama first)")
+            return 1
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print_header("PrismQ.T Pipeline Benchmark")
+        print_info(f"Ideas: {result.ideas}, stories: {result.stories}, stages: {args.stages}")
+        print_info(f"Time scale: {args.time_scale:g}, pass rate: {args.pass_rate:.0%}, "
+                   f"max workers: {args.max_workers}")
+        print_info(f"LLM requests: {sum(result.llm_requests.values())} {result.llm_requests}")
+        print()
+        print_result(result)
+        print_success(
+            f"{result.finished}/{result.stories} stories finished in {result.elapsed_seconds:.1f}s "
+            f"({result.stories_per_hour:.0f} stories/hour)"
+        )
+        print_info(f"DB share of stage time: {result.db_share:.0%}")
+        if result.dead_letters:
+            print_warning(f"Dead-lettered stories: {result.dead_letters}")
+        if result.timed_out:
+            print_warning(f"Stopped after the {args.timeout:g}s timeout")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(result.to_dict(), handle, indent=2)
+        print_info(f"Baseline saved to {args.save}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            problems = compare_results(result.to_dict(), json.load(handle), args.tolerance)
+        for problem in problems:
+            print_error(f"Regression: {problem}")
+        if problems:
+            return 1
+        print_success("No regression against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""Command-line entry point for the PrismQ.T pipeline runner.
+
+Usage:
+    python -m T.Pipeline                      # all stages, run until Ctrl+C
+    python -m T.Pipeline --stages 03,05-07,10-17
+    python -m T.Pipeline --stages 11-17 --once
+    python -m T.Pipeline --concurrency 03=4 --max-workers 4
+    python -m T.Pipeline --list
+    python -m T.Pipeline --no-backpressure    # ignore WIP limits
+    python -m T.Pipeline --metrics-port 9464  # Prometheus/OpenMetrics at /metrics
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+from typing import Dict, List, Optional
+
+from Model.Infrastructure.backpressure import DEFAULT_WIP_LIMITS, BackpressureGate, load_wip_groups
+from Model.Infrastructure.metrics import start_metrics_server
+from Model.Infrastructure.tracing import configure_tracing
+
+from .journal import install_journal, prune_journal
+from .runner import DEFAULT_IDLE_INTERVAL, PipelineRunner
+from .stages import PARALLEL_WORKERS, STAGES, StageOutcome, parse_stage_filter
+
+
+class Colors:
+    HEADER = "\033[95m"
+    CYAN = "\033[96m"
+    GREEN = "\033[92m"
+    YELLOW = "\033[93m"
+    RED = "\033[91m"
+    END = "\033[0m"
+    BOLD = "\033[1m"
+
+
+def print_header(text: str) -> None:
+    print(f"\n{Colors.HEADER}{Colors.BOLD}{'═' * 78}{Colors.END}")
+    print(f"{Colors.HEADER}{Colors.BOLD}{text.center(78)}{Colors.END}")
+    print(f"{Colors.HEADER}{Colors.BOLD}{'═' * 78}{Colors.END}\n")
+
+
+def print_info(text: str) -> None:
+    print(f"{Colors.CYAN}ℹ {text}{Colors.END}")
+
+
+def print_success(text: str) -> None:
+    print(f"{Colors.GREEN}✓ {text}{Colors.END}")
+
+
+def print_error(text: str) -> None:
+    print(f"{Colors.RED}✗ {text}{Colors.END}")
+
+
+def print_warning(text: str) -> None:
+    print(f"{Colors.YELLOW}⚠ {text}{Colors.END}")
+
+
+def parse_concurrency(values: Optional[List[str]]) -> Dict[int, int]:
+    """Parse ``--concurrency`` values like ``03=4`` or ``11=0``."""
+    limits: Dict[int, int] = {}
+    for value in values or []:
+        for item in value.split(","):
+            if not item.strip():
+                continue
+            stage, sep, limit = item.partition("=")
+            if not sep:
+                raise ValueError(f"Invalid concurrency '{item}', expected STAGE=N")
+            limits[int(stage)] = int(limit)
+    return limits
+
+
+def print_outcome(outcome: StageOutcome) -> None:
+    """Print one finished job in the style of the workflow scripts."""
+    label = f"[{outcome.stage:02d}] Story {outcome.story_id}"
+    if not outcome.success:
+        print_error(f"{label}: Error - {outcome.error}")
+    elif outcome.passes is False:
+        print_warning(f"{label}: FAILED → {outcome.next_state} ({outcome.duration:.1f}s)")
+    else:
+        print_success(f"{label}: → {outcome.next_state} ({outcome.duration:.1f}s)")
+
+
+def resolve_db_path(db_path: Optional[str]) -> str:
+    """Return the database path from the argument or Config."""
+    if db_path:
+        return db_path
+    try:
+        from src.config import get_config
+
+        return get_config().database_path
+    except Exception:
+        return "C:/PrismQ/db.s3db"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m T.Pipeline",
+        description="Run PrismQ.T pipeline stages in a single process",
+    )
+    parser.add_argument("--db", help="Path to db.s3db (default: from Config)")
+    parser.add_argument(
+        "--stages", help="Stage numbers/ranges as in _meta/scripts, e.g. 03,05-07,10-17"
+    )
+    parser.add_argument(
+        "--concurrency", action="append", metavar="STAGE=N",
+        help="Workers per stage (repeatable or comma-separated)",
+    )
+    parser.add_argument(
+        "--max-workers", type=int, default=PARALLEL_WORKERS,
+        help=f"Jobs in flight across all stages (default: {PARALLEL_WORKERS})",
+    )
+    parser.add_argument(
+        "--idle-interval", type=float, default=DEFAULT_IDLE_INTERVAL,
+        help="Seconds to wait when no stage has work (default: 30)",
+    )
+    parser.add_argument(
+        "--no-backpressure", action="store_true",
+        help="Ignore WIP limits (PRISMQ_WIP_LIMIT_*) for upstream stages",
+    )
+    parser.add_argument(
+        "--metrics-port", type=int, default=int(os.getenv("PRISMQ_METRICS_PORT", "0")),
+        help="Serve /metrics on this port (default: PRISMQ_METRICS_PORT, 0 = off)",
+    )
+    parser.add_argument(
+        "--metrics-host", default=os.getenv("PRISMQ_METRICS_HOST", "127.0.0.1"),
+        help="Address for the metrics endpoint (default: 127.0.0.1)",
+    )
+    parser.add_argument("--once", action="store_true", help="Exit when all queues are drained")
+    parser.add_argument("--list", action="store_true", help="List available stages and exit")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    if args.list:
+        for spec in STAGES:
+            print(f"{spec.folder}  (max workers: {spec.max_concurrency})")
+        return 0
+
+    try:
+        stages = parse_stage_filter(args.stages)
+        concurrency = parse_concurrency(args.concurrency)
+    except ValueError as e:
+        print_error(str(e))
+        return 2
+
+    db_path = resolve_db_path(args.db)
+    if args.no_backpressure:
+        gate = BackpressureGate(load_wip_groups({name: None for name in DEFAULT_WIP_LIMITS}))
+    else:
+        gate = BackpressureGate()
+
+    try:
+        conn = sqlite3.connect(db_path, timeout=30)
+        try:
+            # State journal for the monitor (00_PrismQ.Monitor)
+            install_journal(conn)
+            prune_journal(conn)
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logging.getLogger(__name__).warning(f"State journal not installed: {e}")
+
+    print_header("PrismQ.T Pipeline")
+    print_info(f"Database: {db_path}")
+    print_info(f"Stages: {', '.join(f'{s.number:02d}' for s in stages)}")
+    print_info(f"Max workers: {args.max_workers}")
+    print_info(
+        "WIP limits: "
+        + ", ".join(f"{g.name}={g.limit or 'off'}" for g in gate.groups)
+    )
+    metrics_server = None
+    if args.metrics_port:
+        try:
+            metrics_server = start_metrics_server(args.metrics_port, args.metrics_host)
+            print_info(f"Metrics: http://{args.metrics_host}:{args.metrics_port}/metrics")
+        except OSError as e:
+            print_warning(f"Metrics endpoint not started: {e}")
+    tracer = configure_tracing("pipeline")
+    if tracer.enabled:
+        targets = [getattr(e, "path", None) or getattr(e, "endpoint", "") for e in tracer.exporters]
+        print_info(f"Tracing: {', '.join(targets)}")
+    print_info("Press Ctrl+C to stop")
+    print()
+
+    runner = PipelineRunner(
+        db_path,
+        stages,
+        concurrency=concurrency,
+        max_workers=args.max_workers,
+        idle_interval=args.idle_interval,
+        on_outcome=print_outcome,
+        gate=gate,
+        record_history=True,
+    )
+
+    try:
+        runner.start()
+        print_success("Stage services loaded")
+        runner.run(stop_when_idle=args.once)
+    except KeyboardInterrupt:
+        print()
+        print_info("Pipeline interrupted by user")
+        runner.close()
+    except Exception as e:
+        print_error(f"Unexpected error: {e}")
+        import traceback
+
+        traceback.print_exc()
+        runner.close()
+        return 1
+    finally:
+        if metrics_server is not None:
+            metrics_server.shutdown()
+
+    print()
+    for spec in runner.stages:
+        stats = runner.stats[spec.number]
+        if stats.processed or stats.errors:
+            print_info(
+                f"{spec.folder}: {stats.processed} processed "
+                f"({stats.passed} passed, {stats.failed} failed, {stats.errors} errors)"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Inspect and requeue dead-lettered stories.
+
+Stories that fail ``PRISMQ_RETRY_MAX_ATTEMPTS`` times in the same state are
+moved to ``PrismQ.DeadLetter`` (see ``Model.Repositories.story_retry_repository``).
+This tool lists them and moves them back to the state they failed in.
+
+Usage:
+    python -m T.Pipeline.src.dead_letter                   # list dead letters
+    python -m T.Pipeline.src.dead_letter --requeue 12 57   # requeue stories
+    python -m T.Pipeline.src.dead_letter --all             # requeue everything
+    python -m T.Pipeline.src.dead_letter --all --state PrismQ.T.Review.Content.Grammar
+"""
+
+import argparse
+import sqlite3
+import sys
+from typing import List, Optional
+
+from Model.Repositories.story_retry_repository import StoryRetryRepository
+
+from .cli import print_error, print_header, print_info, print_success, print_warning, resolve_db_path
+
+
+def print_dead_letters(repo: StoryRetryRepository, state: Optional[str] = None) -> int:
+    """Print dead-lettered stories; return how many there are."""
+    dead = repo.find_dead_letters(state)
+    if not dead:
+        print_success("No dead-lettered stories")
+        return 0
+    for retry in dead:
+        print_warning(
+            f"Story {retry.story_id}: {retry.state} "
+            f"({retry.attempts} attempts, since {retry.dead_lettered_at})"
+        )
+        if retry.last_error:
+            print(f"    {retry.last_error[:200]}")
+    print()
+    print_info(f"{len(dead)} dead-lettered stories")
+    return len(dead)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m T.Pipeline.src.dead_letter",
+        description="List and requeue dead-lettered PrismQ stories",
+    )
+    parser.add_argument("--db", help="Path to db.s3db (default: from Config)")
+    parser.add_argument(
+        "--requeue", nargs="+", type=int, metavar="STORY_ID",
+        help="Move these stories back to the state they failed in",
+    )
+    parser.add_argument("--all", action="store_true", help="Requeue every dead-lettered story")
+    parser.add_argument("--state", help="Only stories that failed in this state")
+    args = parser.parse_args(argv)
+
+    db_path = resolve_db_path(args.db)
+    print_header("PrismQ Dead Letters")
+    print_info(f"Database: {db_path}")
+    print()
+
+    conn = sqlite3.connect(db_path)
+    try:
+        repo = StoryRetryRepository(conn)
+        if args.requeue:
+            failed = 0
+            for story_id in args.requeue:
+                if repo.requeue(story_id):
+                    print_success(f"Story {story_id} requeued")
+                else:
+                    print_error(f"Story {story_id} is not dead-lettered")
+                    failed += 1
+            return 1 if failed else 0
+        if args.all:
+            count = repo.requeue_all(args.state)
+            print_success(f"Requeued {count} stories")
+            return 0
+        print_dead_letters(repo, args.state)
+        return 0
+    except sqlite3.Error as e:
+        print_error(f"Database error: {e}")
+        return 1
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
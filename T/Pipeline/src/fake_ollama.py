@@ -0,0 +1,350 @@
+"""Deterministic fake Ollama server for GPU-free pipeline runs.
+
+Implements the two endpoints the stage services use, ``/api/tags`` and
+``/api/generate``, on the normal Ollama address, so every stage runs
+unmodified against it.
+
+Prompts are sorted into families by their wording, and each family returns
+a canned response that the stage's parser accepts:
+
+    review   - prompts asking for JSON (stages 05-07, 10-17): a review object
+               with ``overall_score``, ``feedback`` and the title-review
+               fields. A share ``pass_rate`` of reviews pass.
+    title    - title generation/improvement (stages 03, 08): one title line
+    content  - script generation/improvement (stages 04, 09): narration text
+
+Responses are seeded from the prompt text, so the same prompt always
+returns the same answer. Latency follows each family's profile: prompt
+processing plus ``tokens / tokens_per_second`` with log-normal jitter. The
+profile is scaled by ``time_scale`` (0 = instant), and ``parallel`` requests
+are served at once, like ``OLLAMA_NUM_PARALLEL``. Durations in the response
+(``eval_duration`` ...) are the unscaled model times, so tokens/sec metrics
+match the profile.
+
+Usage:
+    python -m T.Pipeline.src.fake_ollama                        # real-time, port 11434
+    python -m T.Pipeline.src.fake_ollama --time-scale 0.1 --pass-rate 0.7
+    python -m T.Pipeline.src.fake_ollama --profile profiles.json
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from .cli import print_error, print_header, print_info
+
+DEFAULT_PORT = 11434
+DEFAULT_MODELS = ("qwen3:8b", "qwen3:14b", "qwen3:32b")
+DEFAULT_PASS_RATE = 0.85
+
+# Scores well above / below every stage's pass threshold (70-95)
+PASS_SCORE = 98
+FAIL_SCORE = 55
+
+
+@dataclass
+class FamilyProfile:
+    """Latency model of one prompt family.
+
+    Attributes:
+        tokens: Mean completion tokens.
+        tokens_per_second: Generation speed.
+        prompt_tokens_per_second: Prompt processing speed.
+        overhead: Fixed seconds per request.
+        jitter: Sigma of the log-normal factor on the generation time.
+    """
+
+    tokens: int
+    tokens_per_second: float
+    prompt_tokens_per_second: float = 2000.0
+    overhead: float = 0.05
+    jitter: float = 0.2
+
+
+DEFAULT_PROFILES: Dict[str, FamilyProfile] = {
+    "review": FamilyProfile(tokens=220, tokens_per_second=45.0),
+    "title": FamilyProfile(tokens=20, tokens_per_second=45.0),
+    "content": FamilyProfile(tokens=450, tokens_per_second=40.0),
+}
+
+# First match wins; anything else is a content prompt
+FAMILY_RULES = [
+    ("review", re.compile(r"\bjson\b", re.IGNORECASE)),
+    ("title", re.compile(r"title architect|improved title|\bone title\b", re.IGNORECASE)),
+]
+
+_WORDS = (
+    "the night the river remembered her name and the lantern in the window "
+    "kept burning long after the letters stopped arriving from the city "
+    "she counted the footsteps on the stairs and wondered who had kept the key "
+    "every promise has a price and every silence hides a door"
+).split()
+
+# Titles are assembled from these parts, so rewrites rarely repeat a title
+# (a repeated title would repeat its review verdict)
+_TITLE_SUBJECTS = (
+    "The Lantern", "The River", "Her Sister's Letters", "The Last Key", "The Stairs",
+    "The Night Shift", "The Empty Mall", "The Old Radio", "The Locked Door", "The Lighthouse",
+)
+_TITLE_PREDICATES = (
+    "That Kept Burning", "Nobody Remembered", "That Stopped Arriving", "Behind the Silence",
+    "That Knew Her Name", "Before the Storm", "That Was Never Lost", "Under the Floorboards",
+    "That Answered Back", "After Midnight",
+)
+_TITLE_ENDINGS = ("", " Again", " at Dawn", " for the Last Time", " in the Dark", " Tonight")
+
+
+def classify_prompt(prompt: str) -> str:
+    """Return the prompt family (``review``, ``title`` or ``content``)."""
+    for family, pattern in FAMILY_RULES:
+        if pattern.search(prompt):
+            return family
+    return "content"
+
+
+def load_profiles(path: str) -> Dict[str, FamilyProfile]:
+    """Load family profiles from JSON (``{"review": {"tokens_per_second": 30}}``)."""
+    with open(path, encoding="utf-8") as handle:
+        data = json.load(handle)
+    profiles = {name: FamilyProfile(**asdict(profile)) for name, profile in DEFAULT_PROFILES.items()}
+    for name, values in data.items():
+        if name not in profiles:
+            raise ValueError(f"Unknown prompt family: {name}")
+        profiles[name] = FamilyProfile(**{**asdict(profiles[name]), **values})
+    return profiles
+
+
+class FakeOllama:
+    """Response and latency model behind the HTTP server (usable without it)."""
+
+    def __init__(
+        self,
+        profiles: Optional[Dict[str, FamilyProfile]] = None,
+        pass_rate: float = DEFAULT_PASS_RATE,
+        seed: int = 0,
+        time_scale: float = 1.0,
+        parallel: int = 4,
+        models: Optional[List[str]] = None,
+    ):
+        self.profiles = profiles or dict(DEFAULT_PROFILES)
+        self.pass_rate = pass_rate
+        self.seed = seed
+        self.time_scale = time_scale
+        self.models = list(models) if models else _configured_models()
+        self._slots = threading.BoundedSemaphore(max(1, parallel))
+        self._lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+
+    def tags(self) -> Dict[str, Any]:
+        return {"models": [{"name": name, "model": name, "size": 0} for name in self.models]}
+
+    def generate(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one ``/api/generate`` request (blocks for the simulated time)."""
+        prompt = str(body.get("prompt", ""))
+        model = str(body.get("model", self.models[0] if self.models else "fake"))
+        family = classify_prompt(prompt)
+        rng = random.Random(hashlib.sha256(f"{self.seed}:{prompt}".encode("utf-8")).digest())
+        profile = self.profiles[family]
+
+        if family == "review":
+            text = self._review(rng)
+        elif family == "title":
+            text = (
+                f"{rng.choice(_TITLE_SUBJECTS)} {rng.choice(_TITLE_PREDICATES)}"
+                f"{rng.choice(_TITLE_ENDINGS)}"
+            )
+        else:
+            text = self._content(rng, profile.tokens)
+
+        prompt_tokens = max(1, len(prompt) // 4)
+        eval_count = max(1, int(profile.tokens * math.exp(rng.gauss(0, profile.jitter))))
+        prompt_seconds = prompt_tokens / profile.prompt_tokens_per_second
+        eval_seconds = eval_count / profile.tokens_per_second
+        total_seconds = profile.overhead + prompt_seconds + eval_seconds
+
+        with self._slots:
+            if self.time_scale > 0:
+                time.sleep(total_seconds * self.time_scale)
+        with self._lock:
+            self.requests[family] = self.requests.get(family, 0) + 1
+
+        return {
+            "model": model,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "response": text,
+            "done": True,
+            "done_reason": "stop",
+            "total_duration": int(total_seconds * 1e9),
+            "load_duration": 0,
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": int(prompt_seconds * 1e9),
+            "eval_count": eval_count,
+            "eval_duration": int(eval_seconds * 1e9),
+        }
+
+    def _review(self, rng: random.Random) -> str:
+        passes = rng.random() < self.pass_rate
+        score = PASS_SCORE if passes else FAIL_SCORE
+        feedback = (
+            "Clear structure and consistent voice; minor polish only."
+            if passes
+            else "The opening is slow and the ending does not pay off the setup."
+        )
+        review = {
+            "overall_score": score,
+            "feedback": feedback,
+            "script_alignment_score": score,
+            "idea_alignment_score": score,
+            "engagement_score": score,
+            "seo_score": score,
+            "strengths": ["Distinct voice"],
+            "weaknesses": [] if passes else ["Pacing"],
+            "improvement_points": [] if passes else [
+                {
+                    "category": "engagement",
+                    "title": "Tighten the hook",
+                    "description": "The first line does not create tension.",
+                    "priority": "high",
+                    "suggested_fix": "Open with the unanswered question.",
+                }
+            ],
+        }
+        return json.dumps(review)
+
+    def _content(self, rng: random.Random, tokens: int) -> str:
+        words = [rng.choice(_WORDS) for _ in range(max(20, int(tokens * 0.75)))]
+        sentences = []
+        for start in range(0, len(words), 12):
+            sentence = " ".join(words[start:start + 12])
+            sentences.append(sentence[0].upper() + sentence[1:] + ".")
+        return " ".join(sentences)
+
+
+def _configured_models() -> List[str]:
+    """Default models plus every model configured through PRISMQ_AI_MODEL_*."""
+    models = list(DEFAULT_MODELS)
+    for key, value in os.environ.items():
+        if key.startswith("PRISMQ_AI_MODEL") and value and value not in models:
+            models.append(value)
+    return models
+
+
+class _FakeOllamaHandler(BaseHTTPRequestHandler):
+    fake: FakeOllama
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/api/tags":
+            self._send_json(self.fake.tags())
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/api/generate":
+            self.send_error(404)
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self.send_error(400, "Invalid JSON")
+            return
+        result = self.fake.generate(body)
+        if body.get("stream", True):
+            # Streaming clients read NDJSON; answer with the final chunk only
+            self._send_json(result, content_type="application/x-ndjson")
+        else:
+            self._send_json(result)
+
+    def _send_json(self, data: Dict[str, Any], content_type: str = "application/json"):
+        payload = json.dumps(data).encode("utf-8")
+        if content_type == "application/x-ndjson":
+            payload += b"\n"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fake_ollama(
+    port: int = DEFAULT_PORT, host: str = "127.0.0.1", fake: Optional[FakeOllama] = None
+) -> ThreadingHTTPServer:
+    """Serve a :class:`FakeOllama` from a daemon thread.
+
+    The server's ``fake`` attribute holds the model (request counts); call
+    ``shutdown()`` and ``server_close()`` to stop it.
+
+    Raises:
+        OSError: If the port is in use (e.g. a real Ollama is running).
+    """
+    fake = fake or FakeOllama()
+    handler = type("FakeOllamaHandler", (_FakeOllamaHandler,), {"fake": fake})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.fake = fake  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, name="fake-ollama", daemon=True)
+    thread.start()
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m T.Pipeline.src.fake_ollama",
+        description="Deterministic Ollama stand-in for benchmarks without a GPU",
+    )
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--time-scale", type=float, default=1.0,
+                        help="Latency factor (1 = profile speed, 0 = instant)")
+    parser.add_argument("--pass-rate", type=float, default=DEFAULT_PASS_RATE,
+                        help=f"Share of passing reviews (default: {DEFAULT_PASS_RATE})")
+    parser.add_argument("--parallel", type=int, default=4, help="Requests served at once")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profile", help="JSON file overriding family latency profiles")
+    args = parser.parse_args(argv)
+
+    try:
+        profiles = load_profiles(args.profile) if args.profile else None
+    except (OSError, ValueError, TypeError) as e:
+        print_error(f"Invalid profile: {e}")
+        return 2
+    fake = FakeOllama(profiles, args.pass_rate, args.seed, args.time_scale, args.parallel)
+    try:
+        server = start_fake_ollama(args.port, args.host, fake)
+    except OSError as e:
+        print_error(f"Cannot listen on {args.host}:{args.port}: {e} (is Ollama running?)")
+        return 1
+
+    print_header("Fake Ollama")
+    print_info(f"Listening on http://{args.host}:{args.port}")
+    print_info(f"Models: {', '.join(fake.models)}")
+    print_info(f"Time scale: {args.time_scale:g}, pass rate: {args.pass_rate:.0%}")
+    print_info("Press Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print()
+        print_info(f"Requests served: {fake.requests}")
+    finally:
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
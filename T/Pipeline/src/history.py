@@ -0,0 +1,114 @@
+"""Persistent log of pipeline stage runs.
+
+The runner records every finished job (stage, story, outcome, duration) in
+the ``PipelineStageRun`` table. The Story table only keeps the *current*
+state, so this log is what :mod:`.simulator` fits per-stage service times
+and pass/fail routing from.
+
+Usage:
+    >>> log = StageRunLog(conn)
+    >>> log.record(outcome)
+    >>> runs = log.load(stage=11, since_days=14)
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import List, Optional
+
+from .stages import StageOutcome
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS PipelineStageRun (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stage INTEGER NOT NULL,
+    story_id INTEGER NULL,
+    success INTEGER NOT NULL,
+    passes INTEGER NULL,
+    next_state TEXT NULL,
+    duration REAL NOT NULL,
+    finished_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_pipeline_stage_run_stage ON PipelineStageRun(stage, finished_at);
+"""
+
+
+@dataclass
+class StageRun:
+    """One recorded job of a pipeline stage."""
+
+    stage: int
+    story_id: Optional[int]
+    success: bool
+    passes: Optional[bool]
+    next_state: Optional[str]
+    duration: float
+    finished_at: Optional[str] = None
+
+
+class StageRunLog:
+    """Append-only SQLite log of stage outcomes.
+
+    The table is created on first use; databases without it simply have no
+    run history (:meth:`load` returns an empty list).
+    """
+
+    def __init__(self, connection: sqlite3.Connection, ensure_table: bool = True):
+        self._conn = connection
+        if ensure_table:
+            self._conn.executescript(SCHEMA)
+
+    def record(self, outcome: StageOutcome) -> None:
+        """Store a finished (non-idle) job."""
+        self._conn.execute(
+            """
+            INSERT INTO PipelineStageRun
+                (stage, story_id, success, passes, next_state, duration)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                outcome.stage,
+                outcome.story_id,
+                int(outcome.success),
+                None if outcome.passes is None else int(outcome.passes),
+                outcome.next_state,
+                outcome.duration,
+            ),
+        )
+        self._conn.commit()
+
+    def load(self, stage: Optional[int] = None, since_days: Optional[float] = None) -> List[StageRun]:
+        """Return recorded runs, oldest first.
+
+        Args:
+            stage: Only runs of this stage.
+            since_days: Only runs from the last N days.
+        """
+        query = (
+            "SELECT stage, story_id, success, passes, next_state, duration, finished_at "
+            "FROM PipelineStageRun WHERE 1 = 1"
+        )
+        params: list = []
+        if stage is not None:
+            query += " AND stage = ?"
+            params.append(stage)
+        if since_days is not None:
+            query += " AND finished_at >= datetime('now', ?)"
+            params.append(f"-{float(since_days)} days")
+        query += " ORDER BY id"
+        try:
+            rows = self._conn.execute(query, params).fetchall()
+        except sqlite3.OperationalError:
+            return []
+        return [
+            StageRun(
+                stage=row[0],
+                story_id=row[1],
+                success=bool(row[2]),
+                passes=None if row[3] is None else bool(row[3]),
+                next_state=row[4],
+                duration=row[5],
+                finished_at=row[6],
+            )
+            for row in rows
+        ]
@@ -0,0 +1,233 @@
+"""Startup import budget for the stage workflow entry points.
+
+Every ``_meta/scripts/NN_*/Run.bat`` restarts a Python workflow, so import
+time is paid on every (re)start. This tool imports each entry point in a
+fresh ``python -X importtime`` process - without running its ``main()`` - and
+fails when:
+
+    - the total import time (median of ``--runs``) exceeds the budget
+      (``--budget``, default 300 ms), or
+    - a heavy scientific stack (``HEAVY_MODULES``: nltk, scikit-learn, scipy
+      ...) is imported at startup. Those belong behind a lazy import
+      (:mod:`Model.Infrastructure.lazy`) in the code that uses them.
+
+Usage:
+    python -m T.Pipeline.src.import_budget                 # stages 02-17
+    python -m T.Pipeline.src.import_budget --stages 11 --top 15
+    python -m T.Pipeline.src.import_budget --budget 250 --runs 5 --json
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+
+from .cli import Colors, print_error, print_header, print_info, print_success, print_warning
+from .stages import REPO_ROOT
+
+SCRIPTS_DIR = REPO_ROOT / "_meta" / "scripts"
+
+DEFAULT_BUDGET_MS = 300.0
+DEFAULT_RUNS = 3
+DEFAULT_STAGES = "02-17"
+
+# Top-level packages that must not be imported while a workflow starts
+HEAVY_MODULES = (
+    "nltk", "sklearn", "scipy", "numpy", "pandas", "torch", "spacy", "transformers",
+)
+
+_PYTHON_LINE = re.compile(r"^\s*python\s+(\S+\.py)\b", re.IGNORECASE | re.MULTILINE)
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)")
+
+# Imports the entry point as a module (not __main__), so main() does not run
+_LOADER = (
+    "import importlib.util, sys\n"
+    "spec = importlib.util.spec_from_file_location('prismq_entry_point', sys.argv[1])\n"
+    "module = importlib.util.module_from_spec(spec)\n"
+    "spec.loader.exec_module(module)\n"
+)
+
+
+@dataclass
+class EntryPoint:
+    """A workflow script started by a ``Run.bat``."""
+
+    folder: str
+    path: Path
+
+    @property
+    def stage(self) -> Optional[int]:
+        number = self.folder.split("_", 1)[0]
+        return int(number) if number.isdigit() else None
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    """Import cost of one entry point."""
+
+    folder: str
+    path: str
+    total_ms: float = 0.0
+    heavy: List[str] = field(default_factory=list)
+    top: List[ImportRecord] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def over_budget(self, budget_ms: float) -> bool:
+        return self.error is not None or bool(self.heavy) or self.total_ms > budget_ms
+
+
+def discover_entry_points(scripts_dir: Path = SCRIPTS_DIR) -> List[EntryPoint]:
+    """Python scripts launched by the ``Run*.bat`` files, one per script folder."""
+    entry_points = []
+    for folder in sorted(p for p in scripts_dir.iterdir() if p.is_dir()):
+        seen = set()
+        for bat in sorted(folder.glob("Run*.bat")):
+            text = bat.read_text(encoding="utf-8", errors="replace")
+            for relative in _PYTHON_LINE.findall(text):
+                path = (folder / relative.replace("\\", "/")).resolve()
+                if path.is_file() and path not in seen:
+                    seen.add(path)
+                    entry_points.append(EntryPoint(folder.name, path))
+    return entry_points
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parse ``python -X importtime`` stderr into records (nesting as ``depth``)."""
+    records = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            records.append(ImportRecord(
+                module=match.group(4),
+                self_us=int(match.group(1)),
+                cumulative_us=int(match.group(2)),
+                depth=(len(match.group(3)) - 1) // 2,
+            ))
+    return records
+
+
+def measure(
+    entry: EntryPoint,
+    runs: int = DEFAULT_RUNS,
+    heavy_modules: Sequence[str] = HEAVY_MODULES,
+    top: int = 5,
+    timeout: float = 120.0,
+) -> StartupProfile:
+    """Import ``entry`` ``runs`` times in fresh interpreters and profile it."""
+    profile = StartupProfile(entry.folder, str(entry.path))
+    totals = []
+    records: List[ImportRecord] = []
+    for _ in range(max(1, runs)):
+        try:
+            completed = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", _LOADER, str(entry.path)],
+                cwd=str(entry.path.parent), capture_output=True, text=True, timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            profile.error = f"import did not finish within {timeout:g}s"
+            return profile
+        records = parse_importtime(completed.stderr)
+        if completed.returncode != 0:
+            lines = [line for line in completed.stderr.splitlines() if not line.startswith("import time:")]
+            profile.error = lines[-1] if lines else f"exit code {completed.returncode}"
+            return profile
+        totals.append(sum(r.cumulative_us for r in records if r.depth == 0) / 1000)
+
+    profile.total_ms = statistics.median(totals)
+    loaded = {r.module.split(".")[0] for r in records}
+    profile.heavy = sorted(loaded & set(heavy_modules))
+    profile.top = sorted(
+        (r for r in records if r.depth == 0), key=lambda r: r.cumulative_us, reverse=True
+    )[:top]
+    return profile
+
+
+def select_entry_points(entry_points: Iterable[EntryPoint], stages: Optional[str]) -> List[EntryPoint]:
+    """Filter entry points by stage numbers such as ``02-17`` or ``04,11``."""
+    if not stages:
+        return list(entry_points)
+    wanted = set()
+    for item in stages.split(","):
+        low, _, high = item.strip().partition("-")
+        wanted.update(range(int(low), int(high or low) + 1))
+    return [e for e in entry_points if e.stage in wanted]
+
+
+def print_profile(profile: StartupProfile, budget_ms: float) -> None:
+    if profile.error:
+        print(f"{Colors.RED}{'ERROR':>8}{Colors.END}  {profile.folder}")
+        print(f"{'':10}{profile.error[:160]}")
+        return
+    color = Colors.RED if profile.over_budget(budget_ms) else Colors.GREEN
+    print(f"{color}{profile.total_ms:>6.0f}ms{Colors.END}  {profile.folder}")
+    if profile.heavy:
+        print(f"{'':10}{Colors.RED}heavy imports: {', '.join(profile.heavy)}{Colors.END}")
+    for record in profile.top:
+        print(f"{'':10}{record.cumulative_us / 1000:>6.0f}ms  {record.module}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m T.Pipeline.src.import_budget",
+        description="Check the startup import time of the PrismQ stage workflows",
+    )
+    parser.add_argument("--stages", default=DEFAULT_STAGES,
+                        help=f"Script folders to check, e.g. 04,11-17 (default: {DEFAULT_STAGES})")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Allowed import time per entry point in ms (default: {DEFAULT_BUDGET_MS:g})")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS,
+                        help=f"Measurements per entry point, median is used (default: {DEFAULT_RUNS})")
+    parser.add_argument("--top", type=int, default=5, help="Slowest top-level imports to show")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        entry_points = select_entry_points(discover_entry_points(), args.stages)
+    except ValueError as e:
+        print_error(f"Invalid --stages: {e}")
+        return 2
+    if not entry_points:
+        print_warning("No entry points found")
+        return 0
+
+    if not args.json:
+        print_header("PrismQ Startup Import Budget")
+        print_info(f"Budget: {args.budget:g} ms, median of {args.runs} run(s)")
+        print()
+
+    profiles = []
+    for entry in entry_points:
+        profile = measure(entry, runs=args.runs, top=args.top)
+        profiles.append(profile)
+        if not args.json:
+            print_profile(profile, args.budget)
+
+    failed = [p for p in profiles if p.over_budget(args.budget)]
+    if args.json:
+        print(json.dumps([asdict(p) for p in profiles], indent=2))
+    else:
+        print()
+        if failed:
+            print_error(f"{len(failed)} of {len(profiles)} entry points over budget")
+        else:
+            print_success(f"All {len(profiles)} entry points within {args.budget:g} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
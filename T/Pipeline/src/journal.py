@@ -0,0 +1,280 @@
+"""Story state-change journal and incrementally maintained state counters.
+
+SQLite triggers on the Story table keep two small tables up to date, no
+matter which service or script changes a story:
+
+    StoryStateCount  - stories per state (replaces ``GROUP BY state`` scans)
+    StoryTransition  - one row per state change, with the time the story
+                       spent in the state it left
+
+:class:`JournalTail` reads only the rows appended since its last poll, so a
+monitor can refresh every second at negligible database cost, and derives
+per-state arrivals/departures per hour, p50/p95 time-in-state, pass rates and
+the ETA to drain each queue.
+
+Usage:
+    >>> install_journal(conn)           # idempotent; seeds counts once
+    >>> tail = JournalTail(conn)
+    >>> tail.poll()
+    >>> for stats in tail.stats().values():
+    ...     print(stats.state, stats.count, stats.eta_seconds)
+"""
+
+import sqlite3
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+from Model.State.validators.transition_validator import TRANSITIONS
+
+# Default window for rates and percentiles (seconds)
+DEFAULT_WINDOW = 3600.0
+
+# Unix time in SQLite, with millisecond precision
+_NOW = "((julianday('now') - 2440587.5) * 86400.0)"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS StoryTransition (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    story_id INTEGER NOT NULL,
+    from_state TEXT NULL,
+    to_state TEXT NULL,
+    changed_at REAL NOT NULL,
+    seconds_in_state REAL NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_story_transition_story ON StoryTransition(story_id, id);
+CREATE INDEX IF NOT EXISTS idx_story_transition_changed ON StoryTransition(changed_at);
+"""
+
+_COUNT_SCHEMA = """
+CREATE TABLE StoryStateCount (
+    state TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS trg_story_journal_insert AFTER INSERT ON Story
+BEGIN
+    INSERT INTO StoryStateCount (state, count) VALUES (NEW.state, 1)
+        ON CONFLICT(state) DO UPDATE SET count = count + 1;
+    INSERT INTO StoryTransition (story_id, from_state, to_state, changed_at)
+        VALUES (NEW.id, NULL, NEW.state, {now});
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_story_journal_update AFTER UPDATE OF state ON Story
+WHEN OLD.state IS NOT NEW.state
+BEGIN
+    UPDATE StoryStateCount SET count = count - 1 WHERE state = OLD.state;
+    INSERT INTO StoryStateCount (state, count) VALUES (NEW.state, 1)
+        ON CONFLICT(state) DO UPDATE SET count = count + 1;
+    INSERT INTO StoryTransition (story_id, from_state, to_state, changed_at, seconds_in_state)
+        VALUES (NEW.id, OLD.state, NEW.state, {now}, {now} - COALESCE(
+            (SELECT changed_at FROM StoryTransition WHERE story_id = NEW.id ORDER BY id DESC LIMIT 1),
+            {entered}));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_story_journal_delete AFTER DELETE ON Story
+BEGIN
+    UPDATE StoryStateCount SET count = count - 1 WHERE state = OLD.state;
+    INSERT INTO StoryTransition (story_id, from_state, to_state, changed_at)
+        VALUES (OLD.id, OLD.state, NULL, {now});
+END;
+"""
+
+
+def _table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ).fetchone()
+    return row is not None
+
+
+def install_journal(conn: sqlite3.Connection) -> bool:
+    """Create the journal tables and Story triggers if missing.
+
+    The first installation seeds StoryStateCount from one ``GROUP BY state``
+    inside the same transaction as the triggers, so no change is missed.
+
+    Returns:
+        True if the journal is available (False when there is no Story table).
+    """
+    if not _table_exists(conn, "Story"):
+        return False
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(Story)")}
+    # Time in state for the first journaled change of an older story
+    entered = "NULL"
+    if "updated_at" in columns:
+        entered = "(julianday(OLD.updated_at) - 2440587.5) * 86400.0"
+
+    previous_isolation = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            if not _table_exists(conn, "StoryStateCount"):
+                conn.execute(_COUNT_SCHEMA)
+                conn.execute(
+                    "INSERT INTO StoryStateCount (state, count) "
+                    "SELECT state, COUNT(*) FROM Story GROUP BY state"
+                )
+            for statement in _TRIGGERS.format(now=_NOW, entered=entered).split("END;"):
+                if statement.strip():
+                    conn.execute(statement + "END;")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.isolation_level = previous_isolation
+    return True
+
+
+def rebuild_counts(conn: sqlite3.Connection) -> None:
+    """Recompute StoryStateCount from the Story table (repairs any drift)."""
+    conn.execute("DELETE FROM StoryStateCount")
+    conn.execute(
+        "INSERT INTO StoryStateCount (state, count) SELECT state, COUNT(*) FROM Story GROUP BY state"
+    )
+    conn.commit()
+
+
+def prune_journal(conn: sqlite3.Connection, keep_days: float = 30.0) -> int:
+    """Delete transitions older than ``keep_days``; return rows removed."""
+    cursor = conn.execute(
+        f"DELETE FROM StoryTransition WHERE changed_at < {_NOW} - ?", (keep_days * 86400.0,)
+    )
+    conn.commit()
+    return cursor.rowcount
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+@dataclass
+class StateStats:
+    """Flow statistics of one state over the journal window.
+
+    Attributes:
+        state: Full state name.
+        count: Stories currently in the state.
+        arrivals_per_hour: Stories entering the state.
+        departures_per_hour: Stories leaving the state.
+        p50_seconds / p95_seconds: Time spent in the state by departed stories.
+        pass_rate: Share of departures taking the forward transition (review
+            states only).
+        eta_seconds: Time to drain the queue at the current net rate; None
+            when the queue is not shrinking.
+    """
+
+    state: str
+    count: int
+    arrivals_per_hour: float = 0.0
+    departures_per_hour: float = 0.0
+    p50_seconds: Optional[float] = None
+    p95_seconds: Optional[float] = None
+    pass_rate: Optional[float] = None
+    eta_seconds: Optional[float] = None
+
+
+class JournalTail:
+    """Incremental reader of the state journal.
+
+    Each :meth:`poll` reads the StoryStateCount table (one row per state) and
+    the StoryTransition rows with an id above the last one seen.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, window: float = DEFAULT_WINDOW):
+        self._conn = conn
+        self.window = window
+        self.counts: Dict[str, int] = {}
+        self._last_id = 0
+        self._arrivals: Dict[str, Deque[float]] = {}
+        self._departures: Dict[str, Deque[Tuple[float, Optional[float], Optional[str]]]] = {}
+        now = time.time()
+        row = conn.execute("SELECT MIN(changed_at) FROM StoryTransition").fetchone()
+        self._journal_start = row[0] if row and row[0] is not None else now
+        # Start from the window so rates are meaningful right away
+        row = conn.execute(
+            "SELECT MIN(id) FROM StoryTransition WHERE changed_at >= ?", (now - window,)
+        ).fetchone()
+        if row and row[0] is not None:
+            self._last_id = row[0] - 1
+        else:
+            row = conn.execute("SELECT MAX(id) FROM StoryTransition").fetchone()
+            self._last_id = row[0] or 0
+
+    def poll(self) -> int:
+        """Read new transitions and current counts; return new transitions."""
+        self.counts = {
+            state: count
+            for state, count in self._conn.execute("SELECT state, count FROM StoryStateCount")
+            if count
+        }
+        rows = self._conn.execute(
+            "SELECT id, from_state, to_state, changed_at, seconds_in_state "
+            "FROM StoryTransition WHERE id > ? ORDER BY id",
+            (self._last_id,),
+        ).fetchall()
+        for row_id, from_state, to_state, changed_at, seconds in rows:
+            if to_state is not None:
+                self._arrivals.setdefault(to_state, deque()).append(changed_at)
+            if from_state is not None:
+                self._departures.setdefault(from_state, deque()).append((changed_at, seconds, to_state))
+            self._last_id = row_id
+        return len(rows)
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        for queue in self._arrivals.values():
+            while queue and queue[0] < cutoff:
+                queue.popleft()
+        for queue in self._departures.values():
+            while queue and queue[0][0] < cutoff:
+                queue.popleft()
+
+    def stats(self, now: Optional[float] = None) -> Dict[str, StateStats]:
+        """Per-state flow statistics for the current window."""
+        now = time.time() if now is None else now
+        self._expire(now)
+        # At least one minute, so the first seconds after installation do not spike
+        hours = max(min(self.window, now - self._journal_start), 60.0) / 3600.0
+
+        result: Dict[str, StateStats] = {}
+        for state in set(self.counts) | set(self._arrivals) | set(self._departures):
+            arrivals = self._arrivals.get(state, ())
+            departures = self._departures.get(state, ())
+            if not (self.counts.get(state) or arrivals or departures):
+                continue
+            stats = StateStats(
+                state=state,
+                count=self.counts.get(state, 0),
+                arrivals_per_hour=len(arrivals) / hours,
+                departures_per_hour=len(departures) / hours,
+            )
+            durations = sorted(seconds for _, seconds, _ in departures if seconds is not None)
+            stats.p50_seconds = _percentile(durations, 0.5)
+            stats.p95_seconds = _percentile(durations, 0.95)
+
+            targets = TRANSITIONS.get(state, [])
+            if ".Review." in state and len(targets) > 1 and departures:
+                routed = [to for _, _, to in departures if to in targets]
+                if routed:
+                    stats.pass_rate = sum(1 for to in routed if to == targets[0]) / len(routed)
+
+            net = stats.departures_per_hour - stats.arrivals_per_hour
+            if stats.count == 0:
+                stats.eta_seconds = 0.0
+            elif net > 0:
+                stats.eta_seconds = stats.count / net * 3600.0
+            result[state] = stats
+        return result
@@ -0,0 +1,378 @@
+"""Single-process scheduler for the PrismQ.T pipeline.
+
+Replaces the per-stage ``Run.bat`` loops (and ``run_all_14b.bat``) with one
+Python process that imports every stage service once, keeps one long-lived
+database connection and service instance per worker slot, and schedules work
+across all Story states.
+
+Scheduling:
+    - One ``SELECT state, COUNT(*) FROM Story GROUP BY state`` per tick gives
+      the queue depth of every stage.
+    - Stages are visited downstream-first so stories already deep in the
+      pipeline drain before new ones are started.
+    - Each stage runs at most ``concurrency[stage]`` jobs at once, and the
+      whole runner at most ``max_workers`` jobs (the Ollama parallel slots).
+    - Upstream generation stages (02-04) pause while a downstream WIP group
+      is over its limit (see :mod:`Model.Infrastructure.backpressure`).
+    - Stories backing off after a failure (``StoryRetry``) do not count as
+      pending, and a stage whose jobs keep erroring (e.g. Ollama down) is
+      paused with exponential backoff until a job succeeds again.
+    - A stage whose jobs find nothing to do although its queue count says
+      otherwise (e.g. stories without content) backs off from
+      ``poll_interval`` up to ``idle_interval`` (until another job succeeds)
+      instead of being resubmitted on every tick.
+    - Finished jobs, queue depths and control-query times are recorded in
+      :mod:`Model.Infrastructure.metrics` (served by ``--metrics-port``);
+      each job runs in a stage span of the story's trace
+      (:mod:`Model.Infrastructure.tracing`).
+    - When nothing is pending and nothing is in flight, the runner waits
+      ``idle_interval`` seconds (30 s, like the workflow scripts).
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from Model.Infrastructure.backpressure import BackpressureGate, GroupPressure
+from Model.Infrastructure.metrics import DB_QUERY_DURATION, QUEUE_DEPTH, record_stage_result
+from Model.Infrastructure.tracing import trace_stage
+
+from .history import StageRunLog
+from .stages import PARALLEL_WORKERS, StageContext, StageOutcome, StageSpec
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_IDLE_INTERVAL = 30.0
+
+# Stage-level backoff after consecutive job errors (seconds)
+STAGE_BACKOFF_BASE = 5.0
+STAGE_BACKOFF_MAX = 300.0
+
+_BACKING_OFF_SQL = """
+    SELECT s.state, COUNT(*)
+    FROM StoryRetry sr
+    INNER JOIN Story s ON s.id = sr.story_id AND s.state = sr.state
+    WHERE sr.next_attempt_at > datetime('now')
+    GROUP BY s.state
+"""
+
+
+@dataclass
+class StageStats:
+    """Running totals for one stage."""
+
+    processed: int = 0
+    passed: int = 0
+    failed: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+
+    def record(self, outcome: StageOutcome) -> None:
+        self.busy_seconds += outcome.duration
+        if not outcome.success:
+            self.errors += 1
+            return
+        self.processed += 1
+        if outcome.passes is True:
+            self.passed += 1
+        elif outcome.passes is False:
+            self.failed += 1
+
+
+class PipelineRunner:
+    """Run many pipeline stages in one process with shared resources.
+
+    Attributes:
+        stages: Stages hosted by this runner, in step order.
+        concurrency: Effective worker limit per stage number.
+        max_workers: Global limit on jobs in flight.
+        stats: Per-stage :class:`StageStats`.
+
+    Example:
+        >>> from T.Pipeline import PipelineRunner, parse_stage_filter
+        >>> runner = PipelineRunner("C:/PrismQ/db.s3db", parse_stage_filter("10-17"))
+        >>> runner.run()  # until Ctrl+C or runner.stop()
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        stages: List[StageSpec],
+        concurrency: Optional[Dict[int, int]] = None,
+        max_workers: int = PARALLEL_WORKERS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        idle_interval: float = DEFAULT_IDLE_INTERVAL,
+        on_outcome: Optional[Callable[[StageOutcome], None]] = None,
+        gate: Optional[BackpressureGate] = None,
+        record_history: bool = False,
+        context: Optional[StageContext] = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            db_path: Path to the shared SQLite database.
+            stages: Stages to host (see :func:`parse_stage_filter`).
+            concurrency: Requested workers per stage number (default 1, or
+                ``max_concurrency`` for stages that claim stories). Values
+                above a stage's ``max_concurrency`` are clamped.
+            max_workers: Maximum jobs in flight across all stages.
+            poll_interval: Maximum wait between scheduling ticks while busy.
+            idle_interval: Wait when no stage has pending work.
+            on_outcome: Callback invoked for every finished job.
+            gate: Backpressure gate for upstream stages (default: WIP limits
+                from the environment).
+            record_history: Log every finished job to ``PipelineStageRun``
+                (input for the throughput simulator).
+            context: Shared stage resources (default: a :class:`StageContext`
+                for ``db_path``); the benchmark passes one with timed
+                connections.
+        """
+        self.db_path = db_path
+        self.stages = sorted(stages, key=lambda s: s.number)
+        self.max_workers = max(1, max_workers)
+        self.poll_interval = poll_interval
+        self.idle_interval = idle_interval
+        self.on_outcome = on_outcome
+        self.context = context if context is not None else StageContext(db_path)
+        self.gate = gate if gate is not None else BackpressureGate()
+        self.record_history = record_history
+
+        requested = concurrency or {}
+        self.concurrency: Dict[int, int] = {}
+        for spec in self.stages:
+            wanted = requested.get(spec.number, spec.max_concurrency)
+            if wanted > spec.max_concurrency:
+                logger.warning(
+                    f"Stage {spec.number:02d} supports at most {spec.max_concurrency} "
+                    f"worker(s); clamping concurrency {wanted}"
+                )
+            self.concurrency[spec.number] = max(0, min(wanted, spec.max_concurrency))
+
+        self.stats: Dict[int, StageStats] = {spec.number: StageStats() for spec in self.stages}
+        self._idle_handlers: Dict[int, list] = {spec.number: [] for spec in self.stages}
+        self._in_flight: Dict[Future, tuple] = {}
+        self._control: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._history: Optional[StageRunLog] = None
+        self._paused: Dict[int, str] = {}
+        self._error_streak: Dict[int, int] = {spec.number: 0 for spec in self.stages}
+        self._idle_streak: Dict[int, int] = {spec.number: 0 for spec in self.stages}
+        self._resume_at: Dict[int, float] = {}
+        self._idle_until: Dict[int, float] = {}
+        self._stop = threading.Event()
+
+    # === Lifecycle ===
+
+    def start(self) -> None:
+        """Import every stage service and open all worker connections once."""
+        self._control = self.context.connect()
+        if self.record_history:
+            self._history = StageRunLog(self._control)
+        for spec in self.stages:
+            for _ in range(self.concurrency[spec.number]):
+                self._idle_handlers[spec.number].append(spec.factory(self.context))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="prismq-stage"
+        )
+
+    def close(self) -> None:
+        """Wait for in-flight jobs and release every connection."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for future in list(self._in_flight):
+            self._collect(future)
+        for handlers in self._idle_handlers.values():
+            for handler in handlers:
+                handler.close()
+            handlers.clear()
+        if self._control is not None:
+            self._control.close()
+            self._control = None
+            self._history = None
+
+    def stop(self) -> None:
+        """Ask :meth:`run` to return after the current tick."""
+        self._stop.set()
+
+    # === Scheduling ===
+
+    def queue_depths(self) -> Dict[int, int]:
+        """Return the number of pending items per hosted stage.
+
+        Also feeds the same per-state counts to the backpressure gate, so WIP
+        limits cost no extra query.
+        """
+        with DB_QUERY_DURATION.time(query="state_counts"):
+            counts = {
+                row[0]: row[1]
+                for row in self._control.execute("SELECT state, COUNT(*) FROM Story GROUP BY state")
+            }
+        self.gate.update(counts)
+        self._log_pause_changes()
+        backing_off = self._backing_off_counts()
+        depths: Dict[int, int] = {}
+        for spec in self.stages:
+            if spec.pending_sql:
+                try:
+                    with DB_QUERY_DURATION.time(query="pending"):
+                        depths[spec.number] = self._control.execute(spec.pending_sql).fetchone()[0]
+                except sqlite3.OperationalError:
+                    depths[spec.number] = 0
+            else:
+                depths[spec.number] = max(
+                    0, counts.get(spec.input_state, 0) - backing_off.get(spec.input_state, 0)
+                )
+            QUEUE_DEPTH.set(depths[spec.number], stage=f"{spec.number:02d}")
+        return depths
+
+    def _backing_off_counts(self) -> Dict[str, int]:
+        """Stories per state waiting for their retry time (none before the first failure)."""
+        try:
+            with DB_QUERY_DURATION.time(query="backing_off"):
+                return {row[0]: row[1] for row in self._control.execute(_BACKING_OFF_SQL)}
+        except sqlite3.OperationalError:
+            # StoryRetry is created on the first recorded failure
+            return {}
+
+    def tick(self) -> int:
+        """Submit as much pending work as the limits allow.
+
+        Returns:
+            Number of jobs submitted.
+        """
+        depths = self.queue_depths()
+        running: Dict[int, int] = {}
+        for stage, _ in self._in_flight.values():
+            running[stage] = running.get(stage, 0) + 1
+
+        submitted = 0
+        now = time.monotonic()
+        for spec in reversed(self.stages):
+            if self.gate.is_paused(spec.number):
+                continue
+            if max(self._resume_at.get(spec.number, 0), self._idle_until.get(spec.number, 0)) > now:
+                continue
+            pending = depths.get(spec.number, 0) - running.get(spec.number, 0)
+            idle = self._idle_handlers[spec.number]
+            while idle and pending > 0 and len(self._in_flight) < self.max_workers:
+                handler = idle.pop()
+                future = self._executor.submit(
+                    trace_stage, f"{spec.number:02d}", handler.process_next
+                )
+                self._in_flight[future] = (spec.number, handler)
+                pending -= 1
+                submitted += 1
+        return submitted
+
+    def pressure(self) -> Dict[str, GroupPressure]:
+        """Current WIP pressure per state group (as of the last tick)."""
+        return self.gate.pressure
+
+    def paused_stages(self) -> Dict[int, str]:
+        """Hosted stages currently held back, with the reason."""
+        return self.gate.paused_stages(spec.number for spec in self.stages)
+
+    def _log_pause_changes(self) -> None:
+        paused = self.paused_stages()
+        for stage, reason in paused.items():
+            if stage not in self._paused:
+                logger.warning(f"Stage {stage:02d} paused: WIP limit reached ({reason})")
+        for stage in self._paused:
+            if stage not in paused:
+                logger.warning(f"Stage {stage:02d} resumed")
+        self._paused = paused
+
+    def run(self, stop_when_idle: bool = False) -> Dict[int, StageStats]:
+        """Run the scheduling loop.
+
+        Args:
+            stop_when_idle: Return once no stage has pending or running work
+                instead of waiting ``idle_interval`` (used for one-shot drains).
+
+        Returns:
+            Per-stage statistics.
+        """
+        self._stop.clear()
+        if self._executor is None:
+            self.start()
+        try:
+            while not self._stop.is_set():
+                self.tick()
+                if not self._in_flight:
+                    if stop_when_idle:
+                        break
+                    self._stop.wait(self._idle_wait())
+                    continue
+
+                done, _ = wait(
+                    list(self._in_flight), timeout=self.poll_interval, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    self._collect(future)
+        finally:
+            self.close()
+        return self.stats
+
+    def _collect(self, future: Future) -> StageOutcome:
+        stage, handler = self._in_flight.pop(future)
+        self._idle_handlers[stage].append(handler)
+        try:
+            outcome = future.result()
+        except Exception as e:
+            logger.exception(f"Stage {stage:02d}: worker crashed")
+            outcome = StageOutcome(stage=stage, success=False, error=str(e))
+        self._track_idle(stage, outcome)
+        if not outcome.idle:
+            self.stats[stage].record(outcome)
+            self._track_errors(stage, outcome)
+            record_stage_result(f"{stage:02d}", outcome.success, outcome.passes, outcome.duration)
+            if self._history is not None:
+                self._history.record(outcome)
+            if self.on_outcome is not None:
+                self.on_outcome(outcome)
+        return outcome
+
+    def _track_errors(self, stage: int, outcome: StageOutcome) -> None:
+        """Pause a stage with exponential backoff while its jobs keep erroring."""
+        if outcome.success:
+            if self._error_streak[stage]:
+                logger.warning(f"Stage {stage:02d} recovered")
+            self._error_streak[stage] = 0
+            self._resume_at.pop(stage, None)
+            return
+        self._error_streak[stage] += 1
+        streak = self._error_streak[stage]
+        if streak < 2:
+            return
+        delay = min(STAGE_BACKOFF_MAX, STAGE_BACKOFF_BASE * (2 ** (streak - 2)))
+        self._resume_at[stage] = time.monotonic() + delay
+        logger.warning(
+            f"Stage {stage:02d}: {streak} consecutive errors, backing off {delay:.0f}s"
+        )
+
+    def _track_idle(self, stage: int, outcome: StageOutcome) -> None:
+        """Back a stage off while its jobs come back empty despite a pending count.
+
+        A successful job anywhere may have produced work for the idle stages,
+        so it clears their backoff.
+        """
+        if not outcome.idle:
+            if outcome.success:
+                self._idle_streak = dict.fromkeys(self._idle_streak, 0)
+                self._idle_until.clear()
+            return
+        self._idle_streak[stage] += 1
+        delay = min(self.idle_interval, self.poll_interval * 2 ** (self._idle_streak[stage] - 1))
+        self._idle_until[stage] = time.monotonic() + delay
+
+    def _idle_wait(self) -> float:
+        """Seconds to wait with nothing in flight (until the next stage resumes)."""
+        now = time.monotonic()
+        resumes = list(self._resume_at.values()) + list(self._idle_until.values())
+        return min([self.idle_interval] + [resume - now for resume in resumes if resume > now])
@@ -0,0 +1,686 @@
+"""Throughput simulator and bottleneck analyzer for the PrismQ.T pipeline.
+
+Fits a model of every stage from the database and replays it in a
+discrete-event simulation under different worker counts, model speeds and
+WIP limits, so GPU and worker sizing no longer relies on guesswork.
+
+Fitting (:func:`fit_pipeline`), per stage and in order of preference:
+    1. ``PipelineStageRun`` - jobs logged by ``python -m T.Pipeline``
+       (exact durations and next states)
+    2. Artifact history - gaps between consecutive Title/Content versions and
+       StoryReview rows of the same stage. During busy periods the gap
+       between two completions equals the service time of one worker.
+    3. Defaults (``DEFAULT_SERVICE_SECONDS``)
+    Routing (pass/fail loops) comes from the logged next states; without a
+    log each stage follows the transition graph in
+    ``Model/State/validators/transition_validator.py`` with
+    ``DEFAULT_ACCEPT_RATE`` for reviews.
+
+Simulation (:func:`simulate`) schedules like :class:`PipelineRunner`:
+downstream-first, per-stage worker limits, a global slot limit
+(``max_workers``, the Ollama parallel slots) and the same
+:class:`BackpressureGate` for stages 02-04. A story is finished when it
+leaves the hosted stages (e.g. reaches ``Story.Review``).
+
+Usage:
+    python -m T.Pipeline.src.simulator
+    python -m T.Pipeline.src.simulator --max-workers 8 --concurrency 03=4
+    python -m T.Pipeline.src.simulator --speed 11-17=0.5   # faster model for quality reviews
+    python -m T.Pipeline.src.simulator --wip review=100 --ideas-per-day 20
+    python -m T.Pipeline.src.simulator --save baseline.json
+    python -m T.Pipeline.src.simulator --compare baseline.json   # exit 1 on regression
+"""
+
+import argparse
+import heapq
+import json
+import math
+import random
+import sqlite3
+import sys
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from statistics import mean
+from typing import Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from Model import StateNames
+from Model.Infrastructure.backpressure import BackpressureGate, load_wip_groups
+from Model.State.validators.transition_validator import TRANSITIONS
+
+from .cli import (
+    Colors,
+    parse_concurrency,
+    print_error,
+    print_header,
+    print_info,
+    print_success,
+    print_warning,
+    resolve_db_path,
+)
+from .history import StageRunLog
+from .stages import PARALLEL_WORKERS, STAGES, StageSpec, parse_stage_filter
+
+SECONDS_PER_DAY = 86400.0
+
+# Stories created per Idea by stage 02 (StoryFromIdeaService.NUM_STORIES)
+STORIES_PER_IDEA = 10
+
+# Rough service times (seconds, 14b model) used when a stage has no history
+DEFAULT_SERVICE_SECONDS: Dict[int, float] = {
+    2: 1.0,
+    3: 20.0,
+    4: 90.0,
+    5: 30.0,
+    6: 45.0,
+    7: 30.0,
+    8: 20.0,
+    9: 90.0,
+    10: 45.0,
+    11: 40.0,
+    12: 40.0,
+    13: 40.0,
+    14: 40.0,
+    15: 40.0,
+    16: 20.0,
+    17: 40.0,
+}
+
+# Share of stories a review stage accepts when no routing history exists
+DEFAULT_ACCEPT_RATE = 0.9
+
+# Samples needed before history replaces the default for a stage
+MIN_SAMPLES = 5
+
+# With an unlimited idea backlog, at most this many stories wait for the first
+# stage after stage 02 (the real backlog is ideas, not stories)
+UNLIMITED_BACKLOG = 100
+
+# Artifact gaps longer than this are idle time, not service time (seconds)
+MAX_BUSY_GAP = 1800.0
+
+# Artifact tables whose consecutive rows mark completions of a stage
+_ARTIFACT_SQL: Dict[int, str] = {
+    3: "SELECT julianday(created_at) FROM Title WHERE version = 0 ORDER BY 1",
+    4: "SELECT julianday(created_at) FROM Content WHERE version = 0 ORDER BY 1",
+    8: "SELECT julianday(created_at) FROM Title WHERE version > 0 ORDER BY 1",
+    9: "SELECT julianday(created_at) FROM Content WHERE version > 0 ORDER BY 1",
+    11: "SELECT julianday(created_at) FROM StoryReview WHERE review_type = 'grammar' ORDER BY 1",
+    12: "SELECT julianday(created_at) FROM StoryReview WHERE review_type = 'tone' ORDER BY 1",
+    13: "SELECT julianday(created_at) FROM StoryReview WHERE review_type = 'content' ORDER BY 1",
+    14: "SELECT julianday(created_at) FROM StoryReview WHERE review_type = 'consistency' ORDER BY 1",
+    15: "SELECT julianday(created_at) FROM StoryReview WHERE review_type = 'editing' ORDER BY 1",
+}
+
+
+# =============================================================================
+# Model
+# =============================================================================
+
+
+@dataclass
+class StageModel:
+    """Fitted behaviour of one stage.
+
+    Attributes:
+        number: Stage number (``_meta/scripts`` prefix).
+        name: Module name.
+        input_state: State consumed (None for stage 02, which consumes Ideas).
+        max_concurrency: Worker limit of the real stage.
+        samples: Observed service times in seconds (may be empty).
+        default_seconds: Median service time used when samples are missing.
+        routes: ``(next_state, probability)`` after a successful job.
+        error_rate: Share of jobs that fail and leave the story in place.
+        source: Where the service times came from ("log", "artifacts", "default").
+    """
+
+    number: int
+    name: str
+    input_state: Optional[str]
+    max_concurrency: int = 1
+    samples: List[float] = field(default_factory=list)
+    default_seconds: float = 30.0
+    routes: List[Tuple[str, float]] = field(default_factory=list)
+    error_rate: float = 0.0
+    source: str = "default"
+
+    @property
+    def mean_service(self) -> float:
+        """Mean service time in seconds."""
+        if self.samples:
+            return mean(self.samples)
+        return self.default_seconds * math.exp(0.3 ** 2 / 2)
+
+    def sample_service(self, rng: random.Random) -> float:
+        """Draw one service time (bootstrap from samples, else lognormal)."""
+        if self.samples:
+            return rng.choice(self.samples)
+        return rng.lognormvariate(math.log(self.default_seconds), 0.3)
+
+    def sample_route(self, rng: random.Random) -> Optional[str]:
+        """Draw the next state of a successful job."""
+        roll = rng.random()
+        for state, probability in self.routes:
+            roll -= probability
+            if roll < 0:
+                return state
+        return self.routes[-1][0] if self.routes else None
+
+
+@dataclass
+class PipelineModel:
+    """Fitted stage models plus the observed workload."""
+
+    stages: Dict[int, StageModel]
+    ideas_per_day: float = 0.0
+    current_wip: Dict[str, int] = field(default_factory=dict)
+
+
+def default_routes(input_state: Optional[str]) -> List[Tuple[str, float]]:
+    """Routing from the transition graph when no history exists."""
+    if input_state is None:
+        return [(StateNames.TITLE_FROM_IDEA, 1.0)]
+    targets = list(TRANSITIONS.get(input_state, []))
+    if not targets:
+        return []
+    if len(targets) == 1:
+        return [(targets[0], 1.0)]
+    # Generation stages normally take their first transition (others are error
+    # recovery); reviews accept DEFAULT_ACCEPT_RATE and loop back otherwise.
+    accept = DEFAULT_ACCEPT_RATE if ".Review." in input_state else 1.0
+    rest = (1.0 - accept) / (len(targets) - 1)
+    return [(targets[0], accept)] + [(state, rest) for state in targets[1:]]
+
+
+def _artifact_gaps(conn: sqlite3.Connection, stage: int, since_days: Optional[float]) -> List[float]:
+    sql = _ARTIFACT_SQL.get(stage)
+    if sql is None:
+        return []
+    try:
+        days = [row[0] for row in conn.execute(sql) if row[0] is not None]
+    except sqlite3.OperationalError:
+        return []
+    if since_days is not None and days:
+        days = [day for day in days if day >= days[-1] - since_days]
+    gaps = [(later - earlier) * SECONDS_PER_DAY for earlier, later in zip(days, days[1:])]
+    return [gap for gap in gaps if 0 < gap <= MAX_BUSY_GAP]
+
+
+def fit_pipeline(
+    conn: sqlite3.Connection,
+    stages: Sequence[StageSpec] = STAGES,
+    since_days: Optional[float] = 14.0,
+) -> PipelineModel:
+    """Fit per-stage service times, routing and workload from the database.
+
+    Args:
+        conn: Connection to db.s3db (read-only use).
+        stages: Stages to model.
+        since_days: Only use history from the last N days (None = all).
+
+    Returns:
+        The fitted :class:`PipelineModel`.
+    """
+    runs = StageRunLog(conn, ensure_table=False).load(since_days=since_days)
+    runs_by_stage: Dict[int, list] = {}
+    for run in runs:
+        runs_by_stage.setdefault(run.stage, []).append(run)
+
+    models: Dict[int, StageModel] = {}
+    for spec in stages:
+        model = StageModel(
+            number=spec.number,
+            name=spec.name,
+            input_state=spec.input_state,
+            max_concurrency=spec.max_concurrency,
+            default_seconds=DEFAULT_SERVICE_SECONDS.get(spec.number, 30.0),
+            routes=default_routes(spec.input_state),
+        )
+        stage_runs = runs_by_stage.get(spec.number, [])
+        durations = [run.duration for run in stage_runs if run.success and run.duration > 0]
+        if len(durations) >= MIN_SAMPLES:
+            model.samples = durations
+            model.source = "log"
+        else:
+            gaps = _artifact_gaps(conn, spec.number, since_days)
+            if len(gaps) >= MIN_SAMPLES:
+                model.samples = gaps
+                model.source = "artifacts"
+
+        next_states = Counter(run.next_state for run in stage_runs if run.success and run.next_state)
+        if sum(next_states.values()) >= MIN_SAMPLES:
+            total = sum(next_states.values())
+            model.routes = [(state, count / total) for state, count in next_states.most_common()]
+        if len(stage_runs) >= MIN_SAMPLES:
+            model.error_rate = sum(1 for run in stage_runs if not run.success) / len(stage_runs)
+        models[spec.number] = model
+
+    current_wip: Dict[str, int] = {}
+    ideas_per_day = 0.0
+    try:
+        current_wip = {
+            row[0]: row[1] for row in conn.execute("SELECT state, COUNT(*) FROM Story GROUP BY state")
+        }
+        window = since_days or 14.0
+        created = conn.execute(
+            "SELECT COUNT(*) FROM Story WHERE created_at >= datetime('now', ?)", (f"-{window} days",)
+        ).fetchone()[0]
+        ideas_per_day = created / STORIES_PER_IDEA / window
+    except sqlite3.OperationalError:
+        pass
+
+    return PipelineModel(stages=models, ideas_per_day=ideas_per_day, current_wip=current_wip)
+
+
+# =============================================================================
+# Simulation
+# =============================================================================
+
+
+@dataclass
+class SimulationConfig:
+    """What-if parameters for one simulation run.
+
+    Attributes:
+        concurrency: Workers per stage (default: the stage's max_concurrency,
+            like the runner); clamped to ``max_concurrency``.
+        max_workers: Jobs in flight across all stages (Ollama slots).
+        speed: Service-time multiplier per stage, e.g. ``0.5`` for a model
+            assigned to that stage that is twice as fast.
+        wip_limits: WIP limit per group (None = environment/defaults; map a
+            group to None to disable it).
+        ideas_per_day: Idea arrival rate (Poisson); None = unlimited backlog,
+            which measures the maximum sustainable throughput.
+        start_wip: Stories per state at time zero.
+        days: Simulated time after warm-up.
+        warmup_days: Initial period excluded from the statistics.
+        seed: Random seed (same seed + model = same result).
+    """
+
+    concurrency: Dict[int, int] = field(default_factory=dict)
+    max_workers: int = PARALLEL_WORKERS
+    speed: Dict[int, float] = field(default_factory=dict)
+    wip_limits: Optional[Dict[str, Optional[int]]] = None
+    ideas_per_day: Optional[float] = None
+    start_wip: Dict[str, int] = field(default_factory=dict)
+    days: float = 7.0
+    warmup_days: float = 1.0
+    seed: int = 0
+
+
+@dataclass
+class StageResult:
+    """Simulated statistics of one stage (measurement window only)."""
+
+    number: int
+    name: str
+    workers: int
+    jobs: int
+    utilization: float
+    throughput_per_day: float
+    mean_wait: float
+    max_queue: int
+    mean_service: float
+    source: str
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of :func:`simulate`."""
+
+    stories_per_day: float
+    slot_utilization: float
+    stages: List[StageResult]
+    bottleneck: str
+
+    def to_dict(self) -> Dict:
+        return {
+            "stories_per_day": round(self.stories_per_day, 2),
+            "slot_utilization": round(self.slot_utilization, 4),
+            "bottleneck": self.bottleneck,
+            "stages": {
+                f"{stage.number:02d}": {
+                    "utilization": round(stage.utilization, 4),
+                    "throughput_per_day": round(stage.throughput_per_day, 2),
+                    "mean_service": round(stage.mean_service, 2),
+                    "mean_wait": round(stage.mean_wait, 1),
+                }
+                for stage in self.stages
+            },
+        }
+
+
+def _overlap(start: float, end: float, window_start: float, window_end: float) -> float:
+    return max(0.0, min(end, window_end) - max(start, window_start))
+
+
+def simulate(model: PipelineModel, config: Optional[SimulationConfig] = None) -> SimulationResult:
+    """Run a discrete-event simulation of the pipeline.
+
+    Args:
+        model: Fitted stage models (see :func:`fit_pipeline`).
+        config: What-if parameters (default: runner defaults, unlimited ideas).
+
+    Returns:
+        Predicted throughput, per-stage utilization and the bottleneck.
+    """
+    config = config or SimulationConfig()
+    rng = random.Random(config.seed)
+    stages = [model.stages[number] for number in sorted(model.stages)]
+    by_state = {stage.input_state: stage for stage in stages if stage.input_state}
+    workers = {
+        stage.number: max(0, min(config.concurrency.get(stage.number, stage.max_concurrency),
+                                 stage.max_concurrency))
+        for stage in stages
+    }
+    gate = BackpressureGate(load_wip_groups(config.wip_limits))
+
+    warmup = config.warmup_days * SECONDS_PER_DAY
+    end = warmup + config.days * SECONDS_PER_DAY
+
+    queues: Dict[str, Deque[Tuple[int, float]]] = {state: deque() for state in by_state}
+    in_flight_states: Counter = Counter()
+    next_id = 0
+    for state, count in config.start_wip.items():
+        if state in queues:
+            for _ in range(count):
+                next_id += 1
+                queues[state].append((next_id, 0.0))
+    unlimited_ideas = config.ideas_per_day is None
+    ideas: Deque[float] = deque()
+    # Without stage 02 an unlimited backlog feeds the first simulated stage directly
+    entry_state = stages[0].input_state if stages and unlimited_ideas else None
+
+    free = dict(workers)
+    slots_used = 0
+    busy = Counter()
+    jobs = Counter()
+    waits: Dict[int, List[float]] = {stage.number: [] for stage in stages}
+    max_queue = Counter()
+    finished = 0
+    events: list = []
+    seq = 0
+
+    def push(time: float, kind: str, payload) -> None:
+        nonlocal seq
+        seq += 1
+        heapq.heappush(events, (time, seq, kind, payload))
+
+    if not unlimited_ideas and config.ideas_per_day > 0:
+        push(rng.expovariate(config.ideas_per_day / SECONDS_PER_DAY), "idea", None)
+
+    def schedule(now: float) -> None:
+        nonlocal slots_used, next_id
+        if entry_state is not None:
+            while len(queues[entry_state]) < UNLIMITED_BACKLOG:
+                next_id += 1
+                queues[entry_state].append((next_id, now))
+        counts = {state: len(queue) + in_flight_states[state] for state, queue in queues.items()}
+        gate.update(counts)
+        for stage in reversed(stages):
+            if gate.is_paused(stage.number):
+                continue
+            while free[stage.number] > 0 and slots_used < config.max_workers:
+                if stage.input_state is None:
+                    if not unlimited_ideas and not ideas:
+                        break
+                    if unlimited_ideas and len(queues.get(StateNames.TITLE_FROM_IDEA, ())) >= UNLIMITED_BACKLOG:
+                        break
+                    arrived = now if unlimited_ideas else ideas.popleft()
+                    item = (None, arrived)
+                else:
+                    queue = queues[stage.input_state]
+                    if not queue:
+                        break
+                    item = queue.popleft()
+                    in_flight_states[stage.input_state] += 1
+                if now >= warmup:
+                    waits[stage.number].append(now - item[1])
+                duration = stage.sample_service(rng) * config.speed.get(stage.number, 1.0)
+                free[stage.number] -= 1
+                slots_used += 1
+                push(now + duration, "done", (stage, item[0], now))
+
+    def enqueue(state: Optional[str], story_id: int, now: float) -> None:
+        nonlocal finished
+        if state in queues:
+            queues[state].append((story_id, now))
+            max_queue[state] = max(max_queue[state], len(queues[state]))
+        elif warmup <= now <= end:
+            finished += 1
+
+    schedule(0.0)
+    while events:
+        if events[0][0] > end:
+            break
+        now, _, kind, payload = heapq.heappop(events)
+        if kind == "idea":
+            ideas.append(now)
+            push(now + rng.expovariate(config.ideas_per_day / SECONDS_PER_DAY), "idea", None)
+        else:
+            stage, story_id, started = payload
+            free[stage.number] += 1
+            slots_used -= 1
+            busy[stage.number] += _overlap(started, now, warmup, end)
+            if now >= warmup:
+                jobs[stage.number] += 1
+            if stage.input_state is None:
+                for _ in range(STORIES_PER_IDEA):
+                    next_id += 1
+                    enqueue(stage.sample_route(rng), next_id, now)
+            else:
+                in_flight_states[stage.input_state] -= 1
+                if rng.random() < stage.error_rate:
+                    enqueue(stage.input_state, story_id, now)
+                else:
+                    enqueue(stage.sample_route(rng), story_id, now)
+        schedule(now)
+
+    # Jobs still running at the end count towards utilization
+    for _, _, kind, payload in events:
+        if kind == "done":
+            stage, _, started = payload
+            busy[stage.number] += _overlap(started, end, warmup, end)
+
+    window = end - warmup
+    days = window / SECONDS_PER_DAY
+    results = []
+    for stage in stages:
+        capacity = workers[stage.number] * window
+        results.append(StageResult(
+            number=stage.number,
+            name=stage.name,
+            workers=workers[stage.number],
+            jobs=jobs[stage.number],
+            utilization=busy[stage.number] / capacity if capacity else 0.0,
+            throughput_per_day=jobs[stage.number] / days,
+            mean_wait=mean(waits[stage.number]) if waits[stage.number] else 0.0,
+            max_queue=max_queue[stage.input_state] if stage.input_state else 0,
+            mean_service=stage.mean_service * config.speed.get(stage.number, 1.0),
+            source=stage.source,
+        ))
+
+    slot_utilization = sum(busy.values()) / (config.max_workers * window) if window else 0.0
+    return SimulationResult(
+        stories_per_day=finished / days,
+        slot_utilization=slot_utilization,
+        stages=results,
+        bottleneck=_bottleneck(results, slot_utilization, config.max_workers),
+    )
+
+
+def _bottleneck(results: List[StageResult], slot_utilization: float, max_workers: int) -> str:
+    """Name the resource that limits throughput."""
+    active = [result for result in results if result.workers and result.jobs]
+    if not active:
+        return "none"
+    busiest = max(active, key=lambda result: result.utilization)
+    if slot_utilization >= 0.9 and slot_utilization >= busiest.utilization:
+        return f"slots (max_workers={max_workers})"
+    return f"{busiest.number:02d} {busiest.name}"
+
+
+def compare_results(current: Mapping, baseline: Mapping, tolerance: float = 0.1) -> List[str]:
+    """List regressions of ``current`` against a saved ``baseline`` (both ``to_dict()``).
+
+    A regression is a drop in stories/day or a rise in a stage's mean service
+    time of more than ``tolerance`` (relative).
+    """
+    problems = []
+    before, after = baseline.get("stories_per_day", 0), current.get("stories_per_day", 0)
+    if before and after < before * (1 - tolerance):
+        problems.append(f"stories/day {before:.1f} -> {after:.1f}")
+    for stage, old in baseline.get("stages", {}).items():
+        new = current.get("stages", {}).get(stage)
+        if new and old.get("mean_service") and new["mean_service"] > old["mean_service"] * (1 + tolerance):
+            problems.append(
+                f"stage {stage} service time {old['mean_service']:.1f}s -> {new['mean_service']:.1f}s"
+            )
+    return problems
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def parse_stage_values(values: Optional[List[str]], cast=float) -> Dict[int, float]:
+    """Parse ``STAGES=VALUE`` items such as ``11-17=0.5`` or ``03=4``."""
+    parsed: Dict[int, float] = {}
+    for value in values or []:
+        for item in value.split(","):
+            if not item.strip():
+                continue
+            stages, sep, number = item.partition("=")
+            if not sep:
+                raise ValueError(f"Invalid value '{item}', expected STAGES=VALUE")
+            for spec in parse_stage_filter(stages):
+                parsed[spec.number] = cast(number)
+    return parsed
+
+
+def parse_wip_limits(values: Optional[List[str]]) -> Optional[Dict[str, Optional[int]]]:
+    """Parse ``--wip`` items such as ``review=150`` (``0`` disables a limit)."""
+    if not values:
+        return None
+    limits: Dict[str, Optional[int]] = {}
+    for value in values:
+        for item in value.split(","):
+            name, sep, limit = item.partition("=")
+            if not sep:
+                raise ValueError(f"Invalid WIP limit '{item}', expected GROUP=N")
+            limits[name.strip()] = int(limit) or None
+    return limits
+
+
+def print_result(result: SimulationResult) -> None:
+    print(f"{'Stage':<44} {'W':>2} {'Util':>6} {'Jobs/day':>9} {'Svc s':>7} {'Wait s':>8}  Fit")
+    for stage in result.stages:
+        color = Colors.RED if stage.utilization >= 0.9 else (
+            Colors.YELLOW if stage.utilization >= 0.7 else Colors.GREEN
+        )
+        print(
+            f"{stage.number:02d} {stage.name:<41} {stage.workers:>2} "
+            f"{color}{stage.utilization:>6.0%}{Colors.END} {stage.throughput_per_day:>9.1f} "
+            f"{stage.mean_service:>7.1f} {stage.mean_wait:>8.0f}  {stage.source}"
+        )
+    print()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m T.Pipeline.src.simulator",
+        description="Predict PrismQ.T pipeline throughput and find the bottleneck",
+    )
+    parser.add_argument("--db", help="Path to db.s3db (default: from Config)")
+    parser.add_argument("--stages", help="Stages to simulate, e.g. 03,05-07,10-17 (default: all)")
+    parser.add_argument("--concurrency", action="append", metavar="STAGE=N",
+                        help="Workers per stage, as for python -m T.Pipeline")
+    parser.add_argument("--max-workers", type=int, default=PARALLEL_WORKERS,
+                        help=f"Jobs in flight across all stages (default: {PARALLEL_WORKERS})")
+    parser.add_argument("--speed", action="append", metavar="STAGES=FACTOR",
+                        help="Service-time factor per stage for another model, e.g. 11-17=0.5")
+    parser.add_argument("--wip", action="append", metavar="GROUP=N",
+                        help="WIP limit override, e.g. review=150 (0 = off)")
+    parser.add_argument("--ideas-per-day", type=float,
+                        help="Idea arrival rate (default: unlimited backlog)")
+    parser.add_argument("--observed", action="store_true",
+                        help="Use the observed idea rate and current WIP as the workload")
+    parser.add_argument("--days", type=float, default=7.0, help="Simulated days (default: 7)")
+    parser.add_argument("--history-days", type=float, default=14.0,
+                        help="Fit from the last N days of history (default: 14)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    parser.add_argument("--save", metavar="FILE", help="Save the result as a regression baseline")
+    parser.add_argument("--compare", metavar="FILE", help="Compare with a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="Allowed relative regression for --compare (default: 0.1)")
+    args = parser.parse_args(argv)
+
+    try:
+        specs = parse_stage_filter(args.stages)
+        config = SimulationConfig(
+            concurrency=parse_concurrency(args.concurrency),
+            max_workers=args.max_workers,
+            speed=parse_stage_values(args.speed),
+            wip_limits=parse_wip_limits(args.wip),
+            ideas_per_day=args.ideas_per_day,
+            days=args.days,
+            seed=args.seed,
+        )
+    except ValueError as e:
+        print_error(str(e))
+        return 2
+
+    db_path = resolve_db_path(args.db)
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        model = fit_pipeline(conn, specs, since_days=args.history_days)
+    except sqlite3.Error as e:
+        print_error(f"Database error: {e}")
+        return 1
+    finally:
+        conn.close()
+
+    if args.observed:
+        config.start_wip = dict(model.current_wip)
+        if config.ideas_per_day is None:
+            config.ideas_per_day = model.ideas_per_day
+
+    result = simulate(model, config)
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print_header("PrismQ.T Pipeline Simulation")
+        print_info(f"Database: {db_path}")
+        arrivals = "unlimited" if config.ideas_per_day is None else f"{config.ideas_per_day:.1f}/day"
+        print_info(f"Ideas: {arrivals}, max workers: {config.max_workers}, {config.days:g} days")
+        defaults = [f"{s.number:02d}" for s in model.stages.values() if s.source == "default"]
+        if defaults:
+            print_warning(
+                f"No history for stages {', '.join(defaults)}; using defaults "
+                "(run python -m T.Pipeline to record stage timings)"
+            )
+        print()
+        print_result(result)
+        print_success(f"Predicted throughput: {result.stories_per_day:.1f} stories/day")
+        print_info(f"Slot utilization: {result.slot_utilization:.0%}")
+        print_warning(f"Bottleneck: {result.bottleneck}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(result.to_dict(), handle, indent=2)
+        print_info(f"Baseline saved to {args.save}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            problems = compare_results(result.to_dict(), json.load(handle), args.tolerance)
+        for problem in problems:
+            print_error(f"Regression: {problem}")
+        if problems:
+            return 1
+        print_success("No regression against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
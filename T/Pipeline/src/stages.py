@@ -0,0 +1,534 @@
+"""Stage registry for the single-process PrismQ.T pipeline runner.
+
+Each entry mirrors one numbered folder in ``_meta/scripts`` (e.g.
+``11_PrismQ.T.Review.Content.Grammar``) and knows how to build a handler
+for that stage from a shared :class:`StageContext`.
+
+Stage services are imported lazily by :func:`load_service_module` the first
+time a handler is built, and then cached for the lifetime of the process, so
+a runner that hosts every stage pays each import exactly once.
+
+Most services expose ``process_oldest_story()`` and pick the head of their
+queue themselves without claiming it, so they are capped at one concurrent
+worker (``max_concurrency=1``). Stage 03 selects stories explicitly and claims
+them through the shared context, so it can run several workers in parallel.
+"""
+
+import importlib
+import importlib.util
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from Model import StateNames
+
+logger = logging.getLogger(__name__)
+
+# T/Pipeline/src/stages.py -> T/Pipeline/src -> T/Pipeline -> T -> repo root
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+
+# Number of parallel Ollama slots; shared with step 03 (title_from_idea_interactive.py)
+PARALLEL_WORKERS = int(os.getenv("PRISMQ_PARALLEL_WORKERS", "4"))
+
+# "1" rejects near-duplicate titles (stage 03) and content (stage 04) using the
+# MinHash index kept in the shared database (src/near_duplicates.py)
+NEAR_DUPLICATES = os.getenv("PRISMQ_NEAR_DUPLICATES", "0").strip().lower() in (
+    "1", "true", "yes", "on",
+)
+
+# Ideas that no Story references yet (input of stage 02)
+_UNREFERENCED_IDEAS_SQL = (
+    "SELECT COUNT(*) FROM Idea WHERE id NOT IN "
+    "(SELECT CAST(idea_id AS INTEGER) FROM Story WHERE idea_id IS NOT NULL)"
+)
+
+
+@dataclass
+class StageOutcome:
+    """Normalized result of one unit of stage work.
+
+    Stage services return different result dataclasses (``next_state`` vs
+    ``new_state``, ``passes`` vs ``accepted``); the runner only sees this.
+    """
+
+    stage: int
+    success: bool
+    story_id: Optional[int] = None
+    passes: Optional[bool] = None
+    next_state: Optional[str] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+
+    @property
+    def idle(self) -> bool:
+        """True when the stage found nothing to process."""
+        return self.success and self.story_id is None
+
+
+@dataclass
+class StageContext:
+    """Process-wide resources shared by every stage handler.
+
+    Attributes:
+        db_path: Path to the shared SQLite database (db.s3db).
+        claims: Story IDs currently being processed, keyed by stage number.
+            Used by stages that select stories explicitly (stage 03).
+    """
+
+    db_path: str
+    claims: Dict[int, Set[int]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection suitable for a long-lived stage worker.
+
+        The connection is held by one handler for the whole run and may be
+        used from different pool threads, one job at a time.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def claim(self, stage: int, candidates: Iterable[int]) -> Optional[int]:
+        """Claim the first candidate story not already held by another worker."""
+        with self._lock:
+            held = self.claims.setdefault(stage, set())
+            for story_id in candidates:
+                if story_id not in held:
+                    held.add(story_id)
+                    return story_id
+        return None
+
+    def release(self, stage: int, story_id: int) -> None:
+        """Release a story claimed with :meth:`claim`."""
+        with self._lock:
+            self.claims.get(stage, set()).discard(story_id)
+
+
+@dataclass(frozen=True)
+class StageSpec:
+    """Static description of one pipeline stage.
+
+    Attributes:
+        number: Step number matching the ``_meta/scripts`` folder prefix.
+        name: Module name, e.g. ``PrismQ.T.Review.Content.Grammar``.
+        input_state: Story state consumed by the stage, or None when the stage
+            consumes something other than Stories (stage 02 reads Ideas).
+        factory: Builds a handler (``process_next()`` / ``close()``) from a
+            :class:`StageContext`.
+        max_concurrency: Upper bound for parallel workers of this stage.
+        pending_sql: COUNT query used instead of ``input_state`` counts.
+    """
+
+    number: int
+    name: str
+    input_state: Optional[str]
+    factory: Callable[[StageContext], Any]
+    max_concurrency: int = 1
+    pending_sql: Optional[str] = None
+
+    @property
+    def folder(self) -> str:
+        """Name of the matching ``_meta/scripts`` folder."""
+        return f"{self.number:02d}_{self.name}"
+
+
+# =============================================================================
+# Service loading
+# =============================================================================
+
+_MODULE_CACHE: Dict[str, Any] = {}
+_MODULE_LOCK = threading.Lock()
+
+
+def load_service_module(module: str) -> Any:
+    """Import a stage service module once per process.
+
+    Tries a regular package import first. Several stage packages have stale
+    ``__init__`` re-exports, so on ImportError the module file is loaded
+    directly with its own directory on ``sys.path`` - the same way the
+    per-stage workflow scripts import their service.
+
+    Args:
+        module: Dotted module path relative to the repository root.
+
+    Returns:
+        The imported module object.
+    """
+    with _MODULE_LOCK:
+        if module in _MODULE_CACHE:
+            return _MODULE_CACHE[module]
+
+        # Config must be imported before services that prepend T/Idea/Model/src
+        # (which contains another 'src' package) to sys.path.
+        importlib.import_module("src.config")
+
+        try:
+            loaded = importlib.import_module(module)
+        except ImportError as package_error:
+            path = REPO_ROOT.joinpath(*module.split(".")).with_suffix(".py")
+            if not path.exists():
+                raise package_error
+            if str(path.parent) not in sys.path:
+                sys.path.insert(0, str(path.parent))
+            spec = importlib.util.spec_from_file_location(f"_prismq_stage_{path.stem}", path)
+            loaded = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(loaded)  # type: ignore[union-attr]
+
+        _MODULE_CACHE[module] = loaded
+        return loaded
+
+
+def near_duplicate_index(conn: sqlite3.Connection, kind: str) -> Optional[Any]:
+    """Near-duplicate index on ``conn`` with ``kind`` backfilled, or None when disabled."""
+    if not NEAR_DUPLICATES:
+        return None
+    index = load_service_module("src.near_duplicates").NearDuplicateIndex(connection=conn)
+    index.create_tables()
+    index.index_missing(kind)
+    return index
+
+
+def _first(result: Any, *names: str) -> Any:
+    """Return the first non-None attribute among ``names``."""
+    for name in names:
+        value = getattr(result, name, None)
+        if value is not None:
+            return value
+    return None
+
+
+# =============================================================================
+# Stage handlers
+# =============================================================================
+
+
+class OldestStoryHandler:
+    """Adapter for services exposing ``process_oldest_story()``."""
+
+    def __init__(self, stage: int, service: Any, conn: sqlite3.Connection):
+        self.stage = stage
+        self.service = service
+        self._conn = conn
+
+    def process_next(self) -> StageOutcome:
+        started = time.perf_counter()
+        try:
+            result = self.service.process_oldest_story()
+        except Exception as e:
+            logger.exception(f"Stage {self.stage:02d}: unhandled service error")
+            return StageOutcome(
+                stage=self.stage,
+                success=False,
+                error=str(e),
+                duration=time.perf_counter() - started,
+            )
+
+        if result is None:
+            return StageOutcome(stage=self.stage, success=True)
+
+        story_id = getattr(result, "story_id", None)
+        error = _first(result, "error", "error_message")
+        if getattr(result, "near_duplicate_of", None) is not None:
+            # Output rejected and the story deferred by the service: not a stage error
+            return StageOutcome(
+                stage=self.stage,
+                success=True,
+                story_id=story_id,
+                passes=False,
+                next_state=getattr(self.service, "INPUT_STATE", None),
+                error=error,
+                duration=time.perf_counter() - started,
+            )
+        return StageOutcome(
+            stage=self.stage,
+            # "No stories found" results are success=True with story_id=None
+            success=bool(getattr(result, "success", error is None)),
+            story_id=story_id,
+            passes=_first(result, "passes", "accepted", "title_accepted"),
+            next_state=_first(result, "next_state", "new_state"),
+            error=error if story_id is not None else None,
+            duration=time.perf_counter() - started,
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class StoryFromIdeaHandler:
+    """Stage 02: create Stories for the oldest unreferenced Idea."""
+
+    def __init__(self, context: StageContext):
+        module = load_service_module("T.Story.From.Idea.src.story_from_idea_service")
+        self._conn = context.connect()
+        self._idea_db = module.IdeaTable(context.db_path)
+        self._idea_db.connect(check_same_thread=False)
+        self.service = module.StoryFromIdeaService(self._conn, self._idea_db)
+
+    def process_next(self) -> StageOutcome:
+        started = time.perf_counter()
+        try:
+            result = self.service.process_oldest_unreferenced_idea()
+        except Exception as e:
+            logger.exception("Stage 02: story creation failed")
+            return StageOutcome(
+                stage=2, success=False, error=str(e), duration=time.perf_counter() - started
+            )
+
+        if result is None:
+            return StageOutcome(stage=2, success=True)
+        return StageOutcome(
+            stage=2,
+            success=True,
+            story_id=result.stories[0].id if result.stories else None,
+            next_state=StateNames.TITLE_FROM_IDEA,
+            duration=time.perf_counter() - started,
+        )
+
+    def close(self) -> None:
+        self._idea_db.close()
+        self._conn.close()
+
+
+class TitleFromIdeaHandler:
+    """Stage 03: generate Title v0 for one claimed Story.
+
+    Mirrors ``_worker_process_story`` in title_from_idea_interactive.py but
+    reuses a held connection and service instead of opening them per story.
+    """
+
+    STAGE = 3
+
+    def __init__(self, context: StageContext):
+        module = load_service_module("T.Title.From.Idea.src.story_title_service")
+        idea_module = load_service_module("src.idea")
+        self._context = context
+        self._conn = context.connect()
+        self._idea_db = idea_module.IdeaTable(context.db_path)
+        self._idea_db.connect(check_same_thread=False)
+        self._idea_cls = module.Idea
+        self._genre = sys.modules[module.Idea.__module__].ContentGenre.OTHER
+        self._near_duplicate_error = load_service_module("src.near_duplicates").NearDuplicateError
+        self.service = module.StoryTitleService(
+            self._conn,
+            auto_create_schema=False,
+            duplicate_index=near_duplicate_index(self._conn, "title"),
+        )
+
+    def process_next(self) -> StageOutcome:
+        started = time.perf_counter()
+        stories = {s.id: s for s in self.service.get_stories_without_titles()}
+        while True:
+            story_id = self._context.claim(self.STAGE, stories)
+            if story_id is None:
+                return StageOutcome(stage=self.STAGE, success=True)
+            if not self.service.story_has_title(story_id):
+                break
+            # Another worker titled it after our snapshot was taken
+            self._context.release(self.STAGE, story_id)
+            del stories[story_id]
+
+        outcome = StageOutcome(stage=self.STAGE, success=False, story_id=story_id)
+        try:
+            idea = self._load_idea(stories[story_id])
+            if idea is None:
+                outcome.error = "No idea data available"
+            elif self.service.generate_title_for_story(stories[story_id], idea):
+                outcome.success = True
+                outcome.next_state = StateNames.CONTENT_FROM_IDEA_TITLE
+            else:
+                outcome.error = "Story already has a title"
+        except self._near_duplicate_error as e:
+            # The service deferred the story; the next call takes another one
+            logger.warning(f"Stage 03: story {story_id}: {e}, will regenerate")
+            outcome.success = True
+            outcome.passes = False
+            outcome.next_state = StateNames.TITLE_FROM_IDEA
+            outcome.error = str(e)
+        except Exception as e:
+            logger.exception(f"Stage 03: title generation failed for story {story_id}")
+            outcome.error = str(e)
+        finally:
+            self._context.release(self.STAGE, story_id)
+
+        outcome.duration = time.perf_counter() - started
+        return outcome
+
+    def _load_idea(self, story: Any) -> Optional[Any]:
+        try:
+            idea_dict = self._idea_db.get_idea(int(story.idea_id))
+        except (TypeError, ValueError):
+            return None
+        idea_text = (idea_dict or {}).get("text", "")
+        if not idea_text:
+            return None
+        title_text = idea_text if len(idea_text) <= 100 else idea_text[:97] + "..."
+        return self._idea_cls(title=title_text, concept=idea_text, genre=self._genre)
+
+    def close(self) -> None:
+        self._idea_db.close()
+        self._conn.close()
+
+
+def _oldest_story_stage(
+    number: int, module: str, class_name: str, duplicate_kind: Optional[str] = None
+) -> Callable[[StageContext], Any]:
+    """Build a factory for a ``process_oldest_story()`` service stage.
+
+    ``duplicate_kind`` names the text the service writes ('content'); when
+    near-duplicate detection is enabled the service gets a ``duplicate_index``.
+    """
+
+    def factory(context: StageContext) -> OldestStoryHandler:
+        service_cls = getattr(load_service_module(module), class_name)
+        conn = context.connect()
+        index = near_duplicate_index(conn, duplicate_kind) if duplicate_kind else None
+        service = service_cls(conn, duplicate_index=index) if index else service_cls(conn)
+        return OldestStoryHandler(number, service, conn)
+
+    return factory
+
+
+# =============================================================================
+# Registry (numbering mirrors _meta/scripts)
+# =============================================================================
+
+STAGES: List[StageSpec] = [
+    StageSpec(
+        2, "PrismQ.T.Story.From.Idea", None,
+        StoryFromIdeaHandler,
+        pending_sql=_UNREFERENCED_IDEAS_SQL,
+    ),
+    StageSpec(
+        3, "PrismQ.T.Title.From.Idea", StateNames.TITLE_FROM_IDEA,
+        TitleFromIdeaHandler,
+        max_concurrency=PARALLEL_WORKERS,
+    ),
+    StageSpec(
+        4, "PrismQ.T.Content.From.Idea.Title", StateNames.CONTENT_FROM_IDEA_TITLE,
+        _oldest_story_stage(4, "T.Content.From.Idea.Title.src.story_content_service",
+                            "StateBasedContentService", duplicate_kind="content"),
+    ),
+    StageSpec(
+        5, "PrismQ.T.Review.Title.From.Content.Idea", StateNames.REVIEW_TITLE_FROM_CONTENT_IDEA,
+        _oldest_story_stage(5, "T.Review.Title.From.Idea.Content.src.review_title_from_content_idea_service",
+                            "ReviewTitleFromContentIdeaService"),
+    ),
+    StageSpec(
+        6, "PrismQ.T.Review.Content.From.Title.Idea", StateNames.REVIEW_CONTENT_FROM_TITLE_IDEA,
+        _oldest_story_stage(6, "T.Review.Content.From.Title.Idea.src.review_content_from_title_idea_service",
+                            "ReviewContentFromTitleIdeaService"),
+    ),
+    StageSpec(
+        7, "PrismQ.T.Review.Title.From.Content", StateNames.REVIEW_TITLE_FROM_CONTENT,
+        _oldest_story_stage(7, "T.Review.Title.From.Content.src.review_title_from_script_service",
+                            "ReviewTitleFromScriptService"),
+    ),
+    StageSpec(
+        8, "PrismQ.T.Title.From.Title.Review.Content", StateNames.TITLE_FROM_TITLE_REVIEW_CONTENT,
+        _oldest_story_stage(8, "T.Title.From.Title.Review.Script.src.title_from_review_service",
+                            "TitleFromReviewService"),
+    ),
+    StageSpec(
+        9, "PrismQ.T.Content.From.Title.Content.Review", StateNames.CONTENT_FROM_CONTENT_REVIEW_TITLE,
+        _oldest_story_stage(9, "T.Content.From.Title.Review.Script.src.script_from_review_service",
+                            "ScriptFromReviewService"),
+    ),
+    StageSpec(
+        10, "PrismQ.T.Review.Content.From.Title", StateNames.REVIEW_CONTENT_FROM_TITLE,
+        _oldest_story_stage(10, "T.Review.Script.From.Title.src.review_script_from_title",
+                            "ReviewContentFromTitleService"),
+    ),
+    StageSpec(
+        11, "PrismQ.T.Review.Content.Grammar", StateNames.REVIEW_CONTENT_GRAMMAR,
+        _oldest_story_stage(11, "T.Review.Script.Grammar.script_grammar_service",
+                            "ScriptGrammarReviewService"),
+    ),
+    StageSpec(
+        12, "PrismQ.T.Review.Content.Tone", StateNames.REVIEW_CONTENT_TONE,
+        _oldest_story_stage(12, "T.Review.Script.Tone.src.review_script_tone",
+                            "ScriptToneReviewService"),
+    ),
+    StageSpec(
+        13, "PrismQ.T.Review.Content.Content", StateNames.REVIEW_CONTENT_CONTENT,
+        _oldest_story_stage(13, "T.Review.Script.Content.script_content_review",
+                            "ScriptContentReviewer"),
+    ),
+    StageSpec(
+        14, "PrismQ.T.Review.Content.Consistency", StateNames.REVIEW_CONTENT_CONSISTENCY,
+        _oldest_story_stage(14, "T.Review.Script.Consistency.src.script_consistency_review_service",
+                            "ScriptConsistencyReviewService"),
+    ),
+    StageSpec(
+        15, "PrismQ.T.Review.Content.Editing", StateNames.REVIEW_CONTENT_EDITING,
+        _oldest_story_stage(15, "T.Review.Script.Editing.src.review_script_editing_service",
+                            "ScriptEditingReviewService"),
+    ),
+    StageSpec(
+        16, "PrismQ.T.Review.Title.Readability", StateNames.REVIEW_TITLE_READABILITY,
+        _oldest_story_stage(16, "T.Review.Title.Readability.src.review_title_readability",
+                            "TitleReadabilityReviewService"),
+    ),
+    StageSpec(
+        17, "PrismQ.T.Review.Content.Readability", StateNames.REVIEW_CONTENT_READABILITY,
+        _oldest_story_stage(17, "T.Review.Script.Readability.src.review_script_readability_service",
+                            "ScriptReadabilityReviewService"),
+    ),
+]
+
+
+def get_stage(number: int) -> StageSpec:
+    """Look up a registered stage by its step number."""
+    for spec in STAGES:
+        if spec.number == number:
+            return spec
+    raise KeyError(f"Unknown stage: {number:02d}")
+
+
+def parse_stage_filter(text: Optional[str], stages: Optional[List[StageSpec]] = None) -> List[StageSpec]:
+    """Parse a ``--stages`` filter such as ``"03,05-07,10-17"``.
+
+    Args:
+        text: Comma-separated step numbers and inclusive ranges. None or
+            empty selects every registered stage.
+        stages: Registry to select from (default: :data:`STAGES`).
+
+    Returns:
+        Selected stages in step order.
+
+    Raises:
+        ValueError: If the filter is malformed or names an unknown step.
+    """
+    registry = stages if stages is not None else STAGES
+    if not text:
+        return list(registry)
+
+    wanted: Set[int] = set()
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if "-" in part:
+                low, high = (int(p) for p in part.split("-", 1))
+                wanted.update(range(low, high + 1))
+            else:
+                wanted.add(int(part))
+        except ValueError:
+            raise ValueError(f"Invalid stage filter: '{part}'")
+
+    known = {spec.number for spec in registry}
+    unknown = sorted(wanted - known)
+    if unknown:
+        raise ValueError(
+            f"Unknown stage(s): {', '.join(f'{n:02d}' for n in unknown)}; "
+            f"available: {', '.join(f'{n:02d}' for n in sorted(known))}"
+        )
+    return [spec for spec in registry if spec.number in wanted]
@@ -0,0 +1,274 @@
+"""Render per-story traces and aggregate where stage wall time goes.
+
+Reads the span files written by :mod:`Model.Infrastructure.tracing`
+(``PRISMQ_TRACE_DIR``, one ``<worker>.jsonl`` per process).
+
+    waterfall  - every stage run of one story in time order, with its
+                 fetch/prompt/llm/parse/commit sub-spans and the time the
+                 story waited in the queue between stages
+    breakdown  - per stage: runs, mean/p95 duration, queue wait and the
+                 share of each sub-span in the stage's wall time
+
+Usage:
+    python -m T.Pipeline.src.traces                  # breakdown of all stages
+    python -m T.Pipeline.src.traces --story 42       # waterfall of story 42
+    python -m T.Pipeline.src.traces --since-days 1 --stage 11
+    python -m T.Pipeline.src.traces --dir C:/PrismQ/traces --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from Model.Infrastructure.tracing import Span, load_spans
+
+from .cli import Colors, print_error, print_header, print_info, print_warning
+
+# Sub-span share of wall time not covered by a named child
+SELF_TIME = "other"
+
+BAR_WIDTH = 40
+
+
+def _duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "—"
+    if seconds < 10:
+        return f"{seconds:.2f}s"
+    if seconds < 90:
+        return f"{seconds:.0f}s"
+    if seconds < 5400:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 172800:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / 86400:.1f}d"
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _stage_of(root: Span) -> str:
+    return str(root.attributes.get("stage") or root.name)
+
+
+def filter_spans(
+    spans: Sequence[Span],
+    story_id: Optional[int] = None,
+    stage: Optional[str] = None,
+    since: Optional[float] = None,
+) -> List[Span]:
+    """Keep span trees matching the filters (a tree is kept or dropped whole)."""
+    roots = {
+        s.span_id: s
+        for s in spans
+        if s.parent_id is None
+        and (story_id is None or s.story_id == story_id)
+        and (stage is None or _stage_of(s) == stage)
+        and (since is None or s.start >= since)
+    }
+    kept_ids = set(roots)
+    # Children reference their parent; add them in passes until stable
+    remaining = [s for s in spans if s.parent_id is not None]
+    changed = True
+    while changed:
+        changed = False
+        rest = []
+        for s in remaining:
+            if s.parent_id in kept_ids:
+                kept_ids.add(s.span_id)
+                changed = True
+            else:
+                rest.append(s)
+        remaining = rest
+    return [s for s in spans if s.span_id in kept_ids]
+
+
+def build_waterfall(spans: Sequence[Span]) -> List[Tuple[int, Span]]:
+    """Order one story's spans for display: ``(depth, span)``, roots by start time."""
+    children: Dict[Optional[str], List[Span]] = {}
+    for s in spans:
+        children.setdefault(s.parent_id, []).append(s)
+    rows: List[Tuple[int, Span]] = []
+
+    def visit(parent_id: Optional[str], depth: int) -> None:
+        for s in sorted(children.get(parent_id, []), key=lambda s: s.start):
+            rows.append((depth, s))
+            visit(s.span_id, depth + 1)
+
+    visit(None, 0)
+    return rows
+
+
+@dataclass
+class StageBreakdown:
+    """Where one stage's wall time goes, over all recorded runs."""
+
+    stage: str
+    runs: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    mean_seconds: float = 0.0
+    p95_seconds: Optional[float] = None
+    mean_wait_seconds: Optional[float] = None
+    parts: Dict[str, float] = field(default_factory=dict)
+
+    def share(self, part: str) -> float:
+        return self.parts.get(part, 0.0) / self.total_seconds if self.total_seconds else 0.0
+
+
+def aggregate_stages(spans: Sequence[Span]) -> List[StageBreakdown]:
+    """Per-stage totals, sub-span seconds and queue wait before the stage."""
+    roots = [s for s in spans if s.parent_id is None]
+    child_seconds: Dict[str, Dict[str, float]] = {}
+    for s in spans:
+        if s.parent_id is not None:
+            parts = child_seconds.setdefault(s.parent_id, {})
+            parts[s.name] = parts.get(s.name, 0.0) + s.duration
+
+    # Queue wait: gap between the previous stage run of the story and this one
+    waits: Dict[str, List[float]] = {}
+    by_story: Dict[Optional[int], List[Span]] = {}
+    for root in roots:
+        by_story.setdefault(root.story_id, []).append(root)
+    for story_roots in by_story.values():
+        story_roots.sort(key=lambda s: s.start)
+        for previous, current in zip(story_roots, story_roots[1:]):
+            gap = current.start - (previous.end or previous.start)
+            if gap > 0:
+                waits.setdefault(_stage_of(current), []).append(gap)
+
+    stages: Dict[str, StageBreakdown] = {}
+    durations: Dict[str, List[float]] = {}
+    for root in roots:
+        name = _stage_of(root)
+        breakdown = stages.setdefault(name, StageBreakdown(stage=name))
+        breakdown.runs += 1
+        breakdown.errors += root.status == "error"
+        breakdown.total_seconds += root.duration
+        durations.setdefault(name, []).append(root.duration)
+        parts = child_seconds.get(root.span_id, {})
+        for part, seconds in parts.items():
+            breakdown.parts[part] = breakdown.parts.get(part, 0.0) + seconds
+        self_time = max(0.0, root.duration - sum(parts.values()))
+        breakdown.parts[SELF_TIME] = breakdown.parts.get(SELF_TIME, 0.0) + self_time
+
+    for name, breakdown in stages.items():
+        values = sorted(durations[name])
+        breakdown.mean_seconds = breakdown.total_seconds / breakdown.runs
+        breakdown.p95_seconds = _percentile(values, 0.95)
+        if waits.get(name):
+            breakdown.mean_wait_seconds = sum(waits[name]) / len(waits[name])
+    return [stages[name] for name in sorted(stages)]
+
+
+def print_waterfall(spans: Sequence[Span]) -> None:
+    rows = build_waterfall(spans)
+    if not rows:
+        return
+    origin = min(s.start for _, s in rows)
+    end = max(s.end or s.start for _, s in rows)
+    total = max(end - origin, 1e-6)
+
+    previous_root: Optional[Span] = None
+    for depth, s in rows:
+        if depth == 0 and previous_root is not None:
+            gap = s.start - (previous_root.end or previous_root.start)
+            if gap > 1:
+                print(f"{Colors.YELLOW}{'':<4}… waited {_duration(gap)} in queue{Colors.END}")
+        if depth == 0:
+            previous_root = s
+        offset = int((s.start - origin) / total * BAR_WIDTH)
+        width = max(1, int(s.duration / total * BAR_WIDTH))
+        color = Colors.RED if s.status == "error" else (Colors.CYAN if depth else Colors.GREEN)
+        label = ("  " * depth + s.name)[:28]
+        extra = ""
+        if s.attributes.get("model"):
+            extra = f" {s.attributes['model']}"
+            if s.attributes.get("completion_tokens"):
+                extra += f" {s.attributes['completion_tokens']} tok"
+        elif depth == 0 and s.attributes.get("next_state"):
+            extra = f" → {s.attributes['next_state']}"
+        print(
+            f"{label:<28} +{_duration(s.start - origin):>6} {_duration(s.duration):>6} "
+            f"{color}{' ' * offset}{'█' * width}{Colors.END}{' ' * (BAR_WIDTH - offset - width)}"
+            f"{extra}"
+        )
+    print()
+    print_info(f"Total: {_duration(end - origin)} across {sum(1 for d, _ in rows if d == 0)} stage runs")
+
+
+def print_breakdown(breakdowns: Sequence[StageBreakdown]) -> None:
+    part_names = sorted(
+        {part for b in breakdowns for part in b.parts if part != SELF_TIME}
+    ) + [SELF_TIME]
+    header = f"{'Stage':<10} {'Runs':>5} {'Err':>4} {'Mean':>7} {'p95':>7} {'Wait':>7}  "
+    print(header + " ".join(f"{name[:7]:>7}" for name in part_names))
+    for b in breakdowns:
+        shares = " ".join(f"{b.share(name):>7.0%}" for name in part_names)
+        error_color = Colors.RED if b.errors else ""
+        print(
+            f"{b.stage:<10} {b.runs:>5} {error_color}{b.errors:>4}{Colors.END if b.errors else ''} "
+            f"{_duration(b.mean_seconds):>7} {_duration(b.p95_seconds):>7} "
+            f"{_duration(b.mean_wait_seconds):>7}  {shares}"
+        )
+    print()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m T.Pipeline.src.traces",
+        description="Show PrismQ.T story traces and per-stage time breakdown",
+    )
+    parser.add_argument("--dir", default=os.getenv("PRISMQ_TRACE_DIR"),
+                        help="Trace directory (default: PRISMQ_TRACE_DIR)")
+    parser.add_argument("--story", type=int, help="Show the waterfall of one story")
+    parser.add_argument("--stage", help="Only runs of this stage, e.g. 11")
+    parser.add_argument("--since-days", type=float, help="Only runs from the last N days")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args(argv)
+
+    if not args.dir:
+        print_error("No trace directory: set PRISMQ_TRACE_DIR or pass --dir")
+        return 2
+    if not os.path.isdir(args.dir):
+        print_error(f"Trace directory not found: {args.dir}")
+        return 1
+
+    since = time.time() - args.since_days * 86400 if args.since_days is not None else None
+    spans = filter_spans(load_spans(args.dir), args.story, args.stage, since)
+
+    if args.story is not None:
+        if args.json:
+            print(json.dumps([s.to_dict() for _, s in build_waterfall(spans)], indent=2))
+            return 0
+        print_header(f"PrismQ.T Trace - Story {args.story}")
+        if not spans:
+            print_warning("No spans recorded for this story")
+            return 1
+        print_waterfall(spans)
+        return 0
+
+    breakdowns = aggregate_stages(spans)
+    if args.json:
+        print(json.dumps([asdict(b) for b in breakdowns], indent=2))
+        return 0
+    print_header("PrismQ.T Stage Time Breakdown")
+    print_info(f"Traces: {args.dir}")
+    if not breakdowns:
+        print_warning("No spans recorded")
+        return 0
+    print()
+    print_breakdown(breakdowns)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ This module provides automated SEO keyword extraction and metadata generation
 for published content. It includes:
 
 - Keyword extraction using NLP techniques (TF-IDF, frequency analysis)
+- Corpus TF-IDF model fitted once over all published stories
 - SEO metadata generation (meta descriptions, title tags)
 - AI-powered metadata generation using GPT/LLM (POST-001)
 - Keyword density analysis
@@ -14,14 +15,17 @@ Main Classes:
     - MetadataGenerator: Generate SEO-optimized metadata (rule-based)
     - AIMetadataGenerator: Generate AI-powered SEO metadata (GPT-based)
     - KeywordExtractionResult: Result of keyword extraction
+    - CorpusTfidfModel: Vocabulary and IDF of all published stories
     - SEOMetadata: Complete SEO metadata package
     - AIConfig: Configuration for AI-powered generation
 
 Convenience Functions:
     - extract_keywords(): Quick keyword extraction
+    - extract_keywords_batch(): Keyword extraction for many stories at once
     - generate_seo_metadata(): Quick metadata generation (rule-based)
     - generate_ai_seo_metadata(): AI-powered metadata generation
     - process_content_seo(): Complete end-to-end SEO processing
+    - process_content_seo_batch(): End-to-end SEO processing of many stories
 
 Example:
     >>> from T.Publishing.SEO.Keywords import process_content_seo
@@ -46,13 +50,15 @@ Example:
     ... )
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from .ai_metadata_generator import (
     AIConfig,
     AIMetadataGenerator,
     generate_ai_seo_metadata,
 )
+from .batch_keywords import extract_keywords_batch
+from .corpus_tfidf import CorpusModelError, CorpusTfidfModel
 from .keyword_extractor import (
     KeywordExtractionResult,
     KeywordExtractor,
@@ -138,6 +144,71 @@ def process_content_seo(
         title=title, script=script, method=extraction_method
     )
 
+    return _compile_seo_result(
+        extractor,
+        extraction_result,
+        title,
+        script,
+        brand_name=brand_name,
+        include_related=include_related,
+        use_ai=use_ai,
+        ai_config=ai_config,
+    )
+
+
+def process_content_seo_batch(
+    stories: Sequence[Tuple[str, str]],
+    extraction_method: str = "tfidf",
+    primary_count: int = 5,
+    secondary_count: int = 10,
+    brand_name: Optional[str] = None,
+    include_related: bool = True,
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Process many ``(title, script)`` stories for SEO, e.g. a daily publishing batch.
+
+    Keywords of all stories are extracted together (``extract_keywords_batch``:
+    one tokenization per story, one sparse document-term matrix for the
+    batch); metadata is then generated per story with the rule-based
+    generator. Returns the same dictionaries as ``process_content_seo``,
+    in input order.
+
+    Args:
+        stories: ``(title, script)`` pairs
+        extraction_method: Keyword extraction method ('tfidf', 'frequency', 'hybrid')
+        primary_count: Number of primary keywords per story
+        secondary_count: Number of secondary keywords per story
+        brand_name: Optional brand name for title tags
+        include_related: Whether to generate related keyword suggestions
+        workers: Tokenizer processes for large batches (default: all cores)
+    """
+    stories = list(stories)
+    extractor = KeywordExtractor(primary_count=primary_count, secondary_count=secondary_count)
+    extraction_results = extractor.extract_keywords_batch(stories, extraction_method, workers)
+    return [
+        _compile_seo_result(
+            extractor,
+            extraction_result,
+            title,
+            script,
+            brand_name=brand_name,
+            include_related=include_related,
+        )
+        for (title, script), extraction_result in zip(stories, extraction_results)
+    ]
+
+
+def _compile_seo_result(
+    extractor: KeywordExtractor,
+    extraction_result: KeywordExtractionResult,
+    title: str,
+    script: str,
+    brand_name: Optional[str] = None,
+    include_related: bool = True,
+    use_ai: bool = False,
+    ai_config: Optional[AIConfig] = None,
+) -> Dict[str, Any]:
+    """Related keywords, metadata and the result dictionary of one story."""
     # Step 2: Generate related keyword suggestions
     # Note: When using AI, related keywords are generated by AI within metadata generation
     # For rule-based generation, we use the traditional context-based approach
@@ -209,13 +280,17 @@ __all__ = [
     # Classes
     "KeywordExtractor",
     "KeywordExtractionResult",
+    "CorpusTfidfModel",
+    "CorpusModelError",
     "MetadataGenerator",
     "AIMetadataGenerator",
     "SEOMetadata",
     "AIConfig",
     # Functions
     "extract_keywords",
+    "extract_keywords_batch",
     "generate_seo_metadata",
     "generate_ai_seo_metadata",
     "process_content_seo",
+    "process_content_seo_batch",
 ]
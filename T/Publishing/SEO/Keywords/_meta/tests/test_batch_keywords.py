@@ -0,0 +1,165 @@
+"""Tests for batch keyword extraction."""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[6]
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from T.Publishing.SEO.Keywords import batch_keywords
+from T.Publishing.SEO.Keywords.batch_keywords import (
+    DocumentTerms,
+    extract_keywords_batch,
+    score_documents,
+)
+from T.Publishing.SEO.Keywords.corpus_tfidf import CorpusTfidfModel
+from T.Publishing.SEO.Keywords.keyword_extractor import KeywordExtractor
+
+STOP_WORDS = {"the", "a", "in", "is", "of", "and", "for", "it"}
+
+STORIES = [
+    ("Ghost in the attic", "A ghost story in Rome. The attic is old and the ghost is older."),
+    ("Python for beginners", "Learn Python programming. Python is easy; programming is fun!"),
+    ("Rome", "The empire of Rome fell. Rome fell for good."),
+    ("", ""),
+]
+
+
+class FixedStopWordsExtractor(KeywordExtractor):
+    """KeywordExtractor with a fixed stop word list instead of NLTK's."""
+
+    def __init__(self, corpus_model=None):
+        self.min_keyword_length = 3
+        self.max_keyword_length = 30
+        self.primary_count = 5
+        self.secondary_count = 10
+        self.language = "english"
+        self.corpus_model = corpus_model
+        self.stop_words = set(STOP_WORDS)
+
+
+@pytest.fixture
+def corpus():
+    return CorpusTfidfModel(STOP_WORDS).fit(
+        ["python programming for beginners", "ghost story rome", "rome empire", "old house"]
+    )
+
+
+def _nltk_stopwords_available() -> bool:
+    try:
+        import nltk
+
+        nltk.data.find("corpora/stopwords")
+        return True
+    except (ImportError, LookupError):
+        return False
+
+
+class TestScoreDocuments:
+    def test_frequency_scores_and_density(self):
+        documents = [DocumentTerms(5, {"ghost": 3, "attic": 1, "rome": 1}, {})]
+        [result] = score_documents(documents, "frequency", primary_count=2)
+
+        assert result.keyword_scores == {"ghost": 1.0, "attic": pytest.approx(1 / 3),
+                                         "rome": pytest.approx(1 / 3)}
+        assert result.primary_keywords == ["ghost", "attic"]
+        assert result.secondary_keywords == ["rome"]
+        assert result.keyword_density == {"ghost": 3.0, "attic": 1.0, "rome": 1.0}
+        assert result.total_words == 5
+
+    def test_batch_is_the_corpus_without_a_model(self):
+        documents = [
+            DocumentTerms(2, {}, {"ghost": 1, "rome": 1}),
+            DocumentTerms(2, {}, {"python": 1, "rome": 1}),
+        ]
+        first, second = score_documents(documents, "tfidf")
+        # rome is in both documents, so it ranks below the rarer term
+        assert first.primary_keywords == ["ghost", "rome"]
+        assert second.primary_keywords == ["python", "rome"]
+        assert sum(score**2 for score in first.keyword_scores.values()) == pytest.approx(1.0)
+
+    def test_ties_keep_document_order(self):
+        documents = [DocumentTerms(3, {}, {"zeta": 1, "alpha": 1, "mid": 1})]
+        [result] = score_documents(documents, "tfidf")
+        assert result.primary_keywords == ["zeta", "alpha", "mid"]
+
+    def test_tfidf_keeps_top_terms(self, monkeypatch):
+        monkeypatch.setattr(batch_keywords, "MAX_TFIDF_TERMS", 2)
+        documents = [DocumentTerms(3, {}, {"one": 3, "two": 2, "three": 1})]
+        [result] = score_documents(documents, "tfidf")
+        assert list(result.keyword_scores) == ["one", "two"]
+
+    def test_short_terms_are_filtered(self):
+        documents = [DocumentTerms(2, {"ox": 2, "ghost": 1}, {})]
+        [result] = score_documents(documents, "frequency")
+        assert list(result.keyword_scores) == ["ghost"]
+        assert result.keyword_density == {"ghost": 3.0}
+
+    def test_empty_document(self):
+        [result] = score_documents([DocumentTerms(0, {}, {})], "hybrid")
+        assert result.keyword_scores == {} and result.keyword_density == {}
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            score_documents([], "magic")
+
+
+class TestMatchesSingleExtraction:
+    @pytest.mark.parametrize("method", ["tfidf", "frequency"])
+    def test_same_results_with_corpus_model(self, corpus, method):
+        extractor = FixedStopWordsExtractor(corpus)
+        batch = extract_keywords_batch(STORIES, method, extractor=extractor, workers=1)
+
+        for (title, script), result in zip(STORIES, batch):
+            single = extractor.extract_keywords(title, script, method)
+            assert list(result.keyword_scores) == list(single.keyword_scores)
+            assert result.keyword_scores == pytest.approx(single.keyword_scores)
+            assert result.keyword_density == single.keyword_density
+            assert result.primary_keywords == single.primary_keywords
+            assert result.total_words == single.total_words
+
+    def test_hybrid_scores_with_corpus_model(self, corpus):
+        extractor = FixedStopWordsExtractor(corpus)
+        batch = extract_keywords_batch(STORIES, "hybrid", extractor=extractor, workers=1)
+
+        for (title, script), result in zip(STORIES, batch):
+            single = extractor.extract_keywords(title, script, "hybrid")
+            # Tie order of the single-story hybrid method is not defined
+            assert result.keyword_scores == pytest.approx(single.keyword_scores)
+
+    def test_method_on_extractor(self, corpus):
+        extractor = FixedStopWordsExtractor(corpus)
+        results = extractor.extract_keywords_batch(STORIES, workers=1)
+        assert [r.primary_keywords for r in results] == [
+            r.primary_keywords for r in extract_keywords_batch(STORIES, extractor=extractor)
+        ]
+
+    def test_process_pool(self, corpus, monkeypatch):
+        monkeypatch.setattr(batch_keywords, "POOL_MIN_DOCUMENTS", 2)
+        extractor = FixedStopWordsExtractor(corpus)
+        stories = STORIES * 5
+        pooled = extract_keywords_batch(stories, extractor=extractor, workers=2, chunk_size=3)
+        local = extract_keywords_batch(stories, extractor=extractor, workers=1)
+        assert [r.keyword_scores for r in pooled] == [r.keyword_scores for r in local]
+
+    def test_invalid_arguments(self, corpus):
+        extractor = FixedStopWordsExtractor(corpus)
+        with pytest.raises(ValueError):
+            extract_keywords_batch(STORIES, "magic", extractor=extractor)
+        with pytest.raises(ValueError):
+            extract_keywords_batch(STORIES, extractor=extractor, chunk_size=0)
+
+
+@pytest.mark.skipif(not _nltk_stopwords_available(), reason="NLTK stopwords not installed")
+def test_process_content_seo_batch():
+    from T.Publishing.SEO.Keywords import process_content_seo, process_content_seo_batch
+
+    results = process_content_seo_batch(STORIES[:3], extraction_method="frequency")
+    assert len(results) == 3
+    for (title, script), result in zip(STORIES, results):
+        single = process_content_seo(title, script, extraction_method="frequency")
+        assert result["primary_keywords"] == single["primary_keywords"]
+        assert result["meta_description"] == single["meta_description"]
@@ -0,0 +1,212 @@
+"""Tests for the corpus-level TF-IDF model."""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[6]
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pytest
+
+from T.Publishing.SEO.Keywords import corpus_tfidf
+from T.Publishing.SEO.Keywords.corpus_tfidf import (
+    PUBLISHED_STATE,
+    CorpusModelError,
+    CorpusTfidfModel,
+    fit_published,
+    iter_published_stories,
+)
+from T.Publishing.SEO.Keywords.keyword_extractor import preprocess_text
+
+CORPUS = [
+    "python programming for beginners learn python",
+    "the history of ancient rome and the roman empire",
+    "learn data science with python and pandas",
+    "a haunted house story with a ghost in the attic",
+    "the ghost of rome haunted the old empire",
+]
+STOP_WORDS = ["the", "a", "and", "of", "with", "for", "in"]
+
+
+def _nltk_stopwords_available() -> bool:
+    try:
+        import nltk
+
+        nltk.data.find("corpora/stopwords")
+        return True
+    except (ImportError, LookupError):
+        return False
+
+
+@pytest.fixture
+def model():
+    return CorpusTfidfModel(STOP_WORDS).fit(CORPUS, story_ids=range(1, 6))
+
+
+class TestFit:
+    def test_matches_sklearn_vectorizer(self, model):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        vectorizer = TfidfVectorizer(stop_words=STOP_WORDS, ngram_range=(1, 2)).fit(CORPUS)
+        expected_idf = dict(zip(vectorizer.get_feature_names_out(), vectorizer.idf_))
+
+        assert sorted(model.terms) == sorted(expected_idf)
+        for term, index in model.vocabulary.items():
+            assert model.idf[index] == pytest.approx(expected_idf[term])
+
+        documents = ["ghost story in rome", "python pandas tutorial"]
+        ours = model.transform(documents).toarray()
+        theirs = vectorizer.transform(documents).toarray()
+        columns = [vectorizer.vocabulary_[term] for term in model.terms]
+        np.testing.assert_allclose(ours, theirs[:, columns])
+
+    def test_partial_fit_equals_fit(self, model):
+        incremental = CorpusTfidfModel(STOP_WORDS)
+        incremental.partial_fit(CORPUS[:2], [1, 2]).partial_fit(CORPUS[2:], [3, 4, 5])
+
+        assert incremental.documents == model.documents == 5
+        assert incremental.story_ids == model.story_ids
+        frequency = dict(zip(incremental.terms, incremental.document_frequency))
+        assert frequency == dict(zip(model.terms, model.document_frequency))
+
+    def test_new_terms_are_appended(self, model):
+        terms = list(model.terms)
+        model.partial_fit(["zebra python"])
+        assert model.terms[: len(terms)] == terms
+        assert model.terms[len(terms) :] == ["zebra", "zebra python"]
+
+
+class TestScoreTerms:
+    def test_rare_terms_rank_first(self, model):
+        scores = model.score_terms("python ghost python ghost")
+        # Same counts: ghost (2 documents) and python (2 documents) tie
+        assert scores["python"] == pytest.approx(scores["ghost"])
+        # attic is in 1 document, python in 2
+        scores = model.score_terms("python attic")
+        assert scores["attic"] > scores["python"]
+
+    def test_unseen_terms_get_highest_idf(self, model):
+        scores = model.score_terms("python zeppelin")
+        assert list(scores)[0] == "zeppelin"
+        assert sum(score**2 for score in scores.values()) == pytest.approx(1.0)
+
+    def test_max_terms_and_empty_document(self, model):
+        assert len(model.score_terms("python data science pandas", max_terms=2)) == 2
+        assert model.score_terms("the and of") == {}
+
+
+class TestPersistence:
+    def test_round_trip(self, model, tmp_path):
+        model.save(tmp_path / "model")
+        loaded = CorpusTfidfModel.load(tmp_path / "model")
+
+        assert isinstance(loaded.document_frequency, np.memmap)
+        assert loaded.terms == model.terms
+        assert loaded.story_ids == model.story_ids
+        assert loaded.stop_words == model.stop_words
+        np.testing.assert_allclose(loaded.idf, model.idf)
+        assert loaded.score_terms("ghost in rome") == model.score_terms("ghost in rome")
+
+    def test_update_loaded_model(self, model, tmp_path):
+        model.save(tmp_path)
+        loaded = CorpusTfidfModel.load(tmp_path).partial_fit(["ghost zebra"], [6])
+        loaded.save(tmp_path)
+
+        reloaded = CorpusTfidfModel.load(tmp_path)
+        assert reloaded.documents == 6 and 6 in reloaded.story_ids
+        assert reloaded.document_frequency[reloaded.vocabulary["ghost"]] == 3
+
+    def test_missing_model(self, tmp_path):
+        with pytest.raises(CorpusModelError):
+            CorpusTfidfModel.load(tmp_path / "nothing")
+
+    def test_other_format(self, model, tmp_path):
+        model.save(tmp_path)
+        meta = json.loads((tmp_path / "meta.json").read_text())
+        (tmp_path / "meta.json").write_text(json.dumps({**meta, "format": 99}))
+        with pytest.raises(CorpusModelError):
+            CorpusTfidfModel.load(tmp_path)
+
+    def test_default_model(self, model, tmp_path, monkeypatch):
+        monkeypatch.setenv(corpus_tfidf.MODEL_ENV, str(tmp_path / "missing"))
+        corpus_tfidf.reset_default_model()
+        assert corpus_tfidf.default_model() is None
+
+        model.save(tmp_path / "model")
+        monkeypatch.setenv(corpus_tfidf.MODEL_ENV, str(tmp_path / "model"))
+        corpus_tfidf.reset_default_model()
+        try:
+            assert corpus_tfidf.default_model().documents == 5
+        finally:
+            corpus_tfidf.reset_default_model()
+
+
+@pytest.fixture
+def db():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE Story (id INTEGER PRIMARY KEY, state TEXT NOT NULL);
+        CREATE TABLE Title (story_id INTEGER, version INTEGER, text TEXT);
+        CREATE TABLE Content (story_id INTEGER, version INTEGER, text TEXT);
+        """
+    )
+    stories = [
+        (1, PUBLISHED_STATE, ["Old Title", "Python Basics"], ["Draft.", "Learn Python today!"]),
+        (2, "PrismQ.T.Content.From.Idea.Title", ["Ghosts"], ["Unpublished ghost story."]),
+        (3, PUBLISHED_STATE, ["Rome"], ["The empire of Rome fell."]),
+    ]
+    for story_id, state, titles, contents in stories:
+        conn.execute("INSERT INTO Story VALUES (?, ?)", (story_id, state))
+        conn.executemany(
+            "INSERT INTO Title VALUES (?, ?, ?)",
+            [(story_id, version, text) for version, text in enumerate(titles)],
+        )
+        conn.executemany(
+            "INSERT INTO Content VALUES (?, ?, ?)",
+            [(story_id, version, text) for version, text in enumerate(contents)],
+        )
+    yield conn
+    conn.close()
+
+
+class TestPublishedCorpus:
+    def test_latest_versions_of_published_stories(self, db):
+        assert list(iter_published_stories(db)) == [
+            (1, "Python Basics", "Learn Python today!"),
+            (3, "Rome", "The empire of Rome fell."),
+        ]
+
+    def test_fit_then_update(self, db):
+        model = CorpusTfidfModel(STOP_WORDS)
+        assert fit_published(db, model, preprocess_text, batch_size=1) == 2
+        assert model.story_ids == {1, 3}
+        assert "python basics" in model.vocabulary and "draft" not in model.vocabulary
+
+        assert fit_published(db, model, preprocess_text) == 0
+        db.execute("UPDATE Story SET state = ? WHERE id = 2", (PUBLISHED_STATE,))
+        assert fit_published(db, model, preprocess_text) == 1
+        assert model.documents == 3 and "ghosts" in model.vocabulary
+
+
+@pytest.mark.skipif(not _nltk_stopwords_available(), reason="NLTK stopwords not installed")
+class TestKeywordExtractor:
+    def test_extractor_uses_corpus_model(self, model):
+        from T.Publishing.SEO.Keywords.keyword_extractor import KeywordExtractor
+
+        extractor = KeywordExtractor(corpus_model=model)
+        title, script = "Ghost in the attic", "A ghost story in Rome."
+        result = extractor.extract_keywords(title, script)
+
+        document = corpus_tfidf.story_document(title, script, preprocess_text)
+        expected = {
+            term: score
+            for term, score in model.score_terms(document, 50).items()
+            if 3 <= len(term) <= 30
+        }
+        assert result.keyword_scores == expected
+        assert "ghost" in result.primary_keywords
@@ -0,0 +1,344 @@
+"""Batch keyword extraction for many stories at once.
+
+``extract_keywords`` handles one title and script per call. A daily publishing
+batch of hundreds of stories pays that per-call overhead hundreds of times:
+a new extractor, a new vectorizer and the Python loops that score each
+story. ``extract_keywords_batch`` splits the work in two phases:
+
+1. **Tokenize** each story once: one preprocessing pass, one NLTK
+   tokenization (word counts for frequency scores) and one n-gram analysis
+   (terms for TF-IDF). Large batches are spread over a process pool.
+2. **Score** all stories together: the term counts become one sparse
+   document-term matrix, and TF-IDF weights, frequency scores, hybrid
+   scores and densities are computed with sparse matrix operations.
+
+    >>> results = extract_keywords_batch([(title, script) for title, script in stories])
+    >>> results[0].primary_keywords
+
+TF-IDF uses the corpus model of all published stories when one is
+available (``corpus_tfidf``), exactly as ``extract_keywords`` does. Without
+one, the batch itself is the corpus, which is a better IDF estimate than the
+two-document vectorizer a single-story call falls back to.
+"""
+
+import copy
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .corpus_tfidf import CorpusTfidfModel, default_model, story_document
+from .keyword_extractor import KeywordExtractionResult, KeywordExtractor, preprocess_text
+
+# Worker processes for tokenization (default: all cores)
+DEFAULT_WORKERS = int(os.getenv("PRISMQ_SEO_WORKERS", "0")) or os.cpu_count() or 1
+
+# Stories sent to a worker at a time
+DEFAULT_CHUNK_SIZE = 64
+
+# Smaller batches are tokenized in the calling process (pool start-up costs more)
+POOL_MIN_DOCUMENTS = 256
+
+# Terms kept per story from TF-IDF (the single-story vectorizer's max_features)
+MAX_TFIDF_TERMS = 50
+
+# Weights of the hybrid method
+HYBRID_TFIDF_WEIGHT = 0.6
+HYBRID_FREQUENCY_WEIGHT = 0.4
+
+METHODS = ("tfidf", "frequency", "hybrid")
+
+
+class DocumentTerms(NamedTuple):
+    """Token counts of one story, from the tokenize phase."""
+
+    total_words: int  # tokens that are not stop words
+    words: Dict[str, int]  # keyword-candidate tokens, for frequency scores
+    terms: Dict[str, int]  # unigrams and bigrams, for TF-IDF
+
+
+def tokenize_document(
+    extractor: KeywordExtractor, model: CorpusTfidfModel, title: str, script: str, method: str
+) -> DocumentTerms:
+    """Tokenize one story the way ``KeywordExtractor.extract_keywords`` does."""
+    text = story_document(title, script, preprocess_text)
+    stop_words = extractor.stop_words
+    tokens = extractor._tokenize(text)
+    words: Counter = Counter()
+    if method != "tfidf":
+        words.update(
+            token
+            for token in tokens
+            if (
+                token not in stop_words
+                and extractor.min_keyword_length <= len(token) <= extractor.max_keyword_length
+                and token.isalnum()
+            )
+        )
+    terms = Counter(model.analyze(text)) if method != "frequency" else Counter()
+    return DocumentTerms(
+        sum(1 for token in tokens if token not in stop_words), dict(words), dict(terms)
+    )
+
+
+class _Vocabulary:
+    """Term -> column index, grown as documents are added."""
+
+    def __init__(self) -> None:
+        self.index: Dict[str, int] = {}
+        self.terms: List[str] = []
+
+    def matrices(self, rows: Sequence[Dict[str, int]]):
+        """Count and position matrices (``scipy.sparse.csr_matrix``) of ``rows``.
+
+        Both have the same sparsity; positions are 1-based ranks of each
+        term's first occurrence in its row, used to break score ties in
+        document order as ``extract_keywords`` does.
+        """
+        from scipy.sparse import csr_matrix
+
+        indptr = [0]
+        indices: List[int] = []
+        values: List[int] = []
+        positions: List[int] = []
+        for row in rows:
+            for position, (term, count) in enumerate(row.items(), start=1):
+                column = self.index.get(term)
+                if column is None:
+                    column = self.index[term] = len(self.terms)
+                    self.terms.append(term)
+                indices.append(column)
+                values.append(count)
+                positions.append(position)
+            indptr.append(len(indices))
+        shape = (len(rows), len(self.terms))
+        counts = csr_matrix((np.asarray(values, dtype=np.float64), indices, indptr), shape=shape)
+        ranks = csr_matrix((np.asarray(positions, dtype=np.float64), indices, indptr), shape=shape)
+        counts.sort_indices()
+        ranks.sort_indices()
+        return counts, ranks
+
+
+def _ordered(values: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """Indexes of ``values`` from highest to lowest, ties by ``ranks``."""
+    return np.lexsort((ranks, -values))
+
+
+def _keep_top(matrix, ranks, limit: int):
+    """Zero all but the ``limit`` highest values of each row (CSR, in place).
+
+    ``ranks`` must have the same sparsity as ``matrix``.
+    """
+    for row in range(matrix.shape[0]):
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        if end - start > limit:
+            values = matrix.data[start:end]
+            values[_ordered(values, ranks.data[start:end])[limit:]] = 0
+    matrix.eliminate_zeros()
+    return matrix
+
+
+def score_documents(
+    documents: Sequence[DocumentTerms],
+    method: str = "tfidf",
+    model: Optional[CorpusTfidfModel] = None,
+    min_keyword_length: int = 3,
+    max_keyword_length: int = 30,
+    primary_count: int = 5,
+    secondary_count: int = 10,
+) -> List[KeywordExtractionResult]:
+    """Score tokenized stories together with sparse matrix operations.
+
+    Args:
+        documents: Token counts per story (``tokenize_document``)
+        method: ``tfidf``, ``frequency`` or ``hybrid``
+        model: Corpus TF-IDF model; ``None`` uses the batch as the corpus
+        min_keyword_length: Minimum character length for keywords
+        max_keyword_length: Maximum character length for keywords
+        primary_count: Primary keywords per story
+        secondary_count: Secondary keywords per story
+
+    Returns:
+        One result per story, in order
+    """
+    from scipy.sparse import diags
+
+    if method not in METHODS:
+        raise ValueError(f"Unknown extraction method: {method}")
+
+    # Both matrices share one vocabulary, so hybrid scores are a sparse sum
+    vocabulary = _Vocabulary()
+    terms, term_ranks = vocabulary.matrices([document.terms for document in documents])
+    words, _ = vocabulary.matrices([document.words for document in documents])
+    columns = len(vocabulary.terms)
+    terms.resize((len(documents), columns))
+    term_ranks.resize((len(documents), columns))
+
+    scores = None
+    if method != "frequency":
+        if model is not None:
+            known = np.fromiter(
+                (model.vocabulary.get(term, -1) for term in vocabulary.terms),
+                dtype=np.int64,
+                count=columns,
+            )
+            idf = np.full(columns, model.unseen_idf)
+            idf[known >= 0] = model.idf[known[known >= 0]]
+        else:
+            document_frequency = np.bincount(terms.indices, minlength=columns)
+            idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1
+        # Scaling the stored values keeps the sparsity of term_ranks
+        scores = terms.copy()
+        scores.data *= idf[scores.indices]
+        norms = np.sqrt(np.asarray(scores.multiply(scores).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        scores.data /= np.repeat(norms, np.diff(scores.indptr))
+        scores = _keep_top(scores, term_ranks, MAX_TFIDF_TERMS)
+
+    if method != "tfidf":
+        row_max = words.max(axis=1).toarray().ravel() if columns else np.zeros(len(documents))
+        row_max[row_max == 0] = 1
+        frequency = (diags(1 / row_max) @ words).tocsr()
+        if scores is None:
+            scores = frequency
+        else:
+            scores = (HYBRID_TFIDF_WEIGHT * scores + HYBRID_FREQUENCY_WEIGHT * frequency).tocsr()
+
+    lengths = np.fromiter((len(term) for term in vocabulary.terms), dtype=np.int64, count=columns)
+    allowed = (lengths >= min_keyword_length) & (lengths <= max_keyword_length)
+
+    results = []
+    for row, document in enumerate(documents):
+        start, end = scores.indptr[row], scores.indptr[row + 1]
+        row_columns = scores.indices[start:end]
+        row_scores = scores.data[start:end]
+        keep = allowed[row_columns] & (row_scores > 0)
+        row_columns, row_scores = row_columns[keep], row_scores[keep]
+        row_terms = [vocabulary.terms[column] for column in row_columns]
+
+        # Ties keep the order in which terms first occur in the story
+        position = {
+            term: i for i, term in enumerate(dict.fromkeys([*document.terms, *document.words]))
+        }
+        ranks = np.fromiter(map(position.__getitem__, row_terms), np.int64, len(row_terms))
+        order = _ordered(row_scores, ranks)
+
+        keyword_scores = {row_terms[i]: float(row_scores[i]) for i in order}
+        density: Dict[str, float] = {}
+        if document.total_words and len(order):
+            top = row_scores[order[0]]
+            density = {row_terms[i]: round(float(row_scores[i] / top) * 3.0, 2) for i in order}
+        keywords = list(keyword_scores)
+        results.append(
+            KeywordExtractionResult(
+                primary_keywords=keywords[:primary_count],
+                secondary_keywords=keywords[primary_count : primary_count + secondary_count],
+                keyword_scores=keyword_scores,
+                keyword_density=density,
+                total_words=document.total_words,
+                extraction_method=method,
+            )
+        )
+    return results
+
+
+# Tokenizers of a pool worker process, set once by _init_worker
+_worker_state: Optional[Tuple[KeywordExtractor, CorpusTfidfModel, str]] = None
+
+
+def _init_worker(extractor: KeywordExtractor, analyzer: CorpusTfidfModel, method: str) -> None:
+    global _worker_state
+    _worker_state = (extractor, analyzer, method)
+
+
+def _tokenize_chunk(chunk: List[Tuple[str, str]]) -> List[DocumentTerms]:
+    extractor, model, method = _worker_state
+    return [tokenize_document(extractor, model, title, script, method) for title, script in chunk]
+
+
+def _chunks(documents: Sequence[Tuple[str, str]], chunk_size: int) -> Iterator[list]:
+    items = iter(documents)
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def extract_keywords_batch(
+    documents: Iterable[Tuple[str, str]],
+    method: str = "tfidf",
+    primary_count: int = 5,
+    secondary_count: int = 10,
+    extractor: Optional[KeywordExtractor] = None,
+    corpus_model: Optional[CorpusTfidfModel] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[KeywordExtractionResult]:
+    """Extract keywords from many ``(title, script)`` stories at once.
+
+    Args:
+        documents: ``(title, script)`` pairs
+        method: Extraction method ('tfidf', 'frequency', or 'hybrid')
+        primary_count: Number of primary keywords per story
+        secondary_count: Number of secondary keywords per story
+        extractor: Extractor whose stop words and keyword lengths are used
+            (default: a new ``KeywordExtractor``)
+        corpus_model: Corpus TF-IDF model (default: the extractor's, then the
+            model at ``PRISMQ_KEYWORD_TFIDF_MODEL``, then the batch itself)
+        workers: Tokenizer processes for batches of ``POOL_MIN_DOCUMENTS`` or
+            more (default ``PRISMQ_SEO_WORKERS`` or the number of cores)
+        chunk_size: Stories sent to a worker at a time
+
+    Returns:
+        One ``KeywordExtractionResult`` per story, in input order
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown extraction method: {method}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    documents = list(documents)
+    if extractor is None:
+        extractor = KeywordExtractor()
+    model = corpus_model if corpus_model is not None else extractor.corpus_model
+    if model is None:
+        model = default_model()
+    # Without a corpus model, the batch is analyzed with the extractor's stop words
+    if model is None:
+        analyzer = CorpusTfidfModel(extractor.stop_words)
+    else:
+        analyzer = CorpusTfidfModel(model.stop_words, model.ngram_range)
+    workers = DEFAULT_WORKERS if workers is None else workers
+
+    if workers <= 1 or len(documents) < POOL_MIN_DOCUMENTS:
+        tokenized = [
+            tokenize_document(extractor, analyzer, title, script, method)
+            for title, script in documents
+        ]
+    else:
+        # Workers get the tokenizer settings, not the (possibly large) corpus model
+        worker_extractor = copy.copy(extractor)
+        worker_extractor.corpus_model = None
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(worker_extractor, analyzer, method),
+        ) as pool:
+            tokenized = [
+                document
+                for chunk in pool.map(_tokenize_chunk, _chunks(documents, chunk_size))
+                for document in chunk
+            ]
+
+    return score_documents(
+        tokenized,
+        method,
+        model,
+        extractor.min_keyword_length,
+        extractor.max_keyword_length,
+        primary_count,
+        secondary_count,
+    )
@@ -0,0 +1,428 @@
+"""Corpus-level TF-IDF model for keyword extraction.
+
+``KeywordExtractor`` scores keywords by TF-IDF. Fitting a vectorizer on one
+story (title and script as the only two documents) makes the IDF meaningless:
+every term occurs in one or both documents. ``CorpusTfidfModel`` instead
+learns document frequencies once over all published stories, so a term is
+weighted by how rare it is across the channel, and scores a new story
+against them with one sparse product.
+
+The model is a directory:
+
+- ``meta.json``: document count, n-gram range and stop words;
+- ``terms.txt``: the vocabulary, one term per line (line number = index);
+- ``document_frequency.npy``: documents containing each term;
+- ``story_ids.npy``: stories the model was fitted on.
+
+The arrays are memory-mapped on load, so processes sharing a model share its
+pages. New terms are appended, never reordered, so ``partial_fit`` adds newly
+published stories without refitting:
+
+    python -m T.Publishing.SEO.Keywords.corpus_tfidf fit      # all published stories
+    python -m T.Publishing.SEO.Keywords.corpus_tfidf update   # stories published since
+
+``KeywordExtractor`` uses the model at ``PRISMQ_KEYWORD_TFIDF_MODEL`` (default
+``keyword_tfidf`` in the working directory) when it exists, and falls back to
+the per-story vectorizer otherwise.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+# Model directory used by KeywordExtractor
+MODEL_ENV = "PRISMQ_KEYWORD_TFIDF_MODEL"
+
+FORMAT_VERSION = 1
+
+_META = "meta.json"
+_TERMS = "terms.txt"
+_DOCUMENT_FREQUENCY = "document_frequency.npy"
+_STORY_IDS = "story_ids.npy"
+
+# Story state of published stories (Model.state.StateNames.PUBLISHING)
+PUBLISHED_STATE = "PrismQ.T.Publishing"
+
+# Stories read from the database per partial_fit call
+FIT_BATCH_SIZE = 1000
+
+
+class CorpusModelError(Exception):
+    """The model directory is missing, incomplete or of another format."""
+
+
+def default_model_path() -> Path:
+    """``PRISMQ_KEYWORD_TFIDF_MODEL``, or ``keyword_tfidf`` in the working directory."""
+    configured = os.getenv(MODEL_ENV)
+    if configured:
+        return Path(configured)
+    return Path(os.getenv("PRISMQ_WORKING_DIRECTORY", "C:/PrismQ")) / "keyword_tfidf"
+
+
+class CorpusTfidfModel:
+    """Vocabulary and document frequencies of a corpus, with smoothed IDF.
+
+    Documents are tokenized like ``TfidfVectorizer`` (lowercase ``\\w\\w+``
+    tokens, stop words removed, n-grams), and weighted like it too:
+    ``idf = ln((1 + n) / (1 + df)) + 1``, rows L2-normalized.
+
+    Args:
+        stop_words: Words dropped before building n-grams
+        ngram_range: Smallest and largest n-gram size
+    """
+
+    def __init__(self, stop_words: Iterable[str] = (), ngram_range: Tuple[int, int] = (1, 2)):
+        self.stop_words = sorted(set(stop_words))
+        self.ngram_range = (int(ngram_range[0]), int(ngram_range[1]))
+        self.documents = 0
+        self.terms: List[str] = []
+        self.vocabulary: Dict[str, int] = {}
+        self.story_ids: Set[int] = set()
+        self._document_frequency = np.zeros(0, dtype=np.int64)
+        self._idf: Optional[np.ndarray] = None
+        self._analyzer: Optional[Callable[[str], List[str]]] = None
+
+    def __repr__(self) -> str:
+        return f"CorpusTfidfModel(documents={self.documents}, terms={len(self.terms)})"
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __getstate__(self) -> dict:
+        # The analyzer is rebuilt on first use instead of being pickled
+        return {**self.__dict__, "_analyzer": None}
+
+    # Tokenization
+
+    def analyze(self, document: str) -> List[str]:
+        """The terms (unigrams and n-grams) of ``document``, with repeats."""
+        if self._analyzer is None:
+            from sklearn.feature_extraction.text import CountVectorizer
+
+            self._analyzer = CountVectorizer(
+                stop_words=self.stop_words or None, ngram_range=self.ngram_range
+            ).build_analyzer()
+        return self._analyzer(document)
+
+    # Fitting
+
+    def fit(self, documents: Iterable[str], story_ids: Iterable[int] = ()) -> "CorpusTfidfModel":
+        """Learn the vocabulary and document frequencies of ``documents`` from scratch."""
+        self.documents = 0
+        self.terms = []
+        self.vocabulary = {}
+        self.story_ids = set()
+        self._document_frequency = np.zeros(0, dtype=np.int64)
+        return self.partial_fit(documents, story_ids)
+
+    def partial_fit(
+        self, documents: Iterable[str], story_ids: Iterable[int] = ()
+    ) -> "CorpusTfidfModel":
+        """Add ``documents`` to the corpus; unseen terms are appended to the vocabulary."""
+        vocabulary = self.vocabulary
+        increments: Counter = Counter()
+        added = 0
+        for document in documents:
+            for term in dict.fromkeys(self.analyze(document)):
+                index = vocabulary.get(term)
+                if index is None:
+                    index = vocabulary[term] = len(self.terms)
+                    self.terms.append(term)
+                increments[index] += 1
+            added += 1
+
+        frequency = np.zeros(len(self.terms), dtype=np.int64)
+        frequency[: len(self._document_frequency)] = self._document_frequency
+        if increments:
+            indexes = np.fromiter(increments.keys(), dtype=np.int64, count=len(increments))
+            counts = np.fromiter(increments.values(), dtype=np.int64, count=len(increments))
+            frequency[indexes] += counts
+        self._document_frequency = frequency
+        self.documents += added
+        self.story_ids.update(int(story_id) for story_id in story_ids)
+        self._idf = None
+        return self
+
+    @property
+    def document_frequency(self) -> np.ndarray:
+        """Documents containing each term, by vocabulary index."""
+        return self._document_frequency
+
+    @property
+    def idf(self) -> np.ndarray:
+        """Smoothed inverse document frequency of each term."""
+        if self._idf is None:
+            self._idf = np.log((1 + self.documents) / (1 + self._document_frequency)) + 1
+        return self._idf
+
+    @property
+    def unseen_idf(self) -> float:
+        """IDF of a term no corpus document contains."""
+        return float(np.log(1 + self.documents) + 1)
+
+    # Scoring
+
+    def transform(self, documents: Sequence[str]):
+        """L2-normalized TF-IDF rows (``scipy.sparse.csr_matrix``) of ``documents``.
+
+        Terms outside the vocabulary are dropped, as in ``TfidfVectorizer``.
+        """
+        from scipy.sparse import csr_matrix, diags
+        from sklearn.preprocessing import normalize
+
+        indptr = [0]
+        indices: List[int] = []
+        values: List[int] = []
+        for document in documents:
+            counts = Counter(
+                index
+                for index in map(self.vocabulary.get, self.analyze(document))
+                if index is not None
+            )
+            indices.extend(counts.keys())
+            values.extend(counts.values())
+            indptr.append(len(indices))
+        counts_matrix = csr_matrix(
+            (np.asarray(values, dtype=np.float64), indices, indptr),
+            shape=(len(documents), len(self.terms)),
+        )
+        return normalize(counts_matrix @ diags(self.idf), copy=False)
+
+    def score_terms(self, document: str, max_terms: Optional[int] = None) -> Dict[str, float]:
+        """TF-IDF of each term of ``document``, highest first.
+
+        Unlike ``transform``, terms outside the vocabulary are kept: a term
+        no published story used is weighted as the rarest possible.
+        """
+        counts = Counter(self.analyze(document))
+        if not counts:
+            return {}
+        terms = list(counts)
+        indexes = np.fromiter(
+            (self.vocabulary.get(term, -1) for term in terms), dtype=np.int64, count=len(terms)
+        )
+        known = indexes >= 0
+        weights = np.full(len(terms), self.unseen_idf)
+        weights[known] = self.idf[indexes[known]]
+        weights *= np.fromiter(counts.values(), dtype=np.float64, count=len(terms))
+        weights /= np.linalg.norm(weights)
+
+        order = np.argsort(-weights, kind="stable")
+        if max_terms is not None:
+            order = order[:max_terms]
+        return {terms[i]: float(weights[i]) for i in order}
+
+    # Persistence
+
+    def save(self, path: Path) -> None:
+        """Write the model directory; ``meta.json`` is replaced last."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        def replace(name: str, write: Callable[[Path], None]) -> None:
+            temporary = path / f"{name}.tmp"
+            write(temporary)
+            os.replace(temporary, path / name)
+
+        def write_terms(target: Path) -> None:
+            with open(target, "w", encoding="utf-8", newline="\n") as f:
+                f.writelines(f"{term}\n" for term in self.terms)
+
+        def write_array(array: np.ndarray) -> Callable[[Path], None]:
+            def write(target: Path) -> None:
+                with open(target, "wb") as f:
+                    np.save(f, array)
+
+            return write
+
+        replace(_TERMS, write_terms)
+        replace(_DOCUMENT_FREQUENCY, write_array(np.asarray(self._document_frequency)))
+        replace(_STORY_IDS, write_array(np.array(sorted(self.story_ids), dtype=np.int64)))
+        meta = {
+            "format": FORMAT_VERSION,
+            "documents": self.documents,
+            "terms": len(self.terms),
+            "ngram_range": list(self.ngram_range),
+            "stop_words": self.stop_words,
+        }
+        replace(_META, lambda target: target.write_text(json.dumps(meta), encoding="utf-8"))
+
+    @classmethod
+    def load(cls, path: Path) -> "CorpusTfidfModel":
+        """Read a model directory, memory-mapping its arrays."""
+        path = Path(path)
+        try:
+            meta = json.loads((path / _META).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise CorpusModelError(f"No TF-IDF model at {path}") from None
+        except ValueError as e:
+            raise CorpusModelError(f"Invalid TF-IDF model metadata in {path}: {e}") from None
+        if meta.get("format") != FORMAT_VERSION:
+            raise CorpusModelError(
+                f"TF-IDF model {path} has format {meta.get('format')}, expected {FORMAT_VERSION}"
+            )
+
+        model = cls(meta["stop_words"], tuple(meta["ngram_range"]))
+        size = meta["terms"]
+        try:
+            with open(path / _TERMS, encoding="utf-8") as f:
+                terms = f.read().split("\n")[:size]
+            frequency = np.load(path / _DOCUMENT_FREQUENCY, mmap_mode="r")[:size]
+            story_ids = np.load(path / _STORY_IDS, mmap_mode="r")
+        except (OSError, ValueError) as e:
+            raise CorpusModelError(f"Incomplete TF-IDF model at {path}: {e}") from None
+        if len(terms) != size or len(frequency) != size:
+            raise CorpusModelError(f"Incomplete TF-IDF model at {path}: expected {size} terms")
+
+        model.documents = meta["documents"]
+        model.terms = terms
+        model.vocabulary = {term: index for index, term in enumerate(terms)}
+        model.story_ids = set(story_ids.tolist())
+        model._document_frequency = frequency
+        return model
+
+
+_default_model: Optional[CorpusTfidfModel] = None
+_default_loaded = False
+_default_lock = threading.Lock()
+
+
+def default_model() -> Optional[CorpusTfidfModel]:
+    """The process-wide model at ``default_model_path()``, ``None`` when there is none."""
+    global _default_model, _default_loaded
+    if _default_loaded:
+        return _default_model
+    with _default_lock:
+        if not _default_loaded:
+            path = default_model_path()
+            if (path / _META).exists():
+                _default_model = CorpusTfidfModel.load(path)
+            _default_loaded = True
+    return _default_model
+
+
+def reset_default_model() -> None:
+    """Forget the process-wide model; the next use reloads it."""
+    global _default_model, _default_loaded
+    with _default_lock:
+        _default_model = None
+        _default_loaded = False
+
+
+# Building from the database
+
+
+def story_document(title: str, script: str, preprocess: Callable[[str], str]) -> str:
+    """The text a story is indexed as: the title three times, then the script.
+
+    Matches what ``KeywordExtractor`` scores, so the title weighting is the
+    same at fit and transform time.
+    """
+    return preprocess(f"{title} {title} {title} {script}")
+
+
+def iter_published_stories(
+    conn: sqlite3.Connection, exclude: Iterable[int] = ()
+) -> Iterator[Tuple[int, str, str]]:
+    """Yield ``(story_id, title, script)`` of published stories, latest versions, by id."""
+    sql = """
+        SELECT s.id, t.text, c.text
+        FROM Story s
+        INNER JOIN Title t ON t.story_id = s.id
+            AND t.version = (SELECT MAX(version) FROM Title WHERE story_id = s.id)
+        INNER JOIN Content c ON c.story_id = s.id
+            AND c.version = (SELECT MAX(version) FROM Content WHERE story_id = s.id)
+        WHERE s.state = ?
+        ORDER BY s.id
+    """
+    excluded = set(exclude)
+    for story_id, title, script in conn.execute(sql, (PUBLISHED_STATE,)):
+        if story_id not in excluded:
+            yield story_id, title, script
+
+
+def fit_published(
+    conn: sqlite3.Connection,
+    model: CorpusTfidfModel,
+    preprocess: Callable[[str], str],
+    batch_size: int = FIT_BATCH_SIZE,
+) -> int:
+    """Add the published stories ``model`` has not seen yet; returns how many."""
+    added = 0
+    batch: List[Tuple[int, str, str]] = []
+    for story in iter_published_stories(conn, exclude=model.story_ids):
+        batch.append(story)
+        if len(batch) >= batch_size:
+            added += _fit_batch(model, batch, preprocess)
+            batch = []
+    if batch:
+        added += _fit_batch(model, batch, preprocess)
+    return added
+
+
+def _fit_batch(
+    model: CorpusTfidfModel, batch: List[Tuple[int, str, str]], preprocess: Callable[[str], str]
+) -> int:
+    model.partial_fit(
+        (story_document(title, script, preprocess) for _, title, script in batch),
+        [story_id for story_id, _, _ in batch],
+    )
+    return len(batch)
+
+
+def resolve_db_path(db_path: Optional[str]) -> str:
+    """Return the database path from the argument or Config."""
+    if db_path:
+        return db_path
+    try:
+        from src.config import get_config
+
+        return get_config().database_path
+    except Exception:
+        return "C:/PrismQ/db.s3db"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m T.Publishing.SEO.Keywords.corpus_tfidf",
+        description="Fit or update the corpus TF-IDF model of the keyword extractor",
+    )
+    parser.add_argument(
+        "command", choices=("fit", "update"),
+        help="fit: all published stories from scratch; update: add newly published stories",
+    )
+    parser.add_argument("--db", help="Path to db.s3db (default: from Config)")
+    parser.add_argument(
+        "--out", help=f"Model directory (default: ${MODEL_ENV} or working directory)"
+    )
+    args = parser.parse_args(argv)
+
+    from .keyword_extractor import KeywordExtractor, preprocess_text
+
+    out = Path(args.out) if args.out else default_model_path()
+    if args.command == "update" and (out / _META).exists():
+        model = CorpusTfidfModel.load(out)
+    else:
+        model = CorpusTfidfModel(KeywordExtractor().stop_words)
+
+    conn = sqlite3.connect(resolve_db_path(args.db), timeout=30)
+    try:
+        added = fit_published(conn, model, preprocess_text)
+    finally:
+        conn.close()
+    if added or args.command == "fit":
+        model.save(out)
+    print(f"Added {added} stories: {model.documents} documents, {len(model)} terms in {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
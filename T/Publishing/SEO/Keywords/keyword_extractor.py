@@ -11,29 +11,61 @@ Workflow Position:
 import re
 from collections import Counter
 from dataclasses import asdict, dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple
 
-import nltk
-from sklearn.feature_extraction.text import TfidfVectorizer
+if TYPE_CHECKING:
+    from .corpus_tfidf import CorpusTfidfModel
 
-# Download required NLTK data if not already present
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    nltk.download("punkt", quiet=True)
+# nltk and scikit-learn take over a second to import and may download data;
+# they are loaded on first extraction, not when the package is imported.
+_NLTK_RESOURCES = (
+    ("tokenizers/punkt", "punkt"),
+    ("corpora/stopwords", "stopwords"),
+    ("taggers/averaged_perceptron_tagger_eng", "averaged_perceptron_tagger_eng"),
+)
+_nltk_data_checked = False
 
-try:
-    nltk.data.find("corpora/stopwords")
-except LookupError:
-    nltk.download("stopwords", quiet=True)
 
-try:
-    nltk.data.find("taggers/averaged_perceptron_tagger_eng")
-except LookupError:
-    nltk.download("averaged_perceptron_tagger_eng", quiet=True)
+def _ensure_nltk_data() -> None:
+    """Download required NLTK data if not already present (once per process)."""
+    global _nltk_data_checked
+    if _nltk_data_checked:
+        return
+    import nltk
 
-from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
+    for resource, package in _NLTK_RESOURCES:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package, quiet=True)
+    _nltk_data_checked = True
+
+
+def preprocess_text(text: str) -> str:
+    """Clean and normalize text: lowercase, no URLs or emails, alphanumerics only.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Cleaned text
+    """
+    # Convert to lowercase
+    text = text.lower()
+
+    # Remove URLs
+    text = re.sub(r"http\S+|www\.\S+", "", text)
+
+    # Remove email addresses
+    text = re.sub(r"\S+@\S+", "", text)
+
+    # Keep only alphanumeric and spaces
+    text = re.sub(r"[^a-z0-9\s]", " ", text)
+
+    # Normalize whitespace
+    text = " ".join(text.split())
+
+    return text
 
 
 @dataclass
@@ -74,7 +106,8 @@ class KeywordExtractor:
     """Extract keywords from text content using NLP techniques.
 
     Supports multiple extraction methods:
-    - TF-IDF: Term Frequency-Inverse Document Frequency
+    - TF-IDF: Term Frequency-Inverse Document Frequency, against the corpus
+      model of all published stories when one is available (see corpus_tfidf)
     - Frequency: Simple word frequency analysis
     - Hybrid: Combination of TF-IDF and frequency
     """
@@ -86,6 +119,7 @@ class KeywordExtractor:
         primary_count: int = 5,
         secondary_count: int = 10,
         language: str = "english",
+        corpus_model: Optional["CorpusTfidfModel"] = None,
     ):
         """Initialize the keyword extractor.
 
@@ -95,14 +129,20 @@ class KeywordExtractor:
             primary_count: Number of primary keywords to extract
             secondary_count: Number of secondary keywords to extract
             language: Language for stopwords (default: english)
+            corpus_model: TF-IDF model of the published corpus (default: the
+                model at PRISMQ_KEYWORD_TFIDF_MODEL, if it exists)
         """
         self.min_keyword_length = min_keyword_length
         self.max_keyword_length = max_keyword_length
         self.primary_count = primary_count
         self.secondary_count = secondary_count
         self.language = language
+        self.corpus_model = corpus_model
 
         # Load stopwords
+        _ensure_nltk_data()
+        from nltk.corpus import stopwords
+
         try:
             self.stop_words = set(stopwords.words(language))
         except Exception:
@@ -166,6 +206,36 @@ class KeywordExtractor:
             extraction_method=method,
         )
 
+    def extract_keywords_batch(
+        self,
+        documents: Sequence[Tuple[str, str]],
+        method: str = "tfidf",
+        workers: Optional[int] = None,
+    ) -> List[KeywordExtractionResult]:
+        """Extract keywords from many ``(title, script)`` stories at once.
+
+        Tokenizes each story once and scores all of them together on one
+        sparse document-term matrix (see ``batch_keywords``).
+
+        Args:
+            documents: ``(title, script)`` pairs
+            method: Extraction method ('tfidf', 'frequency', or 'hybrid')
+            workers: Tokenizer processes for large batches (default: all cores)
+
+        Returns:
+            One KeywordExtractionResult per story, in input order
+        """
+        from .batch_keywords import extract_keywords_batch
+
+        return extract_keywords_batch(
+            documents,
+            method,
+            primary_count=self.primary_count,
+            secondary_count=self.secondary_count,
+            extractor=self,
+            workers=workers,
+        )
+
     def _preprocess_text(self, text: str) -> str:
         """Clean and normalize text.
 
@@ -175,22 +245,7 @@ class KeywordExtractor:
         Returns:
             Cleaned text
         """
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove URLs
-        text = re.sub(r"http\S+|www\.\S+", "", text)
-
-        # Remove email addresses
-        text = re.sub(r"\S+@\S+", "", text)
-
-        # Keep only alphanumeric and spaces
-        text = re.sub(r"[^a-z0-9\s]", " ", text)
-
-        # Normalize whitespace
-        text = " ".join(text.split())
-
-        return text
+        return preprocess_text(text)
 
     def _tokenize(self, text: str) -> List[str]:
         """Tokenize text into words.
@@ -201,6 +256,8 @@ class KeywordExtractor:
         Returns:
             List of tokens
         """
+        from nltk.tokenize import word_tokenize
+
         try:
             tokens = word_tokenize(text)
         except Exception:
@@ -212,6 +269,10 @@ class KeywordExtractor:
     def _extract_tfidf(self, title: str, script: str) -> Dict[str, float]:
         """Extract keywords using TF-IDF.
 
+        With a corpus model the story is scored against the document
+        frequencies of all published stories; without one a vectorizer is
+        fitted on the title and script alone.
+
         Args:
             title: Content title
             script: Content script
@@ -219,6 +280,14 @@ class KeywordExtractor:
         Returns:
             Dictionary of keywords with TF-IDF scores
         """
+        from .corpus_tfidf import default_model, story_document
+
+        model = self.corpus_model if self.corpus_model is not None else default_model()
+        if model is not None:
+            scores = model.score_terms(story_document(title, script, preprocess_text), 50)
+            if scores:
+                return scores
+
         # Prepare documents
         documents = [
             self._preprocess_text(f"{title} {title} {title}"),
@@ -226,6 +295,8 @@ class KeywordExtractor:
         ]
 
         # Create TF-IDF vectorizer
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
         vectorizer = TfidfVectorizer(
             stop_words=list(self.stop_words),
             max_features=50,
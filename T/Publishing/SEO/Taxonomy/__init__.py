@@ -46,6 +46,7 @@ from .taxonomy_config import (
     LIFESTYLE_FOCUSED_TAXONOMY,
     TECH_FOCUSED_TAXONOMY,
     TaxonomyConfig,
+    TaxonomyConfigFile,
     create_custom_taxonomy,
     load_taxonomy_config,
 )
@@ -207,6 +208,7 @@ __all__ = [
     "CategoryClassifier",
     "CategoryClassificationResult",
     "TaxonomyConfig",
+    "TaxonomyConfigFile",
     # Functions
     "generate_tags",
     "classify_categories",
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark tag deduplication against the pairwise comparison.
+
+Generates candidate tags the way TagGenerator does (words, bigrams and
+variants such as plurals and hyphenations), deduplicates them with
+``TagGenerator._deduplicate_tags`` and with the old all-pairs SequenceMatcher
+loop, checks that both keep the same tags and prints the timings.
+
+Usage:
+    python T/Publishing/SEO/Taxonomy/_meta/performance/bench_tag_dedup.py
+    python T/Publishing/SEO/Taxonomy/_meta/performance/bench_tag_dedup.py --tags 5000
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[6]
+sys.path.insert(0, str(project_root))
+
+from T.Publishing.SEO.Taxonomy.tag_generator import TagGenerator
+from T.Publishing.SEO.Taxonomy.tag_similarity import tag_similarity
+from T.Publishing.SEO.Taxonomy.taxonomy_config import DEFAULT_TAXONOMY
+
+_ONSETS = ("", "b", "br", "c", "ch", "d", "f", "g", "gr", "h", "k", "l", "m", "n", "p", "pr",
+           "r", "s", "sh", "st", "t", "th", "tr", "v", "w")
+_VOWELS = ("a", "e", "i", "o", "u", "ai", "ea", "ou")
+_CODAS = ("", "", "n", "r", "s", "t", "nd", "ng", "st", "ck")
+
+
+def make_tags(count: int, seed: int = 11):
+    """About ``count`` scored tags: words, bigrams and near-duplicate variants."""
+    rng = random.Random(seed)
+
+    def word() -> str:
+        syllables = rng.choice((1, 2, 2, 3, 3))
+        return "".join(
+            rng.choice(_ONSETS) + rng.choice(_VOWELS) + rng.choice(_CODAS) for _ in range(syllables)
+        )
+
+    vocabulary = [word() for _ in range(max(count // 3, 10))]
+    tags = {}
+    while len(tags) < count:
+        kind = rng.random()
+        if kind < 0.4:
+            tag = rng.choice(vocabulary)
+        elif kind < 0.75:
+            tag = f"{rng.choice(vocabulary)} {rng.choice(vocabulary)}"
+        else:
+            base = rng.choice(list(tags) or vocabulary)
+            tag = rng.choice((base + "s", base + "ing", base.replace(" ", "-"), base[:-1]))
+        if 2 <= len(tag) <= 30:
+            tags[tag] = round(rng.uniform(0.3, 0.9), 2)
+    return tags
+
+
+def pairwise(tags, threshold):
+    """The all-pairs deduplication TagGenerator used before the index."""
+    kept = {}
+    removed = 0
+    for tag, score in sorted(tags.items(), key=lambda x: x[1], reverse=True):
+        if any(tag_similarity(tag, existing) >= threshold for existing in kept):
+            removed += 1
+        else:
+            kept[tag] = score
+    return kept, removed
+
+
+def best_of(function, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark tag deduplication")
+    parser.add_argument("--tags", type=int, default=1000, help="Candidate tags per run")
+    parser.add_argument("--threshold", type=float, default=0.85, help="Similarity threshold")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per method (best is shown)")
+    args = parser.parse_args(argv)
+
+    tags = make_tags(args.tags)
+    generator = TagGenerator(replace(DEFAULT_TAXONOMY, tag_similarity_threshold=args.threshold))
+
+    indexed = generator._deduplicate_tags(tags)
+    expected = pairwise(tags, args.threshold)
+    if indexed != expected:
+        print("Indexed and pairwise deduplication differ", file=sys.stderr)
+        return 1
+
+    indexed_seconds = best_of(lambda: generator._deduplicate_tags(tags), args.repeat)
+    pairwise_seconds = best_of(lambda: pairwise(tags, args.threshold), args.repeat)
+    print(f"{len(tags)} tags, threshold {args.threshold}: "
+          f"{len(expected[0])} kept, {expected[1]} duplicates removed")
+    print(f"Pairwise SequenceMatcher: {pairwise_seconds * 1000:9.1f} ms")
+    print(f"Indexed:                  {indexed_seconds * 1000:9.1f} ms "
+          f"({pairwise_seconds / indexed_seconds:.0f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Tests for the compiled category index."""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[6]
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from T.Publishing.SEO.Taxonomy.category_classifier import CategoryClassifier
+from T.Publishing.SEO.Taxonomy.category_index import compile_category_index
+from T.Publishing.SEO.Taxonomy.taxonomy_config import TaxonomyConfig
+
+
+def test_finds_overlapping_and_nested_keywords():
+    index = compile_category_index(
+        (("mobile", ("app", "mobile app", "application", "ios")), ("other", ("pp",)))
+    )
+    scan = index.scan("my mobile application", [])
+    assert scan.keywords == {"app", "mobile app", "application", "pp"}
+    assert scan.word_counts["mobile"] == 1
+
+
+def test_keywords_are_substrings_not_words():
+    index = compile_category_index((("ai", ("model",)),))
+    assert index.score_all("remodeled", []) == {"ai": 0.05}
+    assert index.score_all("", []) == {"ai": 0.0}
+
+
+@pytest.mark.parametrize(
+    "category, content, tags",
+    [
+        ("technology", "technology software programming computer technology", ["technology"]),
+        ("web development", "frontend and backend web work with react", ["web apps"]),
+        ("ai", "deep learning models and neural networks", ["machine learning"]),
+        ("mobile", "android apps", []),
+        ("unknown", "nothing to see", ["unknown thing"]),
+    ],
+)
+def test_single_category_score_matches_index(category, content, tags):
+    classifier = CategoryClassifier()
+    names = tuple(CategoryClassifier.CATEGORY_KEYWORDS) + ("unknown",)
+    index = compile_category_index(
+        tuple((name, tuple(classifier._get_category_keywords(name))) for name in names)
+    )
+    expected = index.score_all(content, tags)[category]
+    assert classifier._calculate_category_score(category, content, tags) == expected
+
+
+def test_index_is_cached_per_taxonomy():
+    config = TaxonomyConfig(categories={"Technology": ["AI", "Mobile"]})
+    first = CategoryClassifier(config)
+    second = CategoryClassifier(TaxonomyConfig(categories={"Technology": ["AI", "Mobile"]}))
+    first.classify_categories("AI", "machine learning")
+    second.classify_categories("Mobile", "android")
+    assert first._index is second._index
+    assert first._index.names == ("technology", "ai", "mobile")
+
+    config.categories["Business"] = ["Finance"]
+    result = first.classify_categories("Business", "money and investment", ["business"])
+    assert first._index is not second._index
+    assert "Business" in result.categories
+
+
+def test_subclass_keywords_are_compiled():
+    class GamingClassifier(CategoryClassifier):
+        CATEGORY_KEYWORDS = {
+            **CategoryClassifier.CATEGORY_KEYWORDS,
+            "gaming": ["console", "esports"],
+        }
+
+    config = TaxonomyConfig(categories={"Gaming": []}, min_category_score=0.1)
+    text = "Consoles and esports tournaments"
+    assert GamingClassifier(config).classify_categories("", text).categories == ["Gaming"]
+    assert CategoryClassifier(config).classify_categories("", text).categories == []
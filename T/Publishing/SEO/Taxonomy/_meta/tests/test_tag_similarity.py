@@ -0,0 +1,82 @@
+"""Tests for indexed tag deduplication."""
+
+import random
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[6]
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from T.Publishing.SEO.Taxonomy.tag_generator import TagGenerator
+from T.Publishing.SEO.Taxonomy.tag_similarity import SimilarTagIndex, tag_similarity
+from T.Publishing.SEO.Taxonomy.taxonomy_config import DEFAULT_TAXONOMY
+
+
+def pairwise(tags, threshold):
+    """Reference: compare every tag with every kept tag."""
+    kept = {}
+    removed = 0
+    for tag, score in sorted(tags.items(), key=lambda x: x[1], reverse=True):
+        if any(tag_similarity(tag, existing) >= threshold for existing in kept):
+            removed += 1
+        else:
+            kept[tag] = score
+    return kept, removed
+
+
+def random_tags(count, seed):
+    rng = random.Random(seed)
+    words = ["".join(rng.choice("aeilnorst") for _ in range(rng.randint(2, 9))) for _ in range(40)]
+    tags = {}
+    while len(tags) < count:
+        tag = rng.choice(words)
+        if rng.random() < 0.4:
+            tag = f"{tag} {rng.choice(words)}"
+        if rng.random() < 0.3:
+            tag = rng.choice((tag + "s", tag[1:], tag.replace(" ", "-"), tag.upper()))
+        tags[tag] = round(rng.random(), 2)
+    return tags
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.3, 0.6, 0.8, 0.85, 0.95, 1.0])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_matches_pairwise_deduplication(threshold, seed):
+    tags = random_tags(150, seed)
+    generator = TagGenerator(replace(DEFAULT_TAXONOMY, tag_similarity_threshold=threshold))
+    assert generator._deduplicate_tags(tags) == pairwise(tags, threshold)
+
+
+def test_find_returns_first_similar_kept_tag():
+    index = SimilarTagIndex(0.8, ["python", "pythons", "python3", "java"])
+    for tag in ("python", "java"):
+        index.add(tag)
+
+    assert len(index) == 2
+    assert index.find("pythons") == "python"
+    assert index.find("Python3") == "python"
+    assert index.find("javascript") is None
+
+
+def test_empty_tags():
+    index = SimilarTagIndex(0.85)
+    index.add("")
+    assert index.find("") == ""
+    assert index.find("tag") is None
+
+
+def test_custom_similarity_is_used_for_candidates():
+    calls = []
+
+    def similarity(tag1, tag2):
+        calls.append((tag1, tag2))
+        return tag_similarity(tag1, tag2)
+
+    index = SimilarTagIndex(0.85, similarity=similarity)
+    index.add("machine learning")
+    index.add("zebra")
+    assert index.find("machine-learning") == "machine learning"
+    assert calls == [("machine-learning", "machine learning")]
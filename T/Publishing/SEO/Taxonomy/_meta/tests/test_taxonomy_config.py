@@ -1,6 +1,7 @@
 """Tests for TaxonomyConfig module."""
 
 import json
+import os
 import sys
 import tempfile
 from pathlib import Path
@@ -16,6 +17,7 @@ from T.Publishing.SEO.Taxonomy.taxonomy_config import (
     LIFESTYLE_FOCUSED_TAXONOMY,
     TECH_FOCUSED_TAXONOMY,
     TaxonomyConfig,
+    TaxonomyConfigFile,
     create_custom_taxonomy,
     load_taxonomy_config,
 )
@@ -336,3 +338,46 @@ class TestEdgeCases:
         config = TaxonomyConfig(categories={"Technologie": ["IA", "Web"]})
 
         assert config.validate() is True
+
+
+class TestTaxonomyConfigFile:
+    """Test hot reloading of taxonomy files."""
+
+    def _write(self, path, categories, mtime_ns):
+        path.write_text(json.dumps({"categories": categories}))
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_reloads_changed_file(self, tmp_path):
+        path = tmp_path / "taxonomy.json"
+        self._write(path, {"Tech": ["AI"]}, 10**18)
+        taxonomy = TaxonomyConfigFile(path)
+        taxonomy.RELOAD_CHECK_SECONDS = 0
+
+        first = taxonomy.config
+        assert first.categories == {"Tech": ["AI"]}
+        assert taxonomy.config is first and taxonomy.version == 1
+
+        self._write(path, {"Tech": ["AI", "Cloud"]}, 2 * 10**18)
+        assert taxonomy.config.categories == {"Tech": ["AI", "Cloud"]}
+        assert taxonomy.version == 2
+
+    def test_invalid_edit_keeps_last_config(self, tmp_path):
+        path = tmp_path / "taxonomy.json"
+        self._write(path, {"Tech": ["AI"]}, 10**18)
+        taxonomy = TaxonomyConfigFile(path)
+        taxonomy.RELOAD_CHECK_SECONDS = 0
+
+        path.write_text('{"categories": {"Tech": [')
+        assert taxonomy.config.categories == {"Tech": ["AI"]}
+        path.unlink()
+        assert taxonomy.config.categories == {"Tech": ["AI"]}
+
+    def test_checks_are_rate_limited(self, tmp_path):
+        path = tmp_path / "taxonomy.json"
+        self._write(path, {"Tech": ["AI"]}, 10**18)
+        taxonomy = TaxonomyConfigFile(path)
+        taxonomy.RELOAD_CHECK_SECONDS = 3600
+
+        self._write(path, {"Tech": ["Cloud"]}, 2 * 10**18)
+        assert taxonomy.config.categories == {"Tech": ["AI"]}
+        assert taxonomy.reload().categories == {"Tech": ["Cloud"]}
@@ -9,6 +9,7 @@ from collections import Counter
 from dataclasses import asdict, dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
 
+from .category_index import CategoryIndex, compile_category_index
 from .taxonomy_config import DEFAULT_TAXONOMY, TaxonomyConfig
 
 
@@ -49,8 +50,107 @@ class CategoryClassifier:
     - Tag-based: Use generated tags to infer categories
     - Semantic: Analyze content semantically for category relevance
     - Hierarchical: Support parent/child category relationships
+
+    All categories are scored in one pass over the content with a
+    ``CategoryIndex`` compiled from the taxonomy (see category_index.py).
     """
 
+    # Semantic keywords of major categories (lowercase category name -> keywords)
+    CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+        "technology": [
+            "software",
+            "hardware",
+            "tech",
+            "digital",
+            "computer",
+            "internet",
+            "app",
+            "system",
+        ],
+        "ai": [
+            "artificial intelligence",
+            "machine learning",
+            "neural",
+            "deep learning",
+            "algorithm",
+            "model",
+        ],
+        "web development": [
+            "website",
+            "web app",
+            "frontend",
+            "backend",
+            "html",
+            "css",
+            "javascript",
+            "react",
+            "framework",
+        ],
+        "mobile": ["app", "android", "ios", "smartphone", "mobile app", "application"],
+        "cloud": ["aws", "azure", "gcp", "cloud computing", "saas", "paas", "serverless"],
+        "programming": [
+            "code",
+            "coding",
+            "developer",
+            "software",
+            "language",
+            "python",
+            "java",
+            "programming",
+        ],
+        "data science": [
+            "data",
+            "analytics",
+            "analysis",
+            "dataset",
+            "statistics",
+            "visualization",
+        ],
+        "business": ["company", "enterprise", "corporate", "market", "business", "industry"],
+        "marketing": [
+            "advertisement",
+            "promotion",
+            "brand",
+            "campaign",
+            "seo",
+            "social media",
+            "content",
+        ],
+        "finance": [
+            "money",
+            "investment",
+            "financial",
+            "banking",
+            "stock",
+            "trading",
+            "revenue",
+        ],
+        "entrepreneurship": [
+            "startup",
+            "founder",
+            "business",
+            "entrepreneur",
+            "venture",
+            "innovation",
+        ],
+        "health": ["medical", "wellness", "healthcare", "fitness", "nutrition", "healthy"],
+        "lifestyle": ["living", "life", "personal", "daily", "routine", "habit"],
+        "education": [
+            "learning",
+            "teaching",
+            "student",
+            "course",
+            "training",
+            "tutorial",
+            "lesson",
+        ],
+        "science": ["research", "scientific", "study", "experiment", "discovery", "theory"],
+        "creative": ["design", "art", "creative", "visual", "artistic", "graphic"],
+        "entertainment": ["fun", "enjoy", "entertainment", "media", "content", "show"],
+        "sports": ["sport", "game", "player", "team", "athletic", "competition"],
+        "news": ["news", "report", "update", "event", "breaking", "announcement"],
+    }
+
     def __init__(self, config: Optional[TaxonomyConfig] = None):
         """Initialize the category classifier.
 
@@ -58,6 +158,7 @@ class CategoryClassifier:
             config: TaxonomyConfig instance (uses default if not provided)
         """
         self.config = config or DEFAULT_TAXONOMY
+        self._index: Optional[CategoryIndex] = None
 
     def classify_categories(
         self, title: str, script: str, tags: Optional[List[str]] = None
@@ -77,22 +178,18 @@ class CategoryClassifier:
         content_lower = content.lower()
         tags_lower = [tag.lower() for tag in (tags or [])]
 
-        # Calculate category scores
+        # Score every category name in one pass over the content
+        scores = self._category_index().score_all(content_lower, tags_lower)
         category_scores: Dict[str, float] = {}
 
         for parent_category, subcategories in self.config.categories.items():
-            parent_lower = parent_category.lower()
-
             # Calculate parent category score
-            parent_score = self._calculate_category_score(parent_lower, content_lower, tags_lower)
+            parent_score = scores[parent_category.lower()]
 
             # Check subcategories
             subcategory_scores = {}
             for subcat in subcategories:
-                subcat_lower = subcat.lower()
-                subcat_score = self._calculate_category_score(
-                    subcat_lower, content_lower, tags_lower
-                )
+                subcat_score = scores[subcat.lower()]
 
                 if subcat_score > 0:
                     subcategory_scores[subcat] = subcat_score
@@ -134,6 +231,21 @@ class CategoryClassifier:
             classification_method="keyword_matching",
         )
 
+    def _category_index(self) -> CategoryIndex:
+        """Compiled index of the current taxonomy, recompiled when it changes."""
+        names = tuple(
+            dict.fromkeys(
+                name.lower()
+                for parent, subcategories in self.config.categories.items()
+                for name in (parent, *subcategories)
+            )
+        )
+        if self._index is None or self._index.names != names:
+            self._index = compile_category_index(
+                tuple((name, tuple(self._get_category_keywords(name))) for name in names)
+            )
+        return self._index
+
     def _calculate_category_score(self, category: str, content: str, tags: List[str]) -> float:
         """Calculate relevance score for a category.
 
@@ -145,51 +257,8 @@ class CategoryClassifier:
         Returns:
             Relevance score (0-1)
         """
-        score = 0.0
-
-        # 1. Direct category name match in content (40% weight)
-        # Split category into words for matching
-        category_words = category.split()
-        content_words = content.split()
-
-        # Count occurrences of category words
-        matches = 0
-        for cat_word in category_words:
-            if cat_word in content_words:
-                matches += content_words.count(cat_word)
-
-        if matches > 0:
-            # More matches = higher score (up to 0.40)
-            score += min(0.40, matches * 0.10)
-
-        # 2. Category appears in tags (35% weight)
-        for tag in tags:
-            # Check if category is in tag or tag is in category
-            if category in tag or tag in category:
-                score += 0.35
-                break
-
-            # Also check word-level overlap
-            tag_words = tag.split()
-            overlap = len(set(category_words) & set(tag_words))
-            if overlap > 0:
-                score += min(0.25, overlap * 0.10)
-                break
-
-        # 3. Semantic keywords matching (25% weight)
-        # Define keyword mappings for common categories
-        category_keywords = self._get_category_keywords(category)
-
-        keyword_matches = 0
-        for keyword in category_keywords:
-            if keyword in content:
-                keyword_matches += 1
-
-        if keyword_matches > 0:
-            score += min(0.25, keyword_matches * 0.05)
-
-        # Normalize to 0-1 range
-        return min(1.0, score)
+        index = compile_category_index(((category, tuple(self._get_category_keywords(category))),))
+        return index.score_all(content, tags)[category]
 
     def _get_category_keywords(self, category: str) -> List[str]:
         """Get semantic keywords for a category.
@@ -200,103 +269,7 @@ class CategoryClassifier:
         Returns:
             List of relevant keywords
         """
-        # Define keyword mappings for major categories
-        keyword_map = {
-            "technology": [
-                "software",
-                "hardware",
-                "tech",
-                "digital",
-                "computer",
-                "internet",
-                "app",
-                "system",
-            ],
-            "ai": [
-                "artificial intelligence",
-                "machine learning",
-                "neural",
-                "deep learning",
-                "algorithm",
-                "model",
-            ],
-            "web development": [
-                "website",
-                "web app",
-                "frontend",
-                "backend",
-                "html",
-                "css",
-                "javascript",
-                "react",
-                "framework",
-            ],
-            "mobile": ["app", "android", "ios", "smartphone", "mobile app", "application"],
-            "cloud": ["aws", "azure", "gcp", "cloud computing", "saas", "paas", "serverless"],
-            "programming": [
-                "code",
-                "coding",
-                "developer",
-                "software",
-                "language",
-                "python",
-                "java",
-                "programming",
-            ],
-            "data science": [
-                "data",
-                "analytics",
-                "analysis",
-                "dataset",
-                "statistics",
-                "visualization",
-            ],
-            "business": ["company", "enterprise", "corporate", "market", "business", "industry"],
-            "marketing": [
-                "advertisement",
-                "promotion",
-                "brand",
-                "campaign",
-                "seo",
-                "social media",
-                "content",
-            ],
-            "finance": [
-                "money",
-                "investment",
-                "financial",
-                "banking",
-                "stock",
-                "trading",
-                "revenue",
-            ],
-            "entrepreneurship": [
-                "startup",
-                "founder",
-                "business",
-                "entrepreneur",
-                "venture",
-                "innovation",
-            ],
-            "health": ["medical", "wellness", "healthcare", "fitness", "nutrition", "healthy"],
-            "lifestyle": ["living", "life", "personal", "daily", "routine", "habit"],
-            "education": [
-                "learning",
-                "teaching",
-                "student",
-                "course",
-                "training",
-                "tutorial",
-                "lesson",
-            ],
-            "science": ["research", "scientific", "study", "experiment", "discovery", "theory"],
-            "creative": ["design", "art", "creative", "visual", "artistic", "graphic"],
-            "entertainment": ["fun", "enjoy", "entertainment", "media", "content", "show"],
-            "sports": ["sport", "game", "player", "team", "athletic", "competition"],
-            "news": ["news", "report", "update", "event", "breaking", "announcement"],
-        }
-
-        return keyword_map.get(category, [])
+        return list(self.CATEGORY_KEYWORDS.get(category, []))
 
     def _build_hierarchy(self, categories: List[str]) -> Dict[str, List[str]]:
         """Build hierarchical representation of categories.
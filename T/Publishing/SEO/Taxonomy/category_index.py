@@ -0,0 +1,150 @@
+"""Compiled category matcher for PrismQ.T.Publishing.SEO.Taxonomy.
+
+CategoryClassifier scores every category of a taxonomy against the content.
+Scoring each category separately splits and scans the content once per
+category, so ``CategoryIndex`` compiles the whole taxonomy once instead:
+
+- One word Counter of the content serves the name matches of all categories.
+- All semantic keywords are compiled into one regex over a prefix trie,
+  which finds every keyword in the content in a single pass.
+
+Compiled indexes are cached by their categories and keywords, so a
+classifier only recompiles when its taxonomy changes.
+"""
+
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+# Distinct taxonomies kept compiled at the same time
+INDEX_CACHE_SIZE = 32
+
+
+def _trie_pattern(words: Sequence[str]) -> str:
+    """Regex alternation for ``words`` factored into a prefix trie.
+
+    Optional word ends are greedy, so the pattern matches the longest word
+    that starts at a position.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class ContentScan(NamedTuple):
+    """Content and tag features shared by all categories."""
+
+    word_counts: Counter
+    keywords: FrozenSet[str]
+    tags: List[str]
+    tag_words: List[FrozenSet[str]]
+
+
+class CategoryIndex:
+    """Categories and their semantic keywords, compiled for one-pass scoring.
+
+    Example:
+        >>> index = compile_category_index((("ai", ("machine learning", "neural")),))
+        >>> index.score_all("ai and machine learning", [])
+        {'ai': 0.15000000000000002}
+    """
+
+    def __init__(self, categories: Sequence[Tuple[str, Sequence[str]]]):
+        """Compile categories.
+
+        Args:
+            categories: ``(lowercase category name, semantic keywords)`` pairs
+        """
+        self.names = tuple(name for name, _ in categories)
+        self._words = [tuple(name.split()) for name in self.names]
+        self._word_sets = [frozenset(words) for words in self._words]
+        self._keywords = [tuple(keywords) for _, keywords in categories]
+
+        vocabulary = sorted({keyword for keywords in self._keywords for keyword in keywords})
+        # Every keyword found at a position is a prefix of the longest one found there
+        self._prefixes = {
+            keyword: frozenset(other for other in vocabulary if keyword.startswith(other))
+            for keyword in vocabulary
+        }
+        self._pattern: Optional[re.Pattern] = None
+        if vocabulary:
+            self._pattern = re.compile(f"(?=({_trie_pattern(vocabulary)}))")
+
+    def scan(self, content: str, tags: Sequence[str]) -> ContentScan:
+        """Collect the content features used by every category.
+
+        Args:
+            content: Content text (lowercase)
+            tags: Tags (lowercase)
+        """
+        found = set()
+        if self._pattern is not None:
+            for longest in dict.fromkeys(m.group(1) for m in self._pattern.finditer(content)):
+                if longest in self._prefixes:
+                    found.update(self._prefixes[longest])
+        return ContentScan(
+            word_counts=Counter(content.split()),
+            keywords=frozenset(found),
+            tags=list(tags),
+            tag_words=[frozenset(tag.split()) for tag in tags],
+        )
+
+    def score(self, position: int, scan: ContentScan) -> float:
+        """Relevance score (0-1) of the category at ``position`` in ``names``."""
+        category = self.names[position]
+        score = 0.0
+
+        # 1. Direct category name match in content (40% weight)
+        matches = sum(scan.word_counts[word] for word in self._words[position])
+        if matches > 0:
+            score += min(0.40, matches * 0.10)
+
+        # 2. Category appears in tags (35% weight)
+        for tag, tag_words in zip(scan.tags, scan.tag_words):
+            if category in tag or tag in category:
+                score += 0.35
+                break
+
+            overlap = len(self._word_sets[position] & tag_words)
+            if overlap > 0:
+                score += min(0.25, overlap * 0.10)
+                break
+
+        # 3. Semantic keywords matching (25% weight)
+        keyword_matches = sum(1 for keyword in self._keywords[position] if keyword in scan.keywords)
+        if keyword_matches > 0:
+            score += min(0.25, keyword_matches * 0.05)
+
+        return min(1.0, score)
+
+    def score_all(self, content: str, tags: Sequence[str]) -> Dict[str, float]:
+        """Scores of all categories, keyed by lowercase name.
+
+        Args:
+            content: Content text (lowercase)
+            tags: Tags (lowercase)
+        """
+        scan = self.scan(content, tags)
+        return {name: self.score(position, scan) for position, name in enumerate(self.names)}
+
+
+@lru_cache(maxsize=INDEX_CACHE_SIZE)
+def compile_category_index(categories: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> CategoryIndex:
+    """Compiled index for ``(name, keywords)`` pairs, shared by equal taxonomies."""
+    return CategoryIndex(categories)
+
+
+__all__ = ["CategoryIndex", "ContentScan", "compile_category_index"]
@@ -4,12 +4,12 @@ This module provides intelligent tag generation from content and keywords
 with relevance scoring, semantic analysis, and deduplication.
 """
 
-import difflib
 import re
 from collections import Counter
 from dataclasses import asdict, dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
 
+from .tag_similarity import SimilarTagIndex, tag_similarity
 from .taxonomy_config import DEFAULT_TAXONOMY, TaxonomyConfig
 
 
@@ -341,6 +341,10 @@ class TagGenerator:
     def _deduplicate_tags(self, tags: Dict[str, float]) -> Tuple[Dict[str, float], int]:
         """Remove similar/duplicate tags.
 
+        Tags are kept in score order unless they are similar to a tag already
+        kept. ``SimilarTagIndex`` limits the comparisons to kept tags that can
+        reach the threshold.
+
         Args:
             tags: Dictionary of tags with scores
 
@@ -355,21 +359,18 @@ class TagGenerator:
 
         deduplicated = {}
         removed_count = 0
+        index = SimilarTagIndex(
+            self.config.tag_similarity_threshold, tags, self._calculate_similarity
+        )
 
         for tag, score in sorted_tags:
             # Check similarity with existing tags
-            is_duplicate = False
-
-            for existing_tag in deduplicated.keys():
-                similarity = self._calculate_similarity(tag, existing_tag)
-
-                if similarity >= self.config.tag_similarity_threshold:
-                    is_duplicate = True
-                    removed_count += 1
-                    break
+            if index.find(tag) is not None:
+                removed_count += 1
+                continue
 
-            if not is_duplicate:
-                deduplicated[tag] = score
+            index.add(tag)
+            deduplicated[tag] = score
 
         return deduplicated, removed_count
 
@@ -384,7 +385,7 @@ class TagGenerator:
             Similarity score (0-1)
         """
         # Use SequenceMatcher for string similarity
-        return difflib.SequenceMatcher(None, tag1.lower(), tag2.lower()).ratio()
+        return tag_similarity(tag1, tag2)
 
     def _normalize_tag(self, text: str) -> str:
         """Normalize tag text.
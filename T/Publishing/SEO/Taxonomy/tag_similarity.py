@@ -0,0 +1,134 @@
+"""Indexed near-duplicate detection for tags.
+
+TagGenerator drops a tag when its similarity to a tag it already kept reaches
+``tag_similarity_threshold``. Comparing every tag with every kept tag makes
+that quadratic, so ``SimilarTagIndex`` compares a tag only with the kept tags
+that can still reach the threshold:
+
+- The similarity is ``difflib.SequenceMatcher.ratio()``, ``2 * M / T`` where
+  ``M`` matching characters are also characters both tags have in common and
+  ``T`` is the total length. Tags whose lengths or common characters are too
+  few to reach the threshold are skipped without running SequenceMatcher.
+- Each kept tag is indexed under its rarest characters (prefix filtering).
+  Two tags with enough characters in common to reach the threshold always
+  share one of those, so a lookup only reads a few short posting lists.
+
+The exact ratio is computed for the remaining candidates, so the kept tags
+are the same as with the pairwise comparison.
+"""
+
+import difflib
+import math
+from collections import Counter, defaultdict
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+Token = Tuple[str, int]
+
+
+def tag_similarity(tag1: str, tag2: str) -> float:
+    """SequenceMatcher ratio of two tags, ignoring case (0-1)."""
+    return difflib.SequenceMatcher(None, tag1.lower(), tag2.lower()).ratio()
+
+
+def _tokens(text: str) -> List[Token]:
+    """Characters of ``text`` as a set: the n-th ``a`` becomes ``("a", n)``."""
+    seen: Counter = Counter()
+    tokens = []
+    for char in text:
+        seen[char] += 1
+        tokens.append((char, seen[char]))
+    return tokens
+
+
+class SimilarTagIndex:
+    """Kept tags, indexed to find the ones similar to a new tag.
+
+    ``similarity`` must not exceed ``2 * common characters / total length``,
+    which holds for SequenceMatcher ratios (the default).
+
+    Example:
+        >>> index = SimilarTagIndex(0.85, ["machine learning", "machine-learning"])
+        >>> index.add("machine learning")
+        >>> index.find("machine-learning")
+        'machine learning'
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        tags: Iterable[str] = (),
+        similarity: Callable[[str, str], float] = tag_similarity,
+    ):
+        """Initialize an empty index.
+
+        Args:
+            threshold: Similarity at which two tags are duplicates (0-1)
+            tags: All tags that will be looked up, used to rank characters
+                by rarity (other tags still work, the index is just less
+                selective for them)
+            similarity: Exact similarity of a new tag and a kept tag
+        """
+        self.threshold = threshold
+        self.similarity = similarity
+        self._frequency = Counter(token for tag in tags for token in _tokens(tag.lower()))
+        self._tags: List[str] = []
+        self._lengths: List[int] = []
+        self._token_sets: List[FrozenSet[Token]] = []
+        self._postings: Dict[Token, List[int]] = defaultdict(list)
+        # Tags that can be similar without sharing a character (threshold 0)
+        self._unindexed: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def _min_common(self, length: int) -> int:
+        """Fewest common characters a tag of ``length`` needs with any tag."""
+        # The partner is at least threshold / (2 - threshold) times as long
+        return math.ceil(self.threshold * length / (2 - self.threshold) - 1e-9)
+
+    def _prefix(self, tokens: List[Token]) -> List[Token]:
+        rarest = sorted(tokens, key=lambda token: (self._frequency[token], token))
+        return rarest[: len(tokens) - self._min_common(len(tokens)) + 1]
+
+    def add(self, tag: str) -> None:
+        """Keep ``tag`` so later lookups compare against it."""
+        lower = tag.lower()
+        tokens = _tokens(lower)
+        position = len(self._tags)
+        self._tags.append(tag)
+        self._lengths.append(len(lower))
+        self._token_sets.append(frozenset(tokens))
+        if self._min_common(len(tokens)) < 1:
+            self._unindexed.append(position)
+            return
+        for token in self._prefix(tokens):
+            self._postings[token].append(position)
+
+    def find(self, tag: str) -> Optional[str]:
+        """First kept tag (in the order added) similar to ``tag``, or None."""
+        lower = tag.lower()
+        tokens = _tokens(lower)
+        if self._min_common(len(tokens)) < 1:
+            candidates: Iterable[int] = range(len(self._tags))
+        else:
+            found = set(self._unindexed)
+            for token in self._prefix(tokens):
+                found.update(self._postings.get(token, ()))
+            candidates = sorted(found)
+
+        length = len(lower)
+        token_set = frozenset(tokens)
+        for position in candidates:
+            total = length + self._lengths[position]
+            if total and 2.0 * min(length, self._lengths[position]) / total < self.threshold:
+                continue
+            common = len(token_set & self._token_sets[position])
+            if total and 2.0 * common / total < self.threshold:
+                continue
+            existing = self._tags[position]
+            if self.similarity(tag, existing) >= self.threshold:
+                return existing
+        return None
+
+
+__all__ = ["SimilarTagIndex", "tag_similarity"]
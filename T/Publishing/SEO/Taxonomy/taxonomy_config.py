@@ -5,9 +5,10 @@ including predefined categories, tag rules, and custom taxonomy definitions.
 """
 
 import json
+import time
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -131,6 +132,74 @@ def load_taxonomy_config(filepath: Path) -> TaxonomyConfig:
         raise ValueError(f"Invalid configuration structure: {e}")
 
 
+class TaxonomyConfigFile:
+    """Taxonomy configuration file, reloaded when it changes on disk.
+
+    Long-running publishers keep one instance and read ``config`` per story.
+    The file is checked at most every RELOAD_CHECK_SECONDS and reloaded when
+    its modification time or size changes. CategoryClassifier recompiles its
+    category index only when the categories themselves change.
+
+    Example:
+        >>> taxonomy = TaxonomyConfigFile(Path("taxonomy.json"))
+        >>> classifier = CategoryClassifier(taxonomy.config)
+    """
+
+    # Seconds between checks of the file for changes
+    RELOAD_CHECK_SECONDS = 1.0
+
+    def __init__(self, filepath: Path):
+        """Load the configuration.
+
+        Args:
+            filepath: Path to JSON configuration file
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If the configuration is invalid
+        """
+        self.filepath = Path(filepath)
+        self.version = 0
+        self._config: Optional[TaxonomyConfig] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._checked_at = 0.0
+        self.reload()
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.filepath.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self) -> TaxonomyConfig:
+        """Load the file now and return the new configuration."""
+        stamp = self._file_stamp()
+        self._config = load_taxonomy_config(self.filepath)
+        self._stamp = stamp
+        self._checked_at = time.monotonic()
+        self.version += 1
+        return self._config
+
+    @property
+    def config(self) -> TaxonomyConfig:
+        """Current configuration.
+
+        An invalid or missing file keeps the last valid configuration, so a
+        half-written edit does not stop publishing.
+        """
+        now = time.monotonic()
+        if now - self._checked_at >= self.RELOAD_CHECK_SECONDS:
+            self._checked_at = now
+            stamp = self._file_stamp()
+            if stamp is not None and stamp != self._stamp:
+                try:
+                    self.reload()
+                except (OSError, ValueError):
+                    self._stamp = stamp
+        return self._config
+
+
 # Default taxonomy configuration
 DEFAULT_TAXONOMY = TaxonomyConfig(
     categories={
@@ -406,6 +475,7 @@ def create_custom_taxonomy(
 __all__ = [
     "TaxonomyConfig",
     "load_taxonomy_config",
+    "TaxonomyConfigFile",
     "create_custom_taxonomy",
     "DEFAULT_TAXONOMY",
     "TECH_FOCUSED_TAXONOMY",
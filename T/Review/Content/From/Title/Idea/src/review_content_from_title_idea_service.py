@@ -15,10 +15,8 @@ State Transitions:
     - If review does not accept content (score < threshold) -> PrismQ.T.Content.From.Content.Review.Title
 """
 
-import json
 import logging
 import os
-import re
 import sqlite3
 import sys
 from dataclasses import dataclass
@@ -32,11 +30,6 @@ logger = logging.getLogger(__name__)
 # Prompt template directory
 _PROMPTS_DIR = Path(__file__).parent.parent / "_meta" / "prompts"
 
-
-def _load_prompt(filename: str) -> str:
-    """Load a prompt template from the prompts directory."""
-    return (_PROMPTS_DIR / filename).read_text(encoding="utf-8")
-
 # Setup paths for imports
 _current_dir = os.path.dirname(os.path.abspath(__file__))
 _module_root = os.path.dirname(_current_dir)  # T/Review/Content/From/Title/Idea
@@ -57,6 +50,8 @@ from Model.Database.models.story import Story
 from Model.Database.models.title import Title
 from Model.Database.repositories.content_repository import ContentRepository
 from Model.Database.repositories.story_repository import StoryRepository
+from Model.Infrastructure.ollama import run_review
+from Model.Repositories.story_retry_repository import RETRY_READY_SQL, StoryRetryRepository
 from Model.Database.repositories.title_repository import TitleRepository
 from Model.State.constants.state_names import StateNames
 
@@ -145,6 +140,7 @@ class ReviewContentFromTitleIdeaService:
         self.title_repo = TitleRepository(connection)
         self.content_repo = ContentRepository(connection)
         self.review_repo = ReviewRepository(connection)
+        self.retry_repo = StoryRetryRepository(connection)
 
     def _ai_review_content(
         self,
@@ -169,58 +165,23 @@ class ReviewContentFromTitleIdeaService:
             RuntimeError: If Ollama is not available or the API call fails
         """
         try:
-            import requests as _requests
-        except ImportError as exc:
-            raise RuntimeError("requests library not available; run: pip install requests") from exc
-
-        template = _load_prompt("review_content.txt")
-        prompt = template.format(
-            title_text=title_text,
-            idea_text=idea_text or "Not provided",
-            content_text=content_text[:_MAX_CONTENT_PREVIEW_LENGTH],
-        )
-
-        try:
-            check = _requests.get("http://localhost:11434/api/tags", timeout=5)
-            if check.status_code != 200:
-                raise RuntimeError(f"Ollama not available (status {check.status_code})")
-        except _requests.exceptions.RequestException as exc:
-            raise RuntimeError(f"Ollama not reachable: {exc}") from exc
-
-        try:
-            response = _requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": _AI_MODEL,
-                    "prompt": prompt,
-                    "stream": False,
-                    "think": False,
-                    "options": {"temperature": _AI_TEMPERATURE, "num_predict": _AI_MAX_TOKENS, "num_ctx": 4096},
+            return run_review(
+                _AI_MODEL,
+                _PROMPTS_DIR / "review_content.txt",
+                {
+                    "title_text": title_text,
+                    "idea_text": idea_text or "Not provided",
+                    "content_text": content_text[:_MAX_CONTENT_PREVIEW_LENGTH],
                 },
+                default_feedback="AI review completed.",
+                temperature=_AI_TEMPERATURE,
+                max_tokens=_AI_MAX_TOKENS,
                 timeout=_AI_TIMEOUT,
             )
-            response.raise_for_status()
-            raw = response.json().get("response", "").strip()
-        except _requests.exceptions.RequestException as exc:
-            raise RuntimeError(f"Ollama API call failed: {exc}") from exc
-
-        # Strip <think>...</think> blocks (Qwen3 thinking mode)
-        raw = re.sub(r"<think>.*?</think>", "", raw, flags=re.DOTALL).strip()
-
-        # Parse JSON response
-        try:
-            match = re.search(r"\{.*\}", raw, re.DOTALL)
-            if not match:
-                raise ValueError("No JSON in AI response")
-            data = json.loads(match.group())
-            score = max(0, min(100, int(data.get("overall_score", 50))))
-            feedback = str(data.get("feedback", "AI review completed."))
-        except Exception as exc:
+        except ValueError as exc:
             logger.warning(f"Failed to parse AI content review response: {exc}")
             raise RuntimeError(f"Could not parse AI review response: {exc}") from exc
 
-        return feedback, score
-
     def _fetch_story_with_content(self):
         """Fetch the next story to process using priority ordering.
 
@@ -233,7 +194,7 @@ class ReviewContentFromTitleIdeaService:
             sqlite3.Row with story/title/content/idea fields, or None
         """
         cursor = self._conn.execute(
-            """
+            f"""
             SELECT
                 s.id          AS story_id,
                 s.idea_id     AS idea_id,
@@ -256,6 +217,7 @@ class ReviewContentFromTitleIdeaService:
             LEFT JOIN Idea i ON i.id = s.idea_id
             LEFT JOIN Review r ON r.id = t.review_id
             WHERE s.state = ?
+              AND {RETRY_READY_SQL}
             ORDER BY t.version ASC, COALESCE(r.score, 0) DESC, s.created_at ASC
             LIMIT 1
             """,
@@ -331,5 +293,8 @@ class ReviewContentFromTitleIdeaService:
         except Exception as e:
             result.error = f"Processing failed: {str(e)}"
             logger.exception(f"Error processing story {row['story_id']}")
+            retry = self.retry_repo.record_failure(row["story_id"], self.INPUT_STATE, result.error)
+            if retry.is_dead_lettered:
+                result.error += f" (dead-lettered after {retry.attempts} attempts)"
 
         return result
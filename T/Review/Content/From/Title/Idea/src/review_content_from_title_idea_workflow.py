@@ -38,6 +38,7 @@ except ImportError:
 
 try:
     from review_content_from_title_idea_service import ReviewContentFromTitleIdeaService
+    from Model.Infrastructure.workflow import StageTelemetry
     SERVICE_AVAILABLE = True
 except ImportError as e:
     SERVICE_AVAILABLE = False
@@ -139,6 +140,7 @@ def main():
 
     # Initialize service
     service = ReviewContentFromTitleIdeaService(conn)
+    telemetry = StageTelemetry("06")
 
     # Continuous processing loop
     run_count = 0
@@ -180,7 +182,7 @@ def main():
                 print_success(f"Found {pending_count} pending stories")
             
             # Process oldest story
-            result = service.process_oldest_story()
+            result = telemetry.run(service.process_oldest_story)
             
             if result.story_id is None:
                 # Should not happen but handle it
@@ -14,7 +14,7 @@ Service Module (in src/):
 - process_all_consistency_reviews: Process all pending stories
 """
 
-from T.Review.Content.Consistency.consistency_review import (
+from .consistency_review import (
     ConsistencyIssue,
     ConsistencyIssueType,
     ConsistencyReview,
@@ -23,6 +23,7 @@ from T.Review.Content.Consistency.consistency_review import (
     get_consistency_feedback,
     review_content_consistency,
     review_content_consistency_to_json,
+    review_many_consistency,
 )
 
 __all__ = [
@@ -34,5 +35,6 @@ __all__ = [
     "ScriptConsistencyChecker",
     "review_content_consistency",
     "review_content_consistency_to_json",
+    "review_many_consistency",
     "get_consistency_feedback",
 ]
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Benchmark ScriptConsistencyChecker on long scripts with many characters.
+
+Compares ``ScriptConsistencyChecker`` with ``PairwiseConsistencyChecker``, the
+previous implementation kept here as the reference: it compares every pair of
+names and maps contradiction matches to lines by counting newlines in the
+text before each match. Both are run on scripts of growing length - the
+number of characters grows with the script - and the time per line shows
+whether a checker scales linearly.
+
+Usage:
+    python T/Review/Script/Consistency/_meta/performance/bench_consistency.py
+    python T/Review/Script/Consistency/_meta/performance/bench_consistency.py --sizes 1000,16000
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[6]
+sys.path.insert(0, str(project_root))
+
+from T.Review.Script.Consistency.consistency_review import (
+    ConsistencyIssue,
+    ConsistencyIssueType,
+    ConsistencySeverity,
+    ScriptConsistencyChecker,
+)
+
+_SYLLABLES = (
+    "ka", "lo", "mi", "ren", "tas", "vor", "el", "dun", "sa", "bri", "gol", "fen", "ix", "per",
+    "qua", "zel", "thor", "wyn", "ad", "ny",
+)
+_CONSONANTS = "bcdfghjklmnprstvwz"
+_WORDS = (
+    "walked into the room and looked at the old map while the rain kept falling over "
+    "quiet streets where nobody had been seen since the storm began"
+).split()
+_CONTRADICTIONS = (
+    "She was never afraid, she always smiled.",
+    "He said he was alive and then dead tired.",
+    "They were married once but single now.",
+)
+
+
+def make_names(count: int, rng: random.Random) -> list:
+    """``count`` distinct capitalized names: a random onset plus syllables."""
+    names = set()
+    while len(names) < count:
+        onset = rng.choice(_CONSONANTS) + rng.choice("aeiou") + rng.choice(_CONSONANTS)
+        name = onset + "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 3)))
+        names.add(name.capitalize())
+    return sorted(names)
+
+
+def make_script(lines: int, characters: int = 0, seed: int = 17) -> str:
+    """Deterministic script of ``lines`` lines mentioning ``characters`` names.
+
+    ``characters`` defaults to one name per four lines.
+    """
+    rng = random.Random(seed)
+    names = make_names(characters or max(2, lines // 4), rng)
+    out = []
+    for _ in range(lines):
+        roll = rng.random()
+        if roll < 0.05:
+            out.append("")
+        elif roll < 0.08:
+            out.append(rng.choice(_CONTRADICTIONS))
+        else:
+            words = [rng.choice(_WORDS) for _ in range(rng.randint(5, 14))]
+            for _ in range(rng.randint(1, 2)):
+                words.insert(rng.randrange(len(words)), rng.choice(names))
+            out.append(" ".join(words) + ".")
+    return "\n".join(out)
+
+
+class PairwiseConsistencyChecker(ScriptConsistencyChecker):
+    """Reference: the pairwise name comparison and contradiction scan replaced by the index."""
+
+    def _check_character_consistency(self, character_mentions, review):
+        names = list(character_mentions.keys())
+        for i, name1 in enumerate(names):
+            for name2 in names[i + 1 :]:
+                if self._are_names_similar(name1, name2):
+                    review.add_issue(ConsistencyIssue(
+                        issue_type=ConsistencyIssueType.CHARACTER_NAME,
+                        severity=ConsistencySeverity.HIGH,
+                        location=f"Lines {', '.join(map(str, character_mentions[name1][:3]))}",
+                        description="Possible character name inconsistency",
+                        details=f"Character referred to as both '{name1}' and '{name2}'",
+                        suggestion="Use consistent name throughout script",
+                        related_locations=[
+                            f"Lines {', '.join(map(str, character_mentions[name2][:3]))}"
+                        ],
+                        confidence=75,
+                    ))
+
+    def _check_contradictions(self, lines, review, full_text=None, line_starts=None):
+        full_text = " ".join(lines).lower()
+        for pattern, contradiction_type in self.CONTRADICTION_PATTERNS:
+            for match in re.finditer(pattern, full_text, re.IGNORECASE):
+                line_num = full_text[: match.start()].count("\n") + 1
+                review.add_issue(ConsistencyIssue(
+                    issue_type=ConsistencyIssueType.CONTRADICTION,
+                    severity=ConsistencySeverity.MEDIUM,
+                    location=f"Around line {line_num}",
+                    description="Potential contradiction detected",
+                    details=f"Found potentially contradictory statements: {contradiction_type}",
+                    suggestion="Review for logical consistency",
+                    confidence=60,
+                ))
+
+
+def character_issues(review) -> list:
+    """Character name issues of a review as comparable tuples."""
+    return [
+        (issue.details, issue.location, tuple(issue.related_locations))
+        for issue in review.get_character_issues()
+    ]
+
+
+def time_review(checker, script, runs):
+    """Median seconds of ``runs`` reviews, and the last review."""
+    timings = []
+    review = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        review = checker.review_content(script)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), review
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the consistency checker")
+    parser.add_argument("--sizes", default="1000,2000,4000,8000,16000",
+                        help="Comma-separated script lengths in lines")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per checker (median)")
+    parser.add_argument("--reference-limit", type=int, default=4000,
+                        help="Longest script to run the quadratic reference on")
+    args = parser.parse_args(argv)
+
+    identical = True
+    print(f"{'lines':>7} {'names':>6} {'issues':>7} {'pairwise ms':>12} {'indexed ms':>11} "
+          f"{'us/line':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        script = make_script(size)
+        seconds, review = time_review(ScriptConsistencyChecker(), script, args.runs)
+        reference = "-"
+        if size <= args.reference_limit:
+            reference_seconds, reference_review = time_review(
+                PairwiseConsistencyChecker(), script, args.runs
+            )
+            reference = f"{reference_seconds * 1000:.1f}"
+            identical &= character_issues(review) == character_issues(reference_review)
+        print(f"{size:>7} {len(review.characters_found):>6} {len(review.issues):>7} "
+              f"{reference:>12} {seconds * 1000:>11.1f} {seconds / size * 1e6:>8.1f}")
+    print(f"Identical character issues: {'yes' if identical else 'NO'}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
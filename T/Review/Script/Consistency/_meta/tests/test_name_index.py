@@ -0,0 +1,106 @@
+"""Tests for the indexed name comparison and contradiction line mapping."""
+
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[6]
+sys.path.insert(0, str(project_root))
+
+from T.Review.Script.Consistency.consistency_review import (
+    ScriptConsistencyChecker,
+    similar_name_pairs,
+)
+
+_spec = importlib.util.spec_from_file_location(
+    "bench_consistency",
+    Path(__file__).resolve().parents[1] / "performance" / "bench_consistency.py",
+)
+bench = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench)
+
+
+def pairwise(names):
+    checker = ScriptConsistencyChecker()
+    return [
+        (i, j)
+        for i in range(len(names))
+        for j in range(i + 1, len(names))
+        if checker._are_names_similar(names[i], names[j])
+    ]
+
+
+class TestSimilarNamePairs:
+    def test_prefix_and_substring_pairs(self):
+        names = ["John", "Mary", "Johnny", "Jon", "Ann", "Joanna", "Annabel"]
+        assert similar_name_pairs(names) == pairwise(names)
+        assert (0, 2) in similar_name_pairs(names)  # John / Johnny
+        assert (4, 6) in similar_name_pairs(names)  # Ann / Annabel
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_same_pairs_as_comparing_every_pair(self, seed):
+        rng = random.Random(seed)
+        names = list(dict.fromkeys(
+            "".join(rng.choice("abAB") for _ in range(rng.randint(0, 5))) for _ in range(60)
+        ))
+        assert similar_name_pairs(names) == pairwise(names)
+
+    def test_generated_cast(self):
+        names = bench.make_names(300, random.Random(3))
+        assert similar_name_pairs(names) == pairwise(names)
+
+
+class TestCheckerOutput:
+    def test_same_character_issues_as_pairwise_reference(self):
+        script = bench.make_script(600)
+        review = ScriptConsistencyChecker().review_content(script)
+        reference = bench.PairwiseConsistencyChecker().review_content(script)
+        assert review.get_character_issues()
+        assert bench.character_issues(review) == bench.character_issues(reference)
+
+    def test_subclass_similarity_rule_is_used(self):
+        class ExactOnly(ScriptConsistencyChecker):
+            def _are_names_similar(self, name1, name2):
+                return False
+
+        script = "John met Johnny at noon."
+        assert not ExactOnly().review_content(script).get_character_issues()
+        assert ScriptConsistencyChecker().review_content(script).get_character_issues()
+
+
+class TestContradictions:
+    def test_reported_on_the_line_of_the_match(self):
+        script = "Line one.\nHe was never late but always early.\n\nShe is alive, not dead."
+        review = ScriptConsistencyChecker().review_content(script)
+        assert [issue.location for issue in review.get_contradiction_issues()] == [
+            "Around line 2",
+            "Around line 4",
+        ]
+
+    def test_span_lines(self):
+        script = (
+            "The old captain was alive and well.\nHe sailed north.\n"
+            "By winter the captain was dead."
+        )
+        review = ScriptConsistencyChecker().review_content(script)
+        [issue] = review.get_contradiction_issues()
+        assert issue.location == "Around line 1"
+        assert "life_state_contradiction" in issue.details
+        assert review.overall_score < 100
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_same_contradictions_as_space_joined_reference(self, seed):
+        rng = random.Random(seed)
+        words = ["never", "always", "alive", "dead", "married", "single", "the", "ship", "No"]
+        script = "\n".join(
+            " ".join(rng.choice(words) for _ in range(rng.randint(1, 6))) for _ in range(40)
+        )
+        found = ScriptConsistencyChecker().review_content(script)
+        reference = bench.PairwiseConsistencyChecker().review_content(script)
+        assert [i.details for i in found.get_contradiction_issues()] == [
+            i.details for i in reference.get_contradiction_issues()
+        ]
@@ -14,11 +14,62 @@ Workflow Position:
 """
 
 import re
+from bisect import bisect_right
 from collections import defaultdict
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from ..bulk_review import DEFAULT_CHUNK_SIZE, BulkReviewResult, ScriptInput, review_many
+from ..incremental_review import LineResults, incremental_reviewer
+from ..script_analysis import ScriptAnalysis, analyze_script
+
+
+class LineFacts(NamedTuple):
+    """What one line contributes to the consistency checks."""
+
+    names: Dict[str, int]  # character name -> mentions on the line
+    locations: Dict[str, int]  # location -> mentions on the line
+    timeline: List[str]  # timeline indicators on the line
+
+
+def similar_name_pairs(names: Sequence[str]) -> List[Tuple[int, int]]:
+    """Index pairs ``(i, j)``, ``i < j``, of names that may be variations of each other.
+
+    Two names are similar when one contains the other or they share their
+    first three letters (case-insensitive). Instead of comparing every pair,
+    names are bucketed by their 3-letter prefix, and every substring of a
+    name is looked up in a table of the names, so the cost follows the
+    number of names (and similar pairs), not its square.
+
+    Returns:
+        The pairs in the order a nested loop over ``names`` would find them
+    """
+    lowered = [name.lower() for name in names]
+
+    by_name: Dict[str, List[int]] = defaultdict(list)
+    by_prefix: Dict[str, List[int]] = defaultdict(list)
+    for index, name in enumerate(lowered):
+        by_name[name].append(index)
+        if len(names[index]) >= 3:
+            by_prefix[name[:3]].append(index)
+
+    pairs: Set[Tuple[int, int]] = set()
+    for bucket in by_prefix.values():
+        for position, first in enumerate(bucket):
+            pairs.update((first, second) for second in bucket[position + 1 :])
+
+    for index, name in enumerate(lowered):
+        parts = {""}
+        for start in range(len(name)):
+            parts.update(name[start:end] for end in range(start + 1, len(name) + 1))
+        for part in parts:
+            for other in by_name.get(part, ()):
+                if other != index:
+                    pairs.add((min(index, other), max(index, other)))
+
+    return sorted(pairs)
 
 
 class ConsistencyIssueType(Enum):
@@ -474,7 +525,11 @@ class ScriptConsistencyChecker:
         self.pass_threshold = pass_threshold
 
     def review_content(
-        self, content_text: str, content_id: str = "script-001", script_version: str = "v3"
+        self,
+        content_text: str,
+        content_id: str = "script-001",
+        script_version: str = "v3",
+        analysis: Optional[ScriptAnalysis] = None,
     ) -> ConsistencyReview:
         """Review a script for consistency issues.
 
@@ -482,39 +537,90 @@ class ScriptConsistencyChecker:
             content_text: The script text to review
             content_id: Identifier for the script
             script_version: Version of the script (v3, v4, etc.)
+            analysis: Shared tokenization of ``content_text`` (looked up
+                with ``analyze_script`` when omitted)
 
         Returns:
             ConsistencyReview object with all detected issues
         """
-        review = ConsistencyReview(
-            content_id=content_id, script_version=script_version, pass_threshold=self.pass_threshold
-        )
+        analysis = analysis or analyze_script(content_text)
+        results = self.check_lines(analysis)
+        return self.complete_review(analysis, results, content_id, script_version)
 
-        # Split script into lines for analysis
-        lines = content_text.split("\n")
+    def check_lines(
+        self, analysis: ScriptAnalysis, line_numbers: Optional[List[int]] = None
+    ) -> LineResults:
+        """Collect the character names, locations and timeline markers of each line.
 
-        # Track elements throughout the script
-        character_mentions = defaultdict(list)  # name -> [line_numbers]
-        location_mentions = defaultdict(list)  # location -> [line_numbers]
+        Consistency issues are global, so this only records facts per line
+        for ``complete_review``.
+
+        Args:
+            analysis: The script to check
+            line_numbers: Non-blank lines to check (default: all of them)
 
-        # Check each line
-        for line_num, line in enumerate(lines, start=1):
-            if not line.strip():
-                continue
+        Returns:
+            A ``LineFacts`` per line that mentions anything
+        """
+        lines = analysis.lines
+        if line_numbers is None:
+            line_numbers = analysis.content_lines
+
+        results = LineResults()
+        for line_num in line_numbers:
+            index = line_num - 1
+            line = lines[index]
+            line_lower = analysis.lowered[index]
 
             # Track character names
-            self._track_characters(line, line_num, character_mentions)
+            names: Dict[str, List[int]] = defaultdict(list)
+            self._track_characters(line, line_num, names, analysis.capitalized[index])
 
             # Track locations
-            self._track_locations(line, line_num, location_mentions)
+            locations: Dict[str, List[int]] = defaultdict(list)
+            self._track_locations(line, line_num, locations, line_lower)
 
             # Check for timeline markers
-            self._check_timeline(line, line_num, review)
+            markers = self._timeline_markers(line_lower)
+
+            if names or locations or markers:
+                results.facts[line_num] = LineFacts(
+                    {name: len(found) for name, found in names.items()},
+                    {location: len(found) for location, found in locations.items()},
+                    markers,
+                )
+        return results
+
+    def complete_review(
+        self,
+        analysis: ScriptAnalysis,
+        results: LineResults,
+        content_id: str = "script-001",
+        script_version: str = "v3",
+    ) -> ConsistencyReview:
+        """Build the review from line facts: names, timeline, contradictions, scores."""
+        review = ConsistencyReview(
+            content_id=content_id, script_version=script_version, pass_threshold=self.pass_threshold
+        )
+        lines = analysis.lines
+
+        # Track elements throughout the script
+        character_mentions = defaultdict(list)  # name -> [line_numbers]
+        location_mentions = defaultdict(list)  # location -> [line_numbers]
+        for line_num in sorted(results.facts):
+            facts = results.facts[line_num]
+            for name, count in facts.names.items():
+                character_mentions[name].extend([line_num] * count)
+            for location, count in facts.locations.items():
+                location_mentions[location].extend([line_num] * count)
+            review.timeline_events.extend(
+                f"Line {line_num}: {indicator}" for indicator in facts.timeline
+            )
 
         # Analyze tracked elements for consistency
         self._check_character_consistency(character_mentions, review)
         self._check_location_consistency(location_mentions, review)
-        self._check_contradictions(lines, review)
+        self._check_contradictions(lines, review, analysis.lower_text, analysis.line_starts)
 
         # Update review with found elements
         review.characters_found = set(character_mentions.keys())
@@ -543,21 +649,31 @@ class ScriptConsistencyChecker:
         return review
 
     def _track_characters(
-        self, line: str, line_num: int, character_mentions: Dict[str, List[int]]
+        self,
+        line: str,
+        line_num: int,
+        character_mentions: Dict[str, List[int]],
+        words: Optional[List[str]] = None,
     ) -> None:
         """Track character names mentioned in the line."""
         # Find capitalized words (potential character names)
-        words = re.findall(r"\b([A-Z][a-z]+)\b", line)
+        if words is None:
+            words = re.findall(r"\b([A-Z][a-z]+)\b", line)
 
         for word in words:
             if word not in self.COMMON_NON_NAME_WORDS and len(word) > 2:
                 character_mentions[word].append(line_num)
 
     def _track_locations(
-        self, line: str, line_num: int, location_mentions: Dict[str, List[int]]
+        self,
+        line: str,
+        line_num: int,
+        location_mentions: Dict[str, List[int]],
+        line_lower: Optional[str] = None,
     ) -> None:
         """Track locations mentioned in the line."""
-        line_lower = line.lower()
+        if line_lower is None:
+            line_lower = line.lower()
 
         # Look for location patterns
         for keyword in self.LOCATION_KEYWORDS:
@@ -571,13 +687,23 @@ class ScriptConsistencyChecker:
                         if location and len(location) > 2:
                             location_mentions[location].append(line_num)
 
-    def _check_timeline(self, line: str, line_num: int, review: ConsistencyReview) -> None:
+    def _check_timeline(
+        self,
+        line: str,
+        line_num: int,
+        review: ConsistencyReview,
+        line_lower: Optional[str] = None,
+    ) -> None:
         """Check for timeline markers and record them."""
-        line_lower = line.lower()
+        if line_lower is None:
+            line_lower = line.lower()
+
+        for indicator in self._timeline_markers(line_lower):
+            review.timeline_events.append(f"Line {line_num}: {indicator}")
 
-        for indicator in self.TIMELINE_INDICATORS:
-            if indicator in line_lower:
-                review.timeline_events.append(f"Line {line_num}: {indicator}")
+    def _timeline_markers(self, line_lower: str) -> List[str]:
+        """Timeline indicators that occur in a lowercased line."""
+        return [indicator for indicator in self.TIMELINE_INDICATORS if indicator in line_lower]
 
     def _check_character_consistency(
         self, character_mentions: Dict[str, List[int]], review: ConsistencyReview
@@ -586,23 +712,31 @@ class ScriptConsistencyChecker:
         # Look for similar names that might be variations
         names = list(character_mentions.keys())
 
-        for i, name1 in enumerate(names):
-            for name2 in names[i + 1 :]:
-                # Check if names are similar (could be variations)
-                if self._are_names_similar(name1, name2):
-                    issue = ConsistencyIssue(
-                        issue_type=ConsistencyIssueType.CHARACTER_NAME,
-                        severity=ConsistencySeverity.HIGH,
-                        location=f"Lines {', '.join(map(str, character_mentions[name1][:3]))}",
-                        description=f"Possible character name inconsistency",
-                        details=f"Character referred to as both '{name1}' and '{name2}'",
-                        suggestion=f"Use consistent name throughout script",
-                        related_locations=[
-                            f"Lines {', '.join(map(str, character_mentions[name2][:3]))}"
-                        ],
-                        confidence=75,
-                    )
-                    review.add_issue(issue)
+        if type(self)._are_names_similar is ScriptConsistencyChecker._are_names_similar:
+            pairs = [(names[i], names[j]) for i, j in similar_name_pairs(names)]
+        else:
+            # A subclass has its own notion of similar names: compare every pair
+            pairs = [
+                (name1, name2)
+                for i, name1 in enumerate(names)
+                for name2 in names[i + 1 :]
+                if self._are_names_similar(name1, name2)
+            ]
+
+        for name1, name2 in pairs:
+            issue = ConsistencyIssue(
+                issue_type=ConsistencyIssueType.CHARACTER_NAME,
+                severity=ConsistencySeverity.HIGH,
+                location=f"Lines {', '.join(map(str, character_mentions[name1][:3]))}",
+                description=f"Possible character name inconsistency",
+                details=f"Character referred to as both '{name1}' and '{name2}'",
+                suggestion=f"Use consistent name throughout script",
+                related_locations=[
+                    f"Lines {', '.join(map(str, character_mentions[name2][:3]))}"
+                ],
+                confidence=75,
+            )
+            review.add_issue(issue)
 
     def _are_names_similar(self, name1: str, name2: str) -> bool:
         """Check if two names are similar enough to be variations."""
@@ -625,16 +759,35 @@ class ScriptConsistencyChecker:
         # more sophisticated NLP to detect location contradictions
         pass
 
-    def _check_contradictions(self, lines: List[str], review: ConsistencyReview) -> None:
-        """Check for internal contradictions in the script."""
-        full_text = " ".join(lines).lower()
+    def _check_contradictions(
+        self,
+        lines: List[str],
+        review: ConsistencyReview,
+        full_text: Optional[str] = None,
+        line_starts: Optional[List[int]] = None,
+    ) -> None:
+        """Check for internal contradictions in the script.
+
+        Contradiction patterns are matched across lines (``re.DOTALL``), so
+        the two statements may be far apart; a match is reported on the line
+        where it starts.
+
+        Args:
+            lines: Lines of the script
+            review: Review to add issues to
+            full_text: ``"\\n".join(lines).lower()``, when already computed
+            line_starts: Offset of each line in ``full_text``
+        """
+        if full_text is None:
+            full_text = "\n".join(lines).lower()
+        if line_starts is None:
+            line_starts = ScriptAnalysis(full_text).line_starts
 
         for pattern, contradiction_type in self.CONTRADICTION_PATTERNS:
-            matches = re.finditer(pattern, full_text, re.IGNORECASE)
+            matches = re.finditer(pattern, full_text, re.IGNORECASE | re.DOTALL)
             for match in matches:
-                # Find approximate line number
-                pos = match.start()
-                line_num = full_text[:pos].count("\n") + 1
+                # Line of the match start, from the line offsets
+                line_num = bisect_right(line_starts, match.start())
 
                 issue = ConsistencyIssue(
                     issue_type=ConsistencyIssueType.CONTRADICTION,
@@ -753,6 +906,7 @@ def review_content_consistency(
     content_id: str = "script-001",
     script_version: str = "v3",
     pass_threshold: int = 80,
+    incremental: bool = False,
 ) -> ConsistencyReview:
     """Convenience function to review script consistency.
 
@@ -761,6 +915,8 @@ def review_content_consistency(
         content_id: Identifier for the script
         script_version: Version of the script
         pass_threshold: Minimum score required to pass
+        incremental: Re-check only the lines changed since the last review
+            of ``content_id`` in this process (see ``IncrementalReviewer``)
 
     Returns:
         ConsistencyReview object with all detected issues
@@ -773,10 +929,38 @@ def review_content_consistency(
         >>> for issue in review.issues:
         ...     print(f"{issue.location}: {issue.description}")
     """
+    if incremental:
+        reviewer = incremental_reviewer(ScriptConsistencyChecker, pass_threshold)
+        return reviewer.review_content(content_text, content_id, script_version)
+
     checker = ScriptConsistencyChecker(pass_threshold=pass_threshold)
     return checker.review_content(content_text, content_id, script_version)
 
 
+def review_many_consistency(
+    scripts: Iterable[ScriptInput],
+    workers: Optional[int] = None,
+    pass_threshold: int = 80,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[BulkReviewResult]:
+    """Review the consistency of many scripts in a process pool.
+
+    Args:
+        scripts: Script texts or ``(content_id, text[, script_version])`` tuples
+        workers: Worker processes (default: ``PRISMQ_REVIEW_WORKERS`` or all cores)
+        pass_threshold: Minimum score required to pass
+        chunk_size: Scripts sent to a worker at a time
+
+    Returns:
+        Iterator of ``BulkReviewResult`` in input order (see ``bulk_review.review_many``)
+
+    Example:
+        >>> for result in review_many_consistency(archive, workers=8):
+        ...     print(result.content_id, result.review.overall_score)
+    """
+    return review_many(scripts, ScriptConsistencyChecker, workers, chunk_size, pass_threshold)
+
+
 def review_content_consistency_to_json(
     content_text: str,
     content_id: str = "script-001",
@@ -6,7 +6,7 @@ This module provides services for processing consistency reviews:
 - process_all_consistency_reviews: Process all pending stories
 """
 
-from T.Review.Content.Consistency.src.script_consistency_review_service import (
+from .script_consistency_review_service import (
     DEFAULT_PASS_THRESHOLD,
     STATE_REVIEW_SCRIPT_CONSISTENCY,
     STATE_REVIEW_SCRIPT_CONTENT,
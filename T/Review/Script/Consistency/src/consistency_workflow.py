@@ -35,6 +35,7 @@ except ImportError:
 
 try:
     from script_consistency_review_service import ScriptConsistencyReviewService
+    from Model.Infrastructure.workflow import StageTelemetry
     SERVICE_AVAILABLE = True
 except Exception as e:
     SERVICE_AVAILABLE = False
@@ -108,6 +109,7 @@ def main():
         return 1
 
     service = ScriptConsistencyReviewService(conn)
+    telemetry = StageTelemetry("14")
 
     run_count = 0
     total_processed = 0
@@ -133,7 +135,7 @@ def main():
 
             print_success(f"Found {pending_count} stories ready for consistency review")
 
-            result = service.process_oldest_story()
+            result = telemetry.run(service.process_oldest_story)
 
             if result.story_id is None:
                 print_warning("No story found to process")
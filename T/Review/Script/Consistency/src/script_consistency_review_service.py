@@ -5,10 +5,8 @@ On PASS → REVIEW_CONTENT_CONTENT
 On FAIL → TITLE_FROM_TITLE_REVIEW_CONTENT (module 08 — soft title improvement)
 """
 
-import json
 import logging
 import os
-import re
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
@@ -19,6 +17,9 @@ from Model.Database.models.review import Review
 from Model.Database.repositories.review_repository import ReviewRepository
 from Model.Database.repositories.content_repository import ContentRepository
 from Model.Database.repositories.story_repository import StoryRepository
+from Model.Infrastructure.ollama import run_review
+from Model.Infrastructure.tracing import traced
+from Model.Repositories.story_retry_repository import RETRY_READY_SQL, StoryRetryRepository
 from Model import StateNames
 
 logger = logging.getLogger(__name__)
@@ -65,59 +66,25 @@ class ScriptConsistencyReviewService:
         self.story_repo = StoryRepository(connection)
         self.content_repo = ContentRepository(connection)
         self.review_repo = ReviewRepository(connection)
+        self.retry_repo = StoryRetryRepository(connection)
 
     def _ai_review(self, content_text: str, title_text: str) -> Tuple[str, int]:
         """Call Ollama for consistency review. Returns (feedback, score)."""
-        try:
-            import requests as _requests
-        except ImportError as exc:
-            raise RuntimeError("requests library not available; run: pip install requests") from exc
-
-        template = (_PROMPTS_DIR / "review_consistency.txt").read_text(encoding="utf-8")
-        prompt = template.format(
-            title_text=title_text,
-            content_text=content_text[:_MAX_CONTENT_PREVIEW_LENGTH],
+        return run_review(
+            _AI_MODEL,
+            _PROMPTS_DIR / "review_consistency.txt",
+            {"title_text": title_text, "content_text": content_text[:_MAX_CONTENT_PREVIEW_LENGTH]},
+            default_feedback="AI consistency review completed.",
+            temperature=_AI_TEMPERATURE,
+            max_tokens=_AI_MAX_TOKENS,
+            timeout=_AI_TIMEOUT,
         )
 
-        try:
-            check = _requests.get("http://localhost:11434/api/tags", timeout=5)
-            if check.status_code != 200:
-                raise RuntimeError(f"Ollama not available (status {check.status_code})")
-        except _requests.exceptions.RequestException as exc:
-            raise RuntimeError(f"Ollama not reachable: {exc}") from exc
-
-        try:
-            response = _requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": _AI_MODEL,
-                    "prompt": prompt,
-                    "stream": False,
-                    "think": False,
-                    "options": {"temperature": _AI_TEMPERATURE, "num_predict": _AI_MAX_TOKENS, "num_ctx": 4096},
-                },
-                timeout=_AI_TIMEOUT,
-            )
-            response.raise_for_status()
-            raw = response.json().get("response", "").strip()
-        except _requests.exceptions.RequestException as exc:
-            raise RuntimeError(f"Ollama API call failed: {exc}") from exc
-
-        raw = re.sub(r"<think>.*?</think>", "", raw, flags=re.DOTALL).strip()
-
-        match = re.search(r"\{.*\}", raw, re.DOTALL)
-        if not match:
-            raise ValueError(f"No JSON in AI response: {raw[:200]}")
-        data = json.loads(match.group())
-        score = max(0, min(100, int(data.get("overall_score", 50))))
-        feedback = str(data.get("feedback", "AI consistency review completed."))
-
-        return feedback, score
-
+    @traced("fetch")
     def _fetch_story(self) -> Optional[sqlite3.Row]:
         """Fetch the next story to process with priority ordering."""
         cursor = self._conn.execute(
-            """
+            f"""
             SELECT
                 s.id          AS story_id,
                 t.id          AS title_id,
@@ -135,6 +102,7 @@ class ScriptConsistencyReviewService:
                 AND c.version = (SELECT MAX(c2.version) FROM Content c2 WHERE c2.story_id = s.id)
             LEFT JOIN Review r ON r.id = c.review_id
             WHERE s.state = ?
+              AND {RETRY_READY_SQL}
             ORDER BY c.version ASC, COALESCE(r.score, 0) DESC, s.created_at ASC
             LIMIT 1
             """,
@@ -142,6 +110,30 @@ class ScriptConsistencyReviewService:
         )
         return cursor.fetchone()
 
+    @traced("commit")
+    def _save_review(
+        self, row: sqlite3.Row, feedback: str, score: int, result: ConsistencyReviewResult
+    ) -> None:
+        """Store the review, link it to the content and move the story on."""
+        review = Review(text=feedback, score=score, created_at=datetime.now())
+        review = self.review_repo.insert(review)
+        result.review_id = review.id
+
+        self._conn.execute(
+            "UPDATE Content SET review_id = ? WHERE id = ?",
+            (review.id, row["content_id"]),
+        )
+        self._conn.commit()
+
+        result.text = feedback
+        result.score = score
+        result.passes = score >= _PASS_THRESHOLD
+        result.next_state = OUTPUT_STATE_PASS if result.passes else OUTPUT_STATE_FAIL
+
+        story = self.story_repo.find_by_id(row["story_id"])
+        story.state = result.next_state
+        self.story_repo.update(story)
+
     def process_oldest_story(self) -> ConsistencyReviewResult:
         """Process the oldest story in REVIEW_CONTENT_CONSISTENCY state."""
         row = self._fetch_story()
@@ -159,24 +151,7 @@ class ScriptConsistencyReviewService:
                 title_text=row["title_text"],
             )
 
-            review = Review(text=feedback, score=score, created_at=datetime.now())
-            review = self.review_repo.insert(review)
-            result.review_id = review.id
-
-            self._conn.execute(
-                "UPDATE Content SET review_id = ? WHERE id = ?",
-                (review.id, row["content_id"]),
-            )
-            self._conn.commit()
-
-            result.text = feedback
-            result.score = score
-            result.passes = score >= _PASS_THRESHOLD
-            result.next_state = OUTPUT_STATE_PASS if result.passes else OUTPUT_STATE_FAIL
-
-            story = self.story_repo.find_by_id(row["story_id"])
-            story.state = result.next_state
-            self.story_repo.update(story)
+            self._save_review(row, feedback, score, result)
 
             result.success = True
             logger.info(
@@ -187,6 +162,9 @@ class ScriptConsistencyReviewService:
         except Exception as e:
             result.error = f"Consistency review failed: {str(e)}"
             logger.exception(f"Error processing story {row['story_id']}")
+            retry = self.retry_repo.record_failure(row["story_id"], INPUT_STATE, result.error)
+            if retry.is_dead_lettered:
+                result.error += f" (dead-lettered after {retry.attempts} attempts)"
 
         return result
 
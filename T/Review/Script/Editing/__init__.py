@@ -20,6 +20,7 @@ from .script_editing_review import (
     get_editing_feedback,
     review_content_editing,
     review_content_editing_to_json,
+    review_many_editing,
 )
 
 __all__ = [
@@ -32,5 +33,6 @@ __all__ = [
     "ScriptEditingChecker",
     "review_content_editing",
     "review_content_editing_to_json",
+    "review_many_editing",
     "get_editing_feedback",
 ]
@@ -16,7 +16,11 @@ Workflow Position:
 import json
 import re
 from dataclasses import asdict
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..bulk_review import DEFAULT_CHUNK_SIZE, BulkReviewResult, ScriptInput, review_many
+from ..incremental_review import LineResults, incremental_reviewer
+from ..script_analysis import ScriptAnalysis, analyze_script
 
 # Import EditingReview model classes from local module
 from .editing_review import (
@@ -139,7 +143,11 @@ class ScriptEditingChecker:
         ]
 
     def review_content(
-        self, content_text: str, content_id: str = "script-001", script_version: str = "v3"
+        self,
+        content_text: str,
+        content_id: str = "script-001",
+        script_version: str = "v3",
+        analysis: Optional[ScriptAnalysis] = None,
     ) -> EditingReview:
         """Review a script for editing quality, clarity, and flow.
 
@@ -147,36 +155,77 @@ class ScriptEditingChecker:
             content_text: The script text to review
             content_id: Identifier for the script
             script_version: Version of the script (v3, v4, etc.)
+            analysis: Shared tokenization of ``content_text`` (looked up
+                with ``analyze_script`` when omitted)
 
         Returns:
             EditingReview object with all detected issues
         """
-        review = EditingReview(
-            content_id=content_id, script_version=script_version, pass_threshold=self.pass_threshold
-        )
+        analysis = analysis or analyze_script(content_text)
+        results = self.check_lines(analysis)
+        return self.complete_review(analysis, results, content_id, script_version)
+
+    def check_lines(
+        self, analysis: ScriptAnalysis, line_numbers: Optional[List[int]] = None
+    ) -> LineResults:
+        """Run the line-local checks: wordiness, redundancy, clarity, transitions.
 
-        # Split script into lines for line-by-line analysis
-        lines = content_text.split("\n")
+        Args:
+            analysis: The script to check
+            line_numbers: Non-blank lines to check (default: all of them)
 
-        # Check each line
-        for line_num, line in enumerate(lines, start=1):
-            if not line.strip():
-                continue
+        Returns:
+            Issues per line
+        """
+        lines = analysis.lines
+        if line_numbers is None:
+            line_numbers = analysis.content_lines
+
+        # Only phrases that occur somewhere in the script need a per-line check
+        wordy_phrases = [
+            (wordy, self.wordy_phrases[wordy]) for wordy in analysis.present(self.wordy_phrases)
+        ]
+        redundant_pairs = analysis.present(self.redundant_pairs)
+
+        collected = EditingReview(content_id=analysis.digest)
+        for line_num in line_numbers:
+            index = line_num - 1
+            line = lines[index]
+            line_lower = analysis.lowered[index]
 
             # Check for wordiness
-            self._check_wordiness(line, line_num, review)
+            self._check_wordiness(line, line_num, collected, line_lower, wordy_phrases)
 
             # Check for redundancy
-            self._check_redundancy(line, line_num, review)
+            self._check_redundancy(
+                line, line_num, collected, line_lower, analysis.words[index], redundant_pairs
+            )
 
             # Check for clarity (passive voice, complex structures)
-            self._check_clarity(line, line_num, review)
+            self._check_clarity(line, line_num, collected, analysis.word_counts[index])
 
             # Check for weak transitions
-            self._check_transitions(line, line_num, review)
+            self._check_transitions(line, line_num, collected, line_lower)
+
+        return LineResults.from_issues(collected.issues)
+
+    def complete_review(
+        self,
+        analysis: ScriptAnalysis,
+        results: LineResults,
+        content_id: str = "script-001",
+        script_version: str = "v3",
+    ) -> EditingReview:
+        """Build the review from line results: overall flow, score and feedback."""
+        review = EditingReview(
+            content_id=content_id, script_version=script_version, pass_threshold=self.pass_threshold
+        )
+        for issue in results.ordered_issues():
+            review.add_issue(issue)
+        lines = analysis.lines
 
         # Check overall flow and structure
-        self._check_overall_flow(lines, review)
+        self._check_overall_flow(lines, review, analysis.paragraph_lengths)
 
         # Calculate overall score based on issues
         review.overall_score = self._calculate_score(review)
@@ -212,11 +261,21 @@ class ScriptEditingChecker:
         else:
             return replacement.lower()
 
-    def _check_wordiness(self, line: str, line_num: int, review: EditingReview) -> None:
+    def _check_wordiness(
+        self,
+        line: str,
+        line_num: int,
+        review: EditingReview,
+        line_lower: Optional[str] = None,
+        wordy_phrases: Optional[List[Tuple[str, str]]] = None,
+    ) -> None:
         """Check for wordy phrases that can be simplified."""
-        line_lower = line.lower()
+        if line_lower is None:
+            line_lower = line.lower()
+        if wordy_phrases is None:
+            wordy_phrases = list(self.wordy_phrases.items())
 
-        for wordy, concise in self.wordy_phrases.items():
+        for wordy, concise in wordy_phrases:
             if wordy in line_lower:
                 # Find the phrase in the original line (preserve case)
                 pattern = re.compile(re.escape(wordy), re.IGNORECASE)
@@ -243,12 +302,23 @@ class ScriptEditingChecker:
                     review.add_issue(issue)
                     break  # Only flag one wordy phrase per line
 
-    def _check_redundancy(self, line: str, line_num: int, review: EditingReview) -> None:
+    def _check_redundancy(
+        self,
+        line: str,
+        line_num: int,
+        review: EditingReview,
+        line_lower: Optional[str] = None,
+        words: Optional[List[str]] = None,
+        redundant_pairs: Optional[List[str]] = None,
+    ) -> None:
         """Check for redundant phrases and repetitive content."""
-        line_lower = line.lower()
+        if line_lower is None:
+            line_lower = line.lower()
+        if redundant_pairs is None:
+            redundant_pairs = self.redundant_pairs
 
         # Check for redundant pairs
-        for redundant in self.redundant_pairs:
+        for redundant in redundant_pairs:
             if redundant in line_lower:
                 # Suggest removing the redundant part
                 parts = redundant.split()
@@ -274,7 +344,8 @@ class ScriptEditingChecker:
                         break
 
         # Check for repeated words (simple check)
-        words = re.findall(r"\b\w+\b", line_lower)
+        if words is None:
+            words = re.findall(r"\b\w+\b", line_lower)
         for i in range(len(words) - 1):
             if words[i] == words[i + 1] and len(words[i]) > 3:  # Ignore short words
                 issue = EditingIssue(
@@ -289,11 +360,15 @@ class ScriptEditingChecker:
                 review.add_issue(issue)
                 break  # Only flag once per line
 
-    def _check_clarity(self, line: str, line_num: int, review: EditingReview) -> None:
+    def _check_clarity(
+        self, line: str, line_num: int, review: EditingReview, word_count: Optional[int] = None
+    ) -> None:
         """Check for clarity issues like passive voice and complex structures."""
         stripped = line.strip()
         if not stripped or len(stripped) < 10:
             return
+        if word_count is None:
+            word_count = len(stripped.split())
 
         # Skip dialogue lines and formatting
         if stripped.startswith(("[", "(", "*", "-", "INT.", "EXT.")):
@@ -302,7 +377,7 @@ class ScriptEditingChecker:
         # Check for passive voice
         for pattern, suggestion_text in self.passive_indicators:
             matches = list(re.finditer(pattern, line, re.IGNORECASE))
-            if matches and len(stripped.split()) > 8:  # Only flag longer sentences
+            if matches and word_count > 8:  # Only flag longer sentences
                 # Check if this is likely narrative (not dialogue)
                 if not any(char in stripped for char in ['"', "'"]):
                     match = matches[0]
@@ -319,21 +394,23 @@ class ScriptEditingChecker:
                     break  # Only flag once per line
 
         # Check for overly long sentences
-        if len(stripped.split()) > 30:
+        if word_count > 30:
             issue = EditingIssue(
                 issue_type=EditingIssueType.CLARITY,
                 severity=EditingSeverity.MEDIUM,
                 line_number=line_num,
                 text=stripped,
                 suggestion="Consider breaking into shorter sentences",
-                explanation=f"Long sentence ({len(stripped.split())} words) may be hard to follow",
+                explanation=f"Long sentence ({word_count} words) may be hard to follow",
                 confidence=75,
             )
             review.add_issue(issue)
 
-    def _check_transitions(self, line: str, line_num: int, review: EditingReview) -> None:
+    def _check_transitions(
+        self, line: str, line_num: int, review: EditingReview, line_lower: Optional[str] = None
+    ) -> None:
         """Check for weak or missing transitions."""
-        line_lower = line.lower().strip()
+        line_lower = (line.lower() if line_lower is None else line_lower).strip()
 
         # Check if line starts with a weak transition
         for weak in self.weak_transitions:
@@ -350,42 +427,33 @@ class ScriptEditingChecker:
                 review.add_issue(issue)
                 break
 
-    def _check_overall_flow(self, lines: List[str], review: EditingReview) -> None:
+    def _check_overall_flow(
+        self,
+        lines: List[str],
+        review: EditingReview,
+        paragraph_lengths: Optional[List[int]] = None,
+    ) -> None:
         """Check overall flow and structure of the script."""
         # Check for very short paragraphs (single line followed by blank)
-        non_empty_lines = [(i + 1, line) for i, line in enumerate(lines) if line.strip()]
-
-        if len(non_empty_lines) > 10:
-            # Check paragraph variety
-            paragraph_lengths = []
-            current_para_length = 0
-
-            for i, line in enumerate(lines):
-                if line.strip():
-                    current_para_length += 1
-                else:
-                    if current_para_length > 0:
-                        paragraph_lengths.append(current_para_length)
-                        current_para_length = 0
-
-            if current_para_length > 0:
-                paragraph_lengths.append(current_para_length)
-
-            # If all paragraphs are very short or very long, flag as structure issue
-            if paragraph_lengths:
-                avg_length = sum(paragraph_lengths) / len(paragraph_lengths)
-                if avg_length < 1.5 and len(paragraph_lengths) > 5:
-                    # Too many single-line paragraphs
-                    issue = EditingIssue(
-                        issue_type=EditingIssueType.STRUCTURE,
-                        severity=EditingSeverity.LOW,
-                        line_number=1,
-                        text="Overall script structure",
-                        suggestion="Consider combining some single-line paragraphs for better flow",
-                        explanation="Many single-line paragraphs can make the script feel choppy",
-                        confidence=60,
-                    )
-                    review.add_issue(issue)
+        if paragraph_lengths is None:
+            paragraph_lengths = ScriptAnalysis("\n".join(lines)).paragraph_lengths
+
+        # Only judge paragraph variety in scripts with more than 10 lines of text
+        if sum(paragraph_lengths) > 10:
+            # If all paragraphs are very short, flag as structure issue
+            avg_length = sum(paragraph_lengths) / len(paragraph_lengths)
+            if avg_length < 1.5 and len(paragraph_lengths) > 5:
+                # Too many single-line paragraphs
+                issue = EditingIssue(
+                    issue_type=EditingIssueType.STRUCTURE,
+                    severity=EditingSeverity.LOW,
+                    line_number=1,
+                    text="Overall script structure",
+                    suggestion="Consider combining some single-line paragraphs for better flow",
+                    explanation="Many single-line paragraphs can make the script feel choppy",
+                    confidence=60,
+                )
+                review.add_issue(issue)
 
     def _calculate_score(self, review: EditingReview) -> int:
         """Calculate overall editing score based on issues.
@@ -463,6 +531,7 @@ def review_content_editing(
     content_id: str = "script-001",
     script_version: str = "v3",
     pass_threshold: int = 85,
+    incremental: bool = False,
 ) -> EditingReview:
     """Convenience function to review script editing quality.
 
@@ -471,6 +540,8 @@ def review_content_editing(
         content_id: Identifier for the script
         script_version: Version of the script
         pass_threshold: Minimum score required to pass
+        incremental: Re-check only the lines changed since the last review
+            of ``content_id`` in this process (see ``IncrementalReviewer``)
 
     Returns:
         EditingReview object with all detected issues
@@ -483,10 +554,38 @@ def review_content_editing(
         >>> for issue in review.issues:
         ...     print(f"Line {issue.line_number}: {issue.explanation}")
     """
+    if incremental:
+        reviewer = incremental_reviewer(ScriptEditingChecker, pass_threshold)
+        return reviewer.review_content(content_text, content_id, script_version)
+
     checker = ScriptEditingChecker(pass_threshold=pass_threshold)
     return checker.review_content(content_text, content_id, script_version)
 
 
+def review_many_editing(
+    scripts: Iterable[ScriptInput],
+    workers: Optional[int] = None,
+    pass_threshold: int = 85,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[BulkReviewResult]:
+    """Review the editing of many scripts in a process pool.
+
+    Args:
+        scripts: Script texts or ``(content_id, text[, script_version])`` tuples
+        workers: Worker processes (default: ``PRISMQ_REVIEW_WORKERS`` or all cores)
+        pass_threshold: Minimum score required to pass
+        chunk_size: Scripts sent to a worker at a time
+
+    Returns:
+        Iterator of ``BulkReviewResult`` in input order (see ``bulk_review.review_many``)
+
+    Example:
+        >>> for result in review_many_editing(archive, workers=8):
+        ...     print(result.content_id, result.review.overall_score)
+    """
+    return review_many(scripts, ScriptEditingChecker, workers, chunk_size, pass_threshold)
+
+
 def review_content_editing_to_json(
     content_text: str,
     content_id: str = "script-001",
@@ -12,10 +12,8 @@ Escalate → REVIEW_TITLE_FROM_CONTENT [07] (title + content realignment)
 Priority: c.version ASC, COALESCE(r.score,0) DESC, s.created_at ASC
 """
 
-import json
 import logging
 import os
-import re
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
@@ -26,6 +24,8 @@ from Model.Database.models.review import Review
 from Model.Database.repositories.review_repository import ReviewRepository
 from Model.Database.repositories.content_repository import ContentRepository
 from Model.Database.repositories.story_repository import StoryRepository
+from Model.Infrastructure.ollama import run_review
+from Model.Repositories.story_retry_repository import RETRY_READY_SQL, StoryRetryRepository
 from Model import StateNames
 
 logger = logging.getLogger(__name__)
@@ -74,16 +74,17 @@ class ReviewContentFromTitleService:
         self.story_repo   = StoryRepository(connection)
         self.content_repo = ContentRepository(connection)
         self.review_repo  = ReviewRepository(connection)
+        self.retry_repo   = StoryRetryRepository(connection)
 
     # ── score trend ──────────────────────────────────────────────────────────
 
     def _fetch_recent_scores(self, story_id: int) -> List[int]:
-        """Return review scores for the last _ESCALATION_LOOKBACK content versions (newest first)."""
+        """Return scores of the last _ESCALATION_LOOKBACK reviewed content versions (newest first)."""
         cursor = self._conn.execute(
             """
             SELECT COALESCE(r.score, 0) AS score
             FROM Content c
-            LEFT JOIN Review r ON r.id = c.review_id
+            INNER JOIN Review r ON r.id = c.review_id
             WHERE c.story_id = ?
             ORDER BY c.version DESC
             LIMIT ?
@@ -92,16 +93,52 @@ class ReviewContentFromTitleService:
         )
         return [row["score"] for row in cursor.fetchall()]
 
+    def _latest_review(self, table: str, story_id: int) -> Optional[Tuple[str, int]]:
+        """Return (created_at, id) of the newest Review attached to a Title or Content row."""
+        row = self._conn.execute(
+            f"""
+            SELECT r.created_at, r.id
+            FROM {table} x
+            INNER JOIN Review r ON r.id = x.review_id
+            WHERE x.story_id = ?
+            ORDER BY r.created_at DESC, r.id DESC
+            LIMIT 1
+            """,
+            (story_id,),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def _title_reviewed_since_content(self, story_id: int) -> bool:
+        """Return True if a title was reviewed after the last content review.
+
+        That is the case right after an escalation: [07] has reviewed the
+        title against this content (and [08] may have rewritten it), so
+        escalating again would only bounce the story between [07] and [10]
+        without producing a new content version. Reviews are ordered by
+        ``Review.created_at``; the id only breaks ties within one second.
+        """
+        title_review = self._latest_review("Title", story_id)
+        content_review = self._latest_review("Content", story_id)
+        return (
+            title_review is not None
+            and content_review is not None
+            and title_review > content_review
+        )
+
     def _should_escalate(self, story_id: int) -> bool:
         """Return True if score has not improved over the last _ESCALATION_LOOKBACK versions.
 
         Escalation condition: we have at least _ESCALATION_LOOKBACK data points
         AND the newest score is not better than the oldest of those points
         (no net improvement → title/direction needs rethinking).
+        Only reviewed versions count, and a title already re-reviewed since
+        the last content review is not escalated again.
         """
         scores = self._fetch_recent_scores(story_id)
         if len(scores) < _ESCALATION_LOOKBACK:
             return False
+        if self._title_reviewed_since_content(story_id):
+            return False
         newest = scores[0]
         oldest = scores[-1]
         return newest <= oldest
@@ -110,52 +147,16 @@ class ReviewContentFromTitleService:
 
     def _ai_review(self, content_text: str, title_text: str) -> Tuple[str, int]:
         """Call Ollama for content quality review. Returns (feedback, score)."""
-        try:
-            import requests as _requests
-        except ImportError as exc:
-            raise RuntimeError("requests library not available; run: pip install requests") from exc
-
-        template = (_PROMPTS_DIR / "review_content_from_title.txt").read_text(encoding="utf-8")
-        prompt = template.format(
-            title_text=title_text,
-            content_text=content_text[:_MAX_CONTENT_PREVIEW_LENGTH],
+        return run_review(
+            _AI_MODEL,
+            _PROMPTS_DIR / "review_content_from_title.txt",
+            {"title_text": title_text, "content_text": content_text[:_MAX_CONTENT_PREVIEW_LENGTH]},
+            default_feedback="AI quality gate review completed.",
+            temperature=_AI_TEMPERATURE,
+            max_tokens=_AI_MAX_TOKENS,
+            timeout=_AI_TIMEOUT,
         )
 
-        try:
-            check = _requests.get("http://localhost:11434/api/tags", timeout=5)
-            if check.status_code != 200:
-                raise RuntimeError(f"Ollama not available (status {check.status_code})")
-        except _requests.exceptions.RequestException as exc:
-            raise RuntimeError(f"Ollama not reachable: {exc}") from exc
-
-        try:
-            response = _requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": _AI_MODEL,
-                    "prompt": prompt,
-                    "stream": False,
-                    "think": False,
-                    "options": {"temperature": _AI_TEMPERATURE, "num_predict": _AI_MAX_TOKENS, "num_ctx": 4096},
-                },
-                timeout=_AI_TIMEOUT,
-            )
-            response.raise_for_status()
-            raw = response.json().get("response", "").strip()
-        except _requests.exceptions.RequestException as exc:
-            raise RuntimeError(f"Ollama API call failed: {exc}") from exc
-
-        raw = re.sub(r"<think>.*?</think>", "", raw, flags=re.DOTALL).strip()
-
-        match = re.search(r"\{.*\}", raw, re.DOTALL)
-        if not match:
-            raise ValueError(f"No JSON in AI response: {raw[:200]}")
-        data = json.loads(match.group())
-        score = max(0, min(100, int(data.get("overall_score", 50))))
-        feedback = str(data.get("feedback", "AI quality gate review completed."))
-
-        return feedback, score
-
     # ── story fetch ──────────────────────────────────────────────────────────
 
     def _fetch_story(self) -> Optional[sqlite3.Row]:
@@ -166,7 +167,7 @@ class ReviewContentFromTitleService:
         then oldest story as tiebreaker.
         """
         cursor = self._conn.execute(
-            """
+            f"""
             SELECT
                 s.id          AS story_id,
                 t.id          AS title_id,
@@ -184,6 +185,7 @@ class ReviewContentFromTitleService:
                 AND c.version = (SELECT MAX(c2.version) FROM Content c2 WHERE c2.story_id = s.id)
             LEFT JOIN Review r ON r.id = c.review_id
             WHERE s.state = ?
+              AND {RETRY_READY_SQL}
             ORDER BY c.version ASC, COALESCE(r.score, 0) DESC, s.created_at ASC
             LIMIT 1
             """,
@@ -255,6 +257,9 @@ class ReviewContentFromTitleService:
         except Exception as e:
             result.error = f"Quality gate review failed: {str(e)}"
             logger.exception(f"Error processing story {story_id}")
+            retry = self.retry_repo.record_failure(story_id, INPUT_STATE, result.error)
+            if retry.is_dead_lettered:
+                result.error += f" (dead-lettered after {retry.attempts} attempts)"
 
         return result
 
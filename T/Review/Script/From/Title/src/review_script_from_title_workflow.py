@@ -29,13 +29,14 @@ sys.path.insert(0, str(SCRIPT_DIR))
 sys.path.insert(0, str(REPO_ROOT))
 
 try:
-    from src.config import Config
+    from src.config import get_config
     CONFIG_AVAILABLE = True
 except ImportError:
     CONFIG_AVAILABLE = False
 
 try:
     from review_script_from_title import ReviewContentFromTitleService
+    from Model.Infrastructure.workflow import StageTelemetry
     SERVICE_AVAILABLE = True
 except ImportError as e:
     SERVICE_AVAILABLE = False
@@ -67,7 +68,7 @@ def main() -> int:
     db_path = "C:/PrismQ/db.s3db"
     if CONFIG_AVAILABLE:
         try:
-            db_path = Config(interactive=False).database_path
+            db_path = get_config().database_path
         except Exception:
             pass
 
@@ -91,6 +92,7 @@ def main() -> int:
     print_success("Connected to database")
 
     service = ReviewContentFromTitleService(conn)
+    telemetry = StageTelemetry("10")
 
     run_count = 0
     total_processed = 0
@@ -119,7 +121,7 @@ def main() -> int:
             else:
                 print_success(f"Found {pending} pending stories")
 
-            result = service.process_oldest_story()
+            result = telemetry.run(service.process_oldest_story)
 
             if result.story_id is None:
                 print_warning("No story returned")
@@ -32,6 +32,7 @@ from .script_grammar_review import (
     get_grammar_feedback,
     review_content_grammar,
     review_content_grammar_to_json,
+    review_many_grammar,
 )
 from .script_grammar_service import (
     DEFAULT_PASS_THRESHOLD,
@@ -53,6 +54,7 @@ __all__ = [
     "ScriptGrammarChecker",
     "review_content_grammar",
     "review_content_grammar_to_json",
+    "review_many_grammar",
     "get_grammar_feedback",
     # Workflow service
     "ScriptGrammarReviewService",
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Benchmark the compiled grammar rule engine on long scripts.
+
+Compares ``ScriptGrammarChecker`` with ``LineByLineGrammarChecker``, the
+previous line-by-line implementation kept here as the reference, and checks
+that both produce the same GrammarReview.
+
+Usage:
+    python T/Review/Script/Grammar/_meta/performance/bench_rule_engine.py
+    python T/Review/Script/Grammar/_meta/performance/bench_rule_engine.py --lines 10000 --runs 5
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[6]
+sys.path.insert(0, str(project_root))
+
+from T.Review.Script.Grammar.grammar_review import (
+    GrammarIssue,
+    GrammarIssueType,
+    GrammarReview,
+    GrammarSeverity,
+)
+from T.Review.Script.Grammar.script_grammar_review import ScriptGrammarChecker
+
+_WORDS = (
+    "the sun was setting over the hills and the shadows grew longer as she walked home "
+    "through the quiet streets where nobody had seen a light in the old house for years"
+).split()
+_ERRORS = (
+    "recieved", "thier", "wich", "untill", "he were", "we was", "you has", "it are", "they is",
+)
+_PREFIXES = ("", "", "", "", "[", "- ")
+
+
+def make_script(lines: int, error_rate: float = 0.1, seed: int = 14) -> str:
+    """Deterministic script of ``lines`` lines; ``error_rate`` of them get an error."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(lines):
+        if rng.random() < 0.05:
+            out.append("")
+            continue
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(4, 16))]
+        if rng.random() < error_rate:
+            words.insert(rng.randrange(len(words)), rng.choice(_ERRORS))
+        if rng.random() < 0.9:
+            words[0] = words[0].capitalize()
+        line = rng.choice(_PREFIXES) + " ".join(words)
+        out.append(line + rng.choice((".", ".", ".", "!", "", "  ")))
+    return "\n".join(out)
+
+
+class LineByLineGrammarChecker(ScriptGrammarChecker):
+    """Reference: the line-by-line checker the rule engine replaced."""
+
+    def review_content(self, content_text, content_id="script-001", script_version="v3"):
+        review = GrammarReview(
+            content_id=content_id, script_version=script_version, pass_threshold=self.pass_threshold
+        )
+        lines = content_text.split("\n")
+        for line_num, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            self._legacy_spelling(line, line_num, review)
+            self._legacy_grammar(line, line_num, review)
+            self._check_punctuation(line, line_num, review)
+            self._check_capitalization(line, line_num, review)
+        self._legacy_tense(content_text, lines, review)
+        review.overall_score = self._calculate_score(review)
+        self._generate_feedback(review)
+        return review
+
+    def _legacy_spelling(self, line, line_num, review):
+        for word in re.findall(r"\b\w+\b", line.lower()):
+            if word in self.common_spelling_errors:
+                correct_word = self.common_spelling_errors[word]
+                pattern = re.compile(r"\b" + re.escape(word) + r"\b", re.IGNORECASE)
+                match = pattern.search(line)
+                if match:
+                    original_word = match.group()
+                    if original_word[0].isupper():
+                        correct_word = correct_word.capitalize()
+                    review.add_issue(GrammarIssue(
+                        issue_type=GrammarIssueType.SPELLING,
+                        severity=GrammarSeverity.HIGH,
+                        line_number=line_num,
+                        text=original_word,
+                        suggestion=correct_word,
+                        explanation=f"Spelling error: '{original_word}' should be '{correct_word}'",
+                        confidence=95,
+                    ))
+
+    def _legacy_grammar(self, line, line_num, review):
+        for pattern, correct_verb, explanation in self.subject_verb_errors:
+            for match in re.finditer(pattern, line, re.IGNORECASE):
+                error_text = match.group()
+                words = error_text.split()
+                if len(words) >= 2:
+                    review.add_issue(GrammarIssue(
+                        issue_type=GrammarIssueType.AGREEMENT,
+                        severity=GrammarSeverity.CRITICAL,
+                        line_number=line_num,
+                        text=error_text,
+                        suggestion=f"{words[0]} {correct_verb}",
+                        explanation=explanation,
+                        confidence=90,
+                    ))
+
+    def _legacy_tense(self, content_text, lines, review):
+        past_count = sum(
+            len(re.findall(p, content_text, re.IGNORECASE)) for p in self.tense_patterns["past"]
+        )
+        present_count = sum(
+            len(re.findall(p, content_text, re.IGNORECASE)) for p in self.tense_patterns["present"]
+        )
+        if past_count > present_count * 2:
+            primary_tense, tense_name = "past", "present"
+        elif present_count > past_count * 2:
+            primary_tense, tense_name = "present", "past"
+        else:
+            return
+        for line_num, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            for pattern in self.tense_patterns[tense_name]:
+                if re.search(pattern, line, re.IGNORECASE) and len(line.split()) > 5:
+                    if len(re.findall(pattern, line, re.IGNORECASE)) >= 2:
+                        review.add_issue(GrammarIssue(
+                            issue_type=GrammarIssueType.TENSE,
+                            severity=GrammarSeverity.MEDIUM,
+                            line_number=line_num,
+                            text=line.strip(),
+                            suggestion=f"Consider using {primary_tense} tense consistently",
+                            explanation=f"Content primarily uses {primary_tense} tense, but this line uses {tense_name} tense",
+                            confidence=60,
+                        ))
+                        break
+
+
+def comparable(review: GrammarReview) -> dict:
+    """Review as a dict without its timestamp."""
+    data = review.to_dict()
+    data.pop("reviewed_at", None)
+    return data
+
+
+def time_review(checker, script, runs):
+    """Median seconds of ``runs`` reviews, and the last review."""
+    timings = []
+    review = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        review = checker.review_content(script)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), review
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the grammar rule engine")
+    parser.add_argument("--lines", type=int, default=10000, help="Script length in lines")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per checker (median)")
+    parser.add_argument("--error-rate", type=float, default=0.1,
+                        help="Fraction of lines with a spelling/agreement error")
+    args = parser.parse_args(argv)
+
+    script = make_script(args.lines, args.error_rate)
+    reference_seconds, reference = time_review(LineByLineGrammarChecker(), script, args.runs)
+    engine_seconds, review = time_review(ScriptGrammarChecker(), script, args.runs)
+
+    identical = comparable(review) == comparable(reference)
+    print(f"Script: {args.lines} lines, {len(review.issues)} issues")
+    print(f"Line-by-line: {reference_seconds * 1000:8.1f} ms")
+    print(f"Rule engine:  {engine_seconds * 1000:8.1f} ms  ({reference_seconds / engine_seconds:.1f}x)")
+    print(f"Identical output: {'yes' if identical else 'NO'}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Benchmark the spelling index on a dictionary of realistic size.
+
+Builds an index for a synthetic dictionary (pseudo-words with Zipf
+frequencies, about the size of SymSpell's 82k English list) or for a real
+word list, then times the lookups the grammar checker makes.
+
+Usage:
+    python T/Review/Script/Grammar/_meta/performance/bench_spelling.py
+    python T/Review/Script/Grammar/_meta/performance/bench_spelling.py \
+        --words frequency_dictionary_en_82_765.txt
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[6]
+sys.path.insert(0, str(project_root))
+
+from T.Review.Script.Grammar.spelling import (
+    Speller,
+    SpellingIndex,
+    build_index,
+    read_word_list,
+)
+
+_ONSETS = ("", "b", "br", "c", "ch", "d", "f", "g", "gr", "h", "k", "l", "m", "n", "p", "pr",
+           "r", "s", "sh", "st", "t", "th", "tr", "v", "w")
+_VOWELS = ("a", "e", "i", "o", "u", "ai", "ea", "ou")
+_CODAS = ("", "", "n", "r", "s", "t", "nd", "ng", "st", "ck")
+
+
+def make_words(count: int, seed: int = 7):
+    """``count`` distinct pseudo-words with Zipf-distributed frequencies."""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        syllables = rng.choice((1, 2, 2, 3, 3, 4))
+        words.add("".join(
+            rng.choice(_ONSETS) + rng.choice(_VOWELS) + rng.choice(_CODAS) for _ in range(syllables)
+        ))
+    ordered = sorted(words)
+    rng.shuffle(ordered)
+    return [(word, 10**9 // rank) for rank, word in enumerate(ordered, start=1)]
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    """``word`` with one random delete, insert, replace or transpose."""
+    index = rng.randrange(len(word))
+    edit = rng.choice(("delete", "insert", "replace", "transpose"))
+    if edit == "delete" and len(word) > 3:
+        return word[:index] + word[index + 1 :]
+    if edit == "transpose" and index < len(word) - 1:
+        return word[:index] + word[index + 1] + word[index] + word[index + 2 :]
+    letter = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    if edit == "insert":
+        return word[:index] + letter + word[index:]
+    return word[:index] + letter + word[index + 1 :]
+
+
+def per_call(function, items, repeat: int = 3) -> float:
+    """Best time per call of ``function`` over ``items``, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the spelling index")
+    parser.add_argument("--words", help="Word list to index (default: synthetic dictionary)")
+    parser.add_argument("--size", type=int, default=82000, help="Synthetic dictionary size")
+    parser.add_argument("--lookups", type=int, default=20000, help="Words looked up per test")
+    args = parser.parse_args(argv)
+
+    words = list(read_word_list(Path(args.words))) if args.words else make_words(args.size)
+    rng = random.Random(3)
+    # Text words follow the dictionary's frequencies (most text is common words)
+    weights = [frequency for _, frequency in words]
+    text_words = [word for word, _ in rng.choices(words, weights=weights, k=args.lookups)]
+    typos = [misspell(word, rng) for word in rng.sample([w for w, _ in words], 2000)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "spelling.idx"
+        start = time.perf_counter()
+        count = build_index(words, path)
+        build_seconds = time.perf_counter() - start
+        size_mb = path.stat().st_size / 2**20
+
+        index = SpellingIndex(path)
+        speller = Speller(index)
+        start = time.perf_counter()
+        for word in text_words:
+            speller.correction(word)
+        first_pass = (time.perf_counter() - start) / len(text_words) * 1e6
+
+        print(f"Dictionary: {count} words, index {size_mb:.1f} MB, "
+              f"built in {build_seconds:.1f} s")
+        known = per_call(index.frequency, text_words)
+        warm = per_call(speller.correction, text_words)
+        typo = per_call(index.lookup, typos, 1)
+        print(f"Known word, index lookup:         {known:7.2f} us")
+        print(f"Text word, speller (cold cache):  {first_pass:7.2f} us")
+        print(f"Text word, speller (warm cache):  {warm:7.2f} us")
+        print(f"Misspelling, index lookup:        {typo:7.2f} us")
+        found = sum(1 for typo in typos if (index.lookup(typo) or (None, 3))[1] <= 1)
+        print(f"Misspellings with a suggestion at distance <= 1: {found}/{len(typos)}")
+        del speller
+        index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
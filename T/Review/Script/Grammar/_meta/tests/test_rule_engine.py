@@ -0,0 +1,106 @@
+"""Tests for the compiled grammar rule engine.
+
+The previous line-by-line checker (kept in _meta/performance) is the
+reference: the compiled engine must produce the same GrammarReview.
+"""
+
+import importlib.util
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[6]
+sys.path.insert(0, str(project_root))
+
+from T.Review.Script.Grammar.grammar_review import GrammarIssueType
+from T.Review.Script.Grammar.rule_engine import compile_rules, keyword_trie_pattern, line_starts
+from T.Review.Script.Grammar.script_grammar_review import ScriptGrammarChecker
+
+_spec = importlib.util.spec_from_file_location(
+    "bench_rule_engine", Path(__file__).resolve().parents[1] / "performance" / "bench_rule_engine.py"
+)
+bench = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench)
+
+
+def assert_same_review(script, checker=None, reference=None):
+    checker = checker or ScriptGrammarChecker()
+    reference = reference or bench.LineByLineGrammarChecker()
+    review = checker.review_content(script)
+    assert bench.comparable(review) == bench.comparable(reference.review_content(script))
+    return review
+
+
+class TestSameOutputAsLineByLine:
+    @pytest.mark.parametrize("error_rate", [0.0, 0.1, 1.0])
+    def test_generated_scripts(self, error_rate):
+        assert_same_review(bench.make_script(400, error_rate, seed=3))
+
+    def test_repeated_misspelling_reports_first_occurrence(self):
+        review = assert_same_review("Thier dog and thier cat sat by the door.")
+        assert [issue.text for issue in review.issues] == ["Thier", "Thier"]
+
+    def test_agreement_does_not_span_lines(self):
+        review = assert_same_review("Later that night I\nwas alone in the house.")
+        assert not review.get_issues_by_type(GrammarIssueType.AGREEMENT)
+
+    def test_agreement_issues_ordered_by_rule(self):
+        review = assert_same_review("He were late and we was early and she were gone.")
+        assert [issue.text for issue in review.issues] == ["we was", "He were", "she were"]
+
+    def test_tense_inconsistency(self):
+        script = "\n".join(
+            ["She walked home and had said nothing.", "He went out and saw it."] * 5
+            + ["She walks home and says it is late and goes to bed."]
+        )
+        review = assert_same_review(script)
+        assert review.get_issues_by_type(GrammarIssueType.TENSE)
+
+    def test_text_whose_lowercase_changes_length(self):
+        # "İ".lower() is two characters, so offsets of the lowercased text shift
+        assert_same_review("İstanbul was where I recieved thier letter.\nhe were there.")
+
+
+class TestRuleData:
+    def test_rules_added_after_init_are_used(self):
+        checker = ScriptGrammarChecker()
+        reference = bench.LineByLineGrammarChecker()
+        for c in (checker, reference):
+            c.common_spelling_errors["teh"] = "the"
+            c.common_spelling_errors["alot"] = "a lot"
+        review = assert_same_review("Alot of teh time it rains.", checker, reference)
+        assert [issue.suggestion for issue in review.issues] == ["A lot", "the"]
+
+    def test_arbitrary_agreement_pattern_falls_back(self):
+        checker = ScriptGrammarChecker()
+        reference = bench.LineByLineGrammarChecker()
+        for c in (checker, reference):
+            c.subject_verb_errors.append((r"\bthere\s+is\s+many\b", "are", "Plural noun"))
+        review = assert_same_review("There is many reasons to stay.", checker, reference)
+        assert review.issues[0].text == "There is many"
+
+    def test_compiled_rules_are_shared(self):
+        first, second = ScriptGrammarChecker(), ScriptGrammarChecker()
+        assert first._compiled_rules() is second._compiled_rules()
+
+
+class TestHelpers:
+    def test_keyword_trie_pattern_matches_exactly_the_words(self):
+        words = ["run", "runs", "ran", "walk"]
+        pattern = re.compile(rf"\b(?:{keyword_trie_pattern(words)})\b")
+        assert pattern.findall("run runs ran rant walk walks") == ["run", "runs", "ran", "walk"]
+
+    def test_line_starts(self):
+        assert line_starts("a\nbc\n\nd") == [0, 2, 5, 6]
+
+    def test_scan_groups_by_line(self):
+        checker = ScriptGrammarChecker()
+        rules = compile_rules(
+            checker.common_spelling_errors, checker.subject_verb_errors, checker.tense_patterns
+        )
+        scan = rules.scan("fine\nI recieved it\n\nthey was here")
+        assert scan.spelling == {2: [("recieved", "recieved")]}
+        assert scan.agreement == {4: [(0, "they was")]}
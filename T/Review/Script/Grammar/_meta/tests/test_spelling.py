@@ -0,0 +1,234 @@
+"""Tests for the dictionary spelling index and its use by the grammar checker."""
+
+import random
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[6]
+sys.path.insert(0, str(project_root))
+
+from T.Review.Script.Grammar import spelling
+from T.Review.Script.Grammar.grammar_review import GrammarIssueType, GrammarSeverity
+from T.Review.Script.Grammar.script_grammar_review import ScriptGrammarChecker
+from T.Review.Script.Grammar.spelling import (
+    Speller,
+    SpellingIndex,
+    SpellingIndexError,
+    Suggestion,
+    build_index,
+    edit_distance,
+    read_word_list,
+)
+from T.Review.Script.incremental_review import IncrementalReviewer
+
+WORDS = {
+    "the": 2300, "quick": 500, "quickly": 200, "brown": 300, "fox": 100, "jumps": 80,
+    "over": 900, "lazy": 60, "dog": 120, "receive": 300, "their": 3000, "there": 5000,
+    "three": 400, "separate": 90, "international": 400, "internationally": 10, "house": 700,
+    "horse": 300, "walked": 200, "she": 4000, "saw": 500, "a": 9000, "at": 8000,
+}
+
+
+@pytest.fixture(scope="module")
+def index_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("spelling") / "spelling.idx"
+    build_index(WORDS.items(), path)
+    return path
+
+
+@pytest.fixture
+def index(index_path):
+    opened = SpellingIndex(index_path)
+    yield opened
+    opened.close()
+
+
+def brute_force(word, max_distance=2):
+    """Closest dictionary word by comparing with every word."""
+    best = None
+    for term, frequency in WORDS.items():
+        distance = edit_distance(word, term, max_distance)
+        if distance <= max_distance and (
+            best is None or (distance, -frequency) < (best.distance, -best.frequency)
+        ):
+            best = Suggestion(term, distance, frequency)
+    return best
+
+
+class TestEditDistance:
+    @pytest.mark.parametrize(
+        "a, b, distance",
+        [
+            ("house", "house", 0),
+            ("house", "horse", 1),
+            ("recieve", "receive", 1),  # transposition
+            ("fox", "fxo", 1),
+            ("quick", "quack", 1),
+            ("walked", "walk", 2),
+            ("", "abc", 3),
+        ],
+    )
+    def test_distance(self, a, b, distance):
+        assert edit_distance(a, b, 3) == distance
+
+    def test_stops_above_max_distance(self):
+        assert edit_distance("international", "house", 2) == 3
+
+
+class TestSpellingIndex:
+    def test_exact_words(self, index):
+        assert len(index) == len(WORDS)
+        assert "quick" in index
+        assert "Quick" in index
+        assert "quikc" not in index
+        assert index.frequency("there") == 5000
+
+    @pytest.mark.parametrize(
+        "word, expected",
+        [
+            ("quikc", "quick"),
+            ("brwon", "brown"),
+            ("recieve", "receive"),
+            ("thier", "their"),
+            ("seperate", "separate"),
+            ("internatonal", "international"),  # edit beyond the indexed prefix
+            ("hoyse", "house"),  # house and horse are both 1 away: the more frequent wins
+            ("dgo", "dog"),
+        ],
+    )
+    def test_suggestions(self, index, word, expected):
+        assert index.lookup(word).term == expected
+
+    def test_no_close_word(self, index):
+        assert index.lookup("zzzzzzzz") is None
+        assert index.lookup("quikc", max_distance=0) is None
+
+    def test_same_result_as_brute_force(self, index):
+        rng = random.Random(11)
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        for _ in range(300):
+            word = rng.choice(list(WORDS))
+            for _ in range(rng.randint(1, 2)):
+                position = rng.randrange(len(word) + 1)
+                word = word[:position] + rng.choice(letters) + word[position + 1 :]
+            found, expected = index.lookup(word), brute_force(word)
+            assert (found and found[1:]) == (expected and expected[1:]), word
+
+    def test_rebuild_replaces_the_file(self, tmp_path):
+        path = tmp_path / "spelling.idx"
+        build_index([("one", 1)], path)
+        first = SpellingIndex(path)
+        build_index([("one", 1), ("two", 1)], path)
+        second = SpellingIndex(path)
+        assert (len(first), len(second)) == (1, 2)
+        assert "one" in first
+        first.close()
+        second.close()
+
+    def test_not_an_index(self, tmp_path):
+        path = tmp_path / "words.txt"
+        path.write_text("just some words, not an index file\n")
+        with pytest.raises(SpellingIndexError):
+            SpellingIndex(path)
+        with pytest.raises(SpellingIndexError):
+            SpellingIndex(tmp_path / "missing.idx")
+
+    def test_word_list_formats(self, tmp_path):
+        path = tmp_path / "words.txt"
+        path.write_text("# comment\nthe 23135851162\n\nPrismQ\n")
+        assert list(read_word_list(path)) == [("the", 23135851162), ("PrismQ", 1)]
+
+
+class TestSpeller:
+    def test_corrections_and_lexicon(self, index):
+        speller = Speller(index, lexicon=["Zorblax"])
+        assert speller.correction("quick") is None
+        assert speller.correction("Quikc").term == "quick"
+        assert speller.correction("zorblax") is None
+        assert speller.correction("brwon").term == "brown"
+        speller.add_words(["brwon"])
+        assert speller.correction("brwon") is None
+
+    def test_results_are_cached(self, index):
+        speller = Speller(index, cache_size=2)
+        for word in ("quikc", "quikc", "fox", "quikc"):
+            speller.correction(word)
+        info = speller.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+
+    def test_without_index_nothing_is_corrected(self):
+        assert Speller().correction("quikc") is None
+
+
+class TestDefaultSpeller:
+    def test_configured_index_and_lexicon(self, index_path, tmp_path, monkeypatch):
+        lexicon = tmp_path / "names.txt"
+        lexicon.write_text("Hoyse\n")
+        monkeypatch.setenv(spelling.INDEX_ENV, str(index_path))
+        monkeypatch.setenv(spelling.LEXICON_ENV, str(lexicon))
+        spelling.reset_default_speller()
+        try:
+            speller = spelling.default_speller()
+            assert speller is spelling.default_speller()
+            assert ScriptGrammarChecker().speller is speller
+            assert speller.correction("hoyse") is None
+            assert speller.correction("quikc").term == "quick"
+        finally:
+            spelling.reset_default_speller()
+
+    def test_no_index_configured(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(spelling.INDEX_ENV, str(tmp_path / "missing.idx"))
+        spelling.reset_default_speller()
+        try:
+            assert spelling.default_speller() is None
+            assert ScriptGrammarChecker().speller is None
+        finally:
+            spelling.reset_default_speller()
+
+
+class TestGrammarChecker:
+    SCRIPT = (
+        "She saw the quikc brwon fox.\n"
+        "Thier dog walked over the hoyse.\n"
+        "Zorblax saw a brwon fox."
+    )
+
+    def test_dictionary_issues(self, index):
+        checker = ScriptGrammarChecker(speller=Speller(index))
+        review = checker.review_content(self.SCRIPT)
+        spelling_issues = [
+            (issue.line_number, issue.text, issue.suggestion, issue.severity)
+            for issue in review.get_issues_by_type(GrammarIssueType.SPELLING)
+        ]
+        assert spelling_issues == [
+            (1, "quikc", "quick", GrammarSeverity.MEDIUM),
+            (1, "brwon", "brown", GrammarSeverity.MEDIUM),
+            # the misspelling dictionary's issue, not a second one from the index
+            (2, "Thier", "Their", GrammarSeverity.HIGH),
+            (2, "hoyse", "house", GrammarSeverity.MEDIUM),
+            (3, "brwon", "brown", GrammarSeverity.MEDIUM),
+        ]
+
+    def test_without_speller_only_known_misspellings(self, monkeypatch):
+        monkeypatch.setattr(spelling, "_default_loaded", True)
+        monkeypatch.setattr(spelling, "_default_speller", None)
+        review = ScriptGrammarChecker().review_content(self.SCRIPT)
+        assert [issue.text for issue in review.get_issues_by_type(GrammarIssueType.SPELLING)] == [
+            "Thier"
+        ]
+
+    def test_incremental_review_matches_full_review(self, index):
+        speller = Speller(index)
+        reviewer = IncrementalReviewer(ScriptGrammarChecker(speller=speller))
+        reviewer.review_content(self.SCRIPT, "script-3")
+        edited = self.SCRIPT.replace("hoyse", "house").replace("She saw", "She sawq")
+        review = reviewer.review_content(edited, "script-3", "v4")
+        full = ScriptGrammarChecker(speller=speller).review_content(edited, "script-3", "v4")
+        assert [asdict(issue) for issue in review.issues] == [
+            asdict(issue) for issue in full.issues
+        ]
+        assert reviewer.last_stats.checked_lines == 2
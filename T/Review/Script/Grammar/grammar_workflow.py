@@ -33,6 +33,7 @@ except ImportError:
 
 try:
     from T.Review.Script.Grammar import ScriptGrammarReviewService, INPUT_STATE
+    from Model.Infrastructure.workflow import StageTelemetry
     SERVICE_AVAILABLE = True
 except Exception as e:
     SERVICE_AVAILABLE = False
@@ -106,6 +107,7 @@ def main():
         return 1
 
     service = ScriptGrammarReviewService(conn)
+    telemetry = StageTelemetry("11")
 
     run_count = 0
     total_processed = 0
@@ -131,7 +133,7 @@ def main():
 
             print_success(f"Found {pending_count} stories ready for grammar review")
 
-            result = service.process_oldest_story()
+            result = telemetry.run(service.process_oldest_story)
 
             if result.story_id is None:
                 print_warning("No story found to process")
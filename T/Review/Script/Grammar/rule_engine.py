@@ -0,0 +1,248 @@
+"""Compiled rule engine for the script grammar checker.
+
+``ScriptGrammarChecker`` keeps its rules as plain data: a misspelling
+dictionary, subject-verb agreement patterns and tense marker patterns. This
+module compiles them once and runs them over the whole script instead of
+line by line:
+
+    - word rules (the misspelling dictionary and word-list patterns such as
+      ``\\b(walked|ran|said)\\b``) share one trie-shaped alternation - the
+      regex form of an Aho-Corasick keyword automaton - run once over the
+      lowercased script; each hit is dispatched through a word table
+    - phrase rules (``\\b(I|you|we|they)\\s+was\\b``) share one
+      ``subject whitespace verb`` alternation, looked up by word pair
+    - any other pattern is scanned once over the whole script on its own
+
+Matches are mapped to line numbers through a precomputed index of line
+starts. Compiled rule sets are cached per rule content, so checkers created
+per call (``review_content_grammar``) share them.
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Rule shapes the engine can merge: a word list, and "subjects then a verb"
+_WORD_LIST_RULE = re.compile(r"^\\b\((\w+(?:\|\w+)*)\)\\b$")
+_PHRASE_RULE = re.compile(r"^\\b\((\w+(?:\|\w+)*)\)\\s\+(\w+)\\b$")
+_WORD = re.compile(r"\w+")
+
+# (family, key, pattern index) a word or phrase hit counts towards
+Target = Tuple[str, str, int]
+
+SPELLING = "spelling"
+AGREEMENT = "agreement"
+TENSE = "tense"
+
+
+def keyword_trie_pattern(words: Sequence[str]) -> str:
+    """Regex alternation for ``words`` factored into a prefix trie.
+
+    Python's regex engine tries alternatives one by one; sharing prefixes
+    lets it reject most positions after one character.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def line_starts(text: str) -> List[int]:
+    """Offsets at which each ``\\n``-separated line of ``text`` starts."""
+    starts = [0]
+    position = text.find("\n")
+    while position != -1:
+        starts.append(position + 1)
+        position = text.find("\n", position + 1)
+    return starts
+
+
+@dataclass
+class ScriptScan:
+    """Rule matches of one script, grouped by 1-based line number."""
+
+    # line -> [(matched text, lowercase dictionary key)], in line order
+    spelling: Dict[int, List[Tuple[str, str]]] = field(default_factory=dict)
+    # line -> [(rule index, matched text)], ordered by rule, then position
+    agreement: Dict[int, List[Tuple[int, str]]] = field(default_factory=dict)
+    # tense -> total matches per pattern
+    tense_totals: Dict[str, List[int]] = field(default_factory=dict)
+    # tense -> line -> matches per pattern
+    tense_lines: Dict[str, Dict[int, List[int]]] = field(default_factory=dict)
+
+    def renumbered(self, line_numbers: Sequence[int]) -> "ScriptScan":
+        """Scan of selected lines joined with newlines, moved to their line numbers.
+
+        Line ``i`` of the scanned text becomes line ``line_numbers[i - 1]``.
+        """
+        def move(per_line: Dict[int, list]) -> Dict[int, list]:
+            return {line_numbers[line - 1]: hits for line, hits in per_line.items()}
+
+        return ScriptScan(
+            spelling=move(self.spelling),
+            agreement=move(self.agreement),
+            tense_totals=self.tense_totals,
+            tense_lines={tense: move(lines) for tense, lines in self.tense_lines.items()},
+        )
+
+
+class CompiledGrammarRules:
+    """The checker's rule data compiled for a single pass over a script.
+
+    Phrase rules are matched together, so they are assumed not to overlap:
+    no rule's verb is another rule's subject, as in the built-in rules.
+    """
+
+    def __init__(
+        self,
+        spelling_errors: Dict[str, str],
+        agreement_rules: Sequence[Tuple[str, str, str]],
+        tense_patterns: Dict[str, Sequence[str]],
+    ):
+        self._tense_sizes = {tense: len(patterns) for tense, patterns in tense_patterns.items()}
+
+        # The checker looks up lowercased \w+ tokens, so only such keys can match
+        words: Dict[str, List[Target]] = {}
+        for key in spelling_errors:
+            if _WORD.fullmatch(key) and key == key.lower():
+                words.setdefault(key, []).append((SPELLING, key, 0))
+
+        self._fallback: List[Tuple[re.Pattern, Target]] = []
+        for tense, patterns in tense_patterns.items():
+            for index, pattern in enumerate(patterns):
+                match = _WORD_LIST_RULE.match(pattern)
+                if match:
+                    for word in set(match.group(1).lower().split("|")):
+                        words.setdefault(word, []).append((TENSE, tense, index))
+                else:
+                    self._fallback.append((re.compile(pattern, re.IGNORECASE), (TENSE, tense, index)))
+
+        phrases: Dict[Tuple[str, str], List[int]] = {}
+        for index, (pattern, _, _) in enumerate(agreement_rules):
+            match = _PHRASE_RULE.match(pattern)
+            if match:
+                for subject in match.group(1).lower().split("|"):
+                    phrases.setdefault((subject, match.group(2).lower()), []).append(index)
+            else:
+                self._fallback.append(
+                    (re.compile(pattern, re.IGNORECASE | re.MULTILINE), (AGREEMENT, "", index))
+                )
+
+        self._words = words
+        self._word_scan = self._word_scan_folded = None
+        if words:
+            trie = keyword_trie_pattern(sorted(words))
+            self._word_scan = re.compile(rf"\b(?:{trie})\b")
+            self._word_scan_folded = re.compile(rf"\b(?:{trie})\b", re.IGNORECASE)
+
+        self._phrases = phrases
+        self._phrase_scan = self._phrase_scan_folded = None
+        if phrases:
+            subjects = keyword_trie_pattern(sorted({subject for subject, _ in phrases}))
+            verbs = keyword_trie_pattern(sorted({verb for _, verb in phrases}))
+            # Per-line semantics: the whitespace between the words is not "\n"
+            phrase = rf"\b({subjects})[^\S\n]+({verbs})\b"
+            self._phrase_scan = re.compile(phrase)
+            self._phrase_scan_folded = re.compile(phrase, re.IGNORECASE)
+
+    def scan(self, text: str, folded: Optional[str] = None) -> ScriptScan:
+        """Run all rules over ``text`` once.
+
+        Args:
+            text: The script text
+            folded: ``text.lower()``, when the caller already has it
+        """
+        starts = line_starts(text)
+        scan = ScriptScan(
+            tense_totals={tense: [0] * size for tense, size in self._tense_sizes.items()},
+            tense_lines={tense: {} for tense in self._tense_sizes},
+        )
+
+        if folded is None:
+            folded = text.lower()
+        # lower() keeps offsets unless a character folds to several
+        same_offsets = len(folded) == len(text)
+
+        def count_tense(tense: str, index: int, line: int) -> None:
+            scan.tense_totals[tense][index] += 1
+            per_line = scan.tense_lines[tense]
+            counts = per_line.get(line)
+            if counts is None:
+                counts = per_line[line] = [0] * self._tense_sizes[tense]
+            counts[index] += 1
+
+        if self._word_scan is not None:
+            if same_offsets:
+                matches = self._word_scan.finditer(folded)
+            else:
+                matches = self._word_scan_folded.finditer(text)
+            words = self._words
+            for match in matches:
+                start, end = match.span()
+                word = match.group().lower()
+                line = bisect_right(starts, start)
+                for family, key, index in words.get(word, ()):
+                    if family == SPELLING:
+                        scan.spelling.setdefault(line, []).append((text[start:end], word))
+                    else:
+                        count_tense(key, index, line)
+
+        if self._phrase_scan is not None:
+            if same_offsets:
+                matches = self._phrase_scan.finditer(folded)
+            else:
+                matches = self._phrase_scan_folded.finditer(text)
+            for match in matches:
+                rules = self._phrases.get((match.group(1).lower(), match.group(2).lower()))
+                if rules:
+                    start, end = match.span()
+                    hits = scan.agreement.setdefault(bisect_right(starts, start), [])
+                    hits.extend((rule, text[start:end]) for rule in rules)
+
+        for pattern, (family, key, index) in self._fallback:
+            for match in pattern.finditer(text):
+                line = bisect_right(starts, match.start())
+                if family == TENSE:
+                    count_tense(key, index, line)
+                elif "\n" not in match.group():
+                    scan.agreement.setdefault(line, []).append((index, match.group()))
+
+        # Per line, agreement issues are reported rule by rule
+        for hits in scan.agreement.values():
+            hits.sort(key=lambda hit: hit[0])
+
+        return scan
+
+
+_compiled: Dict[Hashable, CompiledGrammarRules] = {}
+
+
+def compile_rules(
+    spelling_errors: Dict[str, str],
+    agreement_rules: Sequence[Tuple[str, str, str]],
+    tense_patterns: Dict[str, Sequence[str]],
+) -> CompiledGrammarRules:
+    """Return the (cached) compiled form of a rule set."""
+    key = (
+        tuple(spelling_errors),
+        tuple(rule[0] for rule in agreement_rules),
+        tuple((tense, tuple(patterns)) for tense, patterns in tense_patterns.items()),
+    )
+    rules: Optional[CompiledGrammarRules] = _compiled.get(key)
+    if rules is None:
+        rules = _compiled[key] = CompiledGrammarRules(
+            spelling_errors, agreement_rules, tense_patterns
+        )
+    return rules
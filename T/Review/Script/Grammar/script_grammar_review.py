@@ -16,7 +16,7 @@ Workflow Position:
 import json
 import re
 from dataclasses import asdict
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 # Import the GrammarReview model from local module
 from .grammar_review import (
@@ -25,6 +25,20 @@ from .grammar_review import (
     GrammarReview,
     GrammarSeverity,
 )
+from ..bulk_review import DEFAULT_CHUNK_SIZE, BulkReviewResult, ScriptInput, review_many
+from ..incremental_review import LineResults, incremental_reviewer
+from ..script_analysis import ScriptAnalysis, analyze_script
+from .rule_engine import CompiledGrammarRules, ScriptScan, compile_rules
+from .spelling import Speller, default_speller
+
+# Punctuation check: a line that reads like a complete sentence
+_SENTENCE_PATTERN = re.compile(
+    r"\b(I|you|he|she|it|we|they|the|a|an)\b.*\b(is|are|was|were|has|have|do|does|did)\b",
+    re.IGNORECASE,
+)
+_WHITESPACE_RUN = re.compile(r"\s+")
+# Dictionary spelling check: lowercase words (names and sentence starts are capitalized)
+_DICTIONARY_WORD = re.compile(r"(?<![\w'’])[a-z]{3,}(?![\w'’])")
 
 
 class ScriptGrammarChecker:
@@ -41,13 +55,16 @@ class ScriptGrammarChecker:
     Provides line-by-line error detection with specific corrections.
     """
 
-    def __init__(self, pass_threshold: int = 85):
+    def __init__(self, pass_threshold: int = 85, speller: Optional[Speller] = None):
         """Initialize the grammar checker.
 
         Args:
             pass_threshold: Minimum score (0-100) required to pass review
+            speller: Dictionary spelling check (default: the configured
+                spelling index, if one is built - see ``spelling.py``)
         """
         self.pass_threshold = pass_threshold
+        self.speller = speller if speller is not None else default_speller()
 
         # Common spelling errors (could be expanded with AI/NLP library)
         self.common_spelling_errors = {
@@ -139,7 +156,11 @@ class ScriptGrammarChecker:
         }
 
     def review_content(
-        self, content_text: str, content_id: str = "script-001", script_version: str = "v3"
+        self,
+        content_text: str,
+        content_id: str = "script-001",
+        script_version: str = "v3",
+        analysis: Optional[ScriptAnalysis] = None,
     ) -> GrammarReview:
         """Review a script for grammar, punctuation, spelling, syntax, and tense.
 
@@ -147,36 +168,91 @@ class ScriptGrammarChecker:
             content_text: The script text to review
             content_id: Identifier for the script
             script_version: Version of the script (v3, v4, etc.)
+            analysis: Shared tokenization of ``content_text`` (looked up
+                with ``analyze_script`` when omitted)
 
         Returns:
             GrammarReview object with all detected issues
         """
-        review = GrammarReview(
-            content_id=content_id, script_version=script_version, pass_threshold=self.pass_threshold
-        )
+        analysis = analysis or analyze_script(content_text)
+        results = self.check_lines(analysis)
+        return self.complete_review(analysis, results, content_id, script_version)
 
-        # Split script into lines for line-by-line analysis
-        lines = content_text.split("\n")
+    def check_lines(
+        self, analysis: ScriptAnalysis, line_numbers: Optional[List[int]] = None
+    ) -> LineResults:
+        """Run the line-local checks: spelling, agreement, punctuation, capitalization.
 
-        # Check each line
-        for line_num, line in enumerate(lines, start=1):
-            if not line.strip():
-                continue
+        Args:
+            analysis: The script to check
+            line_numbers: Non-blank lines to check (default: all of them)
+
+        Returns:
+            Issues per line, and the tense marker counts of each line as facts
+        """
+        rules = self._compiled_rules()
+        if line_numbers is None:
+            # Run the dictionary and pattern rules once over the whole script
+            line_numbers = analysis.content_lines
+            scan = rules.scan(analysis.text, analysis.lower_text)
+        else:
+            selected = "\n".join(analysis.lines[line_num - 1] for line_num in line_numbers)
+            scan = rules.scan(selected).renumbered(line_numbers)
+
+        collected = GrammarReview(content_id=analysis.digest)
+        for line_num in line_numbers:
+            line = analysis.lines[line_num - 1]
 
             # Check spelling
-            self._check_spelling(line, line_num, review)
+            self._add_spelling_issues(scan.spelling.get(line_num, ()), line_num, collected)
+            if self.speller is not None:
+                self._add_dictionary_spelling_issues(line, line_num, collected)
 
             # Check grammar (subject-verb agreement)
-            self._check_grammar(line, line_num, review)
+            self._add_agreement_issues(scan.agreement.get(line_num, ()), line_num, collected)
 
             # Check punctuation
-            self._check_punctuation(line, line_num, review)
+            self._check_punctuation(line, line_num, collected)
 
             # Check capitalization
-            self._check_capitalization(line, line_num, review)
+            self._check_capitalization(line, line_num, collected)
+
+        results = LineResults.from_issues(collected.issues)
+        for tense, per_line in scan.tense_lines.items():
+            for line_num, counts in per_line.items():
+                results.facts.setdefault(line_num, {})[tense] = counts
+        return results
+
+    def complete_review(
+        self,
+        analysis: ScriptAnalysis,
+        results: LineResults,
+        content_id: str = "script-001",
+        script_version: str = "v3",
+    ) -> GrammarReview:
+        """Build the review from line results: tense consistency, score and feedback."""
+        review = GrammarReview(
+            content_id=content_id, script_version=script_version, pass_threshold=self.pass_threshold
+        )
+        for issue in results.ordered_issues():
+            review.add_issue(issue)
 
-        # Check overall tense consistency
-        self._check_tense_consistency(content_text, lines, review)
+        # Check overall tense consistency, from the tense markers of each line
+        tense_scan = ScriptScan(
+            tense_totals={
+                tense: [0] * len(patterns) for tense, patterns in self.tense_patterns.items()
+            },
+            tense_lines={tense: {} for tense in self.tense_patterns},
+        )
+        for line_num, per_tense in results.facts.items():
+            for tense, counts in per_tense.items():
+                tense_scan.tense_lines[tense][line_num] = counts
+                totals = tense_scan.tense_totals[tense]
+                for index, count in enumerate(counts):
+                    totals[index] += count
+        self._check_tense_consistency(
+            analysis.text, analysis.lines, review, tense_scan, analysis.word_counts
+        )
 
         # Calculate overall score based on issues
         review.overall_score = self._calculate_score(review)
@@ -186,59 +262,100 @@ class ScriptGrammarChecker:
 
         return review
 
+    def _compiled_rules(self) -> CompiledGrammarRules:
+        """Compiled form of the current rule data (cached per rule set)."""
+        return compile_rules(
+            self.common_spelling_errors, self.subject_verb_errors, self.tense_patterns
+        )
+
     def _check_spelling(self, line: str, line_num: int, review: GrammarReview) -> None:
         """Check for spelling errors in a line."""
-        words = re.findall(r"\b\w+\b", line.lower())
-
-        for word in words:
-            if word in self.common_spelling_errors:
-                correct_word = self.common_spelling_errors[word]
-
-                # Find the word in the original line (preserve case)
-                pattern = re.compile(r"\b" + re.escape(word) + r"\b", re.IGNORECASE)
-                match = pattern.search(line)
-
-                if match:
-                    original_word = match.group()
-                    # Preserve original capitalization
-                    if original_word[0].isupper():
-                        correct_word = correct_word.capitalize()
-
-                    issue = GrammarIssue(
-                        issue_type=GrammarIssueType.SPELLING,
-                        severity=GrammarSeverity.HIGH,
-                        line_number=line_num,
-                        text=original_word,
-                        suggestion=correct_word,
-                        explanation=f"Spelling error: '{original_word}' should be '{correct_word}'",
-                        confidence=95,
-                    )
-                    review.add_issue(issue)
+        hits = self._compiled_rules().scan(line).spelling.get(1, ())
+        self._add_spelling_issues(hits, line_num, review)
+        if self.speller is not None:
+            self._add_dictionary_spelling_issues(line, line_num, review)
+
+    def _add_spelling_issues(
+        self, hits: Sequence[Tuple[str, str]], line_num: int, review: GrammarReview
+    ) -> None:
+        """Add an issue per misspelled word of one line, in line order."""
+        first_seen: Dict[str, str] = {}
+        for text, word in hits:
+            correct_word = self.common_spelling_errors[word]
+
+            # Repeated misspellings report the first occurrence in the line
+            original_word = first_seen.setdefault(word, text)
+            # Preserve original capitalization
+            if original_word[0].isupper():
+                correct_word = correct_word.capitalize()
+
+            issue = GrammarIssue(
+                issue_type=GrammarIssueType.SPELLING,
+                severity=GrammarSeverity.HIGH,
+                line_number=line_num,
+                text=original_word,
+                suggestion=correct_word,
+                explanation=f"Spelling error: '{original_word}' should be '{correct_word}'",
+                confidence=95,
+            )
+            review.add_issue(issue)
+
+    def _add_dictionary_spelling_issues(
+        self, line: str, line_num: int, review: GrammarReview
+    ) -> None:
+        """Add an issue per lowercase word of one line that the dictionary corrects.
+
+        Words of ``common_spelling_errors`` are already reported; words the
+        dictionary has no close match for (slang, invented names) are not.
+        """
+        seen: Set[str] = set()
+        for word in _DICTIONARY_WORD.findall(line):
+            if word in seen or word in self.common_spelling_errors:
+                continue
+            seen.add(word)
+            suggestion = self.speller.correction(word)
+            if suggestion is None:
+                continue
+            issue = GrammarIssue(
+                issue_type=GrammarIssueType.SPELLING,
+                severity=GrammarSeverity.MEDIUM,
+                line_number=line_num,
+                text=word,
+                suggestion=suggestion.term,
+                explanation=(
+                    f"Possible spelling error: '{word}' - did you mean '{suggestion.term}'?"
+                ),
+                confidence=85 if suggestion.distance == 1 else 70,
+            )
+            review.add_issue(issue)
 
     def _check_grammar(self, line: str, line_num: int, review: GrammarReview) -> None:
         """Check for grammar errors (subject-verb agreement)."""
-        for pattern, correct_verb, explanation in self.subject_verb_errors:
-            matches = re.finditer(pattern, line, re.IGNORECASE)
-
-            for match in matches:
-                error_text = match.group()
-                # Extract subject and verb
-                words = error_text.split()
-                if len(words) >= 2:
-                    subject = words[0]
-                    wrong_verb = " ".join(words[1:])
-                    suggested_text = f"{subject} {correct_verb}"
-
-                    issue = GrammarIssue(
-                        issue_type=GrammarIssueType.AGREEMENT,
-                        severity=GrammarSeverity.CRITICAL,
-                        line_number=line_num,
-                        text=error_text,
-                        suggestion=suggested_text,
-                        explanation=explanation,
-                        confidence=90,
-                    )
-                    review.add_issue(issue)
+        hits = self._compiled_rules().scan(line).agreement.get(1, ())
+        self._add_agreement_issues(hits, line_num, review)
+
+    def _add_agreement_issues(
+        self, hits: Sequence[Tuple[int, str]], line_num: int, review: GrammarReview
+    ) -> None:
+        """Add an issue per subject-verb agreement match of one line."""
+        for rule, error_text in hits:
+            _, correct_verb, explanation = self.subject_verb_errors[rule]
+            # Extract subject and verb
+            words = error_text.split()
+            if len(words) >= 2:
+                subject = words[0]
+                suggested_text = f"{subject} {correct_verb}"
+
+                issue = GrammarIssue(
+                    issue_type=GrammarIssueType.AGREEMENT,
+                    severity=GrammarSeverity.CRITICAL,
+                    line_number=line_num,
+                    text=error_text,
+                    suggestion=suggested_text,
+                    explanation=explanation,
+                    confidence=90,
+                )
+                review.add_issue(issue)
 
     def _check_punctuation(self, line: str, line_num: int, review: GrammarReview) -> None:
         """Check for punctuation errors."""
@@ -251,13 +368,9 @@ class ScriptGrammarChecker:
             return
 
         # Check if sentence ends with proper punctuation
-        if len(stripped) > 10 and not re.search(r"[.!?:]$", stripped):
+        if len(stripped) > 10 and not stripped.endswith((".", "!", "?", ":")):
             # Only flag if it looks like a complete sentence (has subject and verb patterns)
-            if re.search(
-                r"\b(I|you|he|she|it|we|they|the|a|an)\b.*\b(is|are|was|were|has|have|do|does|did)\b",
-                stripped,
-                re.IGNORECASE,
-            ):
+            if _SENTENCE_PATTERN.search(stripped):
                 issue = GrammarIssue(
                     issue_type=GrammarIssueType.PUNCTUATION,
                     severity=GrammarSeverity.MEDIUM,
@@ -276,7 +389,7 @@ class ScriptGrammarChecker:
                 severity=GrammarSeverity.LOW,
                 line_number=line_num,
                 text=line,
-                suggestion=re.sub(r"\s+", " ", line),
+                suggestion=_WHITESPACE_RUN.sub(" ", line),
                 explanation="Remove extra spaces",
                 confidence=100,
             )
@@ -306,41 +419,43 @@ class ScriptGrammarChecker:
             review.add_issue(issue)
 
     def _check_tense_consistency(
-        self, content_text: str, lines: List[str], review: GrammarReview
+        self,
+        content_text: str,
+        lines: List[str],
+        review: GrammarReview,
+        scan: Optional[ScriptScan] = None,
+        word_counts: Optional[List[int]] = None,
     ) -> None:
         """Check for tense consistency throughout the script."""
-        # Count tense markers
-        past_count = 0
-        present_count = 0
-
-        for pattern in self.tense_patterns["past"]:
-            past_count += len(re.findall(pattern, content_text, re.IGNORECASE))
+        if scan is None:
+            scan = self._compiled_rules().scan(content_text)
+        if word_counts is None:
+            word_counts = [len(line.split()) for line in lines]
 
-        for pattern in self.tense_patterns["present"]:
-            present_count += len(re.findall(pattern, content_text, re.IGNORECASE))
+        # Count tense markers
+        past_count = sum(scan.tense_totals["past"])
+        present_count = sum(scan.tense_totals["present"])
 
         # Determine primary tense
         if past_count > present_count * 2:
             primary_tense = "past"
-            inconsistent_patterns = self.tense_patterns["present"]
             tense_name = "present"
         elif present_count > past_count * 2:
             primary_tense = "present"
-            inconsistent_patterns = self.tense_patterns["past"]
             tense_name = "past"
         else:
             # Mixed tense is acceptable in scripts (dialogue vs narration)
             return
 
         # Flag lines with inconsistent tense (only if very clear)
-        for line_num, line in enumerate(lines, start=1):
+        for line_num, counts in sorted(scan.tense_lines[tense_name].items()):
+            line = lines[line_num - 1]
             if not line.strip():
                 continue
 
-            for pattern in inconsistent_patterns:
-                if re.search(pattern, line, re.IGNORECASE) and len(line.split()) > 5:
+            for inconsistent_matches in counts:
+                if inconsistent_matches and word_counts[line_num - 1] > 5:
                     # Only flag if the line has mostly the inconsistent tense
-                    inconsistent_matches = len(re.findall(pattern, line, re.IGNORECASE))
                     if inconsistent_matches >= 2:
                         issue = GrammarIssue(
                             issue_type=GrammarIssueType.TENSE,
@@ -426,6 +541,7 @@ def review_content_grammar(
     content_id: str = "script-001",
     script_version: str = "v3",
     pass_threshold: int = 85,
+    incremental: bool = False,
 ) -> GrammarReview:
     """Convenience function to review script grammar.
 
@@ -434,6 +550,8 @@ def review_content_grammar(
         content_id: Identifier for the script
         script_version: Version of the script
         pass_threshold: Minimum score required to pass
+        incremental: Re-check only the lines changed since the last review
+            of ``content_id`` in this process (see ``IncrementalReviewer``)
 
     Returns:
         GrammarReview object with all detected issues
@@ -446,10 +564,38 @@ def review_content_grammar(
         >>> for issue in review.issues:
         ...     print(f"Line {issue.line_number}: {issue.explanation}")
     """
+    if incremental:
+        reviewer = incremental_reviewer(ScriptGrammarChecker, pass_threshold)
+        return reviewer.review_content(content_text, content_id, script_version)
+
     checker = ScriptGrammarChecker(pass_threshold=pass_threshold)
     return checker.review_content(content_text, content_id, script_version)
 
 
+def review_many_grammar(
+    scripts: Iterable[ScriptInput],
+    workers: Optional[int] = None,
+    pass_threshold: int = 85,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[BulkReviewResult]:
+    """Review the grammar of many scripts in a process pool.
+
+    Args:
+        scripts: Script texts or ``(content_id, text[, script_version])`` tuples
+        workers: Worker processes (default: ``PRISMQ_REVIEW_WORKERS`` or all cores)
+        pass_threshold: Minimum score required to pass
+        chunk_size: Scripts sent to a worker at a time
+
+    Returns:
+        Iterator of ``BulkReviewResult`` in input order (see ``bulk_review.review_many``)
+
+    Example:
+        >>> for result in review_many_grammar(archive, workers=8):
+        ...     print(result.content_id, result.review.overall_score)
+    """
+    return review_many(scripts, ScriptGrammarChecker, workers, chunk_size, pass_threshold)
+
+
 def review_content_grammar_to_json(
     content_text: str,
     content_id: str = "script-001",
@@ -0,0 +1,524 @@
+"""Dictionary-based spelling for the script grammar checker.
+
+``ScriptGrammarChecker.common_spelling_errors`` only knows a few dozen
+misspellings. This module adds a full dictionary check using a SymSpell
+style symmetric-delete index: every dictionary word is stored under itself
+and under all strings obtained by deleting up to ``max_edit_distance``
+characters from its first ``prefix_length`` characters. Looking up a word
+generates the same deletes of the word and only compares it with the
+dictionary words found under them - no scan of the dictionary, no
+generation of transposes, replaces or inserts.
+
+The index is a single binary file built once from a word-frequency list
+and memory-mapped read-only, so every worker process reading it shares the
+same pages:
+
+    python -m T.Review.Script.Grammar.spelling build --words frequency_dictionary_en_82_765.txt
+    python -m T.Review.Script.Grammar.spelling check recieve quikc
+
+The word list can be SymSpell's ``word count`` format or one word per
+line. The index path is ``PRISMQ_SPELLING_INDEX`` (default
+``<PRISMQ_WORKING_DIRECTORY>/spelling.idx``); ``PRISMQ_SPELLING_LEXICON``
+names a file of extra accepted words (character names, brands), one per
+line.
+
+``Speller`` puts a per-word LRU cache in front of the index: scripts repeat
+their words, so after the first occurrence a word costs one dict lookup.
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+INDEX_ENV = "PRISMQ_SPELLING_INDEX"
+LEXICON_ENV = "PRISMQ_SPELLING_LEXICON"
+DICTIONARY_ENV = "PRISMQ_SPELLING_DICTIONARY"
+
+MAX_EDIT_DISTANCE = 2
+PREFIX_LENGTH = 7
+
+# Words whose lookup result a Speller keeps
+CACHE_SIZE = 65536
+
+# File layout: header, then uint32 arrays (native byte order, recorded in the
+# header) and the UTF-8 words
+_MAGIC = b"PQSPELL1"
+_HEADER = struct.Struct("<8s8I")
+_MAX_FREQUENCY = 2**32 - 1
+
+
+class Suggestion(NamedTuple):
+    """Closest dictionary word to a looked-up word."""
+
+    term: str
+    distance: int
+    frequency: int
+
+
+class SpellingIndexError(Exception):
+    """The index file is missing, corrupt or built for another platform."""
+
+
+def default_index_path() -> Path:
+    """``PRISMQ_SPELLING_INDEX``, or ``spelling.idx`` in the working directory."""
+    configured = os.getenv(INDEX_ENV)
+    if configured:
+        return Path(configured)
+    return Path(os.getenv("PRISMQ_WORKING_DIRECTORY", "C:/PrismQ")) / "spelling.idx"
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Damerau-Levenshtein (optimal string alignment) distance of ``a`` and ``b``.
+
+    Returns ``max_distance + 1`` as soon as the distance is known to exceed
+    ``max_distance``.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    # Common prefixes and suffixes do not change the distance
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if not a or not b:
+        distance = len(a) or len(b)
+        return distance if distance <= max_distance else max_distance + 1
+
+    previous_previous: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j, char_b in enumerate(b, start=1):
+            value = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            )
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    distance = previous[-1]
+    return distance if distance <= max_distance else max_distance + 1
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """``word`` and every string made by deleting up to ``max_distance`` characters."""
+    found = {word}
+    frontier = [word]
+    for _ in range(max_distance):
+        following = []
+        for item in frontier:
+            for index in range(len(item)):
+                delete = item[:index] + item[index + 1 :]
+                if delete not in found:
+                    found.add(delete)
+                    following.append(delete)
+        frontier = following
+    return found
+
+
+def _hash(key: str) -> int:
+    return zlib.crc32(key.encode("utf-8"))
+
+
+def read_word_list(path: Path) -> Iterator[Tuple[str, int]]:
+    """Read ``word count`` lines (SymSpell format) or one word per line.
+
+    Blank lines and lines starting with ``#`` are skipped; a word without a
+    count gets count 1.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if not parts or parts[0].startswith("#"):
+                continue
+            count = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 1
+            yield parts[0], count
+
+
+def build_index(
+    words: Iterable[Tuple[str, int]],
+    path: Path,
+    max_edit_distance: int = MAX_EDIT_DISTANCE,
+    prefix_length: int = PREFIX_LENGTH,
+) -> int:
+    """Build the index file for ``(word, frequency)`` pairs.
+
+    Words are lowercased and their frequencies summed. The file is written
+    next to ``path`` and then moved over it, so processes that have the old
+    index mapped keep a consistent view.
+
+    Returns:
+        Number of dictionary words
+    """
+    if prefix_length <= max_edit_distance:
+        raise ValueError("prefix_length must be larger than max_edit_distance")
+    frequencies: Dict[str, int] = {}
+    for word, count in words:
+        word = word.lower()
+        frequencies[word] = frequencies.get(word, 0) + count
+    terms = sorted(frequencies)
+
+    # Delete (or word) hash -> ids of the words it leads to. Keys are only
+    # stored as hashes: a collision adds a candidate that the distance check
+    # then rejects.
+    buckets: Dict[int, List[int]] = {}
+    for word_id, term in enumerate(terms):
+        keys = _deletes(term[:prefix_length], max_edit_distance)
+        keys.add(term)
+        for key in keys:
+            buckets.setdefault(_hash(key), []).append(word_id)
+
+    slot_count = 1
+    while slot_count < 2 * max(len(buckets), 1):
+        slot_count *= 2
+    slot_hash = array("I", bytes(4 * slot_count))
+    slot_start = array("I", bytes(4 * slot_count))
+    slot_length = array("I", bytes(4 * slot_count))
+    postings = array("I")
+    for key_hash, word_ids in buckets.items():
+        slot = key_hash & (slot_count - 1)
+        while slot_length[slot]:
+            slot = (slot + 1) & (slot_count - 1)
+        slot_hash[slot] = key_hash
+        slot_start[slot] = len(postings)
+        slot_length[slot] = len(word_ids)
+        postings.extend(word_ids)
+
+    encoded = [term.encode("utf-8") for term in terms]
+    offsets = array("I", [0])
+    for term in encoded:
+        offsets.append(offsets[-1] + len(term))
+    counts = array("I", (min(frequencies[term], _MAX_FREQUENCY) for term in terms))
+
+    header = _HEADER.pack(
+        _MAGIC,
+        1 if sys.byteorder == "little" else 0,
+        max_edit_distance,
+        prefix_length,
+        len(terms),
+        slot_count,
+        len(postings),
+        offsets[-1],
+        max((len(term) for term in terms), default=0),
+    )
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, "wb") as f:
+        f.write(header)
+        for section in (offsets, counts, slot_hash, slot_start, slot_length, postings):
+            section.tofile(f)
+        f.write(b"".join(encoded))
+    os.replace(temporary, path)
+    return len(terms)
+
+
+class SpellingIndex:
+    """Read-only, memory-mapped symmetric-delete index (see ``build_index``)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise SpellingIndexError(f"Cannot open spelling index {self.path}: {e}") from e
+
+        if len(self._mmap) < _HEADER.size:
+            raise SpellingIndexError(f"{self.path} is not a spelling index")
+        (
+            magic,
+            little_endian,
+            self.max_edit_distance,
+            self.prefix_length,
+            self.word_count,
+            slot_count,
+            posting_count,
+            word_bytes,
+            self.longest_word,
+        ) = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC:
+            raise SpellingIndexError(f"{self.path} is not a spelling index")
+        if bool(little_endian) != (sys.byteorder == "little"):
+            raise SpellingIndexError(f"{self.path} was built on another platform; rebuild it")
+
+        view = memoryview(self._mmap)
+        position = _HEADER.size
+        sections = []
+        for length in (
+            self.word_count + 1,
+            self.word_count,
+            slot_count,
+            slot_count,
+            slot_count,
+            posting_count,
+        ):
+            sections.append(view[position : position + 4 * length].cast("I"))
+            position += 4 * length
+        (
+            self._offsets,
+            self._frequencies,
+            self._slot_hash,
+            self._slot_start,
+            self._slot_length,
+            self._postings,
+        ) = sections
+        self._words = view[position : position + word_bytes]
+        self._mask = slot_count - 1
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def __contains__(self, word: str) -> bool:
+        return self.frequency(word) > 0
+
+    def close(self) -> None:
+        """Release the mapping (views handed out before become invalid)."""
+        for section in (
+            self._offsets, self._frequencies, self._slot_hash,
+            self._slot_start, self._slot_length, self._postings, self._words,
+        ):
+            section.release()
+        self._mmap.close()
+
+    def _word_ids(self, key: str) -> memoryview:
+        key_hash = _hash(key)
+        slot = key_hash & self._mask
+        while True:
+            length = self._slot_length[slot]
+            if not length:
+                return self._postings[0:0]
+            if self._slot_hash[slot] == key_hash:
+                start = self._slot_start[slot]
+                return self._postings[start : start + length]
+            slot = (slot + 1) & self._mask
+
+    def _term(self, word_id: int) -> str:
+        return str(self._words[self._offsets[word_id] : self._offsets[word_id + 1]], "utf-8")
+
+    def frequency(self, word: str) -> int:
+        """Frequency of ``word`` (lowercased) in the dictionary, 0 if it is not in it."""
+        word = word.lower()
+        encoded = word.encode("utf-8")
+        for word_id in self._word_ids(word):
+            if self._words[self._offsets[word_id] : self._offsets[word_id + 1]] == encoded:
+                return self._frequencies[word_id]
+        return 0
+
+    def lookup(self, word: str, max_distance: Optional[int] = None) -> Optional[Suggestion]:
+        """Closest dictionary word to ``word``: smallest distance, then most frequent.
+
+        Returns ``word`` itself with distance 0 when it is in the dictionary
+        and ``None`` when nothing is within ``max_distance`` edits.
+        """
+        word = word.lower()
+        limit = self.max_edit_distance if max_distance is None else min(
+            max_distance, self.max_edit_distance
+        )
+        frequency = self.frequency(word)
+        if frequency:
+            return Suggestion(word, 0, frequency)
+        if len(word) - limit > self.longest_word:
+            return None
+
+        best: Optional[Suggestion] = None
+        checked: Set[int] = set()
+        prefix = word[: self.prefix_length]
+        queued = {prefix}
+        queue = deque([prefix])
+        while queue:
+            candidate = queue.popleft()
+            deleted = len(prefix) - len(candidate)
+            if best is not None and deleted > best.distance:
+                break  # candidates come in order of deletions; none can be closer
+            for word_id in self._word_ids(candidate):
+                if word_id in checked:
+                    continue
+                checked.add(word_id)
+                term = self._term(word_id)
+                bound = limit if best is None else best.distance
+                if abs(len(term) - len(word)) > bound:
+                    continue
+                distance = edit_distance(word, term, bound)
+                if distance > bound:
+                    continue
+                term_frequency = self._frequencies[word_id]
+                if (
+                    best is None
+                    or distance < best.distance
+                    or (distance == best.distance and term_frequency > best.frequency)
+                ):
+                    best = Suggestion(term, distance, term_frequency)
+            if deleted < limit:
+                for index in range(len(candidate)):
+                    delete = candidate[:index] + candidate[index + 1 :]
+                    if delete not in queued:
+                        queued.add(delete)
+                        queue.append(delete)
+        return best
+
+
+class Speller:
+    """Spelling corrections from a ``SpellingIndex`` plus a custom lexicon.
+
+    Args:
+        index: The dictionary index (``None``: only the lexicon is known and
+            nothing is ever corrected)
+        lexicon: Extra accepted words - character names, brands, jargon
+        cache_size: Words whose result is kept in the LRU cache
+    """
+
+    def __init__(
+        self,
+        index: Optional[SpellingIndex] = None,
+        lexicon: Iterable[str] = (),
+        cache_size: int = CACHE_SIZE,
+    ):
+        self.index = index
+        self.lexicon: Set[str] = {word.lower() for word in lexicon}
+        self._correction = lru_cache(maxsize=cache_size)(self._find_correction)
+
+    def add_words(self, words: Iterable[str]) -> None:
+        """Accept ``words`` from now on."""
+        self.lexicon.update(word.lower() for word in words)
+        self._correction.cache_clear()
+
+    def correction(self, word: str) -> Optional[Suggestion]:
+        """Suggested replacement for a misspelled ``word``.
+
+        ``None`` when the word is in the dictionary or lexicon, or when no
+        dictionary word is close enough to suggest.
+        """
+        return self._correction(word.lower())
+
+    def cache_info(self):
+        """Hits and misses of the per-word cache (``functools`` cache info)."""
+        return self._correction.cache_info()
+
+    def _find_correction(self, word: str) -> Optional[Suggestion]:
+        if self.index is None or word in self.lexicon:
+            return None
+        suggestion = self.index.lookup(word)
+        if suggestion is None or suggestion.distance == 0:
+            return None
+        return suggestion
+
+
+def read_lexicon(path: Path) -> List[str]:
+    """Words of a lexicon file: one per line, ``#`` starts a comment line."""
+    return [word for word, _ in read_word_list(path)]
+
+
+_default_speller: Optional[Speller] = None
+_default_loaded = False
+_default_lock = threading.Lock()
+
+
+def default_speller() -> Optional[Speller]:
+    """The process-wide speller for the configured index, ``None`` without an index.
+
+    Loaded on first use from ``PRISMQ_SPELLING_INDEX`` and
+    ``PRISMQ_SPELLING_LEXICON``; checkers created afterwards share it.
+    """
+    global _default_speller, _default_loaded
+    if _default_loaded:
+        return _default_speller
+    with _default_lock:
+        if not _default_loaded:
+            path = default_index_path()
+            if path.exists():
+                lexicon_path = os.getenv(LEXICON_ENV)
+                lexicon = read_lexicon(Path(lexicon_path)) if lexicon_path else []
+                _default_speller = Speller(SpellingIndex(path), lexicon)
+            _default_loaded = True
+    return _default_speller
+
+
+def reset_default_speller() -> None:
+    """Forget the process-wide speller; the next use reloads the configuration."""
+    global _default_speller, _default_loaded
+    with _default_lock:
+        _default_speller = None
+        _default_loaded = False
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m T.Review.Script.Grammar.spelling",
+        description="Build or query the spelling index of the grammar checker",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Build the index from a word-frequency list")
+    build.add_argument(
+        "--words", help=f"Word list: 'word count' or one word per line (default: ${DICTIONARY_ENV})"
+    )
+    build.add_argument("--lexicon", help="Extra words to add to the dictionary, one per line")
+    build.add_argument("--out", help=f"Index file (default: ${INDEX_ENV} or working directory)")
+    build.add_argument("--max-edit-distance", type=int, default=MAX_EDIT_DISTANCE)
+    build.add_argument("--prefix-length", type=int, default=PREFIX_LENGTH)
+    build.add_argument(
+        "--if-missing", action="store_true",
+        help="Do nothing when the index exists or no word list is configured",
+    )
+
+    check = commands.add_parser("check", help="Look words up in the index")
+    check.add_argument("words", nargs="+")
+    check.add_argument("--index", help="Index file (default: as for build)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        out = Path(args.out) if args.out else default_index_path()
+        words_path = args.words or os.getenv(DICTIONARY_ENV)
+        if args.if_missing and (out.exists() or not words_path):
+            return 0
+        if not words_path:
+            parser.error(f"--words or {DICTIONARY_ENV} is required")
+        words: Iterable[Tuple[str, int]] = read_word_list(Path(words_path))
+        if args.lexicon:
+            lexicon = [(word, 1) for word in read_lexicon(Path(args.lexicon))]
+            words = [*words, *lexicon]
+        count = build_index(words, out, args.max_edit_distance, args.prefix_length)
+        print(f"Indexed {count} words into {out}")
+        return 0
+
+    index = SpellingIndex(Path(args.index) if args.index else default_index_path())
+    try:
+        for word in args.words:
+            suggestion = index.lookup(word)
+            if suggestion is None:
+                print(f"{word}: unknown")
+            elif suggestion.distance == 0:
+                print(f"{word}: ok")
+            else:
+                print(f"{word}: {suggestion.term} (distance {suggestion.distance})")
+    finally:
+        index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
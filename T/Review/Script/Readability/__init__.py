@@ -9,6 +9,7 @@ This module serves as the final script quality gate in the workflow:
 - If FAILS: return to Content Refinement (Stage 11) with voiceover-focused feedback
 """
 
+from .readability_engine import ReadabilityEngine, ReadabilityMetrics, SyllableModel
 from .script_readability_review import (
     ReadabilityIssue,
     ReadabilityIssueType,
@@ -18,6 +19,7 @@ from .script_readability_review import (
     get_readability_feedback,
     review_content_readability,
     review_content_readability_to_json,
+    review_many_readability,
 )
 
 __all__ = [
@@ -28,5 +30,9 @@ __all__ = [
     "ScriptReadabilityChecker",
     "review_content_readability",
     "review_content_readability_to_json",
+    "review_many_readability",
     "get_readability_feedback",
+    "ReadabilityEngine",
+    "ReadabilityMetrics",
+    "SyllableModel",
 ]
@@ -0,0 +1,171 @@
+"""Tests for the voiceover timing and readability index engine."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[6]
+sys.path.insert(0, str(project_root))
+
+from T.Review.Script.Readability.readability_engine import (
+    COMMA_PAUSE,
+    SENTENCE_PAUSE,
+    ComplexWordMatcher,
+    ReadabilityEngine,
+    SyllableModel,
+)
+from T.Review.Script.Readability.script_readability_review import (
+    ReadabilityIssueType,
+    ScriptReadabilityChecker,
+)
+from T.Review.Script.incremental_review import IncrementalReviewer
+from T.Review.Script.script_analysis import analyze_script
+
+# Few words, but about 13 seconds of narration at 150 WPM
+SLOW_LINE = (
+    "Unquestionably, extraordinary international telecommunications "
+    "infrastructure modernization initiatives revolutionized civilization."
+)
+
+
+@pytest.mark.parametrize(
+    "word, syllables",
+    [
+        ("the", 1),
+        ("table", 2),
+        ("walked", 1),
+        ("wanted", 2),
+        ("makes", 1),
+        ("boxes", 2),
+        ("create", 2),
+        ("nation", 2),
+        ("violin", 3),
+        ("yes", 1),
+        ("beautiful", 3),
+        ("phenomenon", 4),
+        ("people", 2),
+        ("42", 3),
+        ("Table", 2),
+    ],
+)
+def test_syllable_model(word, syllables):
+    assert SyllableModel().count(word) == syllables
+
+
+def test_syllable_model_caches_words():
+    model = SyllableModel(cache_size=2)
+    for word in ("river", "river", "river", "stone"):
+        model.count(word)
+    info = model.cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (2, 2, 2)
+
+
+def test_sentence_time_follows_syllables_and_pauses():
+    engine = ReadabilityEngine(words_per_minute=120)
+    short = engine.time_sentence("The cat sat on the mat.")
+    long = engine.time_sentence("Unquestionably, extraordinary implementations materialized.")
+
+    assert short.words == 6 and short.syllables == 6
+    assert short.seconds == pytest.approx(6 * 60 / (120 * 1.4))
+    assert long.pauses == 1
+    assert long.seconds == pytest.approx(
+        long.syllables * engine.seconds_per_syllable + COMMA_PAUSE
+    )
+    assert long.seconds > short.seconds
+
+
+def test_faster_narration_shortens_duration():
+    analysis = analyze_script("The fox ran home.\nIt was late, and the night was cold.")
+    slow = ReadabilityEngine(words_per_minute=120).measure(analysis)
+    fast = ReadabilityEngine(words_per_minute=180).measure(analysis)
+
+    assert fast.duration_seconds < slow.duration_seconds
+    assert slow.sentences == 2 and slow.words == 12
+
+
+def test_indices_match_formulas():
+    analysis = analyze_script("The cat sat on the mat. The dog ran to the big red barn.")
+    metrics = ReadabilityEngine().measure(analysis)
+
+    assert (metrics.sentences, metrics.words, metrics.syllables, metrics.polysyllables) == (
+        2, 14, 14, 0,
+    )
+    assert metrics.flesch_reading_ease == pytest.approx(206.835 - 1.015 * 7 - 84.6)
+    assert metrics.flesch_kincaid_grade == pytest.approx(0.39 * 7 + 11.8 - 15.59)
+    assert metrics.gunning_fog == pytest.approx(2.8)
+    assert metrics.duration_seconds == pytest.approx(
+        14 * ReadabilityEngine().seconds_per_syllable + 2 * SENTENCE_PAUSE
+    )
+
+
+def test_directions_are_not_timed():
+    plain = ReadabilityEngine().measure(analyze_script("She opened the door."))
+    directed = ReadabilityEngine().measure(
+        analyze_script("[Music swells dramatically]\nShe opened the door.")
+    )
+    assert directed == plain
+
+
+def test_empty_script_metrics():
+    metrics = ReadabilityEngine().measure(analyze_script(""))
+    assert metrics.words == 0 and metrics.duration_seconds == 0.0
+
+
+def test_invalid_words_per_minute():
+    with pytest.raises(ValueError):
+        ReadabilityEngine(words_per_minute=-10)
+
+
+def test_complex_word_pattern_matches_substring_search():
+    words = list(ScriptReadabilityChecker.COMPLEX_WORDS)
+    matcher = ComplexWordMatcher(words)
+    lines = [
+        "subsequently, the methodology was nevertheless particularly odd",
+        "a phenomenonal implementationist",
+        "nothing complex here",
+        "specifically and particularly",
+    ]
+    for line in lines:
+        expected = next((word for word in words if word in line), None)
+        assert matcher.first(line) == expected
+
+
+def test_extended_complex_words_are_found():
+    class CustomChecker(ScriptReadabilityChecker):
+        COMPLEX_WORDS = {**ScriptReadabilityChecker.COMPLEX_WORDS, "utilize": "use"}
+
+    review = CustomChecker().review_content("We utilize the tools.")
+    assert [i.issue_type for i in review.issues] == [ReadabilityIssueType.MOUTHFEEL]
+
+
+def test_review_records_metrics():
+    review = ScriptReadabilityChecker(words_per_minute=160).review_content(
+        "The fox ran home. It was late."
+    )
+    assert review.metadata["words_per_minute"] == "160"
+    assert float(review.metadata["estimated_duration_seconds"]) > 0
+    assert "flesch_reading_ease" in review.metadata
+
+
+def test_slow_short_sentence_is_flagged():
+    review = ScriptReadabilityChecker().review_content(SLOW_LINE)
+    pacing = [i for i in review.issues if i.issue_type == ReadabilityIssueType.PACING]
+
+    assert len(pacing) == 1
+    assert "to speak at 150 WPM" in pacing[0].explanation
+
+
+def test_incremental_review_matches_full_review():
+    checker = ScriptReadabilityChecker()
+    reviewer = IncrementalReviewer(checker)
+    before = "The fox ran home.\nThe methodology was odd."
+    after = before + "\n" + SLOW_LINE
+
+    reviewer.review_content(before)
+    incremental = reviewer.review_content(after)
+    full = checker.review_content(after)
+    assert not reviewer.last_stats.full_review
+    assert any("to speak at" in i.explanation for i in incremental.issues)
+    assert [i.explanation for i in incremental.issues] == [i.explanation for i in full.issues]
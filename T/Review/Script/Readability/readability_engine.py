@@ -0,0 +1,281 @@
+"""Voiceover timing and readability indices for scripts.
+
+``ScriptReadabilityChecker`` flags pronunciation and pacing problems line by
+line; narration also needs to know how long a script takes to speak and how
+hard it is to follow. ``ReadabilityEngine`` computes both from one pass over
+a script's sentences:
+
+- syllables per word come from ``SyllableModel``, a rule-based estimate with
+  a per-word LRU cache (scripts reuse a small vocabulary, so almost every
+  lookup after the first script is a cache hit);
+- each sentence gets an estimated speaking time at ``words_per_minute``
+  (default ``PRISMQ_VOICEOVER_WPM`` or 150), weighted by its syllables so
+  that a sentence of long words takes longer than one of short words, plus
+  pauses at commas and sentence ends;
+- Flesch Reading Ease, Flesch-Kincaid grade, Gunning Fog, SMOG,
+  Coleman-Liau and ARI are derived from the same word, sentence, syllable,
+  letter and polysyllable counts.
+
+    >>> metrics = ReadabilityEngine().measure(analyze_script(script_text))
+    >>> metrics.flesch_reading_ease, metrics.duration_seconds
+
+``ComplexWordMatcher`` compiles a word list into one trie-shaped regex, so
+the checker finds its complex words in one scan of a line instead of one
+substring search per word.
+"""
+
+import math
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from ..Grammar.rule_engine import keyword_trie_pattern
+from ..script_analysis import ScriptAnalysis, Sentence
+
+# Narration speed (words per minute) used for speaking-time estimates
+DEFAULT_WORDS_PER_MINUTE = float(os.getenv("PRISMQ_VOICEOVER_WPM", "150"))
+
+# Average syllables per spoken English word; converts WPM to syllable time
+SYLLABLES_PER_WORD = 1.4
+
+# Pauses a narrator takes, in seconds
+COMMA_PAUSE = 0.25
+SENTENCE_PAUSE = 0.5
+
+# Words cached by each SyllableModel
+CACHE_SIZE = 16384
+
+_WORD = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?|\d+")
+_VOWEL_GROUP = re.compile(r"[aeiouy]+")
+_LETTER = re.compile(r"[A-Za-z0-9]")
+_COMMA = re.compile(r"[,;:—]")
+
+# Vowel pairs that are spoken as two syllables (cre-ate, i-de-a, vi-o-lin)
+_HIATUS = re.compile(r"[^aeiouy]?(?:ia|io|eo|ua|uo|ea(?=te|tion))")
+# Endings where the hiatus rule does not apply (na-tion, so-cial, vi-sion)
+_SOFT_ENDING = re.compile(r"(?:[cgst]i(?:a|o)|[cgst]eo)")
+
+# Words the rules get wrong
+_EXCEPTIONS: Dict[str, int] = {
+    "area": 3,
+    "being": 2,
+    "business": 2,
+    "every": 2,
+    "everything": 3,
+    "evening": 2,
+    "family": 3,
+    "fire": 1,
+    "hour": 1,
+    "idea": 3,
+    "people": 2,
+    "poem": 2,
+    "quiet": 2,
+    "science": 2,
+    "something": 2,
+    "wednesday": 2,
+    "whole": 1,
+}
+
+
+def _estimate_syllables(word: str) -> int:
+    """Rule-based syllable count of one lowercase word or digit string."""
+    if not word:
+        return 0
+    if word.isdigit():
+        # Numbers are read out: "42" is for-ty-two, "1999" nine-teen nine-ty-nine
+        return max(1, math.ceil(len(word) * 1.5))
+    word = word.replace("'", "")
+    if word in _EXCEPTIONS:
+        return _EXCEPTIONS[word]
+    # A leading "y" is a consonant (yes, young)
+    body = word[1:] if word.startswith("y") else word
+    count = len(_VOWEL_GROUP.findall(body))
+    # Silent final "e", except "-le" after a consonant (ta-ble) and "-ee"
+    if word.endswith("e") and not word.endswith(("ee", "ye")) and count > 1:
+        if not (word.endswith("le") and len(word) > 2 and word[-3] not in "aeiouy"):
+            count -= 1
+    # Silent "-ed" (walked) unless after t or d (wanted), silent "-es" (makes)
+    # unless after a sibilant (boxes, wishes, judges)
+    elif word.endswith("ed") and len(word) > 3 and word[-3] not in "td" and count > 1:
+        count -= 1
+    elif (
+        word.endswith("es")
+        and len(word) > 3
+        and count > 1
+        and not word.endswith(("ses", "xes", "zes", "ches", "shes", "ges", "ces"))
+    ):
+        count -= 1
+    for match in _HIATUS.finditer(word):
+        if not _SOFT_ENDING.match(match.group()):
+            count += 1
+    return max(1, count)
+
+
+class SyllableModel:
+    """Syllable counts per word, cached in an LRU of ``cache_size`` words."""
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        self._count = lru_cache(maxsize=cache_size)(_estimate_syllables)
+
+    def count(self, word: str) -> int:
+        """Estimated syllables of ``word`` (case-insensitive)."""
+        return self._count(word.lower())
+
+    def cache_info(self):
+        """``functools`` cache statistics of the word LRU."""
+        return self._count.cache_info()
+
+
+class SentenceTiming(NamedTuple):
+    """Counts and estimated speaking time of one sentence."""
+
+    line: int
+    text: str
+    words: int
+    syllables: int
+    polysyllables: int  # words of 3+ syllables
+    letters: int
+    pauses: int  # commas, semicolons, colons and dashes
+    seconds: float
+
+
+class ReadabilityMetrics(NamedTuple):
+    """Readability indices and narration time of a script."""
+
+    words_per_minute: float
+    sentences: int
+    words: int
+    syllables: int
+    polysyllables: int
+    duration_seconds: float
+    longest_sentence_seconds: float
+    flesch_reading_ease: float
+    flesch_kincaid_grade: float
+    gunning_fog: float
+    smog_index: float
+    coleman_liau: float
+    automated_readability: float
+
+    def to_metadata(self) -> Dict[str, str]:
+        """The metrics as ``ReadabilityReview.metadata`` strings."""
+        return {
+            "words_per_minute": f"{self.words_per_minute:g}",
+            "estimated_duration_seconds": f"{self.duration_seconds:.1f}",
+            "longest_sentence_seconds": f"{self.longest_sentence_seconds:.1f}",
+            "flesch_reading_ease": f"{self.flesch_reading_ease:.1f}",
+            "flesch_kincaid_grade": f"{self.flesch_kincaid_grade:.1f}",
+            "gunning_fog": f"{self.gunning_fog:.1f}",
+            "smog_index": f"{self.smog_index:.1f}",
+            "coleman_liau": f"{self.coleman_liau:.1f}",
+            "automated_readability": f"{self.automated_readability:.1f}",
+        }
+
+
+class ComplexWordMatcher:
+    """Finds the listed words in lowercase text with one trie-shaped pattern.
+
+    The words are factored into a prefix trie, so a line is scanned once
+    whatever the number of words; like ``word in line`` a word also matches
+    inside longer words. Earlier words in the list win when a line has several.
+    """
+
+    def __init__(self, words: Sequence[str]):
+        self.pattern = re.compile(f"(?=({keyword_trie_pattern(words)}))")
+        self.priority = {word: index for index, word in enumerate(words)}
+
+    def first(self, line_lower: str) -> Optional[str]:
+        """The earliest-listed word in ``line_lower``, if any."""
+        found = {match.group(1) for match in self.pattern.finditer(line_lower)}
+        return min(found, key=self.priority.__getitem__) if found else None
+
+
+@lru_cache(maxsize=32)
+def complex_word_matcher(words: Tuple[str, ...]) -> ComplexWordMatcher:
+    """Shared matcher for a word list (checkers may extend their lists)."""
+    return ComplexWordMatcher(words)
+
+
+class ReadabilityEngine:
+    """Speaking time and readability indices of scripts.
+
+    Args:
+        words_per_minute: Narration speed (default ``PRISMQ_VOICEOVER_WPM`` or 150)
+        syllables: Syllable model (default: a new ``SyllableModel``)
+    """
+
+    def __init__(
+        self,
+        words_per_minute: Optional[float] = None,
+        syllables: Optional[SyllableModel] = None,
+    ):
+        self.words_per_minute = words_per_minute or DEFAULT_WORDS_PER_MINUTE
+        if self.words_per_minute <= 0:
+            raise ValueError(f"words_per_minute must be positive, got {self.words_per_minute}")
+        self.syllables = syllables or SyllableModel()
+        self.seconds_per_syllable = 60.0 / (self.words_per_minute * SYLLABLES_PER_WORD)
+
+    def time_sentence(self, text: str, line: int = 0) -> SentenceTiming:
+        """Counts and speaking time of one sentence (without the pause after it)."""
+        count = self.syllables.count
+        words = syllables = polysyllables = 0
+        for word in _WORD.findall(text):
+            word_syllables = count(word)
+            words += 1
+            syllables += word_syllables
+            polysyllables += word_syllables >= 3
+        pauses = len(_COMMA.findall(text))
+        seconds = syllables * self.seconds_per_syllable + pauses * COMMA_PAUSE
+        return SentenceTiming(
+            line, text, words, syllables, polysyllables, len(_LETTER.findall(text)), pauses, seconds
+        )
+
+    def time_sentences(self, sentences: Iterable[Sentence]) -> List[SentenceTiming]:
+        """Timings of ``sentences`` (``ScriptAnalysis.sentences`` items)."""
+        return [self.time_sentence(sentence.text, sentence.line) for sentence in sentences]
+
+    def measure(self, analysis: ScriptAnalysis) -> ReadabilityMetrics:
+        """Metrics of the narrated (non-direction) lines of a script."""
+        directions = analysis.direction_lines
+        return self.measure_timings(
+            self.time_sentences(s for s in analysis.sentences if not directions[s.line - 1])
+        )
+
+    def measure_timings(self, timings: Sequence[SentenceTiming]) -> ReadabilityMetrics:
+        """Metrics from sentence timings, accumulated in one pass."""
+        sentences = words = syllables = polysyllables = letters = 0
+        spoken = longest = 0.0
+        for timing in timings:
+            if not timing.words:
+                continue
+            sentences += 1
+            words += timing.words
+            syllables += timing.syllables
+            polysyllables += timing.polysyllables
+            letters += timing.letters
+            spoken += timing.seconds
+            longest = max(longest, timing.seconds)
+
+        if not words:
+            return ReadabilityMetrics(
+                self.words_per_minute, 0, 0, 0, 0, 0.0, 0.0, 100.0, 0.0, 0.0, 0.0, 0.0, 0.0
+            )
+        words_per_sentence = words / sentences
+        syllables_per_word = syllables / words
+        letters_per_100 = letters / words * 100
+        sentences_per_100 = sentences / words * 100
+        return ReadabilityMetrics(
+            words_per_minute=self.words_per_minute,
+            sentences=sentences,
+            words=words,
+            syllables=syllables,
+            polysyllables=polysyllables,
+            duration_seconds=spoken + sentences * SENTENCE_PAUSE,
+            longest_sentence_seconds=longest,
+            flesch_reading_ease=206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word,
+            flesch_kincaid_grade=0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59,
+            gunning_fog=0.4 * (words_per_sentence + 100 * polysyllables / words),
+            smog_index=1.043 * math.sqrt(polysyllables * 30 / sentences) + 3.1291,
+            coleman_liau=0.0588 * letters_per_100 - 0.296 * sentences_per_100 - 15.8,
+            automated_readability=4.71 * letters / words + 0.5 * words_per_sentence - 21.43,
+        )
@@ -17,7 +17,12 @@ import re
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ..bulk_review import DEFAULT_CHUNK_SIZE, BulkReviewResult, ScriptInput, review_many
+from ..incremental_review import LineResults, incremental_reviewer
+from ..script_analysis import ScriptAnalysis, Sentence, analyze_script
+from .readability_engine import ComplexWordMatcher, ReadabilityEngine, complex_word_matcher
 
 
 class ReadabilityIssueType(Enum):
@@ -369,17 +374,25 @@ class ScriptReadabilityChecker:
     # Long sentence thresholds for voiceover
     MAX_WORDS_PER_BREATH = 15  # Maximum comfortable words in one breath
     LONG_SENTENCE_WORDS = 20  # Flag sentences longer than this
+    MAX_SENTENCE_SECONDS = 12.0  # Flag shorter sentences that take longer to speak
 
-    def __init__(self, pass_threshold: int = 85):
+    def __init__(self, pass_threshold: int = 85, words_per_minute: Optional[float] = None):
         """Initialize the readability checker.
 
         Args:
             pass_threshold: Minimum score (0-100) required to pass review
+            words_per_minute: Narration speed for timing estimates (default
+                ``PRISMQ_VOICEOVER_WPM`` or 150)
         """
         self.pass_threshold = pass_threshold
+        self.engine = ReadabilityEngine(words_per_minute)
 
     def review_content(
-        self, content_text: str, content_id: str = "script-001", script_version: str = "v3"
+        self,
+        content_text: str,
+        content_id: str = "script-001",
+        script_version: str = "v3",
+        analysis: Optional[ScriptAnalysis] = None,
     ) -> ReadabilityReview:
         """Review a script for voiceover readability.
 
@@ -387,40 +400,89 @@ class ScriptReadabilityChecker:
             content_text: The script text to review
             content_id: Identifier for the script
             script_version: Version of the script (v3, v4, etc.)
+            analysis: Shared tokenization of ``content_text`` (looked up
+                with ``analyze_script`` when omitted)
 
         Returns:
             ReadabilityReview object with all detected issues
         """
-        review = ReadabilityReview(
-            content_id=content_id, script_version=script_version, pass_threshold=self.pass_threshold
-        )
+        analysis = analysis or analyze_script(content_text)
+        results = self.check_lines(analysis)
+        return self.complete_review(analysis, results, content_id, script_version)
 
-        # Split script into lines for line-by-line analysis
-        lines = content_text.split("\n")
+    def check_lines(
+        self, analysis: ScriptAnalysis, line_numbers: Optional[List[int]] = None
+    ) -> LineResults:
+        """Run the per-line voiceover checks (all readability checks are line-local).
 
-        # Check each line
-        for line_num, line in enumerate(lines, start=1):
-            if not line.strip():
-                continue
+        Args:
+            analysis: The script to check
+            line_numbers: Non-blank lines to check (default: all of them)
+
+        Returns:
+            Issues per line
+        """
+        lines = analysis.lines
+        complex_words = complex_word_matcher(tuple(self.COMPLEX_WORDS))
+        sentences: Dict[int, List[Sentence]] = {}
+        for sentence in analysis.sentences:
+            sentences.setdefault(sentence.line, []).append(sentence)
+        if line_numbers is None:
+            line_numbers = analysis.content_lines
+            # Word-level rules run once over the whole script
+            cluster_matches = [
+                analysis.line_matches(pattern, re.IGNORECASE) for pattern in self.DIFFICULT_CLUSTERS
+            ]
+        else:
+            cluster_matches = None
 
+        collected = ReadabilityReview(content_id=analysis.digest)
+        for line_num in line_numbers:
             # Skip stage directions and formatting
-            if line.strip().startswith(("[", "(", "*", "INT.", "EXT.")):
+            if analysis.direction_lines[line_num - 1]:
                 continue
+            line = lines[line_num - 1]
 
             # Check for pronunciation difficulties
-            self._check_pronunciation(line, line_num, review)
+            self._check_pronunciation(
+                line,
+                line_num,
+                collected,
+                cluster_matches and [found.get(line_num, ()) for found in cluster_matches],
+            )
 
             # Check for tongue twisters
-            self._check_tongue_twisters(line, line_num, review)
+            self._check_tongue_twisters(line, line_num, collected)
 
             # Check for pacing issues (sentence length)
-            self._check_pacing(line, line_num, review)
+            word_count = analysis.word_counts[line_num - 1]
+            self._check_pacing(line, line_num, collected, analysis.split_words[line_num - 1])
+            if word_count <= self.LONG_SENTENCE_WORDS:
+                self._check_speaking_time(line, line_num, collected, sentences.get(line_num, ()))
 
             # Check for breath points
-            self._check_breath_points(line, line_num, review)
+            self._check_breath_points(line, line_num, collected)
 
             # Check for complex words
-            self._check_complex_words(line, line_num, review)
+            self._check_complex_words(
+                line, line_num, collected, analysis.lowered[line_num - 1], complex_words
+            )
+
+        return LineResults.from_issues(collected.issues)
+
+    def complete_review(
+        self,
+        analysis: ScriptAnalysis,
+        results: LineResults,
+        content_id: str = "script-001",
+        script_version: str = "v3",
+    ) -> ReadabilityReview:
+        """Build the review from line results: scores and voiceover feedback."""
+        review = ReadabilityReview(
+            content_id=content_id, script_version=script_version, pass_threshold=self.pass_threshold
+        )
+        for issue in results.ordered_issues():
+            review.add_issue(issue)
 
         # Calculate scores
         review.pronunciation_score = self._calculate_pronunciation_score(review)
@@ -439,17 +501,28 @@ class ScriptReadabilityChecker:
         # Recalculate pass status with final score
         review._recalculate_pass_status()
 
+        # Narration time and readability indices
+        review.metadata.update(self.engine.measure(analysis).to_metadata())
+
         # Generate summary and feedback
         self._generate_feedback(review)
 
         return review
 
-    def _check_pronunciation(self, line: str, line_num: int, review: ReadabilityReview) -> None:
+    def _check_pronunciation(
+        self,
+        line: str,
+        line_num: int,
+        review: ReadabilityReview,
+        cluster_matches: Optional[List[List[str]]] = None,
+    ) -> None:
         """Check for difficult pronunciation patterns."""
-        for pattern in self.DIFFICULT_CLUSTERS:
-            matches = re.finditer(pattern, line, re.IGNORECASE)
-            for match in matches:
-                word = match.group()
+        if cluster_matches is None:
+            cluster_matches = [
+                re.findall(pattern, line, re.IGNORECASE) for pattern in self.DIFFICULT_CLUSTERS
+            ]
+        for words in cluster_matches:
+            for word in words:
                 issue = ReadabilityIssue(
                     issue_type=ReadabilityIssueType.PRONUNCIATION,
                     severity=ReadabilitySeverity.HIGH,
@@ -477,14 +550,21 @@ class ScriptReadabilityChecker:
                 review.add_issue(issue)
                 break  # Only flag once per line
 
-    def _check_pacing(self, line: str, line_num: int, review: ReadabilityReview) -> None:
+    def _check_pacing(
+        self,
+        line: str,
+        line_num: int,
+        review: ReadabilityReview,
+        words: Optional[List[str]] = None,
+    ) -> None:
         """Check for pacing issues based on sentence length."""
         stripped = line.strip()
         if not stripped:
             return
 
         # Count words
-        words = stripped.split()
+        if words is None:
+            words = stripped.split()
         word_count = len(words)
 
         # Check for overly long sentences
@@ -513,6 +593,33 @@ class ScriptReadabilityChecker:
             )
             review.add_issue(issue)
 
+    def _check_speaking_time(
+        self,
+        line: str,
+        line_num: int,
+        review: ReadabilityReview,
+        sentences: Iterable[Sentence],
+    ) -> None:
+        """Check for sentences that take too long to speak despite few words."""
+        for sentence in sentences:
+            timing = self.engine.time_sentence(sentence.text, line_num)
+            if timing.seconds > self.MAX_SENTENCE_SECONDS:
+                issue = ReadabilityIssue(
+                    issue_type=ReadabilityIssueType.PACING,
+                    severity=ReadabilitySeverity.MEDIUM,
+                    line_number=line_num,
+                    text=line.strip(),
+                    suggestion="Use shorter words or split the sentence to keep a steady pace",
+                    explanation=(
+                        f"Sentence takes about {timing.seconds:.1f}s to speak at "
+                        f"{self.engine.words_per_minute:g} WPM ({timing.syllables} syllables "
+                        f"in {timing.words} words)"
+                    ),
+                    confidence=75,
+                )
+                review.add_issue(issue)
+                break  # Only flag once per line
+
     def _check_breath_points(self, line: str, line_num: int, review: ReadabilityReview) -> None:
         """Check for adequate breathing points in the script."""
         stripped = line.strip()
@@ -537,23 +644,34 @@ class ScriptReadabilityChecker:
                 review.add_issue(issue)
                 break  # Only flag once per line
 
-    def _check_complex_words(self, line: str, line_num: int, review: ReadabilityReview) -> None:
+    def _check_complex_words(
+        self,
+        line: str,
+        line_num: int,
+        review: ReadabilityReview,
+        line_lower: Optional[str] = None,
+        complex_words: Optional[ComplexWordMatcher] = None,
+    ) -> None:
         """Check for complex words that are hard to speak naturally."""
-        line_lower = line.lower()
-
-        for complex_word, simple_word in self.COMPLEX_WORDS.items():
-            if complex_word in line_lower:
-                issue = ReadabilityIssue(
-                    issue_type=ReadabilityIssueType.MOUTHFEEL,
-                    severity=ReadabilitySeverity.LOW,
-                    line_number=line_num,
-                    text=line.strip(),
-                    suggestion=f"Consider replacing '{complex_word}' with '{simple_word}' for easier voiceover",
-                    explanation=f"Word '{complex_word}' is complex and formal; simpler alternatives flow better in narration",
-                    confidence=70,
-                )
-                review.add_issue(issue)
-                break  # Only flag one complex word per line
+        if line_lower is None:
+            line_lower = line.lower()
+        if complex_words is None:
+            complex_words = complex_word_matcher(tuple(self.COMPLEX_WORDS))
+
+        # Only flag one complex word per line
+        complex_word = complex_words.first(line_lower)
+        if complex_word is not None:
+            simple_word = self.COMPLEX_WORDS[complex_word]
+            issue = ReadabilityIssue(
+                issue_type=ReadabilityIssueType.MOUTHFEEL,
+                severity=ReadabilitySeverity.LOW,
+                line_number=line_num,
+                text=line.strip(),
+                suggestion=f"Consider replacing '{complex_word}' with '{simple_word}' for easier voiceover",
+                explanation=f"Word '{complex_word}' is complex and formal; simpler alternatives flow better in narration",
+                confidence=70,
+            )
+            review.add_issue(issue)
 
     def _calculate_pronunciation_score(self, review: ReadabilityReview) -> int:
         """Calculate pronunciation ease score."""
@@ -676,6 +794,7 @@ def review_content_readability(
     content_id: str = "script-001",
     script_version: str = "v3",
     pass_threshold: int = 85,
+    incremental: bool = False,
 ) -> ReadabilityReview:
     """Convenience function to review script readability for voiceover.
 
@@ -684,6 +803,8 @@ def review_content_readability(
         content_id: Identifier for the script
         script_version: Version of the script
         pass_threshold: Minimum score required to pass
+        incremental: Re-check only the lines changed since the last review
+            of ``content_id`` in this process (see ``IncrementalReviewer``)
 
     Returns:
         ReadabilityReview object with all detected issues
@@ -696,10 +817,38 @@ def review_content_readability(
         >>> for issue in review.issues:
         ...     print(f"Line {issue.line_number}: {issue.explanation}")
     """
+    if incremental:
+        reviewer = incremental_reviewer(ScriptReadabilityChecker, pass_threshold)
+        return reviewer.review_content(content_text, content_id, script_version)
+
     checker = ScriptReadabilityChecker(pass_threshold=pass_threshold)
     return checker.review_content(content_text, content_id, script_version)
 
 
+def review_many_readability(
+    scripts: Iterable[ScriptInput],
+    workers: Optional[int] = None,
+    pass_threshold: int = 85,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[BulkReviewResult]:
+    """Review the readability of many scripts in a process pool.
+
+    Args:
+        scripts: Script texts or ``(content_id, text[, script_version])`` tuples
+        workers: Worker processes (default: ``PRISMQ_REVIEW_WORKERS`` or all cores)
+        pass_threshold: Minimum score required to pass
+        chunk_size: Scripts sent to a worker at a time
+
+    Returns:
+        Iterator of ``BulkReviewResult`` in input order (see ``bulk_review.review_many``)
+
+    Example:
+        >>> for result in review_many_readability(archive, workers=8):
+        ...     print(result.content_id, result.review.overall_score)
+    """
+    return review_many(scripts, ScriptReadabilityChecker, workers, chunk_size, pass_threshold)
+
+
 def review_content_readability_to_json(
     content_text: str,
     content_id: str = "script-001",
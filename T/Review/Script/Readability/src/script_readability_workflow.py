@@ -35,6 +35,7 @@ except ImportError:
 
 try:
     from review_script_readability_service import ScriptReadabilityReviewService
+    from Model.Infrastructure.workflow import StageTelemetry
     SERVICE_AVAILABLE = True
 except Exception as e:
     SERVICE_AVAILABLE = False
@@ -108,6 +109,7 @@ def main():
         return 1
 
     service = ScriptReadabilityReviewService(conn)
+    telemetry = StageTelemetry("17")
 
     run_count = 0
     total_processed = 0
@@ -133,7 +135,7 @@ def main():
 
             print_success(f"Found {pending_count} stories ready for script readability review")
 
-            result = service.process_oldest_story()
+            result = telemetry.run(service.process_oldest_story)
 
             if result is None:
                 print_warning("No story found to process")
@@ -35,6 +35,7 @@ except ImportError:
 
 try:
     from review_script_tone import ScriptToneReviewService
+    from Model.Infrastructure.workflow import StageTelemetry
     SERVICE_AVAILABLE = True
 except Exception as e:
     SERVICE_AVAILABLE = False
@@ -108,6 +109,7 @@ def main():
         return 1
 
     service = ScriptToneReviewService(conn)
+    telemetry = StageTelemetry("12")
 
     run_count = 0
     total_processed = 0
@@ -139,7 +141,7 @@ def main():
             else:
                 print_success(f"Found {pending_count} pending stories")
 
-            result = service.process_oldest_story()
+            result = telemetry.run(service.process_oldest_story)
 
             if result.story_id is None:
                 print_warning("No story found to process")
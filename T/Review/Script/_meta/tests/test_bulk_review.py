@@ -0,0 +1,146 @@
+"""Tests for bulk review of many scripts and the archive re-review CLI."""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[5]
+sys.path.insert(0, str(project_root))
+
+from Model.Entities.content import Content
+from T._shared.db.script_check_db import ScriptCheckDB
+from T.Review.Script import rereview as rereview_cli
+from T.Review.Script.bulk_review import BulkScript, review_many
+from T.Review.Script.Consistency.consistency_review import ScriptConsistencyChecker
+from T.Review.Script.Editing.script_editing_review import ScriptEditingChecker
+from T.Review.Script.Grammar import review_many_grammar
+from T.Review.Script.Grammar.script_grammar_review import ScriptGrammarChecker
+
+SCRIPTS = [
+    "She walk to the store. They was happy.",
+    "Anna met John. Later, Annie left the house.",
+    "In order to succeed, we must basically try very hard.",
+    "The the cat sat. It were late.",
+    "A clear and simple line.",
+]
+
+
+def comparable(review):
+    data = review.to_dict()
+    data.pop("reviewed_at", None)
+    for key in ("characters_found", "locations_found"):
+        if key in data:
+            data[key] = sorted(data[key])
+    return data
+
+
+class TestReviewMany:
+    def test_same_reviews_as_one_by_one(self):
+        results = list(review_many(SCRIPTS, ScriptGrammarChecker, workers=1, chunk_size=2))
+        assert [result.content_id for result in results] == [
+            "script-001", "script-002", "script-003", "script-004", "script-005",
+        ]
+        for text, result in zip(SCRIPTS, results):
+            expected = ScriptGrammarChecker().review_content(text, result.content_id)
+            assert result.error is None
+            assert comparable(result.review) == comparable(expected)
+
+    def test_process_pool_keeps_input_order(self):
+        scripts = [(f"c{index}", text, "v4") for index, text in enumerate(SCRIPTS * 4)]
+        pooled = list(review_many(scripts, ScriptConsistencyChecker, workers=2, chunk_size=3))
+        assert [result.content_id for result in pooled] == [script[0] for script in scripts]
+        for (content_id, text, version), result in zip(scripts, pooled):
+            expected = ScriptConsistencyChecker().review_content(text, content_id, version)
+            assert comparable(result.review) == comparable(expected)
+
+    def test_failing_script_does_not_stop_the_run(self):
+        scripts = [BulkScript("ok", "Fine text."), BulkScript("bad", None), ("ok2", "More text.")]
+        results = list(review_many(scripts, ScriptEditingChecker, workers=1))
+        assert [result.error is None for result in results] == [True, False, True]
+        assert results[1].review is None
+        assert results[1].error.startswith("AttributeError")
+
+    def test_pass_threshold(self):
+        [strict] = review_many_grammar(["They was late."], workers=1, pass_threshold=100)
+        [lenient] = review_many_grammar(["They was late."], workers=1, pass_threshold=50)
+        assert strict.review.pass_threshold == 100
+        assert not strict.review.passes
+        assert lenient.review.pass_threshold == 50
+
+    def test_invalid_arguments(self):
+        with pytest.raises(TypeError, match="pass_threshold"):
+            list(review_many(SCRIPTS, lambda: ScriptGrammarChecker(), workers=2, pass_threshold=1))
+        with pytest.raises(ValueError, match="chunk_size"):
+            list(review_many(SCRIPTS, ScriptGrammarChecker, workers=1, chunk_size=0))
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "db.s3db"
+    conn = sqlite3.connect(path)
+    conn.executescript(Content.get_sql_schema())
+    conn.executemany(
+        "INSERT INTO Content (story_id, version, text) VALUES (?, ?, ?)",
+        [
+            (1, 0, "Old draft."),
+            (1, 1, SCRIPTS[0]),
+            (2, 0, SCRIPTS[1]),
+            (3, 0, "First."),
+            (3, 1, "Second."),
+            (3, 2, SCRIPTS[3]),
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def check_rows(path):
+    conn = sqlite3.connect(path)
+    rows = conn.execute(
+        "SELECT c.story_id, c.version, s.checker, s.score, s.error "
+        "FROM ScriptCheck s JOIN Content c ON c.id = s.content_id ORDER BY c.story_id, s.checker"
+    ).fetchall()
+    conn.close()
+    return rows
+
+
+class TestRereview:
+    def test_latest_contents(self, db_path):
+        db = ScriptCheckDB(sqlite3.connect(db_path))
+        latest = [(c.story_id, c.version) for c in db.iter_latest_contents()]
+        assert latest == [(1, 1), (2, 0), (3, 2)]
+        assert len(list(db.iter_latest_contents(limit=2))) == 2
+
+    def test_writes_one_row_per_latest_content_and_checker(self, db_path):
+        conn = sqlite3.connect(db_path)
+        summary = rereview_cli.rereview(
+            ScriptCheckDB(conn), ["grammar", "editing"], workers=1, batch_size=2
+        )
+        conn.close()
+        assert summary["grammar"]["reviewed"] == 3
+        rows = check_rows(db_path)
+        assert [(story, version, checker) for story, version, checker, _, _ in rows] == [
+            (1, 1, "editing"), (1, 1, "grammar"),
+            (2, 0, "editing"), (2, 0, "grammar"),
+            (3, 2, "editing"), (3, 2, "grammar"),
+        ]
+        expected = ScriptGrammarChecker().review_content(SCRIPTS[3]).overall_score
+        assert rows[5][3] == expected
+
+    def test_rerun_replaces_results(self, db_path):
+        for workers in ("1", "2"):
+            argv = ["--db", str(db_path), "--workers", workers, "--checkers", "grammar"]
+            assert rereview_cli.main(argv) == 0
+        assert len(check_rows(db_path)) == 3
+
+    def test_dry_run_writes_nothing(self, db_path):
+        assert rereview_cli.main(["--db", str(db_path), "--workers", "1", "--dry-run"]) == 0
+        assert check_rows(db_path) == []
+
+    def test_unknown_checker(self, db_path):
+        with pytest.raises(SystemExit):
+            rereview_cli.main(["--db", str(db_path), "--checkers", "grammar,spelling"])
@@ -0,0 +1,139 @@
+"""Tests for incremental re-review of refined script versions."""
+
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[5]
+sys.path.insert(0, str(project_root))
+
+from T.Review.Script.Consistency.consistency_review import (
+    ScriptConsistencyChecker,
+    review_content_consistency,
+)
+from T.Review.Script.Editing.script_editing_review import ScriptEditingChecker
+from T.Review.Script.Grammar.script_grammar_review import (
+    ScriptGrammarChecker,
+    review_content_grammar,
+)
+from T.Review.Script.incremental_review import IncrementalReviewer, LineResults, diff_lines
+from T.Review.Script.Readability.script_readability_review import ScriptReadabilityChecker
+
+_spec = importlib.util.spec_from_file_location(
+    "bench_rule_engine",
+    project_root / "T/Review/Script/Grammar/_meta/performance/bench_rule_engine.py",
+)
+bench = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench)
+
+CHECKERS = [
+    ScriptGrammarChecker,
+    ScriptReadabilityChecker,
+    ScriptConsistencyChecker,
+    ScriptEditingChecker,
+]
+
+
+def comparable(review):
+    data = review.to_dict()
+    data.pop("reviewed_at", None)
+    for key in ("characters_found", "locations_found"):
+        if key in data:
+            data[key] = sorted(data[key])
+    return data
+
+
+def refine(text, rng, edits=5):
+    """A new version of ``text`` with a few lines replaced, inserted or deleted."""
+    lines = text.split("\n")
+    donor = bench.make_script(edits * 2, error_rate=0.5, seed=rng.randrange(1000)).split("\n")
+    for _ in range(edits):
+        position = rng.randrange(len(lines))
+        action = rng.choice(("replace", "insert", "delete"))
+        if action == "replace":
+            lines[position] = rng.choice(donor)
+        elif action == "insert":
+            lines.insert(position, rng.choice(donor))
+        elif len(lines) > 1:
+            del lines[position]
+    return "\n".join(lines)
+
+
+class TestDiffLines:
+    def test_unchanged_and_changed_lines(self):
+        unchanged, changed = diff_lines(["a", "b", "c", "d"], ["a", "x", "c", "d", "e"])
+        assert unchanged == {1: 1, 3: 3, 4: 4}
+        assert changed == [2, 5]
+
+    def test_lines_shift_after_insert(self):
+        unchanged, changed = diff_lines(["a", "b"], ["new", "a", "b"])
+        assert unchanged == {1: 2, 2: 3}
+        assert changed == [1]
+
+
+class TestLineResults:
+    def test_renumbered_moves_issues(self):
+        issue = bench.GrammarIssue(
+            issue_type=bench.GrammarIssueType.SPELLING,
+            severity=bench.GrammarSeverity.HIGH,
+            line_number=2,
+            text="thier",
+            suggestion="their",
+            explanation="",
+        )
+        results = LineResults.from_issues([issue])
+        results.facts[2] = "fact"
+        moved = results.renumbered({2: 5})
+        assert moved.issues[5][0].line_number == 5
+        assert moved.facts == {5: "fact"}
+        assert issue.line_number == 2
+
+
+class TestSameReviewAsFullReview:
+    @pytest.mark.parametrize("checker_class", CHECKERS, ids=lambda c: c.__name__)
+    def test_version_chain(self, checker_class):
+        rng = random.Random(checker_class.__name__)
+        reviewer = IncrementalReviewer(checker_class())
+        text = bench.make_script(300, error_rate=0.2, seed=5)
+        for version in range(6):
+            review = reviewer.review_content(text, "script-9", f"v{version + 3}")
+            full = checker_class().review_content(text, "script-9", f"v{version + 3}")
+            assert comparable(review) == comparable(full)
+            text = refine(text, rng)
+
+    def test_only_changed_lines_are_checked(self):
+        reviewer = IncrementalReviewer(ScriptGrammarChecker())
+        lines = bench.make_script(200, seed=8).split("\n")
+        reviewer.review_content("\n".join(lines), "script-1")
+        assert reviewer.last_stats.full_review
+
+        lines[10] = "They was recieved at the door."
+        lines.insert(50, "he were late")
+        review = reviewer.review_content("\n".join(lines), "script-1", "v4")
+        assert not reviewer.last_stats.full_review
+        assert reviewer.last_stats.checked_lines == 2
+        assert {issue.line_number for issue in review.issues} >= {11, 51}
+
+    def test_scripts_are_tracked_by_content_id(self):
+        reviewer = IncrementalReviewer(ScriptEditingChecker())
+        reviewer.review_content("First script.", "a")
+        reviewer.review_content("Second script.", "b")
+        reviewer.review_content("First script, edited.", "a")
+        assert reviewer.last_stats.checked_lines == 1
+        reviewer.forget("a")
+        reviewer.review_content("First script, edited.", "a")
+        assert reviewer.last_stats.full_review
+
+
+class TestConvenienceFunctions:
+    def test_incremental_flag(self):
+        v3 = "Anna walked home.\nShe was never late, she always came early.\nJohn met Johnny."
+        v4 = v3.replace("walked", "ran")
+        for review_function in (review_content_grammar, review_content_consistency):
+            review_function(v3, "incremental-7", incremental=True)
+            review = review_function(v4, "incremental-7", "v4", incremental=True)
+            assert comparable(review) == comparable(review_function(v4, "incremental-7", "v4"))
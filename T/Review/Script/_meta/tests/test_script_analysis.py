@@ -0,0 +1,156 @@
+"""Tests for the shared script analysis used by the deterministic checkers."""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[5]
+sys.path.insert(0, str(project_root))
+
+from T.Review.Script import script_analysis
+from T.Review.Script.Consistency.consistency_review import ScriptConsistencyChecker
+from T.Review.Script.Editing.script_editing_review import ScriptEditingChecker
+from T.Review.Script.Grammar.script_grammar_review import ScriptGrammarChecker
+from T.Review.Script.Readability.script_readability_review import ScriptReadabilityChecker
+from T.Review.Script.script_analysis import (
+    ScriptAnalysis,
+    analyze_script,
+    clear_analysis_cache,
+    count_syllables,
+    run_deterministic_reviews,
+)
+
+SCRIPT = """INT. HOUSE - NIGHT
+Anna walked home. She was tired!
+
+Later, Annie said the the answer was in order to be seen.
+[Pause]
+"""
+
+CHECKERS = {
+    "grammar": ScriptGrammarChecker,
+    "readability": ScriptReadabilityChecker,
+    "consistency": ScriptConsistencyChecker,
+    "editing": ScriptEditingChecker,
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_analysis_cache()
+    yield
+    clear_analysis_cache()
+
+
+def comparable(review):
+    data = review.to_dict()
+    data.pop("reviewed_at", None)
+    for key in ("characters_found", "locations_found"):
+        if key in data:
+            data[key] = sorted(data[key])
+    return data
+
+
+class TestViews:
+    def test_lines_and_offsets(self):
+        analysis = ScriptAnalysis(SCRIPT)
+        assert analysis.lines == SCRIPT.split("\n")
+        for line, start in zip(analysis.lines, analysis.line_starts):
+            assert SCRIPT[start : start + len(line)] == line
+        assert analysis.line_of(SCRIPT.index("Annie")) == 4
+
+    def test_content_and_direction_lines(self):
+        analysis = ScriptAnalysis(SCRIPT)
+        assert analysis.content_lines == [1, 2, 4, 5]
+        assert [analysis.direction_lines[n - 1] for n in analysis.content_lines] == [
+            True, False, False, True,
+        ]
+        assert analysis.paragraph_lengths == [2, 2]
+
+    def test_words(self):
+        analysis = ScriptAnalysis(SCRIPT)
+        assert analysis.words[1] == ["anna", "walked", "home", "she", "was", "tired"]
+        assert analysis.split_words[1] == ["Anna", "walked", "home.", "She", "was", "tired!"]
+        assert analysis.word_counts[2] == 0
+        assert analysis.capitalized[3] == ["Later", "Annie"]
+        assert analysis.vocabulary["the"] == 2
+
+    def test_tokens_point_into_the_text(self):
+        analysis = ScriptAnalysis(SCRIPT)
+        for token in analysis.tokens:
+            assert SCRIPT[token.start : token.end] == token.text
+            assert analysis.line_of(token.start) == token.line
+
+    def test_sentences(self):
+        analysis = ScriptAnalysis(SCRIPT)
+        assert [(s.text, s.line) for s in analysis.sentences[2:4]] == [
+            ("Anna walked home.", 2),
+            ("She was tired!", 2),
+        ]
+
+    def test_line_matches_groups_by_line(self):
+        analysis = ScriptAnalysis("STRENGTHS and\nlengths\nnone")
+        pattern = r"\b\w*ngths\w*\b"
+        assert analysis.line_matches(pattern, re.IGNORECASE) == {1: ["STRENGTHS"], 2: ["lengths"]}
+        assert analysis.line_matches(pattern) == {2: ["lengths"]}
+        assert analysis.line_matches(pattern) is analysis.line_matches(pattern)
+
+    def test_present(self):
+        analysis = ScriptAnalysis(SCRIPT)
+        assert analysis.present(["in order to", "due to", "the the"]) == ["in order to", "the the"]
+
+    def test_views_are_lazy(self):
+        analysis = ScriptAnalysis(SCRIPT)
+        assert "words" not in vars(analysis)
+        assert analysis.words is analysis.words
+
+    @pytest.mark.parametrize(
+        "word, syllables",
+        [("cat", 1), ("time", 1), ("table", 2), ("beautiful", 3), ("Phenomenon", 4), ("", 0)],
+    )
+    def test_count_syllables(self, word, syllables):
+        assert count_syllables(word) == syllables
+
+
+class TestCache:
+    def test_same_text_shares_one_analysis(self):
+        assert analyze_script(SCRIPT) is analyze_script("".join(SCRIPT))
+        assert analyze_script(SCRIPT) is not analyze_script(SCRIPT + "x")
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(script_analysis, "CACHE_SIZE", 2)
+        first = analyze_script("one")
+        analyze_script("two")
+        analyze_script("three")
+        assert analyze_script("one") is not first
+
+
+class TestCheckers:
+    @pytest.mark.parametrize("name", sorted(CHECKERS))
+    def test_given_analysis_is_used(self, name, monkeypatch):
+        expected = CHECKERS[name]().review_content(SCRIPT)
+        module = sys.modules[CHECKERS[name].__module__]
+        monkeypatch.setattr(module, "analyze_script", pytest.fail)
+        review = CHECKERS[name]().review_content(SCRIPT, analysis=ScriptAnalysis(SCRIPT))
+        assert comparable(review) == comparable(expected)
+
+    def test_suite_tokenizes_once(self, monkeypatch):
+        created = []
+
+        class CountingAnalysis(ScriptAnalysis):
+            def __init__(self, *args, **kwargs):
+                created.append(self)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(script_analysis, "ScriptAnalysis", CountingAnalysis)
+        checkers = {name: checker() for name, checker in CHECKERS.items()}
+        reviews = run_deterministic_reviews(SCRIPT, checkers, "script-042", "v4")
+        assert len(created) == 1
+        assert set(reviews) == set(CHECKERS)
+        for name, review in reviews.items():
+            assert review.content_id == "script-042"
+            expected = CHECKERS[name]().review_content(SCRIPT, "script-042", "v4")
+            assert comparable(review) == comparable(expected)
@@ -0,0 +1,173 @@
+"""Bulk review of many scripts with the deterministic checkers.
+
+``review_content_grammar`` and friends review one script in the calling
+process. Re-scoring an archive after a rule change means tens of thousands
+of scripts, so ``review_many`` spreads them over a process pool:
+
+- scripts are read lazily from any iterable and submitted in chunks of
+  ``chunk_size``, so workers do not pay one round trip per script;
+- at most ``2 * workers`` chunks are in flight, so memory stays bounded
+  however long the input is;
+- results are streamed back in input order as their chunk completes.
+
+    >>> for result in review_many(archive, ScriptGrammarChecker, workers=8):
+    ...     if result.review is not None:
+    ...         print(result.content_id, result.review.overall_score)
+
+A script that makes a checker raise produces a result with ``error`` set
+instead of stopping the run. Each checker module also exposes a
+``review_many_<checker>`` shortcut that passes its checker class, so this
+module does not depend on the specialized checker packages.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# Worker processes (default: all cores)
+DEFAULT_WORKERS = int(os.getenv("PRISMQ_REVIEW_WORKERS", "0")) or os.cpu_count() or 1
+
+# Scripts sent to a worker at a time
+DEFAULT_CHUNK_SIZE = 16
+
+
+class BulkScript(NamedTuple):
+    """One script to review."""
+
+    content_id: str
+    text: str
+    script_version: str = "v3"
+
+
+class BulkReviewResult(NamedTuple):
+    """Review of one script, or the error that prevented it."""
+
+    content_id: str
+    script_version: str
+    review: Optional[Any] = None
+    error: Optional[str] = None
+
+
+ScriptInput = Union[str, BulkScript, Tuple[str, str], Tuple[str, str, str]]
+
+# Checker class (or factory) taking an optional ``pass_threshold``
+CheckerFactory = Callable[..., Any]
+
+
+def make_checker(checker: CheckerFactory, pass_threshold: Optional[int] = None) -> Any:
+    """Create a checker from its class, with ``pass_threshold`` if given."""
+    if pass_threshold is None:
+        return checker()
+    return checker(pass_threshold=pass_threshold)
+
+
+def review_chunk(checker: Any, chunk: List[BulkScript]) -> List[BulkReviewResult]:
+    """Review a chunk of scripts with one checker instance."""
+    results = []
+    for script in chunk:
+        try:
+            review = checker.review_content(script.text, script.content_id, script.script_version)
+        except Exception as e:
+            results.append(
+                BulkReviewResult(
+                    script.content_id, script.script_version, error=f"{type(e).__name__}: {e}"
+                )
+            )
+        else:
+            results.append(BulkReviewResult(script.content_id, script.script_version, review))
+    return results
+
+
+# Checker of a pool worker process, created once by _init_worker
+_worker_checker: Any = None
+
+
+def _init_worker(checker: CheckerFactory, pass_threshold: Optional[int]) -> None:
+    global _worker_checker
+    _worker_checker = make_checker(checker, pass_threshold)
+
+
+def _review_chunk_in_worker(chunk: List[BulkScript]) -> List[BulkReviewResult]:
+    return review_chunk(_worker_checker, chunk)
+
+
+def _as_script(index: int, item: ScriptInput) -> BulkScript:
+    if isinstance(item, BulkScript):
+        return item
+    if isinstance(item, str):
+        return BulkScript(f"script-{index + 1:03d}", item)
+    return BulkScript(*item)
+
+
+def _chunks(scripts: Iterable[ScriptInput], chunk_size: int) -> Iterator[List[BulkScript]]:
+    items = (_as_script(index, item) for index, item in enumerate(scripts))
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def review_many(
+    scripts: Iterable[ScriptInput],
+    checker: CheckerFactory,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    pass_threshold: Optional[int] = None,
+) -> Iterator[BulkReviewResult]:
+    """Review many scripts in a process pool, streaming results in input order.
+
+    Args:
+        scripts: Script texts, ``(content_id, text)`` or
+            ``(content_id, text, script_version)`` tuples, or ``BulkScript``s;
+            plain texts get ids ``script-001``, ``script-002`` ...
+        checker: Checker class (e.g. ``ScriptGrammarChecker``) or a picklable
+            factory; called once per worker process
+        workers: Worker processes (default ``PRISMQ_REVIEW_WORKERS`` or the
+            number of cores); 1 reviews in the calling process
+        chunk_size: Scripts sent to a worker at a time
+        pass_threshold: Minimum score to pass (default: the checker's own)
+
+    Yields:
+        One ``BulkReviewResult`` per script
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    workers = DEFAULT_WORKERS if workers is None else workers
+    chunks = _chunks(scripts, chunk_size)
+
+    if workers <= 1:
+        local_checker = make_checker(checker, pass_threshold)
+        for chunk in chunks:
+            yield from review_chunk(local_checker, chunk)
+        return
+
+    make_checker(checker, pass_threshold)  # fail fast on a checker that cannot be created
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(checker, pass_threshold)
+    ) as pool:
+        pending: Deque[Future] = deque()
+        try:
+            for chunk in chunks:
+                pending.append(pool.submit(_review_chunk_in_worker, chunk))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # The caller stopped early: do not review chunks nobody will read
+            for future in pending:
+                future.cancel()
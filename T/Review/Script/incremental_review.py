@@ -0,0 +1,193 @@
+"""Incremental re-review of refined script versions.
+
+In the refinement loop Content v(n+1) usually differs from v(n) in a few
+paragraphs. The deterministic checkers split their work in two phases so a
+new version does not have to be checked from scratch:
+
+    check_lines(analysis, line_numbers)  line-local checks; issues and
+                                         per-line facts keyed by line number
+    complete_review(analysis, results)   global checks (tense, timeline,
+                                         character names ...), scores and
+                                         feedback from the per-line results
+
+``IncrementalReviewer`` keeps the line results of the last reviewed version
+of each script. For the next version it diffs the lines, carries the results
+of unchanged lines over (renumbered), runs ``check_lines`` on the changed
+lines only and then completes the review as usual - the result is the same
+review a full ``review_content`` would produce.
+
+Example:
+    >>> reviewer = IncrementalReviewer(ScriptGrammarChecker())
+    >>> first = reviewer.review_content(v3_text, content_id="script-7", script_version="v3")
+    >>> second = reviewer.review_content(v4_text, content_id="script-7", script_version="v4")
+    >>> reviewer.last_stats.checked_lines  # only the lines that changed
+"""
+
+import dataclasses
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Tuple
+
+from .script_analysis import ScriptAnalysis, analyze_script
+
+# Scripts whose last reviewed version an IncrementalReviewer keeps
+DEFAULT_MAX_SCRIPTS = 64
+
+
+@dataclass
+class LineResults:
+    """Results of a checker's line-local checks, keyed by line number.
+
+    Attributes:
+        issues: Line number -> issues found on that line, in check order
+        facts: Line number -> what the global checks need from that line
+            (tense marker counts, character names ...)
+    """
+
+    issues: Dict[int, List[Any]] = field(default_factory=dict)
+    facts: Dict[int, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_issues(cls, issues: List[Any]) -> "LineResults":
+        """Group issues that carry a ``line_number`` by line."""
+        results = cls()
+        for issue in issues:
+            results.issues.setdefault(issue.line_number, []).append(issue)
+        return results
+
+    def ordered_issues(self) -> List[Any]:
+        """All issues, by line."""
+        return [issue for line in sorted(self.issues) for issue in self.issues[line]]
+
+    def renumbered(self, mapping: Dict[int, int]) -> "LineResults":
+        """Results of the lines in ``mapping`` (old -> new line number), on their new lines."""
+        results = LineResults()
+        for old, new in mapping.items():
+            if old in self.issues:
+                results.issues[new] = [
+                    issue if old == new else dataclasses.replace(issue, line_number=new)
+                    for issue in self.issues[old]
+                ]
+            if old in self.facts:
+                results.facts[new] = self.facts[old]
+        return results
+
+    def update(self, other: "LineResults") -> None:
+        """Take over the lines of ``other``."""
+        self.issues.update(other.issues)
+        self.facts.update(other.facts)
+
+
+def diff_lines(old_lines: List[str], new_lines: List[str]) -> Tuple[Dict[int, int], List[int]]:
+    """Match the lines of two versions of a script.
+
+    Returns:
+        ``(unchanged, changed)``: old -> new line number of every line kept
+        as is, and the new line numbers of inserted or replaced lines
+    """
+    matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    unchanged: Dict[int, int] = {}
+    changed: List[int] = []
+    for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+        if tag == "equal":
+            for offset in range(old_end - old_start):
+                unchanged[old_start + offset + 1] = new_start + offset + 1
+        else:
+            changed.extend(range(new_start + 1, new_end + 1))
+    return unchanged, changed
+
+
+@dataclass
+class IncrementalStats:
+    """What the last incremental review had to check."""
+
+    total_lines: int = 0
+    checked_lines: int = 0  # lines run through the line-local checks
+    reused_lines: int = 0  # lines whose results came from the previous version
+    full_review: bool = True  # no previous version was known
+
+
+@dataclass
+class _ReviewedVersion:
+    lines: List[str]
+    results: LineResults
+
+
+class IncrementalReviewer:
+    """Reviews new versions of a script by re-checking only the changed lines.
+
+    Works with any checker that provides ``check_lines`` and
+    ``complete_review`` (Grammar, Readability, Consistency, Editing). The
+    last reviewed version of each ``content_id`` is kept in memory, for the
+    ``max_scripts`` most recently reviewed scripts.
+    """
+
+    def __init__(self, checker: Any, max_scripts: int = DEFAULT_MAX_SCRIPTS):
+        self.checker = checker
+        self.max_scripts = max_scripts
+        self.last_stats = IncrementalStats()
+        self._versions: "OrderedDict[str, _ReviewedVersion]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def review_content(
+        self,
+        content_text: str,
+        content_id: str = "script-001",
+        script_version: str = "v3",
+        analysis: Optional[ScriptAnalysis] = None,
+    ) -> Any:
+        """Review ``content_text``, reusing the results for the last version of ``content_id``."""
+        analysis = analysis or analyze_script(content_text)
+        with self._lock:
+            previous = self._versions.get(content_id)
+
+        stats = IncrementalStats(total_lines=len(analysis.lines), full_review=previous is None)
+        if previous is None:
+            results = self.checker.check_lines(analysis)
+            stats.checked_lines = len(analysis.content_lines)
+        else:
+            unchanged, changed = diff_lines(previous.lines, analysis.lines)
+            results = previous.results.renumbered(unchanged)
+            to_check = [number for number in changed if analysis.stripped[number - 1]]
+            if to_check:
+                results.update(self.checker.check_lines(analysis, to_check))
+            stats.checked_lines = len(to_check)
+            stats.reused_lines = len(analysis.content_lines) - len(to_check)
+
+        review = self.checker.complete_review(analysis, results, content_id, script_version)
+
+        with self._lock:
+            self._versions[content_id] = _ReviewedVersion(analysis.lines, results)
+            self._versions.move_to_end(content_id)
+            while len(self._versions) > self.max_scripts:
+                self._versions.popitem(last=False)
+            self.last_stats = stats
+        return review
+
+    def forget(self, content_id: Optional[str] = None) -> None:
+        """Drop the remembered version of ``content_id``, or of all scripts."""
+        with self._lock:
+            if content_id is None:
+                self._versions.clear()
+            else:
+                self._versions.pop(content_id, None)
+
+
+_reviewers: Dict[Tuple[type, int], IncrementalReviewer] = {}
+_reviewers_lock = threading.Lock()
+
+
+def incremental_reviewer(checker_class: type, pass_threshold: int) -> IncrementalReviewer:
+    """Process-wide ``IncrementalReviewer`` for a checker class and pass threshold.
+
+    Used by the ``review_content_*(..., incremental=True)`` convenience functions.
+    """
+    key = (checker_class, pass_threshold)
+    with _reviewers_lock:
+        reviewer = _reviewers.get(key)
+        if reviewer is None:
+            reviewer = IncrementalReviewer(checker_class(pass_threshold=pass_threshold))
+            _reviewers[key] = reviewer
+        return reviewer
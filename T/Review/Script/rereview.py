@@ -0,0 +1,221 @@
+"""Re-review the latest Content of every story with the deterministic checkers.
+
+After a rule change the whole archive has to be re-scored. This tool streams
+the latest Content version of each story from the database, reviews it in a
+process pool (``bulk_review.review_many``) and bulk-writes the results to the
+ScriptCheck table (``T._shared.db.script_check_db``), one transaction per
+``--batch-size`` results. Story states and Content.review_id are not touched.
+
+Usage:
+    python -m T.Review.Script.rereview                          # all checkers, all cores
+    python -m T.Review.Script.rereview --checkers grammar,editing --workers 8
+    python -m T.Review.Script.rereview --limit 100 --dry-run    # review, do not write
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from T._shared.db.script_check_db import ScriptCheck, ScriptCheckDB
+
+from .bulk_review import (
+    DEFAULT_CHUNK_SIZE,
+    BulkReviewResult,
+    BulkScript,
+    CheckerFactory,
+    review_many,
+)
+from .Consistency.consistency_review import ScriptConsistencyChecker
+from .Editing.script_editing_review import ScriptEditingChecker
+from .Grammar.script_grammar_review import ScriptGrammarChecker
+from .Readability.script_readability_review import ScriptReadabilityChecker
+
+# Checker name (ScriptCheck.checker, --checkers) -> checker class
+CHECKERS: Dict[str, CheckerFactory] = {
+    "grammar": ScriptGrammarChecker,
+    "readability": ScriptReadabilityChecker,
+    "consistency": ScriptConsistencyChecker,
+    "editing": ScriptEditingChecker,
+}
+
+# Results written per transaction
+DEFAULT_BATCH_SIZE = 500
+
+
+class Colors:
+    HEADER = "\033[95m"
+    CYAN = "\033[96m"
+    GREEN = "\033[92m"
+    YELLOW = "\033[93m"
+    RED = "\033[91m"
+    END = "\033[0m"
+    BOLD = "\033[1m"
+
+
+def print_header(text: str) -> None:
+    print(f"\n{Colors.HEADER}{Colors.BOLD}{'═' * 78}{Colors.END}")
+    print(f"{Colors.HEADER}{Colors.BOLD}{text.center(78)}{Colors.END}")
+    print(f"{Colors.HEADER}{Colors.BOLD}{'═' * 78}{Colors.END}\n")
+
+
+def print_info(text: str) -> None:
+    print(f"{Colors.CYAN}ℹ {text}{Colors.END}")
+
+
+def print_success(text: str) -> None:
+    print(f"{Colors.GREEN}✓ {text}{Colors.END}")
+
+
+def print_error(text: str) -> None:
+    print(f"{Colors.RED}✗ {text}{Colors.END}")
+
+
+def resolve_db_path(db_path: Optional[str]) -> str:
+    """Return the database path from the argument or Config."""
+    if db_path:
+        return db_path
+    try:
+        from src.config import get_config
+
+        return get_config().database_path
+    except Exception:
+        return "C:/PrismQ/db.s3db"
+
+
+def parse_checkers(value: Optional[str]) -> List[str]:
+    """Parse ``--checkers`` like ``grammar,editing``; all checkers when empty."""
+    if not value:
+        return list(CHECKERS)
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in CHECKERS]
+    if unknown:
+        raise ValueError(
+            f"Unknown checker(s) {', '.join(unknown)}, expected: {', '.join(CHECKERS)}"
+        )
+    return names
+
+
+def to_check(checker: str, result: BulkReviewResult) -> ScriptCheck:
+    """ScriptCheck row for one bulk review result."""
+    check = ScriptCheck(content_id=int(result.content_id), checker=checker, error=result.error)
+    if result.review is not None:
+        check.score = result.review.overall_score
+        check.passes = result.review.passes
+        check.issue_count = len(result.review.issues)
+        check.result_json = json.dumps(result.review.to_dict())
+    return check
+
+
+def _batches(checks: Iterable[ScriptCheck], size: int) -> Iterator[List[ScriptCheck]]:
+    batch: List[ScriptCheck] = []
+    for check in checks:
+        batch.append(check)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def rereview(
+    db: ScriptCheckDB,
+    checkers: List[str],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    limit: Optional[int] = None,
+    write: bool = True,
+) -> Dict[str, Dict[str, int]]:
+    """Re-review the latest Content of every story and store the results.
+
+    Returns:
+        Checker -> ``{"reviewed", "passed", "errors"}`` counts
+    """
+    summary: Dict[str, Dict[str, int]] = {}
+    for checker in checkers:
+        counts = summary[checker] = {"reviewed": 0, "passed": 0, "errors": 0}
+        scripts = (
+            BulkScript(str(content.content_id), content.text, f"v{content.version}")
+            for content in db.iter_latest_contents(limit)
+        )
+        results = review_many(
+            scripts, CHECKERS[checker], workers=workers, chunk_size=chunk_size
+        )
+        for batch in _batches((to_check(checker, result) for result in results), batch_size):
+            if write:
+                db.upsert_checks(batch)
+            for check in batch:
+                counts["reviewed"] += 1
+                counts["passed"] += bool(check.passes)
+                counts["errors"] += check.error is not None
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m T.Review.Script.rereview",
+        description="Re-review the latest Content of every story with the deterministic checkers",
+    )
+    parser.add_argument("--db", help="Path to db.s3db (default: from Config)")
+    parser.add_argument(
+        "--checkers", help=f"Comma-separated checkers (default: {','.join(CHECKERS)})"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: PRISMQ_REVIEW_WORKERS or all cores)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+        help="Scripts sent to a worker at a time",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Results written per transaction"
+    )
+    parser.add_argument("--limit", type=int, help="Only the first N stories")
+    parser.add_argument("--dry-run", action="store_true", help="Review without writing results")
+    args = parser.parse_args(argv)
+
+    try:
+        checkers = parse_checkers(args.checkers)
+    except ValueError as e:
+        parser.error(str(e))
+
+    db_path = resolve_db_path(args.db)
+    print_header("PrismQ Script Re-review")
+    print_info(f"Database: {db_path}")
+    print_info(f"Checkers: {', '.join(checkers)}")
+    print()
+
+    conn = sqlite3.connect(db_path, timeout=30)
+    started = time.perf_counter()
+    try:
+        summary = rereview(
+            ScriptCheckDB(conn),
+            checkers,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            batch_size=args.batch_size,
+            limit=args.limit,
+            write=not args.dry_run,
+        )
+    except sqlite3.Error as e:
+        print_error(f"Database error: {e}")
+        return 1
+    finally:
+        conn.close()
+
+    for checker, counts in summary.items():
+        message = f"{checker}: {counts['reviewed']} reviewed, {counts['passed']} passed"
+        if counts["errors"]:
+            print_error(f"{message}, {counts['errors']} failed")
+        else:
+            print_success(message)
+    elapsed = time.perf_counter() - started
+    print_info(f"Done in {elapsed:.1f}s" + (" (dry run)" if args.dry_run else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""Shared tokenization for the deterministic script checkers.
+
+The Grammar, Readability, Consistency and Editing checkers all walk the same
+script line by line, and each of them used to split, strip, lowercase and
+tokenize every line again. ``ScriptAnalysis`` does that work once per script
+and exposes it as per-line views; every view is computed on first use and
+then shared by all checkers that receive the same analysis.
+
+``analyze_script`` caches analyses by a hash of the script text, so the
+checkers of one review round - or a stage that re-reviews an unchanged
+script - pay for a single tokenization pass:
+
+    >>> analysis = analyze_script(script_text)
+    >>> grammar = ScriptGrammarChecker().review_content(script_text, analysis=analysis)
+    >>> editing = ScriptEditingChecker().review_content(script_text, analysis=analysis)
+
+Line numbers are 1-based everywhere, matching the checkers' issues.
+"""
+
+import hashlib
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+# Tokens the checkers look at
+_WORD = re.compile(r"\w+")
+_CAPITALIZED = re.compile(r"\b([A-Z][a-z]+)\b")
+_SENTENCE = re.compile(r"[^.!?\n]+[.!?]*")
+_VOWEL_GROUP = re.compile(r"[aeiouy]+")
+
+# Lines that are formatting or directions rather than narration
+DIRECTION_PREFIXES = ("[", "(", "*", "INT.", "EXT.")
+
+# Analyses kept by analyze_script
+CACHE_SIZE = 32
+
+
+class Token(NamedTuple):
+    """A ``\\w+`` word with its position in the script."""
+
+    text: str
+    line: int
+    start: int  # offset in the script text
+    end: int
+
+
+class Sentence(NamedTuple):
+    """A sentence: text up to ``.``, ``!`` or ``?``, or the end of its line."""
+
+    text: str
+    line: int
+    start: int
+    end: int
+
+
+@lru_cache(maxsize=8192)
+def count_syllables(word: str) -> int:
+    """Estimate the syllables of an English word (vowel groups, silent ``e``)."""
+    word = word.lower()
+    count = len(_VOWEL_GROUP.findall(word))
+    if word.endswith("e") and not word.endswith(("le", "ee")) and count > 1:
+        count -= 1
+    return max(1, count) if word else 0
+
+
+class ScriptAnalysis:
+    """Lines, words, sentences and offsets of one script, tokenized once.
+
+    Per-line views are lists indexed by ``line_number - 1``. Everything but
+    ``lines`` is computed lazily, so a checker only pays for what it reads.
+
+    Attributes:
+        text: The script text
+        lines: ``text.split("\\n")``
+        digest: SHA-256 of the text (the analysis cache key)
+    """
+
+    def __init__(self, text: str, digest: Optional[str] = None):
+        self.text = text
+        self.lines: List[str] = text.split("\n")
+        self.digest = digest or content_digest(text)
+        self._line_matches: Dict[Tuple[str, int], Dict[int, List[str]]] = {}
+
+    def __repr__(self) -> str:
+        return f"ScriptAnalysis(lines={len(self.lines)}, digest={self.digest[:12]})"
+
+    # Lines
+
+    @cached_property
+    def line_starts(self) -> List[int]:
+        """Offset in ``text`` at which each line starts."""
+        starts = [0]
+        for line in self.lines[:-1]:
+            starts.append(starts[-1] + len(line) + 1)
+        return starts
+
+    @cached_property
+    def stripped(self) -> List[str]:
+        """Each line without surrounding whitespace."""
+        return [line.strip() for line in self.lines]
+
+    @cached_property
+    def lowered(self) -> List[str]:
+        """Each line lowercased."""
+        return [line.lower() for line in self.lines]
+
+    @cached_property
+    def lower_text(self) -> str:
+        """The whole script lowercased."""
+        return self.text.lower()
+
+    @cached_property
+    def content_lines(self) -> List[int]:
+        """Numbers of the lines that are not blank."""
+        return [number for number, line in enumerate(self.stripped, start=1) if line]
+
+    @cached_property
+    def direction_lines(self) -> List[bool]:
+        """Whether each line is a stage direction or formatting (``[``, ``INT.`` ...)."""
+        return [line.startswith(DIRECTION_PREFIXES) for line in self.stripped]
+
+    @cached_property
+    def paragraph_lengths(self) -> List[int]:
+        """Lengths in lines of the runs of non-blank lines."""
+        lengths = []
+        current = 0
+        for line in self.stripped:
+            if line:
+                current += 1
+            elif current:
+                lengths.append(current)
+                current = 0
+        if current:
+            lengths.append(current)
+        return lengths
+
+    def line_of(self, offset: int) -> int:
+        """Line number containing ``offset`` of ``text``."""
+        return bisect_right(self.line_starts, offset)
+
+    # Words
+
+    @cached_property
+    def split_words(self) -> List[List[str]]:
+        """Whitespace-separated words of each line (``line.split()``)."""
+        return [line.split() for line in self.stripped]
+
+    @cached_property
+    def word_counts(self) -> List[int]:
+        """Number of whitespace-separated words on each line."""
+        return [len(words) for words in self.split_words]
+
+    @cached_property
+    def words(self) -> List[List[str]]:
+        """Lowercased ``\\w+`` words of each line."""
+        return [_WORD.findall(line) for line in self.lowered]
+
+    @cached_property
+    def tokens(self) -> List[Token]:
+        """All ``\\w+`` words of the script, in order, with offsets."""
+        tokens = []
+        for number, (line, start) in enumerate(zip(self.lines, self.line_starts), start=1):
+            tokens.extend(
+                Token(match.group(), number, start + match.start(), start + match.end())
+                for match in _WORD.finditer(line)
+            )
+        return tokens
+
+    @cached_property
+    def capitalized(self) -> List[List[str]]:
+        """Capitalized words (``Anna``, not ``ANNA``) of each line - name candidates."""
+        return [_CAPITALIZED.findall(line) if line else [] for line in self.lines]
+
+    # Sentences and syllables
+
+    @cached_property
+    def sentences(self) -> List[Sentence]:
+        """Sentences of the script; a sentence never spans lines."""
+        sentences = []
+        for number, (line, start) in enumerate(zip(self.lines, self.line_starts), start=1):
+            for match in _SENTENCE.finditer(line):
+                text = match.group().strip()
+                if text:
+                    sentences.append(
+                        Sentence(text, number, start + match.start(), start + match.end())
+                    )
+        return sentences
+
+    @cached_property
+    def syllable_counts(self) -> List[int]:
+        """Estimated syllables on each line."""
+        return [sum(count_syllables(word) for word in words) for words in self.words]
+
+    # Script-level lookups shared by the checkers' rule loops
+
+    def line_matches(self, pattern: str, flags: int = 0) -> Dict[int, List[str]]:
+        """Matches of ``pattern`` grouped by line number, from one pass over the text.
+
+        Only for patterns whose matches cannot contain a newline (word
+        patterns such as ``\\b\\w*ngths\\w*\\b``); then the result is what
+        running the pattern on each line separately would find.
+        """
+        key = (pattern, flags)
+        found = self._line_matches.get(key)
+        if found is None:
+            found = {}
+            for match in re.finditer(pattern, self.text, flags):
+                found.setdefault(self.line_of(match.start()), []).append(match.group())
+            self._line_matches[key] = found
+        return found
+
+    def present(self, phrases: Iterable[str]) -> List[str]:
+        """The lowercase ``phrases`` that occur anywhere in the script, in order.
+
+        A checker that looks for phrases line by line only needs to try these.
+        """
+        return [phrase for phrase in phrases if phrase in self.lower_text]
+
+    @cached_property
+    def vocabulary(self) -> Dict[str, int]:
+        """Lowercased word -> occurrences in the script."""
+        counts: Dict[str, int] = {}
+        for words in self.words:
+            for word in words:
+                counts[word] = counts.get(word, 0) + 1
+        return counts
+
+
+def content_digest(text: str) -> str:
+    """SHA-256 hex digest of a script text."""
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+_cache: "OrderedDict[str, ScriptAnalysis]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def analyze_script(text: str) -> ScriptAnalysis:
+    """Return the (cached) analysis of ``text``.
+
+    The ``CACHE_SIZE`` most recently used analyses are kept, keyed by content
+    hash, so equal scripts share one analysis however they were read.
+    """
+    digest = content_digest(text)
+    with _cache_lock:
+        analysis = _cache.get(digest)
+        if analysis is not None:
+            _cache.move_to_end(digest)
+            return analysis
+    analysis = ScriptAnalysis(text, digest)
+    with _cache_lock:
+        _cache[digest] = analysis
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return analysis
+
+
+def clear_analysis_cache() -> None:
+    """Forget all cached analyses."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def run_deterministic_reviews(
+    content_text: str,
+    checkers: Mapping[str, Any],
+    content_id: str = "script-001",
+    script_version: str = "v3",
+) -> Dict[str, object]:
+    """Run several checkers on one analysis of ``content_text``.
+
+    The checkers are passed in by the caller, so this module does not depend
+    on the specialized checker packages.
+
+    Args:
+        content_text: Script text to review.
+        checkers: Checker instances by name; each must accept
+            ``review_content(text, content_id, script_version, analysis=...)``.
+        content_id: Content identifier stored in the reviews.
+        script_version: Script version stored in the reviews.
+
+    Returns:
+        Dict with the review of each checker, under the same names
+    """
+    analysis = analyze_script(content_text)
+    return {
+        name: checker.review_content(content_text, content_id, script_version, analysis=analysis)
+        for name, checker in checkers.items()
+    }
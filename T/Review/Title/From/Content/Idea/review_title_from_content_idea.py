@@ -18,6 +18,7 @@ import json
 import logging
 import os
 import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
@@ -33,6 +34,11 @@ _AI_TEMPERATURE = 0.3
 _AI_MAX_TOKENS = 1000
 _AI_TIMEOUT = 120  # seconds
 
+try:
+    from Model.Infrastructure.metrics import record_llm_call
+except ImportError:  # Model package not on sys.path (standalone use)
+    record_llm_call = None
+
 from .title_review import (
     TitleCategoryScore,
     TitleImprovementPoint,
@@ -562,6 +568,8 @@ def _review_with_ai(
         return None
 
     # Call Ollama API
+    started = time.monotonic()
+    data = None
     try:
         response = requests.post(
             "http://localhost:11434/api/generate",
@@ -575,10 +583,14 @@ def _review_with_ai(
             timeout=_AI_TIMEOUT,
         )
         response.raise_for_status()
-        raw_text = response.json().get("response", "").strip()
+        data = response.json()
+        raw_text = data.get("response", "").strip()
     except Exception as e:
         logger.warning("Ollama API call failed: %s", e)
         return None
+    finally:
+        if record_llm_call is not None:
+            record_llm_call(_AI_MODEL, time.monotonic() - started, data, ok=data is not None)
 
     if not raw_text:
         return None
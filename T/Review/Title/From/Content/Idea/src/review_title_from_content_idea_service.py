@@ -42,6 +42,7 @@ from Model.Database.models.story import Story
 from Model.Database.repositories.content_repository import ContentRepository
 from Model.Database.repositories.review_repository import ReviewRepository
 from Model.Database.repositories.story_repository import StoryRepository
+from Model.Repositories.story_retry_repository import RETRY_READY_SQL, StoryRetryRepository
 from Model.Database.repositories.title_repository import TitleRepository
 from Model.State.constants.state_names import StateNames
 
@@ -116,6 +117,7 @@ class ReviewTitleFromContentIdeaService:
         self.title_repo = TitleRepository(connection)
         self.content_repo = ContentRepository(connection)
         self.review_repo = ReviewRepository(connection)
+        self.retry_repo = StoryRetryRepository(connection)
 
     def _fetch_idea_text(self, idea_id: Optional[str]) -> str:
         """Fetch idea text from the shared database.
@@ -280,7 +282,7 @@ class ReviewTitleFromContentIdeaService:
             sqlite3.Row with story/title/content/idea fields, or None
         """
         cursor = self._conn.execute(
-            """
+            f"""
             SELECT
                 s.id          AS story_id,
                 s.idea_id     AS idea_id,
@@ -300,6 +302,7 @@ class ReviewTitleFromContentIdeaService:
                 AND c.version = (SELECT MAX(c2.version) FROM Content c2 WHERE c2.story_id = s.id)
             LEFT JOIN Idea i ON i.id = s.idea_id
             WHERE s.state = ?
+              AND {RETRY_READY_SQL}
             ORDER BY t.version ASC, s.created_at ASC
             LIMIT 1
             """,
@@ -386,6 +389,9 @@ class ReviewTitleFromContentIdeaService:
         except Exception as e:
             result.error = f"Processing failed: {str(e)}"
             logger.exception(f"Error processing story {row['story_id']}")
+            retry = self.retry_repo.record_failure(row["story_id"], self.INPUT_STATE, result.error)
+            if retry.is_dead_lettered:
+                result.error += f" (dead-lettered after {retry.attempts} attempts)"
 
         return result
 
@@ -8,10 +8,8 @@ On FAIL  → TITLE_FROM_TITLE_REVIEW_CONTENT [08] (soft title improvement)
 Priority: c.version ASC, COALESCE(r.score,0) DESC, s.created_at ASC
 """
 
-import json
 import logging
 import os
-import re
 import sqlite3
 import sys
 from dataclasses import dataclass
@@ -34,6 +32,8 @@ from Model.Database.models.review import Review
 from Model.Database.repositories.content_repository import ContentRepository
 from Model.Database.repositories.review_repository import ReviewRepository
 from Model.Database.repositories.story_repository import StoryRepository
+from Model.Infrastructure.ollama import run_review
+from Model.Repositories.story_retry_repository import RETRY_READY_SQL, StoryRetryRepository
 from Model.Database.repositories.title_repository import TitleRepository
 from Model import StateNames
 
@@ -91,63 +91,28 @@ class ReviewTitleFromScriptService:
         self.title_repo   = TitleRepository(connection)
         self.content_repo = ContentRepository(connection)
         self.review_repo  = ReviewRepository_impl(connection)
+        self.retry_repo   = StoryRetryRepository(connection)
         self.acceptance_threshold = acceptance_threshold
 
     # ── AI review ────────────────────────────────────────────────────────────
 
     def _ai_review(self, title_text: str, content_text: str) -> Tuple[str, int]:
         """Call Ollama for title quality review. Returns (feedback, score)."""
-        try:
-            import requests as _requests
-        except ImportError as exc:
-            raise RuntimeError("requests library not available; run: pip install requests") from exc
-
-        template = (_PROMPTS_DIR / "review_title_from_content.txt").read_text(encoding="utf-8")
-        prompt = template.format(
-            title_text=title_text,
-            content_text=content_text[:_MAX_CONTENT_PREVIEW_LENGTH],
+        return run_review(
+            _AI_MODEL,
+            _PROMPTS_DIR / "review_title_from_content.txt",
+            {"title_text": title_text, "content_text": content_text[:_MAX_CONTENT_PREVIEW_LENGTH]},
+            default_feedback="AI title review completed.",
+            temperature=_AI_TEMPERATURE,
+            max_tokens=_AI_MAX_TOKENS,
+            timeout=_AI_TIMEOUT,
         )
 
-        try:
-            check = _requests.get("http://localhost:11434/api/tags", timeout=5)
-            if check.status_code != 200:
-                raise RuntimeError(f"Ollama not available (status {check.status_code})")
-        except _requests.exceptions.RequestException as exc:
-            raise RuntimeError(f"Ollama not reachable: {exc}") from exc
-
-        try:
-            response = _requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": _AI_MODEL,
-                    "prompt": prompt,
-                    "stream": False,
-                    "think": False,
-                    "options": {"temperature": _AI_TEMPERATURE, "num_predict": _AI_MAX_TOKENS, "num_ctx": 4096},
-                },
-                timeout=_AI_TIMEOUT,
-            )
-            response.raise_for_status()
-            raw = response.json().get("response", "").strip()
-        except _requests.exceptions.RequestException as exc:
-            raise RuntimeError(f"Ollama API call failed: {exc}") from exc
-
-        raw = re.sub(r"<think>.*?</think>", "", raw, flags=re.DOTALL).strip()
-
-        match = re.search(r"\{.*\}", raw, re.DOTALL)
-        if not match:
-            raise ValueError(f"No JSON in AI response: {raw[:200]}")
-        data = json.loads(match.group())
-        score = max(0, min(100, int(data.get("overall_score", 50))))
-        feedback = str(data.get("feedback", "AI title review completed."))
-
-        return feedback, score
-
     # ── story fetch ───────────────────────────────────────────────────────────
 
     def _fetch_story_with_content(self):
         cursor = self._conn.execute(
-            """
+            f"""
             SELECT
                 s.id          AS story_id,
                 t.id          AS title_id,
@@ -166,6 +131,7 @@ class ReviewTitleFromScriptService:
                 AND c.version = (SELECT MAX(c2.version) FROM Content c2 WHERE c2.story_id = s.id)
             LEFT JOIN Review r ON r.id = c.review_id
             WHERE s.state = ?
+              AND {RETRY_READY_SQL}
             ORDER BY c.version ASC, COALESCE(r.score, 0) DESC, s.created_at ASC
             LIMIT 1
             """,
@@ -226,6 +192,9 @@ class ReviewTitleFromScriptService:
         except Exception as e:
             result.error_message = f"Title review failed: {str(e)}"
             logger.exception(f"Error processing story {story_id}")
+            retry = self.retry_repo.record_failure(story_id, INPUT_STATE, result.error_message)
+            if retry.is_dead_lettered:
+                result.error_message += f" (dead-lettered after {retry.attempts} attempts)"
 
         return result
 
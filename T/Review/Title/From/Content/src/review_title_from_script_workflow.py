@@ -36,6 +36,7 @@ except ImportError:
 
 try:
     from review_title_from_script_service import ReviewTitleFromScriptService
+    from Model.Infrastructure.workflow import StageTelemetry
     SERVICE_AVAILABLE = True
 except ImportError as e:
     SERVICE_AVAILABLE = False
@@ -138,6 +139,7 @@ def main():
 
     # Initialize service
     service = ReviewTitleFromScriptService(conn)
+    telemetry = StageTelemetry("07")
 
     # Continuous processing loop
     run_count = 0
@@ -179,7 +181,7 @@ def main():
                 print_success(f"Found {pending_count} pending stories")
             
             # Process oldest story
-            result = service.process_oldest_story()
+            result = telemetry.run(service.process_oldest_story)
             
             if result.story_id is None:
                 # Should not happen but handle it
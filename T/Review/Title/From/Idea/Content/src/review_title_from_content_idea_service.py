@@ -39,6 +39,7 @@ from Model.Database.models.review import Review
 from Model.Database.models.story import Story
 from Model.Database.repositories.review_repository import ReviewRepository
 from Model.Database.repositories.story_repository import StoryRepository
+from Model.Repositories.story_retry_repository import RETRY_READY_SQL, StoryRetryRepository
 from Model.State.constants.state_names import StateNames
 
 # Import the AI-powered title review function (always required — no algorithmic fallback)
@@ -102,6 +103,7 @@ class ReviewTitleFromContentIdeaService:
         self._conn = connection
         self.story_repo = StoryRepository(connection)
         self.review_repo = ReviewRepository(connection)
+        self.retry_repo = StoryRetryRepository(connection)
 
     def _fetch_story_with_content(self):
         """Fetch the oldest pending story with its latest title, content, and idea in one query.
@@ -117,7 +119,7 @@ class ReviewTitleFromContentIdeaService:
             or None if no eligible story exists.
         """
         cursor = self._conn.execute(
-            """
+            f"""
             SELECT
                 s.id          AS story_id,
                 s.idea_id     AS idea_id,
@@ -141,6 +143,7 @@ class ReviewTitleFromContentIdeaService:
                 )
             LEFT JOIN Idea i ON i.id = s.idea_id
             WHERE s.state = ?
+              AND {RETRY_READY_SQL}
             ORDER BY s.created_at ASC
             LIMIT 1
             """,
@@ -261,6 +264,9 @@ class ReviewTitleFromContentIdeaService:
         except Exception as e:
             result.error = f"Processing failed: {str(e)}"
             logger.exception(f"Error processing story {story_id}")
+            retry = self.retry_repo.record_failure(story_id, self.INPUT_STATE, result.error)
+            if retry.is_dead_lettered:
+                result.error += f" (dead-lettered after {retry.attempts} attempts)"
 
         return result
 
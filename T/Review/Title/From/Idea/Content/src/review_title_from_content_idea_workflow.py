@@ -41,6 +41,7 @@ except ImportError:
 
 try:
     from review_title_from_content_idea_service import ReviewTitleFromContentIdeaService
+    from Model.Infrastructure.workflow import StageTelemetry
     SERVICE_AVAILABLE = True
 except ImportError as e:
     SERVICE_AVAILABLE = False
@@ -142,6 +143,7 @@ def main():
 
     # Initialize service
     service = ReviewTitleFromContentIdeaService(conn)
+    telemetry = StageTelemetry("05")
 
     # Continuous processing loop
     run_count = 0
@@ -183,7 +185,7 @@ def main():
                 print_success(f"Found {pending_count} pending stories")
             
             # Process oldest story
-            result = service.process_oldest_story()
+            result = telemetry.run(service.process_oldest_story)
             
             if result.story_id is None:
                 # Should not happen but handle it
@@ -72,12 +72,20 @@ except (ImportError, AttributeError, TypeError):
 
 # Try to import database connection
 try:
-    from src.config import Config
+    from src.config import get_config
 
     CONFIG_AVAILABLE = True
 except ImportError:
     CONFIG_AVAILABLE = False
 
+# Try to import WIP-limit gate (pauses story creation while generation queues are full)
+try:
+    from Model.Infrastructure.backpressure import BackpressureGate
+
+    BACKPRESSURE_AVAILABLE = True
+except ImportError:
+    BACKPRESSURE_AVAILABLE = False
+
 
 # =============================================================================
 # ANSI Colors for Terminal Output
@@ -182,7 +190,7 @@ def get_database_paths() -> tuple:
         Tuple of (story_db_path, idea_db_path)
     """
     if CONFIG_AVAILABLE:
-        config = Config(interactive=False)
+        config = get_config()
         # Both Story and Idea use the same database file
         return config.database_path, config.database_path
     else:
@@ -268,6 +276,7 @@ def run_continuous_mode(preview: bool = False):
     print("  - 30 seconds when 0 unreferenced ideas")
     print("Press Ctrl+C or close the window to stop.\n")
 
+    gate = BackpressureGate() if BACKPRESSURE_AVAILABLE else None
     iteration = 0
 
     try:
@@ -327,6 +336,18 @@ def run_continuous_mode(preview: bool = False):
                 # Ensure tables exist
                 service.ensure_tables_exist()
 
+                # Hold back while downstream queues are over their WIP limit (step 02)
+                if gate is not None and not preview:
+                    gate.refresh(story_conn)
+                    if gate.is_paused(2):
+                        print_warning(f"WIP limit reached ({gate.describe(2)}) - pausing story creation")
+                        if logger:
+                            logger.info(f"Paused by WIP limit: {gate.describe(2)}")
+                        wait_interval = get_wait_interval(0)
+                        print_info(f"Waiting {format_wait_time(wait_interval)} before checking again...")
+                        time.sleep(wait_interval)
+                        continue
+
                 # Find oldest unreferenced idea
                 oldest_idea = service.get_oldest_unreferenced_idea()
 
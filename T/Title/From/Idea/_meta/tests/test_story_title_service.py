@@ -23,6 +23,9 @@ sys.path.insert(0, str(_project_root))
 sys.path.insert(0, str(_idea_model_path))
 sys.path.insert(0, str(_src_path))
 
+# Before the service import, which puts T/Idea/Model (another 'src') on sys.path
+from src.near_duplicates import NearDuplicateError, NearDuplicateIndex
+
 from story_title_service import (
     StoryTitleResult,
     StoryTitleService,
@@ -606,6 +609,39 @@ class TestGenerateTitleForStoryWithPreGeneratedVariant:
         result = service.generate_title_for_story(story, variant=pre_variant)
         assert result is None
 
+    def test_near_duplicate_title_is_rejected(self, db_connection):
+        """With a duplicate index, a near-identical title is not saved."""
+        index = NearDuplicateIndex(connection=db_connection)
+        index.create_tables()
+        service = StoryTitleService(db_connection, use_ai=False, duplicate_index=index)
+        service.ensure_tables_exist()
+
+        first = service._story_repo.insert(
+            Story(idea_id="5", state=StoryState.TITLE_FROM_IDEA.value)
+        )
+        second = service._story_repo.insert(
+            Story(idea_id="6", state=StoryState.TITLE_FROM_IDEA.value)
+        )
+        variant = TitleVariant(
+            text="The Lighthouse That Predicted Storms", style="direct",
+            length=36, keywords=[], score=0.8,
+        )
+        title = service.generate_title_for_story(first, variant=variant)
+        assert index.find("title", variant.text)[0].ref_id == title.id
+
+        duplicate = TitleVariant(
+            text="The lighthouse that predicted storms!", style="direct",
+            length=37, keywords=[], score=0.8,
+        )
+        with pytest.raises(NearDuplicateError):
+            service.generate_title_for_story(second, variant=duplicate)
+        assert not service.story_has_title(second.id)
+
+        # The rejected story is deferred, not counted as a failed attempt
+        retry = service._retry_repo.find_by_story_id(second.id)
+        assert retry.attempts == 0 and retry.next_attempt_at is not None
+        assert second.id not in [s.id for s in service.get_stories_without_titles()]
+
 
 class TestGetStoriesWithoutTitlesSortOrder:
     """Tests for the sort order of get_stories_without_titles().
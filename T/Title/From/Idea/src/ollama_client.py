@@ -13,6 +13,11 @@ from typing import Optional
 
 import requests
 
+try:
+    from Model.Infrastructure.metrics import record_llm_call
+except ImportError:  # Model package not on sys.path (standalone use)
+    record_llm_call = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -112,9 +117,16 @@ class OllamaClient:
             
             response.raise_for_status()
             result = response.json()
+            self._record_metrics(elapsed, result)
             logger.info(f"Ollama response received in {elapsed:.1f}s (model={self.config.model})")
             return result.get("response", "")
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Ollama API call failed: {e}")
+            self._record_metrics(time.monotonic() - t0, None)
             raise RuntimeError(f"Failed to generate text: {e}") from e
+
+    def _record_metrics(self, elapsed: float, result: Optional[dict]) -> None:
+        """Record latency and token counts (``None`` result = failed call)."""
+        if record_llm_call is not None:
+            record_llm_call(self.config.model, elapsed, result, ok=result is not None)
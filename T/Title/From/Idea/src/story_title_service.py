@@ -91,9 +91,13 @@ from Model.Database.models.story import Story, StoryState
 from Model.Database.models.title import Title
 from Model.Database.repositories.story_repository import StoryRepository
 from Model.Database.repositories.title_repository import TitleRepository
+from Model.Repositories.story_retry_repository import StoryRetryRepository
 from Model.Database.schema_manager import SchemaManager
 from Model import StateNames
 
+if TYPE_CHECKING:
+    from src.near_duplicates import NearDuplicateIndex
+
 
 @dataclass
 class StoryTitleResult:
@@ -168,6 +172,7 @@ class StoryTitleService:
         title_config: Optional[TitleGeneratorConfig] = None,
         use_ai: bool = True,
         auto_create_schema: bool = True,
+        duplicate_index: Optional["NearDuplicateIndex"] = None,
     ):
         """Initialize the service.
 
@@ -183,6 +188,12 @@ class StoryTitleService:
             auto_create_schema: If True (default), automatically creates database
                 tables on initialization. Set to False if schema is managed
                 externally via SchemaManager or migration tools.
+            duplicate_index: Optional NearDuplicateIndex (src.near_duplicates).
+                When set, generated titles that are near-duplicates of any
+                indexed title are rejected before they are saved, and saved
+                titles are added to the index. A rejected story is deferred
+                (StoryRetryRepository.defer) so the next story is taken
+                first; no failed attempt is counted against it.
 
         Note:
             For production environments with proper schema management, set
@@ -195,6 +206,8 @@ class StoryTitleService:
         self._conn = connection
         self._story_repo = StoryRepository(connection) if connection else None
         self._title_repo = TitleRepository(connection) if connection else None
+        self._retry_repo = StoryRetryRepository(connection) if connection else None
+        self._duplicate_index = duplicate_index
 
         # Optionally ensure required tables exist (for convenience in development/testing)
         if connection and auto_create_schema:
@@ -262,6 +275,7 @@ class StoryTitleService:
         Finds Stories where:
         1. state = TITLE_FROM_IDEA (ready for title generation)
         2. No Title records exist for the story_id
+        3. The story is not deferred or backing off (StoryRetry)
 
         The returned list is ordered so that stories from Ideas with fewer
         existing titles are processed first (giving less-covered Ideas
@@ -283,7 +297,9 @@ class StoryTitleService:
             raise RuntimeError("Database connection required for this operation")
 
         # Get stories with TITLE_FROM_IDEA state
-        stories_ready = self._story_repo.find_by_state(StoryState.TITLE_FROM_IDEA)
+        stories_ready = self._story_repo.find_by_state(
+            StoryState.TITLE_FROM_IDEA, skip_backing_off=True
+        )
 
         # Filter to only those without titles
         stories_without_titles = []
@@ -484,6 +500,9 @@ class StoryTitleService:
             RuntimeError: If no database connection is available.
             AIUnavailableError: If AI title generation is not available.
             ValueError: If neither an Idea nor a pre-generated TitleVariant is provided.
+            NearDuplicateError: If a duplicate index is configured and the title
+                is a near-duplicate of an indexed title (nothing is saved and
+                the story is deferred).
         """
         if not self._title_repo or not self._story_repo:
             raise RuntimeError("Database connection required for this operation")
@@ -508,11 +527,21 @@ class StoryTitleService:
                     "Ensure Ollama is running and the model is available."
                 )
 
+        # Reject near-duplicates before content generation spends AI time on them
+        if self._duplicate_index:
+            try:
+                self._duplicate_index.check("title", variant.text)
+            except ValueError as e:  # NearDuplicateError
+                self._retry_repo.defer(story.id, self.CURRENT_STATE, str(e))
+                raise
+
         # Create Title (version 0)
         title = Title(story_id=story.id, version=0, text=variant.text)
 
         # Persist Title
         title = self._title_repo.insert(title)
+        if self._duplicate_index:
+            self._duplicate_index.add("title", title.id, title.text)
 
         # Update Story state to CONTENT_FROM_IDEA_TITLE (next workflow step)
         story.transition_to(StoryState.CONTENT_FROM_IDEA_TITLE)
@@ -59,7 +59,7 @@ sys.path.insert(0, str(REPO_ROOT))  # Repository root for T.Database, T.State im
 # that insert T at sys.path[0], which would shadow REPO_ROOT/src with T/src
 # (a different package that does not contain IdeaTable).
 try:
-    from src.config import Config
+    from src.config import get_config
     from src.idea import IdeaTable, setup_idea_table
 
     IDEA_TABLE_AVAILABLE = True
@@ -118,6 +118,15 @@ except ImportError:
         pass
 
 
+# Try to import WIP-limit gate (pauses generation while review queues are full)
+try:
+    from Model.Infrastructure.backpressure import BackpressureGate
+
+    BACKPRESSURE_AVAILABLE = True
+except ImportError:
+    BACKPRESSURE_AVAILABLE = False
+
+
 # Try to import AI title generator for local Ollama-based generation
 try:
     from ai_title_generator import (
@@ -215,7 +224,7 @@ def get_database_paths() -> tuple:
         Tuple of (title_db_path, story_db_path)
     """
     if CONFIG_AVAILABLE:
-        config = Config(interactive=False)
+        config = get_config()
         # Both Title and Story use the same database file
         return config.database_path, config.database_path
     else:
@@ -720,6 +729,8 @@ def run_state_workflow_mode(
     idea_db = setup_idea_table(db_path)
     print_success("Connected to Idea database")
 
+    gate = BackpressureGate() if BACKPRESSURE_AVAILABLE else None
+
     run_count = 0
     total_processed = 0
     total_errors = 0
@@ -734,6 +745,15 @@ def run_state_workflow_mode(
                 print(f"{Colors.CYAN}Run #{run_count} - Checking for new stories...{Colors.END}")
                 print(f"{Colors.CYAN}{'═' * 80}{Colors.END}\n")
 
+            # Hold back while downstream review queues are over their WIP limit (step 03)
+            if gate is not None:
+                gate.refresh(conn)
+                if gate.is_paused(3):
+                    print_warning(f"WIP limit reached ({gate.describe(3)}) - pausing title generation")
+                    print_info("Waiting 30 seconds before checking again...")
+                    time.sleep(30)
+                    continue
+
             # Find Stories with state TITLE_FROM_IDEA
             if run_count == 1:
                 print_section("Finding Stories for Title Generation")
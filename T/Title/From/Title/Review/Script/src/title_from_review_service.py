@@ -14,7 +14,6 @@ State Transitions:
 
 import logging
 import os
-import re
 import sqlite3
 import sys
 from dataclasses import dataclass
@@ -51,6 +50,8 @@ from Model.Database.models.title import Title
 from Model.Database.models.story import Story
 from Model.Database.repositories.content_repository import ContentRepository
 from Model.Database.repositories.story_repository import StoryRepository
+from Model.Infrastructure.ollama import generate
+from Model.Repositories.story_retry_repository import RETRY_READY_SQL, StoryRetryRepository
 from Model.Database.repositories.title_repository import TitleRepository
 from Model.State.constants.state_names import StateNames
 
@@ -105,6 +106,7 @@ class TitleFromReviewService:
         self.story_repo = StoryRepository(connection)
         self.title_repo = TitleRepository(connection)
         self.content_repo = ContentRepository(connection)
+        self.retry_repo = StoryRetryRepository(connection)
 
     def _ai_improve_title(
         self,
@@ -129,11 +131,6 @@ class TitleFromReviewService:
         Raises:
             RuntimeError: If Ollama is not available or the API call fails
         """
-        try:
-            import requests as _requests
-        except ImportError as exc:
-            raise RuntimeError("requests library not available; run: pip install requests") from exc
-
         template = _load_prompt("title_improvement.txt")
         prompt = template.format(
             title_text=title_text,
@@ -142,32 +139,13 @@ class TitleFromReviewService:
             content_text=content_text[:_MAX_CONTENT_PREVIEW_LENGTH],
         )
 
-        try:
-            check = _requests.get("http://localhost:11434/api/tags", timeout=5)
-            if check.status_code != 200:
-                raise RuntimeError(f"Ollama not available (status {check.status_code})")
-        except _requests.exceptions.RequestException as exc:
-            raise RuntimeError(f"Ollama not reachable: {exc}") from exc
-
-        try:
-            response = _requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": _AI_MODEL,
-                    "prompt": prompt,
-                    "stream": False,
-                    "think": False,
-                    "options": {"temperature": _AI_TEMPERATURE, "num_predict": _AI_MAX_TOKENS, "num_ctx": 4096},
-                },
-                timeout=_AI_TIMEOUT,
-            )
-            response.raise_for_status()
-            raw = response.json().get("response", "").strip()
-        except _requests.exceptions.RequestException as exc:
-            raise RuntimeError(f"Ollama API call failed: {exc}") from exc
-
-        # Strip <think>...</think> blocks (Qwen3 thinking mode)
-        raw = re.sub(r"<think>.*?</think>", "", raw, flags=re.DOTALL).strip()
+        raw = generate(
+            _AI_MODEL,
+            prompt,
+            temperature=_AI_TEMPERATURE,
+            max_tokens=_AI_MAX_TOKENS,
+            timeout=_AI_TIMEOUT,
+        )
 
         if not raw:
             raise RuntimeError("Ollama returned empty response")
@@ -189,7 +167,7 @@ class TitleFromReviewService:
             sqlite3.Row with story/title/content/review fields, or None
         """
         cursor = self._conn.execute(
-            """
+            f"""
             SELECT
                 s.id          AS story_id,
                 t.id          AS title_id,
@@ -208,6 +186,7 @@ class TitleFromReviewService:
                 AND c.version = (SELECT MAX(c2.version) FROM Content c2 WHERE c2.story_id = s.id)
             LEFT JOIN Review r ON r.id = t.review_id
             WHERE s.state = ?
+              AND {RETRY_READY_SQL}
             ORDER BY t.version ASC, COALESCE(r.score, 0) DESC, s.created_at ASC
             LIMIT 1
             """,
@@ -282,5 +261,8 @@ class TitleFromReviewService:
         except Exception as e:
             result.error = f"Unexpected error: {e}"
             logger.exception(f"Story {row['story_id']}: {result.error}")
+            retry = self.retry_repo.record_failure(row["story_id"], self.INPUT_STATE, result.error)
+            if retry.is_dead_lettered:
+                result.error += f" (dead-lettered after {retry.attempts} attempts)"
 
         return result
@@ -38,6 +38,7 @@ except ImportError:
 
 try:
     from title_from_review_service import TitleFromReviewService
+    from Model.Infrastructure.workflow import StageTelemetry
     SERVICE_AVAILABLE = True
 except ImportError as e:
     SERVICE_AVAILABLE = False
@@ -135,6 +136,7 @@ def main():
 
     # Initialize service
     service = TitleFromReviewService(conn)
+    telemetry = StageTelemetry("08")
 
     # Continuous processing loop
     run_count = 0
@@ -174,7 +176,7 @@ def main():
                 print_success(f"Found {pending_count} pending stories")
 
             # Process oldest story
-            result = service.process_oldest_story()
+            result = telemetry.run(service.process_oldest_story)
 
             if result.story_id is None:
                 print_warning("No story found to process")
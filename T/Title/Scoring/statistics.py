@@ -4,8 +4,6 @@ import math
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
-from scipy.stats import chi2_contingency
-
 
 @dataclass
 class VariantMetrics:
@@ -121,7 +119,10 @@ def _calculate_ctr_significance(
         [variant_b.clicks, variant_b.views - variant_b.clicks],
     ]
 
-    # Perform chi-square test
+    # Perform chi-square test (scipy is imported here: it takes ~1 s to load
+    # and only CTR significance needs it)
+    from scipy.stats import chi2_contingency
+
     try:
         chi2, p_value, dof, expected = chi2_contingency(data)
     except ValueError as e:
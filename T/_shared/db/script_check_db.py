@@ -0,0 +1,144 @@
+"""ScriptCheck table management.
+
+ScriptCheck — result of a deterministic checker (grammar, readability,
+consistency, editing) on one Content version, written by bulk re-reviews
+(``python -m T.Review.Script.rereview``). One row per Content and checker;
+re-reviewing replaces the row.
+
+Schema is created automatically on first use (CREATE TABLE IF NOT EXISTS).
+"""
+
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+
+# ---------------------------------------------------------------------------
+# Schema
+# ---------------------------------------------------------------------------
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS ScriptCheck (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    content_id  INTEGER NOT NULL,
+    checker     TEXT NOT NULL,          -- 'grammar', 'readability', ...
+    score       INTEGER,
+    passes      INTEGER,
+    issue_count INTEGER,
+    result_json TEXT,
+    error       TEXT,
+    reviewed_at TEXT NOT NULL,
+    UNIQUE(content_id, checker),
+    FOREIGN KEY (content_id) REFERENCES Content(id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_scriptcheck_checker ON ScriptCheck(checker, score);
+"""
+
+_UPSERT = """
+INSERT INTO ScriptCheck
+    (content_id, checker, score, passes, issue_count, result_json, error, reviewed_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(content_id, checker) DO UPDATE SET
+    score = excluded.score,
+    passes = excluded.passes,
+    issue_count = excluded.issue_count,
+    result_json = excluded.result_json,
+    error = excluded.error,
+    reviewed_at = excluded.reviewed_at
+"""
+
+# ---------------------------------------------------------------------------
+# Dataclasses
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ScriptCheck:
+    content_id: int
+    checker: str                    # "grammar" | "readability" | "consistency" | "editing"
+    score: Optional[int] = None
+    passes: Optional[bool] = None
+    issue_count: Optional[int] = None
+    result_json: Optional[str] = None
+    error: Optional[str] = None     # set instead of the result when the checker failed
+    reviewed_at: datetime = field(default_factory=datetime.now)
+    id: Optional[int] = None
+
+
+@dataclass
+class LatestContent:
+    content_id: int
+    story_id: int
+    version: int
+    text: str
+
+
+# ---------------------------------------------------------------------------
+# Repository
+# ---------------------------------------------------------------------------
+
+class ScriptCheckDB:
+    """Manages the ScriptCheck table.
+
+    Args:
+        connection: Open SQLite connection (must have row_factory = Row).
+    """
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._conn = connection
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """Create tables if they don't exist yet."""
+        self._conn.executescript(_DDL)
+        self._conn.commit()
+
+    def upsert_checks(self, checks: List[ScriptCheck]) -> None:
+        """Bulk-write checks in one transaction, replacing earlier results."""
+        self._conn.executemany(
+            _UPSERT,
+            [
+                (
+                    check.content_id,
+                    check.checker,
+                    check.score,
+                    None if check.passes is None else int(check.passes),
+                    check.issue_count,
+                    check.result_json,
+                    check.error,
+                    check.reviewed_at.isoformat(),
+                )
+                for check in checks
+            ],
+        )
+        self._conn.commit()
+
+    def find_by_content(self, content_id: int) -> List[sqlite3.Row]:
+        """Return all checks of one Content version."""
+        cursor = self._conn.execute(
+            "SELECT * FROM ScriptCheck WHERE content_id = ? ORDER BY checker",
+            (content_id,),
+        )
+        return cursor.fetchall()
+
+    def iter_latest_contents(self, limit: Optional[int] = None) -> Iterator[LatestContent]:
+        """Yield the latest Content version of every story, by story id.
+
+        Rows are read from the cursor as they are consumed, so the archive
+        is never loaded into memory at once.
+        """
+        sql = """
+            SELECT c.id, c.story_id, c.version, c.text
+            FROM Content c
+            INNER JOIN (
+                SELECT story_id, MAX(version) AS version FROM Content GROUP BY story_id
+            ) latest ON latest.story_id = c.story_id AND latest.version = c.version
+            ORDER BY c.story_id
+        """
+        params: tuple = ()
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (limit,)
+        for row in self._conn.execute(sql, params):
+            yield LatestContent(row[0], row[1], row[2], row[3])
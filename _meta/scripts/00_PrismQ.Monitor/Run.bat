@@ -1,6 +1,6 @@
 @echo off
 REM Run.bat - PrismQ Pipeline Monitor
-REM Prints story state distribution every 30 seconds
+REM Prints story flow per state (journal-backed, refreshed every second)
 
 set SCRIPT_DIR=%~dp0
 cd /d "%SCRIPT_DIR%"
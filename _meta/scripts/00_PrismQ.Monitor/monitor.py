@@ -1,8 +1,17 @@
 #!/usr/bin/env python3
-"""PrismQ Pipeline Monitor — prints story state distribution every 30 seconds."""
+"""PrismQ Pipeline Monitor — story flow per state, refreshed every second.
+
+Reads the state journal maintained by SQLite triggers (T.Pipeline.src.journal):
+per-state counters plus only the transitions added since the last refresh, so
+a 1-second refresh costs almost nothing. Shows arrivals/departures per hour,
+p50/p95 time-in-state, pass rates and the ETA to drain each queue.
+
+``--legacy`` falls back to a full ``GROUP BY state`` every 30 seconds.
+"""
 
 import sqlite3
 import sys
+from functools import lru_cache
 import time
 import os
 from datetime import datetime
@@ -14,10 +23,28 @@ if hasattr(sys.stdout, "reconfigure"):
 if hasattr(sys.stderr, "reconfigure"):
     sys.stderr.reconfigure(encoding="utf-8")
 
+# WIP groups (Model.Infrastructure) and the state journal (T.Pipeline);
+# the monitor still works without them
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+try:
+    from Model.Infrastructure.backpressure import BackpressureGate
+except Exception:
+    BackpressureGate = None
+try:
+    from T.Pipeline.src.journal import JournalTail, install_journal, prune_journal
+except Exception:
+    JournalTail = install_journal = prune_journal = None
+
 DB_PATH = "C:/PrismQ/db.s3db"
 REFRESH_SECONDS = 30
+FLOW_REFRESH_SECONDS = 1
+# Old StoryTransition rows are deleted on start and then once per interval
+JOURNAL_PRUNE_SECONDS = 3600
 
 # ANSI colors
+RED    = "\033[91m"
 RESET  = "\033[0m"
 BOLD   = "\033[1m"
 CYAN   = "\033[96m"
@@ -48,9 +75,11 @@ _STATE_MAP = {
     "Story.Review":                     "18",
     "Story.Polish":                     "19",
     "Publishing":                       "20",
+    "DeadLetter":                       "DL",
 }
 
 
+@lru_cache(maxsize=None)
 def _module_num(state: str) -> str:
     for fragment, num in _STATE_MAP.items():
         if fragment in state:
@@ -69,7 +98,47 @@ def _clear():
     os.system("cls" if os.name == "nt" else "clear")
 
 
-def print_table(rows: list, elapsed: float):
+def _home():
+    """Redraw from the top without spawning a process (1-second refresh)."""
+    print("\033[H\033[J", end="")
+
+
+def _duration(seconds) -> str:
+    if seconds is None:
+        return "—"
+    if seconds < 90:
+        return f"{seconds:.0f}s"
+    if seconds < 5400:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 172800:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / 86400:.1f}d"
+
+
+def print_pressure(rows: list, gate) -> None:
+    """Print depth vs WIP limit for each backpressure group and the stages it pauses."""
+    if gate is None:
+        return
+    pressure = gate.update(dict(rows))
+    print(f"{GRAY}  WIP groups (upstream stages pause at the limit){RESET}")
+    for group in pressure.values():
+        if not group.limit:
+            print(f"  {WHITE}{group.name:<11}{RESET} {group.depth:>7,} / {'off':>5}")
+            continue
+        bar = _bar(min(group.depth, group.limit), group.limit)
+        status = f"{RED}PAUSED{RESET}" if group.paused else f"{GREEN}OK{RESET}"
+        color = RED if group.paused else (YELLOW if group.ratio >= gate.resume_ratio else CYAN)
+        print(f"  {WHITE}{group.name:<11}{RESET} {group.depth:>7,} / {group.limit:>5,}  {color}{bar}{RESET}  {status}")
+    # Same per-stage view as PipelineRunner.paused_stages(); a stage's own queue never pauses it
+    paused = gate.paused_stages()
+    if paused:
+        stages = ", ".join(f"{stage:02d} ({reason})" for stage, reason in paused.items())
+        print(f"  {WHITE}{'paused':<11}{RESET} {RED}{stages}{RESET}")
+    else:
+        print(f"  {WHITE}{'paused':<11}{RESET} {GREEN}none{RESET}")
+
+
+def print_table(rows: list, elapsed: float, gate=None):
     _clear()
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     max_count = max((cnt for _, cnt in rows), default=1)
@@ -90,9 +159,83 @@ def print_table(rows: list, elapsed: float):
 
     print(f"{GRAY}  {'──':>2}  {'───────':>7}  {'──────────────────────':<22}  {'─' * 40}{RESET}")
     print(f"  {'':>2}  {BOLD}{WHITE}{total:>7,}{RESET}  {'total stories':}")
+    if gate is not None:
+        print(f"{BOLD}{CYAN}{'─' * 72}{RESET}")
+        print_pressure(rows, gate)
     print(f"{BOLD}{CYAN}{'═' * 72}{RESET}")
 
 
+def print_flow_table(stats: dict, gate=None, clear: bool = True):
+    """Print per-state flow statistics from the journal."""
+    if clear:
+        _home()
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    total = sum(s.count for s in stats.values())
+    rows = sorted(stats.values(), key=lambda s: (_module_num(s.state), s.state))
+
+    print(f"{BOLD}{CYAN}{'═' * 96}{RESET}")
+    print(f"{BOLD}{CYAN}  PrismQ Pipeline Monitor   {GRAY}{now}   rates over the last hour{RESET}")
+    print(f"{BOLD}{CYAN}{'═' * 96}{RESET}")
+    print(f"{GRAY}  {'##':>2}  {'Count':>7}  {'In/h':>6}  {'Out/h':>6}  {'p50':>5}  {'p95':>5}  {'Pass':>4}  {'ETA':>6}  State{RESET}")
+    print(f"{GRAY}  {'──':>2}  {'───────':>7}  {'──────':>6}  {'──────':>6}  {'─────':>5}  {'─────':>5}  {'────':>4}  {'──────':>6}  {'─' * 40}{RESET}")
+
+    for s in rows:
+        color = GREEN if s.count > 0 else GRAY
+        pass_rate = f"{s.pass_rate:.0%}" if s.pass_rate is not None else "—"
+        if s.eta_seconds is None and s.count:
+            eta = f"{RED}{'grow':>6}{RESET}" if s.arrivals_per_hour > s.departures_per_hour else f"{GRAY}{'—':>6}{RESET}"
+        else:
+            eta = f"{_duration(s.eta_seconds):>6}"
+        short_state = s.state.replace("PrismQ.T.", "").replace("PrismQ.", "")
+        print(
+            f"  {YELLOW}{_module_num(s.state):>2}{RESET}  {color}{s.count:>7,}{RESET}  "
+            f"{s.arrivals_per_hour:>6.1f}  {s.departures_per_hour:>6.1f}  "
+            f"{_duration(s.p50_seconds):>5}  {_duration(s.p95_seconds):>5}  {pass_rate:>4}  {eta}  "
+            f"{WHITE}{short_state}{RESET}"
+        )
+
+    print(f"{GRAY}  {'──':>2}  {'───────':>7}{RESET}")
+    print(f"  {'':>2}  {BOLD}{WHITE}{total:>7,}{RESET}  total stories")
+    if gate is not None:
+        print(f"{BOLD}{CYAN}{'─' * 96}{RESET}")
+        print_pressure([(s.state, s.count) for s in rows], gate)
+    print(f"{BOLD}{CYAN}{'═' * 96}{RESET}")
+
+
+def _prune(conn: sqlite3.Connection) -> None:
+    """Drop old journal transitions; a busy database only delays the next prune."""
+    try:
+        prune_journal(conn)
+    except sqlite3.Error as e:
+        print(f"{YELLOW}Journal prune skipped: {e}{RESET}")
+
+
+def run_flow_monitor(conn: sqlite3.Connection, gate, once: bool, clear: bool) -> int:
+    """Journal-backed monitor: counters and new transitions only."""
+    _prune(conn)
+    pruned_at = time.monotonic()
+    tail = JournalTail(conn)
+    if once:
+        tail.poll()
+        print_flow_table(tail.stats(), gate, clear=clear)
+        return 0
+
+    if os.name == "nt":
+        os.system("")  # enable ANSI cursor movement in the Windows console
+    _clear()
+    try:
+        while True:
+            if time.monotonic() - pruned_at >= JOURNAL_PRUNE_SECONDS:
+                _prune(conn)
+                pruned_at = time.monotonic()
+            tail.poll()
+            print_flow_table(tail.stats(), gate, clear=clear)
+            time.sleep(FLOW_REFRESH_SECONDS)
+    except KeyboardInterrupt:
+        print(f"\n{YELLOW}Monitor stopped.{RESET}\n")
+    return 0
+
+
 def query(conn: sqlite3.Connection) -> list:
     return conn.execute(
         "SELECT state, COUNT(*) AS cnt FROM Story GROUP BY state ORDER BY cnt DESC"
@@ -104,6 +247,7 @@ def main():
     parser = argparse.ArgumentParser(description="PrismQ Pipeline Monitor")
     parser.add_argument("--once", action="store_true", help="Print once and exit (no loop)")
     parser.add_argument("--no-clear", action="store_true", help="Skip screen clear (useful for piped output)")
+    parser.add_argument("--legacy", action="store_true", help="Count with GROUP BY every 30s instead of the state journal")
     args = parser.parse_args()
 
     try:
@@ -112,6 +256,20 @@ def main():
         print(f"ERROR: Cannot connect to database: {e}")
         return 1
 
+    gate = BackpressureGate() if BackpressureGate is not None else None
+
+    if not args.legacy and install_journal is not None:
+        try:
+            journal_ready = install_journal(conn)
+        except sqlite3.Error as e:
+            print(f"{YELLOW}State journal unavailable ({e}); using GROUP BY mode.{RESET}")
+            journal_ready = False
+        if journal_ready:
+            try:
+                return run_flow_monitor(conn, gate, args.once, clear=not args.no_clear)
+            finally:
+                conn.close()
+
     if args.once:
         rows = query(conn)
         conn.close()
@@ -131,8 +289,9 @@ def main():
                 print(f"  {YELLOW}{num:>2}{RESET}  {color}{cnt:>7,}{RESET}  {CYAN}{bar}{RESET}  {WHITE}{short_state}{RESET}")
             print(f"{GRAY}  {'':>2}  {'───────':>7}{RESET}")
             print(f"  {'':>2}  {BOLD}{WHITE}{total:>7,}{RESET}  total\n")
+            print_pressure(rows, gate)
         else:
-            print_table(rows, 0)
+            print_table(rows, 0, gate)
         return 0
 
     print(f"{GREEN}Refreshing every {REFRESH_SECONDS}s — press Ctrl+C to stop.{RESET}")
@@ -141,7 +300,7 @@ def main():
     try:
         while True:
             rows = query(conn)
-            print_table(rows, 0)
+            print_table(rows, 0, gate)
             time.sleep(REFRESH_SECONDS)
 
     except KeyboardInterrupt:
@@ -9,6 +9,10 @@ cd /d "%SCRIPT_DIR%"
 call ..\common\setup_env.bat "%SCRIPT_DIR%..\..\..\T\Review\Script\Grammar"
 if %ERRORLEVEL% NEQ 0 ( pause & exit /b 1 )
 
+REM Build the spelling index once (needs PRISMQ_SPELLING_DICTIONARY, see T\Review\Script\Grammar\README.md)
+python ..\..\..\T\Review\Script\Grammar\spelling.py build --if-missing
+if %ERRORLEVEL% NEQ 0 ( echo ERROR: Spelling index build failed & pause & exit /b 1 )
+
 echo ========================================
 echo PrismQ.T.Review.Content.Grammar
 echo ========================================
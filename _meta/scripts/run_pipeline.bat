@@ -0,0 +1,16 @@
+@echo off
+:: run_pipeline.bat — Run pipeline steps 02-17 in a single Python process (T.Pipeline)
+:: Replaces one Run.bat window per step; pass --stages to select steps, e.g.
+::   run_pipeline.bat --stages 03,05-07,10-17
+:: Press Ctrl+C to stop.
+
+set SCRIPT_DIR=%~dp0
+cd /d "%SCRIPT_DIR%"
+call common\setup_env.bat "%SCRIPT_DIR%..\..\T\Pipeline"
+if %ERRORLEVEL% NEQ 0 ( pause & exit /b 1 )
+
+cd /d "%SCRIPT_DIR%..\.."
+python -m T.Pipeline %*
+
+if %ERRORLEVEL% NEQ 0 ( echo ERROR: Pipeline failed & pause & exit /b 1 )
+exit /b 0
@@ -23,6 +23,11 @@ Usage:
     print(config.working_directory)
     print(config.database_url)
 
+    # Workers and hot paths: cached, read-only snapshot (never prompts)
+    from src.config import get_config
+
+    db_path = get_config().database_path
+
     # Use shared database table managers (default: db.s3db in working directory)
     from src.idea import IdeaTable, setup_idea_table
 
@@ -38,8 +43,9 @@ Usage:
     db.close()
 """
 
-from .config import Config
+from .config import Config, ConfigSnapshot, clear_config_cache, get_config
 from .idea import IdeaTable, setup_idea_table
+from .near_duplicates import NearDuplicateIndex, setup_near_duplicate_index
 from .startup import (
     DatabaseConfig,
     create_database_config,
@@ -49,8 +55,13 @@ from .story import StoryTable, setup_story_table
 
 __all__ = [
     "Config",
+    "ConfigSnapshot",
+    "get_config",
+    "clear_config_cache",
     "IdeaTable",
     "setup_idea_table",
+    "NearDuplicateIndex",
+    "setup_near_duplicate_index",
     "StoryTable",
     "setup_story_table",
     # Database configuration
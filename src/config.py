@@ -2,14 +2,27 @@
 
 This module provides centralized configuration loading from environment variables
 and .env files, with standardized working directory management.
+
+Two ways to read the configuration:
+
+    Config        - full setup: creates the .env file, stores the working
+                    directory in it and may prompt for missing values
+    get_config()  - process-wide, read-only ConfigSnapshot for workers and
+                    hot paths; never prompts or writes the .env file, and
+                    re-reads it only when its modification time changes
 """
 
+import hashlib
+import json
 import os
+import threading
+import time
+from dataclasses import asdict, dataclass, fields, replace
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 try:
-    from dotenv import load_dotenv, set_key
+    from dotenv import dotenv_values, load_dotenv, set_key
 except ImportError:
 
     def load_dotenv(*args, **kwargs):
@@ -20,6 +33,49 @@ except ImportError:
         """No-op fallback when python-dotenv is not installed."""
         return (None, None, None)
 
+    def dotenv_values(*args, **kwargs):
+        """Empty fallback when python-dotenv is not installed."""
+        return {}
+
+
+# Set to 1/true/yes to never prompt, even when Config(interactive=True)
+NON_INTERACTIVE_ENV = "PRISMQ_NON_INTERACTIVE"
+
+# Path of the serialized snapshot cache; "0"/"off" disables it
+# (default: .env.cache.json next to the .env file)
+CONFIG_CACHE_ENV = "PRISMQ_CONFIG_CACHE"
+
+# Environment variables that feed the configuration
+CONFIG_KEYS = ("DATABASE_URL", "YOUTUBE_API_KEY", "YOUTUBE_CHANNEL_URL")
+
+# Snapshot fields left out of the cache file and re-read on every load
+SECRET_FIELDS = {"youtube_api_key": "YOUTUBE_API_KEY"}
+
+# Seconds between .env modification-time checks in get_config()
+CHECK_INTERVAL = 1.0
+
+
+def _standard_working_directory() -> Path:
+    """PRISMQ_WORKING_DIRECTORY if set, otherwise C:/PrismQ."""
+    env_override = os.getenv("PRISMQ_WORKING_DIRECTORY")
+    if env_override:
+        return Path(env_override).absolute()
+    return Path("C:/PrismQ")
+
+
+def _non_interactive_forced() -> bool:
+    return os.getenv(NON_INTERACTIVE_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+def _database_path(database_url: str, working_directory: str) -> str:
+    """Database file for ``database_url`` (SQLite), else db.s3db in the working directory."""
+    if database_url.startswith("sqlite:///"):
+        db_path = database_url.replace("sqlite:///", "")
+        if not Path(db_path).is_absolute():
+            return str(Path(working_directory) / db_path)
+        return db_path
+    return str(Path(working_directory) / "db.s3db")
+
 
 class Config:
     """Manages application configuration from environment variables.
@@ -66,7 +122,7 @@ class Config:
             env_file = env_path
 
         self.env_file = str(env_file)
-        self._interactive = interactive
+        self._interactive = interactive and not _non_interactive_forced()
 
         # Create .env file if it doesn't exist
         if not Path(self.env_file).exists():
@@ -91,13 +147,7 @@ class Config:
         Returns:
             Path to the working directory
         """
-        # Check for explicit override via environment variable
-        env_override = os.getenv("PRISMQ_WORKING_DIRECTORY")
-        if env_override:
-            return Path(env_override).absolute()
-
-        # Fallback: C:/PrismQ for all platforms
-        return Path("C:/PrismQ")
+        return _standard_working_directory()
 
     def _find_prismq_directory(self) -> Path:
         """Find the topmost/root parent directory with exact name 'PrismQ'.
@@ -209,15 +259,7 @@ class Config:
         self.database_url = database_url
 
         # For backward compatibility, extract database_path from SQLite URLs
-        if database_url.startswith("sqlite:///"):
-            db_path = database_url.replace("sqlite:///", "")
-            if not Path(db_path).is_absolute():
-                self.database_path = str(Path(self.working_directory) / db_path)
-            else:
-                self.database_path = db_path
-        else:
-            # For non-SQLite databases, use working directory as fallback
-            self.database_path = str(Path(self.working_directory) / "db.s3db")
+        self.database_path = _database_path(database_url, self.working_directory)
 
         # YouTube API configuration (for search-based scraping)
         self.youtube_api_key = self._get_or_prompt(
@@ -240,6 +282,10 @@ class Config:
         self.youtube_trending_max_shorts = self.DEFAULT_YOUTUBE_TRENDING_MAX_SHORTS
         self.youtube_keyword_max_shorts = self.DEFAULT_YOUTUBE_KEYWORD_MAX_SHORTS
 
+    def snapshot(self) -> "ConfigSnapshot":
+        """Return the current values as an immutable ConfigSnapshot."""
+        return ConfigSnapshot(**{f.name: getattr(self, f.name) for f in fields(ConfigSnapshot)})
+
     def get_module_directory(self, module: str, content_id: Optional[str] = None) -> Path:
         """Get standardized directory path for a specific module.
 
@@ -272,3 +318,206 @@ class Config:
         """
         module_dir = self.get_module_directory(module)
         module_dir.mkdir(parents=True, exist_ok=True)
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable configuration values, as returned by :func:`get_config`.
+
+    Has the same attributes and module-directory helpers as :class:`Config`,
+    so it can be passed wherever only the values are read.
+    """
+
+    working_directory: str
+    env_file: str
+    database_url: str
+    database_path: str
+    youtube_api_key: str = ""
+    youtube_channel_url: str = ""
+    youtube_max_results: int = Config.DEFAULT_YOUTUBE_MAX_RESULTS
+    youtube_channel_max_shorts: int = Config.DEFAULT_YOUTUBE_CHANNEL_MAX_SHORTS
+    youtube_trending_max_shorts: int = Config.DEFAULT_YOUTUBE_TRENDING_MAX_SHORTS
+    youtube_keyword_max_shorts: int = Config.DEFAULT_YOUTUBE_KEYWORD_MAX_SHORTS
+
+    def get_module_directory(self, module: str, content_id: Optional[str] = None) -> Path:
+        """Get standardized directory path for a module (see Config)."""
+        base_path = Path(self.working_directory) / module
+        return base_path / content_id if content_id else base_path
+
+    def ensure_module_structure(self, module: str) -> None:
+        """Create the module directory once per process."""
+        module_dir = self.get_module_directory(module)
+        if module_dir not in _ensured_directories:
+            module_dir.mkdir(parents=True, exist_ok=True)
+            _ensured_directories.add(module_dir)
+
+
+_ensured_directories: set = set()
+
+
+def _env_stamp(env_file: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of the .env file, None if it does not exist."""
+    try:
+        stat = env_file.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cache_path(env_file: Path) -> Optional[Path]:
+    setting = os.getenv(CONFIG_CACHE_ENV)
+    if setting is None:
+        return env_file.with_name(env_file.name + ".cache.json")
+    if setting.strip().lower() in ("", "0", "off", "false", "no"):
+        return None
+    return Path(setting)
+
+
+def _cache_key(env_file: Path, stamp: Optional[Tuple[int, int]]) -> Dict[str, Any]:
+    """Everything a cached snapshot depends on (environment values hashed)."""
+    environ = json.dumps([os.environ.get(key) for key in CONFIG_KEYS])
+    return {
+        "env_file": str(env_file),
+        "stamp": list(stamp) if stamp else None,
+        "environ": hashlib.sha256(environ.encode("utf-8")).hexdigest(),
+        "fields": [f.name for f in fields(ConfigSnapshot)],
+        "omitted": sorted(SECRET_FIELDS),
+    }
+
+
+def _secret_values(file_values: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        field: os.environ.get(name) or file_values.get(name) or ""
+        for field, name in SECRET_FIELDS.items()
+    }
+
+
+def _read_cache(path: Path, key: Dict[str, Any]) -> Optional[Tuple[ConfigSnapshot, bool]]:
+    """Cached snapshot without secrets, and whether the .env file holds any."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("key") == key:
+            return ConfigSnapshot(**data["snapshot"]), bool(data.get("secrets_in_file"))
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    return None
+
+
+def _write_cache(
+    path: Path, key: Dict[str, Any], snapshot: ConfigSnapshot, secrets_in_file: bool
+) -> None:
+    values = asdict(snapshot)
+    for name in SECRET_FIELDS:
+        values.pop(name, None)
+    payload = json.dumps({"key": key, "snapshot": values, "secrets_in_file": secrets_in_file})
+    # Best effort: a read-only working directory only costs the next start
+    try:
+        temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(payload)
+        os.replace(temp, path)
+    except OSError:
+        pass
+
+
+def load_config_snapshot(env_file: Optional[str] = None, use_cache: bool = True) -> ConfigSnapshot:
+    """Read the configuration without prompting or writing the .env file.
+
+    Values resolve like :class:`Config`: environment variables first, then
+    the .env file, then defaults. A missing .env file is not created.
+    Secrets (``SECRET_FIELDS``) are never written to the cache file; they are
+    read from the environment or the .env file on every load.
+
+    Args:
+        env_file: Path to .env file (default: .env in standardized working directory)
+        use_cache: Reuse/update the serialized snapshot file (see CONFIG_CACHE_ENV)
+    """
+    if env_file is None:
+        working_dir = _standard_working_directory()
+        env_path = working_dir / ".env"
+    else:
+        env_path = Path(env_file)
+        working_dir = env_path.parent.absolute()
+
+    stamp = _env_stamp(env_path)
+    cache = _cache_path(env_path) if use_cache and stamp else None
+    key = _cache_key(env_path, stamp)
+    if cache is not None:
+        cached = _read_cache(cache, key)
+        if cached is not None:
+            snapshot, secrets_in_file = cached
+            file_values = dotenv_values(env_path) if secrets_in_file else {}
+            return replace(snapshot, **_secret_values(file_values))
+
+    file_values = dotenv_values(env_path) if stamp else {}
+
+    def value(name: str, default: str = "") -> str:
+        return os.environ.get(name) or file_values.get(name) or default
+
+    working_directory = str(working_dir)
+    database_url = value("DATABASE_URL", f"sqlite:///{working_dir / 'db.s3db'}")
+    snapshot = ConfigSnapshot(
+        working_directory=working_directory,
+        env_file=str(env_path),
+        database_url=database_url,
+        database_path=_database_path(database_url, working_directory),
+        youtube_channel_url=value("YOUTUBE_CHANNEL_URL"),
+        **_secret_values(file_values),
+    )
+    if cache is not None:
+        secrets_in_file = any(file_values.get(name) for name in SECRET_FIELDS.values())
+        _write_cache(cache, key, snapshot, secrets_in_file)
+    return snapshot
+
+
+class _CachedSnapshot:
+    __slots__ = ("snapshot", "stamp", "environ", "checked")
+
+    def __init__(self, snapshot, stamp, environ, checked):
+        self.snapshot = snapshot
+        self.stamp = stamp
+        self.environ = environ
+        self.checked = checked
+
+
+_snapshots: Dict[Tuple[Optional[str], Optional[str]], _CachedSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def get_config(env_file: Optional[str] = None) -> ConfigSnapshot:
+    """Process-wide configuration snapshot for workers and hot paths.
+
+    The first call reads the configuration (see :func:`load_config_snapshot`).
+    Later calls return the same object; at most every ``CHECK_INTERVAL``
+    seconds the .env modification time is checked and the snapshot rebuilt
+    if the file or the relevant environment variables changed.
+
+    Args:
+        env_file: Path to .env file (default: .env in standardized working directory)
+    """
+    key = (env_file, os.getenv("PRISMQ_WORKING_DIRECTORY"))
+    now = time.monotonic()
+    entry = _snapshots.get(key)
+    if entry is not None and now - entry.checked < CHECK_INTERVAL:
+        return entry.snapshot
+
+    with _snapshots_lock:
+        entry = _snapshots.get(key)
+        environ = tuple(os.environ.get(name) for name in CONFIG_KEYS)
+        if entry is not None:
+            stamp = _env_stamp(Path(entry.snapshot.env_file))
+            if stamp == entry.stamp and environ == entry.environ:
+                entry.checked = now
+                return entry.snapshot
+        snapshot = load_config_snapshot(env_file)
+        stamp = _env_stamp(Path(snapshot.env_file))
+        _snapshots[key] = _CachedSnapshot(snapshot, stamp, environ, now)
+        return snapshot
+
+
+def clear_config_cache() -> None:
+    """Forget the process-wide snapshots (the next get_config() re-reads)."""
+    with _snapshots_lock:
+        _snapshots.clear()
+    _ensured_directories.clear()
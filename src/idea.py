@@ -93,9 +93,14 @@ class IdeaTable:
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
 
-    def connect(self) -> None:
-        """Establish database connection."""
-        self.conn = sqlite3.connect(self.db_path)
+    def connect(self, check_same_thread: bool = True) -> None:
+        """Establish database connection.
+
+        Args:
+            check_same_thread: Pass False when the connection is used from
+                worker threads (one at a time), as in the pipeline runner.
+        """
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
         self.conn.row_factory = sqlite3.Row
         # Enable foreign key constraints in SQLite
         self.conn.execute("PRAGMA foreign_keys = ON")
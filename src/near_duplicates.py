@@ -0,0 +1,416 @@
+"""Near-duplicate index for Idea, Title and Content text in PrismQ's shared database.
+
+Generating a Story costs several AI calls per stage, so an Idea, Title or
+Content that is nearly identical to one already produced should be caught
+before the next stage spends GPU time on it. Comparing a new text with every
+stored text does not scale; this module keeps a MinHash locality-sensitive
+index instead:
+
+- Each text is reduced to word shingles (word n-grams) and summarized by a
+  MinHash signature of SIGNATURE_SIZE values. The share of equal values
+  estimates the Jaccard similarity of the shingle sets, the same measure
+  ``StoryTitleService.calculate_title_similarity`` uses for words.
+- The signature is cut into BANDS bands of ROWS_PER_BAND values, each hashed
+  to a bucket. Texts sharing at least one bucket are candidates; with 16 x 4
+  a pair at Jaccard 0.7 becomes a candidate with ~98% probability and a pair
+  at 0.3 with ~12%.
+- Buckets live in an indexed SQLite table, so a query is one indexed lookup
+  of BANDS buckets plus a signature comparison per candidate.
+
+Schema:
+    NearDuplicateSignature (
+        kind TEXT NOT NULL,
+        ref_id INTEGER NOT NULL,
+        signature BLOB NOT NULL,
+        created_at TEXT NOT NULL DEFAULT (datetime('now')),
+        PRIMARY KEY (kind, ref_id)
+    )
+
+    NearDuplicateBucket (
+        kind TEXT NOT NULL,
+        bucket INTEGER NOT NULL,
+        ref_id INTEGER NOT NULL,
+        PRIMARY KEY (kind, bucket, ref_id)
+    )
+
+``kind`` is 'idea', 'title' or 'content' and ``ref_id`` the ID of the row
+in the Idea, Title or Content table.
+
+Usage:
+    from src.near_duplicates import setup_near_duplicate_index
+
+    index = setup_near_duplicate_index()
+    matches = index.find("idea", text)
+    if not matches:
+        idea_id = idea_db.insert_idea(text)
+        index.add("idea", idea_id, text)
+    index.close()
+"""
+
+import hashlib
+import random
+import re
+import sqlite3
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+SIGNATURE_SIZE = 64
+BANDS = 16
+ROWS_PER_BAND = SIGNATURE_SIZE // BANDS
+
+# Similarity at or above which a text counts as a near-duplicate
+# (matches StoryTitleService.DEFAULT_SIMILARITY_THRESHOLD)
+DEFAULT_THRESHOLD = 0.7
+
+# Words per shingle: titles compare single words, longer texts word n-grams
+SHINGLE_SIZES = {"title": 1, "idea": 2, "content": 3}
+DEFAULT_SHINGLE_SIZE = 2
+
+# Table holding the (id, text) rows of each kind, for backfilling
+SOURCE_TABLES = {"idea": "Idea", "title": "Title", "content": "Content"}
+
+# Each signature value is the minimum of the shingle hashes XORed with one
+# fixed random mask: as accurate as (a * x + b) mod p permutations for 64-bit
+# cryptographic hashes, and min(map(...)) keeps the loop in C
+_rng = random.Random(0x5EED)
+_MASKS = tuple(_rng.getrandbits(64) for _ in range(SIGNATURE_SIZE))
+del _rng
+_WORD = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> set:
+    """Lowercase word n-grams of ``text``; shorter texts form one shingle."""
+    words = _WORD.findall(text.lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def minhash_signature(text: str, shingle_size: int = DEFAULT_SHINGLE_SIZE) -> Tuple[int, ...]:
+    """MinHash signature of ``text`` (empty tuple for text without words)."""
+    hashes = [_hash64(shingle) for shingle in shingles(text, shingle_size)]
+    if not hashes:
+        return ()
+    return tuple(min(map(mask.__xor__, hashes)) for mask in _MASKS)
+
+
+def signature_similarity(first: Sequence[int], second: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    if not first or len(first) != len(second):
+        return 0.0
+    return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+
+def band_buckets(signature: Sequence[int]) -> List[int]:
+    """One signed 64-bit bucket key per band (the band number is part of the key)."""
+    buckets = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(
+            array("Q", [band, *rows]).tobytes(), digest_size=8
+        ).digest()
+        buckets.append(int.from_bytes(digest, "big", signed=True))
+    return buckets
+
+
+@dataclass(frozen=True)
+class NearDuplicate:
+    """A stored text similar to the queried one.
+
+    Attributes:
+        kind: 'idea', 'title' or 'content'
+        ref_id: ID of the stored row
+        similarity: Estimated Jaccard similarity (0.0-1.0)
+    """
+
+    kind: str
+    ref_id: int
+    similarity: float
+
+
+class NearDuplicateError(ValueError):
+    """Raised when generated text is rejected as a near-duplicate."""
+
+    def __init__(self, kind: str, matches: List[NearDuplicate]):
+        self.kind = kind
+        self.matches = matches
+        best = matches[0]
+        super().__init__(
+            f"{kind.capitalize()} is a near-duplicate of {kind} {best.ref_id} "
+            f"(similarity {best.similarity:.2f})"
+        )
+
+
+class NearDuplicateIndex:
+    """MinHash LSH index over Idea, Title and Content text in the shared database.
+
+    Example:
+        >>> index = NearDuplicateIndex("db.s3db")
+        >>> index.connect()
+        >>> index.create_tables()
+        >>> index.add("title", 1, "The Girl Who Vanished at Midnight")
+        >>> index.find("title", "The girl who vanished at midnight!")
+        [NearDuplicate(kind='title', ref_id=1, similarity=1.0)]
+        >>> index.close()
+    """
+
+    def __init__(
+        self, db_path: str = "db.s3db", connection: Optional[sqlite3.Connection] = None
+    ):
+        """Initialize the index.
+
+        Args:
+            db_path: Path to SQLite database file (default: db.s3db)
+            connection: Existing connection to use instead of opening db_path,
+                e.g. the connection a service already holds. It is not closed
+                by :meth:`close`.
+        """
+        self.db_path = db_path
+        self.conn: Optional[sqlite3.Connection] = connection
+        self._owns_connection = connection is None
+
+    def connect(self, check_same_thread: bool = True) -> None:
+        """Establish database connection (no-op for a borrowed connection)."""
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
+            self._owns_connection = True
+
+    def close(self) -> None:
+        """Close the database connection if this index opened it."""
+        if self.conn and self._owns_connection:
+            self.conn.close()
+        self.conn = None
+
+    def create_tables(self) -> None:
+        """Create the signature and bucket tables."""
+        if not self.conn:
+            self.connect()
+
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS NearDuplicateSignature (
+                kind TEXT NOT NULL,
+                ref_id INTEGER NOT NULL,
+                signature BLOB NOT NULL,
+                created_at TEXT NOT NULL DEFAULT (datetime('now')),
+                PRIMARY KEY (kind, ref_id)
+            )
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS NearDuplicateBucket (
+                kind TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                ref_id INTEGER NOT NULL,
+                PRIMARY KEY (kind, bucket, ref_id)
+            ) WITHOUT ROWID
+        """
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def signature(kind: str, text: str) -> Tuple[int, ...]:
+        """MinHash signature of ``text`` using the shingle size of ``kind``."""
+        return minhash_signature(text, SHINGLE_SIZES.get(kind, DEFAULT_SHINGLE_SIZE))
+
+    def add(self, kind: str, ref_id: int, text: str) -> bool:
+        """Index (or re-index) the text of one row.
+
+        Returns:
+            True if indexed, False if the text has no words
+        """
+        return self.add_many(kind, [(ref_id, text)]) == 1
+
+    def add_many(self, kind: str, rows: Iterable[Tuple[int, str]]) -> int:
+        """Index many ``(ref_id, text)`` rows in one transaction (e.g. a backfill).
+
+        Returns:
+            Number of rows indexed
+        """
+        if not self.conn:
+            self.connect()
+
+        signatures, buckets, ref_ids = [], [], []
+        for ref_id, text in rows:
+            signature = self.signature(kind, text or "")
+            if not signature:
+                continue
+            ref_ids.append((kind, ref_id))
+            signatures.append((kind, ref_id, array("Q", signature).tobytes()))
+            buckets.extend((kind, bucket, ref_id) for bucket in band_buckets(signature))
+
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM NearDuplicateBucket WHERE kind = ? AND ref_id = ?", ref_ids
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO NearDuplicateSignature (kind, ref_id, signature) "
+                "VALUES (?, ?, ?)",
+                signatures,
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO NearDuplicateBucket (kind, bucket, ref_id) "
+                "VALUES (?, ?, ?)",
+                buckets,
+            )
+        return len(signatures)
+
+    def index_missing(self, kind: str) -> int:
+        """Index rows of the kind's source table that are not indexed yet.
+
+        Use once when enabling the index on an existing database, or after
+        rows were written without going through :meth:`add`.
+
+        Returns:
+            Number of rows indexed
+
+        Raises:
+            KeyError: If ``kind`` has no source table
+        """
+        if not self.conn:
+            self.connect()
+
+        table = SOURCE_TABLES[kind]
+        rows = self.conn.execute(
+            f"""
+            SELECT id, text FROM {table}
+            WHERE id NOT IN (SELECT ref_id FROM NearDuplicateSignature WHERE kind = ?)
+        """,
+            (kind,),
+        ).fetchall()
+        return self.add_many(kind, ((row[0], row[1]) for row in rows))
+
+    def remove(self, kind: str, ref_id: int) -> bool:
+        """Drop one row from the index.
+
+        Returns:
+            True if removed, False if it was not indexed
+        """
+        if not self.conn:
+            self.connect()
+
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM NearDuplicateBucket WHERE kind = ? AND ref_id = ?", (kind, ref_id)
+            )
+            cursor = self.conn.execute(
+                "DELETE FROM NearDuplicateSignature WHERE kind = ? AND ref_id = ?",
+                (kind, ref_id),
+            )
+        return cursor.rowcount > 0
+
+    def find(
+        self,
+        kind: str,
+        text: str,
+        threshold: float = DEFAULT_THRESHOLD,
+        exclude: Iterable[int] = (),
+    ) -> List[NearDuplicate]:
+        """Stored rows of ``kind`` whose text is similar to ``text``.
+
+        Args:
+            kind: 'idea', 'title' or 'content'
+            text: Text to check
+            threshold: Minimum estimated Jaccard similarity (default: 0.7)
+            exclude: Row IDs to ignore, e.g. the row being re-checked
+
+        Returns:
+            Matches ordered by similarity (highest first), then ID
+        """
+        return self.find_signature(kind, self.signature(kind, text), threshold, exclude)
+
+    def find_signature(
+        self,
+        kind: str,
+        signature: Sequence[int],
+        threshold: float = DEFAULT_THRESHOLD,
+        exclude: Iterable[int] = (),
+    ) -> List[NearDuplicate]:
+        """Like :meth:`find` for a precomputed :meth:`signature`."""
+        if not signature:
+            return []
+        if not self.conn:
+            self.connect()
+
+        buckets = band_buckets(signature)
+        rows = self.conn.execute(
+            f"""
+            SELECT s.ref_id, s.signature FROM NearDuplicateSignature s
+            WHERE s.kind = ? AND s.ref_id IN (
+                SELECT ref_id FROM NearDuplicateBucket
+                WHERE kind = ? AND bucket IN ({", ".join("?" * len(buckets))})
+            )
+        """,
+            (kind, kind, *buckets),
+        ).fetchall()
+
+        excluded = set(exclude)
+        matches = []
+        for ref_id, blob in rows:
+            if ref_id in excluded:
+                continue
+            similarity = signature_similarity(signature, array("Q", blob))
+            if similarity >= threshold:
+                matches.append(NearDuplicate(kind, ref_id, similarity))
+        matches.sort(key=lambda match: (-match.similarity, match.ref_id))
+        return matches
+
+    def check(
+        self,
+        kind: str,
+        text: str,
+        threshold: float = DEFAULT_THRESHOLD,
+        exclude: Iterable[int] = (),
+    ) -> None:
+        """Reject ``text`` if it is a near-duplicate of a stored row.
+
+        Raises:
+            NearDuplicateError: With the matches, best first
+        """
+        matches = self.find(kind, text, threshold, exclude)
+        if matches:
+            raise NearDuplicateError(kind, matches)
+
+    def count(self, kind: Optional[str] = None) -> int:
+        """Number of indexed rows (of ``kind`` if given)."""
+        if not self.conn:
+            self.connect()
+        if kind is None:
+            return self.conn.execute("SELECT COUNT(*) FROM NearDuplicateSignature").fetchone()[0]
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM NearDuplicateSignature WHERE kind = ?", (kind,)
+        ).fetchone()[0]
+
+
+def setup_near_duplicate_index(db_path: str = "db.s3db") -> NearDuplicateIndex:
+    """Connect to the shared database and ensure the index tables exist.
+
+    Args:
+        db_path: Path to shared SQLite database file (default: db.s3db)
+
+    Returns:
+        Connected and initialized NearDuplicateIndex instance
+    """
+    index = NearDuplicateIndex(db_path)
+    index.connect()
+    index.create_tables()
+    return index
+
+
+__all__ = [
+    "DEFAULT_THRESHOLD",
+    "NearDuplicate",
+    "NearDuplicateError",
+    "NearDuplicateIndex",
+    "SOURCE_TABLES",
+    "minhash_signature",
+    "setup_near_duplicate_index",
+    "signature_similarity",
+]
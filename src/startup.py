@@ -79,12 +79,14 @@ def create_database_config(
             db_path = db_config.get_database_path()
     """
     # Lazy import Config - only when factory is called
-    from .config import Config
+    from .config import Config, get_config
     
     # Determine database path
     if database_path is None:
-        cfg = Config(interactive=interactive)
-        database_path = cfg.database_path
+        if interactive:
+            database_path = Config(interactive=True).database_path
+        else:
+            database_path = get_config().database_path
     
     return DatabaseConfig(database_path=database_path)
 
@@ -105,7 +107,7 @@ def get_database_path(config: Optional['Config'] = None) -> str:
         Absolute path to the database file
     """
     if config is None:
-        from .config import Config
-        config = Config(interactive=False)
+        from .config import get_config
+        return get_config().database_path
     
     return config.database_path
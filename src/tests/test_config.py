@@ -6,7 +6,8 @@ from pathlib import Path
 
 import pytest
 
-from src import Config
+from src import Config, clear_config_cache, get_config
+from src import config as config_module
 
 
 @pytest.fixture
@@ -295,3 +296,121 @@ def test_runtime_parameters_are_constants(temp_dir, clean_env):
     # Runtime parameters should use class defaults, not env
     assert config.youtube_max_results == Config.DEFAULT_YOUTUBE_MAX_RESULTS
     assert config.youtube_max_results == 50  # Not 999
+
+
+@pytest.fixture
+def snapshot_env(temp_dir, clean_env, monkeypatch):
+    """Fresh process-wide snapshot cache and a .env path in a temp directory."""
+    monkeypatch.delenv("PRISMQ_CONFIG_CACHE", raising=False)
+    monkeypatch.setattr(config_module, "CHECK_INTERVAL", 0.0)
+    clear_config_cache()
+    yield Path(temp_dir) / ".env"
+    clear_config_cache()
+
+
+def test_get_config_does_not_create_env_file(snapshot_env):
+    """The snapshot never writes the .env file or prompts."""
+    snapshot = get_config(str(snapshot_env))
+
+    assert not snapshot_env.exists()
+    assert snapshot.database_path == str(snapshot_env.parent / "db.s3db")
+    assert snapshot.youtube_max_results == Config.DEFAULT_YOUTUBE_MAX_RESULTS
+
+
+def test_get_config_is_cached_until_env_file_changes(snapshot_env):
+    """Repeated calls return the same object until the .env file changes."""
+    snapshot_env.write_text("YOUTUBE_CHANNEL_URL=https://example.com\n")
+    first = get_config(str(snapshot_env))
+    assert get_config(str(snapshot_env)) is first
+
+    snapshot_env.write_text("YOUTUBE_CHANNEL_URL=https://example.com/other\n")
+    os.utime(snapshot_env, ns=(0, 10**9))
+
+    assert get_config(str(snapshot_env)) is not first
+
+
+def test_get_config_follows_environment(snapshot_env):
+    """A changed DATABASE_URL environment variable rebuilds the snapshot."""
+    os.environ["DATABASE_URL"] = "sqlite:///first.db"
+    assert get_config(str(snapshot_env)).database_path.endswith("first.db")
+
+    os.environ["DATABASE_URL"] = "sqlite:///second.db"
+    assert get_config(str(snapshot_env)).database_path.endswith("second.db")
+
+
+def test_get_config_reads_env_file(snapshot_env):
+    """Values in the .env file are used like Config does."""
+    pytest.importorskip("dotenv")
+    snapshot_env.write_text("DATABASE_URL=sqlite:///from_file.db\nYOUTUBE_API_KEY=key\n")
+
+    snapshot = get_config(str(snapshot_env))
+
+    assert snapshot.database_path == str(snapshot_env.parent / "from_file.db")
+    assert snapshot.youtube_api_key == "key"
+
+
+def test_snapshot_cache_file_is_reused(snapshot_env, monkeypatch):
+    """A new process reuses the serialized snapshot while the .env is unchanged."""
+    snapshot_env.write_text("\n")
+    first = config_module.load_config_snapshot(str(snapshot_env))
+    cache_file = snapshot_env.with_name(".env.cache.json")
+    assert cache_file.exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError(".env parsed despite valid cache")
+
+    monkeypatch.setattr(config_module, "dotenv_values", fail)
+    assert config_module.load_config_snapshot(str(snapshot_env)) == first
+
+
+def test_snapshot_cache_file_can_be_disabled(snapshot_env, monkeypatch):
+    """PRISMQ_CONFIG_CACHE=off keeps the working directory free of cache files."""
+    monkeypatch.setenv("PRISMQ_CONFIG_CACHE", "off")
+    snapshot_env.write_text("\n")
+
+    config_module.load_config_snapshot(str(snapshot_env))
+
+    assert not snapshot_env.with_name(".env.cache.json").exists()
+
+
+def test_snapshot_cache_file_leaves_out_secrets(snapshot_env, monkeypatch):
+    """The API key is re-read on every load and never written to the cache file."""
+    monkeypatch.setattr(config_module, "dotenv_values", lambda path: {"YOUTUBE_API_KEY": "file-key"})
+    snapshot_env.write_text("YOUTUBE_API_KEY=file-key\n")
+    config_module.load_config_snapshot(str(snapshot_env))
+    cache_file = snapshot_env.with_name(".env.cache.json")
+
+    assert "file-key" not in cache_file.read_text(encoding="utf-8")
+    if os.name == "posix":
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+    assert config_module.load_config_snapshot(str(snapshot_env)).youtube_api_key == "file-key"
+
+    monkeypatch.setenv("YOUTUBE_API_KEY", "env-key")
+    config_module.load_config_snapshot(str(snapshot_env))
+    assert "env-key" not in cache_file.read_text(encoding="utf-8")
+    assert config_module.load_config_snapshot(str(snapshot_env)).youtube_api_key == "env-key"
+
+
+def test_config_snapshot_matches_config(temp_dir, clean_env):
+    """Config.snapshot() carries the same values as the Config instance."""
+    env_path = Path(temp_dir) / ".env"
+    config = Config(str(env_path), interactive=False)
+
+    snapshot = config.snapshot()
+
+    assert snapshot.database_path == config.database_path
+    assert snapshot.working_directory == config.working_directory
+    assert snapshot.get_module_directory("T", "1") == config.get_module_directory("T", "1")
+
+
+def test_non_interactive_environment_never_prompts(temp_dir, clean_env, monkeypatch):
+    """PRISMQ_NON_INTERACTIVE disables prompts even for interactive=True."""
+    monkeypatch.setenv("PRISMQ_NON_INTERACTIVE", "1")
+
+    def fail(*args):
+        raise AssertionError("prompted")
+
+    monkeypatch.setattr("builtins.input", fail)
+    config = Config(str(Path(temp_dir) / ".env"), interactive=True)
+
+    assert config._prompt_for_value("DATABASE_URL", "Database URL", "x") == "x"
@@ -0,0 +1,106 @@
+"""Tests for the shared near-duplicate index."""
+
+import random
+import sqlite3
+
+import pytest
+
+from src import NearDuplicateIndex, setup_near_duplicate_index
+from src.near_duplicates import (
+    NearDuplicateError,
+    minhash_signature,
+    shingles,
+    signature_similarity,
+)
+
+STORY = (
+    "A lighthouse keeper on a remote island finds a diary that predicts every storm "
+    "before it arrives, and the last entry describes tonight"
+)
+
+
+def jaccard(first, second, size=2):
+    a, b = shingles(first, size), shingles(second, size)
+    return len(a & b) / len(a | b)
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = setup_near_duplicate_index(str(tmp_path / "db.s3db"))
+    yield index
+    index.close()
+
+
+class TestSignatures:
+    def test_shingles(self):
+        assert shingles("The Dark, the DARK!", 2) == {"the dark", "dark the"}
+        assert shingles("Lost", 2) == {"lost"}
+        assert shingles("  ...  ") == set()
+
+    def test_estimate_tracks_jaccard(self):
+        rng = random.Random(4)
+        words = [f"w{i}" for i in range(200)]
+        errors = []
+        for _ in range(100):
+            base = [rng.choice(words) for _ in range(50)]
+            other = list(base)
+            for _ in range(rng.randrange(20)):
+                other[rng.randrange(50)] = rng.choice(words)
+            first, second = " ".join(base), " ".join(other)
+            estimate = signature_similarity(minhash_signature(first), minhash_signature(second))
+            errors.append(abs(estimate - jaccard(first, second)))
+        assert sum(errors) / len(errors) < 0.07
+
+    def test_empty_text_has_no_signature(self):
+        assert minhash_signature("!!!") == ()
+        assert signature_similarity((), ()) == 0.0
+
+
+class TestNearDuplicateIndex:
+    def test_finds_near_duplicate(self, index):
+        index.add("idea", 1, STORY)
+        index.add("idea", 2, "A chef opens a restaurant that only serves meals from dreams")
+        edited = STORY.replace("tonight", "tomorrow night")
+
+        matches = index.find("idea", edited)
+        assert [match.ref_id for match in matches] == [1]
+        assert matches[0].similarity >= 0.7
+        assert index.find("idea", "Completely unrelated space opera about miners") == []
+
+    def test_kinds_are_separate(self, index):
+        index.add("title", 7, "The Diary That Predicts Storms")
+        assert index.find("idea", "The Diary That Predicts Storms") == []
+        assert index.find("title", "the diary that predicts storms")[0].ref_id == 7
+
+    def test_check_and_exclude(self, index):
+        index.add("title", 3, "The Keeper of the Last Light")
+        with pytest.raises(NearDuplicateError) as error:
+            index.check("title", "The keeper of the last light")
+        assert error.value.matches[0].ref_id == 3
+        index.check("title", "The keeper of the last light", exclude=[3])
+
+    def test_readd_and_remove(self, index):
+        index.add("idea", 1, STORY)
+        index.add("idea", 1, "Something else entirely about cooking pasta at midnight")
+        assert index.find("idea", STORY) == []
+        assert index.count("idea") == 1
+        assert index.remove("idea", 1)
+        assert not index.remove("idea", 1)
+        assert index.count() == 0
+
+    def test_index_missing_backfills_source_table(self, tmp_path):
+        path = str(tmp_path / "db.s3db")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE Idea (id INTEGER PRIMARY KEY, text TEXT)")
+        conn.executemany("INSERT INTO Idea (text) VALUES (?)", [(STORY,), ("",), (None,)])
+        conn.commit()
+
+        index = NearDuplicateIndex(connection=conn)
+        index.create_tables()
+        assert index.index_missing("idea") == 1
+        assert index.index_missing("idea") == 0
+        assert index.find("idea", STORY)[0].ref_id == 1
+        index.close()
+        # A borrowed connection stays open
+        assert conn.execute("SELECT COUNT(*) FROM Idea").fetchone()[0] == 3
+        conn.close()